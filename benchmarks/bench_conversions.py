@@ -0,0 +1,154 @@
+"""
+benchmark the vectorized ChannelConversion.convert paths against the
+previous numpy/object array implementation
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from asammdf.blocks import v4_constants as v4c
+from asammdf.blocks.conversion_utils import from_dict
+from asammdf.blocks.v4_blocks import ChannelConversion
+
+
+def legacy_tabx(conversion, values):
+    nr = conversion.val_param_nr
+    x = sorted(
+        zip([conversion[f"val_{i}"] for i in range(nr)], [conversion.referenced_blocks[f"text_{i}"] for i in range(nr)])
+    )
+    raw_vals = np.array([e[0] for e in x], dtype="<i8")
+    phys = [e[1] for e in x]
+
+    ret = np.full(values.size, None, "O")
+    idx1 = np.searchsorted(raw_vals, values, side="right") - 1
+    idx2 = np.searchsorted(raw_vals, values, side="left")
+
+    ret[np.argwhere(idx1 != idx2).ravel()] = conversion.referenced_blocks["default_addr"]
+    idx = np.argwhere(idx1 == idx2).ravel()
+    indexes = idx1[idx]
+    for val in np.unique(indexes).tolist():
+        ret[idx[np.argwhere(indexes == val).ravel()]] = phys[val]
+
+    all(isinstance(v, bytes) for v in ret.tolist())
+    return ret.astype(bytes)
+
+
+def legacy_rtabx(conversion, values):
+    nr = conversion.val_param_nr // 2
+    x = sorted(
+        zip(
+            [conversion[f"lower_{i}"] for i in range(nr)],
+            [conversion[f"upper_{i}"] for i in range(nr)],
+            [conversion.referenced_blocks[f"text_{i}"] for i in range(nr)],
+        )
+    )
+    lower = np.array([e[0] for e in x], dtype="<i8")
+    upper = np.array([e[1] for e in x], dtype="<i8")
+    phys = [e[2] for e in x]
+
+    ret = np.full(values.size, None, "O")
+    idx1 = np.searchsorted(lower, values, side="right") - 1
+    idx2 = np.searchsorted(upper, values, side="left")
+
+    ret[np.argwhere(idx1 != idx2).ravel()] = conversion.referenced_blocks["default_addr"]
+    idx_eq = np.argwhere(idx1 == idx2).ravel()
+    indexes = idx1[idx_eq]
+    for val in np.unique(indexes):
+        ret[idx_eq[np.argwhere(indexes == val).ravel()]] = phys[val]
+
+    all(isinstance(v, bytes) for v in ret.tolist())
+    return ret.astype(bytes)
+
+
+def legacy_tab(conversion, values):
+    nr = conversion.val_param_nr // 2
+    raw_vals = np.array([conversion[f"raw_{i}"] for i in range(nr)])
+    phys = np.array([conversion[f"phys_{i}"] for i in range(nr)])
+
+    dim = raw_vals.shape[0]
+    inds = np.searchsorted(raw_vals, values)
+    inds[inds >= dim] = dim - 1
+    inds2 = inds - 1
+    inds2[inds2 < 0] = 0
+    cond = np.abs(values - raw_vals[inds]) >= np.abs(values - raw_vals[inds2])
+
+    return np.where(cond, phys[inds2], phys[inds])
+
+
+def legacy_ttab(conversion, values):
+    nr = conversion.val_param_nr - 1
+    raw_values = [conversion.referenced_blocks[f"text_{i}"] for i in range(nr)]
+    phys = [conversion[f"val_{i}"] for i in range(nr)]
+
+    new_values = []
+    for val in values:
+        try:
+            val = phys[raw_values.index(val)]
+        except ValueError:
+            val = conversion.val_default
+        new_values.append(val)
+
+    return np.array(new_values)
+
+
+def conversions():
+    tabx = {f"val_{i}": i for i in range(64)}
+    tabx.update({f"text_{i}": f"state {i}" for i in range(64)})
+    tabx["default_addr"] = b"unknown"
+
+    rtabx = {}
+    for i in range(32):
+        rtabx[f"lower_{i}"] = i * 10
+        rtabx[f"upper_{i}"] = i * 10 + 7
+        rtabx[f"text_{i}"] = f"range {i}"
+    rtabx["default_addr"] = b"out of range"
+
+    tab = {f"raw_{i}": float(i * 3) for i in range(64)}
+    tab.update({f"phys_{i}": float(i * i) for i in range(64)})
+
+    ttab = ChannelConversion(
+        conversion_type=v4c.CONVERSION_TYPE_TTAB,
+        links_nr=4 + 16,
+        val_default=-1.0,
+        **{f"val_{i}": float(i) for i in range(16)},
+    )
+    ttab.referenced_blocks = {f"text_{i}": f"key {i}".encode() for i in range(16)}
+
+    return [
+        ("TABX", from_dict(tabx), legacy_tabx, lambda size: np.random.randint(0, 70, size)),
+        ("RTABX", from_dict(rtabx), legacy_rtabx, lambda size: np.random.randint(0, 330, size)),
+        ("TAB", from_dict(tab), legacy_tab, lambda size: np.random.uniform(-5, 200, size)),
+        (
+            "TTAB",
+            ttab,
+            legacy_ttab,
+            lambda size: np.array([f"key {i}".encode() for i in range(20)])[np.random.randint(0, 20, size)],
+        ),
+    ]
+
+
+def main(samples):
+    print(f"{'conversion':<12}{'previous [s]':>14}{'current [s]':>14}{'speed-up':>10}")
+
+    for name, conversion, legacy, generate in conversions():
+        values = generate(samples)
+
+        start = perf_counter()
+        expected = legacy(conversion, values)
+        previous = perf_counter() - start
+
+        start = perf_counter()
+        result = conversion.convert(values)
+        current = perf_counter() - start
+
+        assert result.dtype == expected.dtype and np.array_equal(result, expected), name
+
+        print(f"{name:<12}{previous:>14.3f}{current:>14.3f}{previous / current:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=10_000_000, help="number of converted samples")
+    main(parser.parse_args().samples)
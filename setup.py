@@ -106,6 +106,7 @@ setup(
             "fastparquet",
             "h5py",
             "hdf5storage>=0.1.19",
+            "pyarrow",
             "python-snappy",
         ],
         "export_matlab_v5": "scipy",
@@ -0,0 +1,275 @@
+""" asyncio wrapper for the MDF class """
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from types import TracebackType
+from typing import Any, TypeVar
+
+import pandas as pd
+
+from .mdf import MDF
+from .signal import Signal
+from .types import ChannelsType, InputType
+
+__all__ = ["AsyncMDF"]
+
+T = TypeVar("T")
+
+# the get arguments that have an equivalent in MDF.select; get requests that
+# only use these arguments can be coalesced in a single select call
+COALESCED_GET_ARGUMENTS = {
+    "raw",
+    "ignore_invalidation_bits",
+    "record_offset",
+    "record_count",
+}
+
+_STOP = object()
+
+
+class AsyncMDF:
+    """asyncio wrapper around an *MDF* object
+
+    The blocking *MDF* calls (block reads, decompression and the samples
+    processing) are dispatched to a bounded executor so that the event loop
+    is never blocked. The calls to the wrapped *MDF* object are serialized,
+    so a single file can be shared by many concurrent clients.
+
+    *get* requests for channels from the same group that are issued in the
+    same event loop iteration are coalesced in a single *select* call, so the
+    group data is read just once.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    mdf : MDF
+        opened *MDF* object
+    executor : concurrent.futures.Executor
+        executor used for the blocking calls; if not provided then a
+        *ThreadPoolExecutor* with a single worker is created and it is shut
+        down when the *AsyncMDF* is closed
+    coalesce : bool
+        coalesce concurrent *get* requests for the same group; default *True*
+
+    Examples
+    --------
+    >>> async with await AsyncMDF.open("path/to/file.mf4") as mdf:
+    ...     speed, rpm = await asyncio.gather(mdf.get("Speed"), mdf.get("RPM"))
+    ...     async for df in mdf.iter_to_dataframe(channels=["Speed", "RPM"]):
+    ...         print(df)
+
+    """
+
+    def __init__(
+        self,
+        mdf: MDF,
+        executor: Executor | None = None,
+        coalesce: bool = True,
+    ) -> None:
+        self.mdf = mdf
+        self.coalesce = coalesce
+
+        if executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asammdf-aio")
+            self._own_executor = True
+        else:
+            self._executor = executor
+            self._own_executor = False
+
+        self._lock = Lock()
+        self._batches = {}
+
+    @classmethod
+    async def open(
+        cls,
+        name: InputType,
+        executor: Executor | None = None,
+        coalesce: bool = True,
+        **kwargs,
+    ) -> AsyncMDF:
+        """open the measurement file in the executor
+
+        Parameters
+        ----------
+        name : str | pathlib.Path | file-like
+            measurement file
+        executor : concurrent.futures.Executor
+            see *AsyncMDF*
+        coalesce : bool
+            see *AsyncMDF*
+        kwargs :
+            keyword arguments passed to *MDF*
+
+        Returns
+        -------
+        mdf : AsyncMDF
+
+        """
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asammdf-aio")
+            own_executor = True
+        else:
+            own_executor = False
+
+        loop = asyncio.get_running_loop()
+        try:
+            mdf = await loop.run_in_executor(executor, partial(MDF, name, **kwargs))
+        except:
+            if own_executor:
+                executor.shutdown(wait=False)
+            raise
+
+        async_mdf = cls(mdf, executor=executor, coalesce=coalesce)
+        async_mdf._own_executor = own_executor
+        return async_mdf
+
+    async def __aenter__(self) -> AsyncMDF:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def _call(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            return func(*args)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, func, *args)
+
+    async def get(
+        self,
+        name: str | None = None,
+        group: int | None = None,
+        index: int | None = None,
+        **kwargs,
+    ) -> Signal:
+        """awaitable version of *MDF.get*; the arguments are the same"""
+
+        if not self.coalesce or set(kwargs) - COALESCED_GET_ARGUMENTS:
+            return await self._run(partial(self.mdf.get, name, group, index, **kwargs))
+
+        # the channel selection is validated in the executor, together with
+        # the other requests of the batch, while the lock is held
+        key = tuple(sorted(kwargs.items()))
+        batch = self._batches.get(key, None)
+        if batch is None:
+            batch = self._batches[key] = []
+            asyncio.get_running_loop().call_soon(self._dispatch_batch, key)
+
+        future = asyncio.get_running_loop().create_future()
+        batch.append(((name, group, index), future))
+
+        return await future
+
+    def _dispatch_batch(self, key: tuple[tuple[str, Any], ...]) -> None:
+        batch = self._batches.pop(key)
+
+        requests = [request for request, _ in batch]
+        task = asyncio.ensure_future(self._run(self._select_batch, requests, dict(key)))
+        task.add_done_callback(partial(self._set_batch_results, [future for _, future in batch]))
+
+    def _select_batch(
+        self,
+        requests: list[tuple[str | None, int | None, int | None]],
+        options: dict[str, Any],
+    ) -> list[Signal | Exception]:
+        """validate the (name, group, index) *requests* and select the
+        channels with a single *select* call for each group; the result or
+        the exception of each request is returned. This runs in the executor
+        while the lock is held"""
+
+        results = [None] * len(requests)
+        groups = {}
+        for i, request in enumerate(requests):
+            try:
+                gp_nr, ch_nr = self.mdf._validate_channel_selection(*request)
+            except Exception as exc:
+                results[i] = exc
+            else:
+                groups.setdefault(gp_nr, {}).setdefault(ch_nr, []).append(i)
+
+        for gp_nr, channels in groups.items():
+            try:
+                signals = self.mdf.select(
+                    [(None, gp_nr, ch_nr) for ch_nr in channels],
+                    raw=options.get("raw", False),
+                    record_offset=options.get("record_offset", 0),
+                    record_count=options.get("record_count", None),
+                    validate=not options.get("ignore_invalidation_bits", False),
+                )
+            except Exception as exc:
+                for indexes in channels.values():
+                    for i in indexes:
+                        results[i] = exc
+                continue
+
+            for signal, indexes in zip(signals, channels.values()):
+                for j, i in enumerate(indexes):
+                    # each client gets its own Signal object
+                    results[i] = signal if j == 0 else signal.copy()
+
+        return results
+
+    @staticmethod
+    def _set_batch_results(futures: list[asyncio.Future], task: asyncio.Future) -> None:
+        if task.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+
+        error = task.exception()
+        if error is not None:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for result, future in zip(task.result(), futures):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def select(self, channels: ChannelsType, **kwargs) -> list[Signal]:
+        """awaitable version of *MDF.select*; the arguments are the same"""
+        return await self._run(partial(self.mdf.select, channels, **kwargs))
+
+    async def to_dataframe(self, **kwargs) -> pd.DataFrame:
+        """awaitable version of *MDF.to_dataframe*; the arguments are the same"""
+        return await self._run(partial(self.mdf.to_dataframe, **kwargs))
+
+    async def iter_to_dataframe(self, **kwargs) -> AsyncIterator[pd.DataFrame]:
+        """asynchronous generator version of *MDF.iter_to_dataframe*; the
+        arguments are the same. Each DataFrame chunk is computed in the
+        executor"""
+
+        dataframes = self.mdf.iter_to_dataframe(**kwargs)
+        try:
+            while True:
+                df = await self._run(next, dataframes, _STOP)
+                if df is _STOP:
+                    break
+                yield df
+        finally:
+            await self._run(dataframes.close)
+
+    async def close(self) -> None:
+        """close the wrapped *MDF* object and shut down the executor if it
+        was created by the *AsyncMDF*"""
+        await self._run(self.mdf.close)
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
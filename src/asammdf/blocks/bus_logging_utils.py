@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from traceback import format_exc
-from typing import Any
+from typing import Any, NamedTuple, TYPE_CHECKING
 
 from canmatrix import Frame, Signal
 import numpy as np
@@ -9,8 +9,12 @@ from numpy.typing import NDArray
 from typing_extensions import TypedDict
 
 from .conversion_utils import from_dict
+from .cutils import extract_bit_fields
 from .utils import as_non_byte_sized_signed_int, MdfException
 
+if TYPE_CHECKING:
+    from .v4_blocks import ChannelConversion
+
 MAX_VALID_J1939 = {
     2: 1,
     4: 0xA,
@@ -26,6 +30,26 @@ MAX_VALID_J1939 = {
 }
 
 
+class SignalLayout(NamedTuple):
+    """position of the signal bits in the CAN payload"""
+
+    start_bit: int
+    start_byte: int
+    byte_size: int
+    bit_offset: int
+    bit_count: int
+    std_size: int
+    big_endian: bool
+    signed: bool
+    is_float: bool
+    payload_size: int
+
+    @property
+    def bit_fields(self) -> tuple[int, int, int, int, int]:
+        """row of the *cutils.extract_bit_fields* plan"""
+        return self.start_byte, self.byte_size, self.bit_offset, self.bit_count, int(self.big_endian)
+
+
 def defined_j1939_bit_count(signal):
     size = signal.size
     for defined_size in (2, 4, 8, 10, 12, 16, 20, 24, 28, 32, 64):
@@ -34,7 +58,24 @@ def defined_j1939_bit_count(signal):
     return size
 
 
-def apply_conversion(vals: NDArray[Any], signal: Signal, ignore_value2text_conversion: bool) -> NDArray[Any]:
+def value2text_conversion(signal: Signal) -> ChannelConversion:
+    conv = {}
+    for i, (val, text) in enumerate(signal.values.items()):
+        conv[f"upper_{i}"] = val
+        conv[f"lower_{i}"] = val
+        conv[f"text_{i}"] = text
+
+    conv["default"] = from_dict({"a": float(signal.factor), "b": float(signal.offset)})
+
+    return from_dict(conv)
+
+
+def apply_conversion(
+    vals: NDArray[Any],
+    signal: Signal,
+    ignore_value2text_conversion: bool,
+    conversion: ChannelConversion | None = None,
+) -> NDArray[Any]:
     a, b = float(signal.factor), float(signal.offset)
 
     if signal.values:
@@ -44,16 +85,9 @@ def apply_conversion(vals: NDArray[Any], signal: Signal, ignore_value2text_conve
                 if b:
                     vals += b
         else:
-            conv = {}
-            for i, (val, text) in enumerate(signal.values.items()):
-                conv[f"upper_{i}"] = val
-                conv[f"lower_{i}"] = val
-                conv[f"text_{i}"] = text
-
-            conv["default"] = from_dict({"a": a, "b": b})
-
-            conv = from_dict(conv)
-            vals = conv.convert(vals)
+            if conversion is None:
+                conversion = value2text_conversion(signal)
+            vals = conversion.convert(vals)
 
     else:
         if (a, b) != (1, 0):
@@ -64,23 +98,27 @@ def apply_conversion(vals: NDArray[Any], signal: Signal, ignore_value2text_conve
     return vals
 
 
-def extract_signal(
-    signal: Signal,
-    payload: NDArray[Any],
-    raw: bool = False,
-    ignore_value2text_conversion: bool = True,
-) -> NDArray[Any]:
-    vals = payload
+def signal_layout(signal: Signal) -> SignalLayout:
+    """compute the position of the signal bits in the payload
+
+    Parameters
+    ----------
+    signal : canmatrix.Signal
+        signal description
+
+    Returns
+    -------
+    layout : SignalLayout
 
+    """
     big_endian = False if signal.is_little_endian else True
-    signed = signal.is_signed
     is_float = signal.is_float
 
     start_bit = signal.get_startbit(bit_numbering=1)
+    bit_count = signal.size
 
     if big_endian:
         start_byte = start_bit // 8
-        bit_count = signal.size
 
         pos = start_bit % 8 + 1
 
@@ -93,8 +131,6 @@ def extract_signal(
     else:
         start_byte, bit_offset = divmod(start_bit, 8)
 
-    bit_count = signal.size
-
     if is_float:
         if bit_offset:
             raise MdfException(f"Cannot extract float signal '{signal}' because it is not byte aligned")
@@ -115,19 +151,9 @@ def extract_signal(
             else:
                 break
 
-        if byte_pos > vals.shape[1]:
-            raise MdfException(
-                f'Could not extract signal "{signal.name}" with start '
-                f"bit {start_bit} and bit count {signal.size} "
-                f"from the payload with shape {vals.shape}"
-            )
+        payload_size = byte_pos
     else:
-        if start_bit + bit_count > vals.shape[1] * 8:
-            raise MdfException(
-                f'Could not extract signal "{signal.name}" with start '
-                f"bit {start_bit} and bit count {signal.size} "
-                f"from the payload with shape {vals.shape}"
-            )
+        payload_size = (start_bit + bit_count + 7) // 8
 
     byte_size, r = divmod(bit_offset + bit_count, 8)
     if r:
@@ -138,105 +164,106 @@ def extract_signal(
     else:
         extra_bytes = 4 - (byte_size % 4)
 
-    std_size = byte_size + extra_bytes
+    return SignalLayout(
+        start_bit,
+        start_byte,
+        byte_size,
+        bit_offset,
+        bit_count,
+        byte_size + extra_bytes,
+        big_endian,
+        signal.is_signed and not is_float,
+        is_float,
+        payload_size,
+    )
+
+
+def check_payload_size(signal: Signal, layout: SignalLayout, payload: NDArray[Any]) -> None:
+    if layout.payload_size > payload.shape[1]:
+        raise MdfException(
+            f'Could not extract signal "{signal.name}" with start '
+            f"bit {layout.start_bit} and bit count {signal.size} "
+            f"from the payload with shape {payload.shape}"
+        )
+
+
+def samples_from_bit_fields(fields: NDArray[Any], layout: SignalLayout) -> NDArray[Any]:
+    """build the raw signal samples from the bit fields returned by
+    *cutils.extract_bit_fields*"""
+    std_size = layout.std_size
+
+    if layout.is_float:
+        vals = fields.astype(f"<u{std_size}").view(f"<f{std_size}")
+        if layout.big_endian:
+            vals = vals.astype(f">f{std_size}")
+    else:
+        vals = fields.astype(f"u{std_size}")
 
-    # prepend or append extra bytes columns
-    # to get a standard size number of bytes
+        if layout.signed:
+            if layout.bit_count not in (8, 16, 32, 64):
+                vals = as_non_byte_sized_signed_int(vals, layout.bit_count)
+            else:
+                vals = vals.view(f"i{std_size}")
 
-    if extra_bytes:
-        if big_endian:
-            vals = np.column_stack(
-                [
-                    vals[:, start_byte : start_byte + byte_size],
-                    np.zeros(len(vals), dtype=f"<({extra_bytes},)u1"),
-                ]
-            )
+    return vals
 
-            if std_size > 8:
-                fmt = f"({std_size},)u1"
-            elif is_float:
-                fmt = f">f{std_size}"
-            else:
-                fmt = f">u{std_size}"
 
-            try:
-                vals = vals.view(fmt).ravel()
-            except:
-                vals = np.frombuffer(vals.tobytes(), dtype=fmt)
+def extract_signal(
+    signal: Signal,
+    payload: NDArray[Any],
+    raw: bool = False,
+    ignore_value2text_conversion: bool = True,
+) -> NDArray[Any]:
+    layout = signal_layout(signal)
+    check_payload_size(signal, layout, payload)
+
+    start_byte, byte_size, std_size = layout.start_byte, layout.byte_size, layout.std_size
 
-            if std_size <= 8 and not is_float:
-                vals = vals >> (extra_bytes * 8 + bit_offset)
-                vals &= (2**bit_count) - 1
+    if std_size <= 8 and payload.dtype == np.uint8:
+        fields = extract_bit_fields(
+            payload,
+            None,
+            np.array([layout.bit_fields], dtype="<i8"),
+        )
+        vals = samples_from_bit_fields(fields[0], layout)
 
-        else:
+    else:
+        # signals longer than 8 bytes are returned as byte arrays
+        vals = payload[:, start_byte : start_byte + byte_size]
+        extra_bytes = std_size - byte_size
+
+        if extra_bytes:
             vals = np.column_stack(
                 [
-                    vals[:, start_byte : start_byte + byte_size],
+                    vals,
                     np.zeros(len(vals), dtype=f"<({extra_bytes},)u1"),
                 ]
             )
 
-            if std_size > 8:
-                fmt = f"({std_size},)u1"
-            elif is_float:
-                fmt = f"<f{std_size}"
-            else:
-                fmt = f"<u{std_size}"
-
-            try:
-                vals = vals.view(fmt).ravel()
-            except:
-                vals = np.frombuffer(vals.tobytes(), dtype=fmt)
+        if std_size > 8:
+            fmt = f"({std_size},)u1"
+        elif layout.is_float:
+            fmt = f"{'>' if layout.big_endian else '<'}f{std_size}"
+        else:
+            fmt = f"{'>' if layout.big_endian else '<'}u{std_size}"
 
-            if std_size <= 8 and not is_float:
-                vals = vals >> bit_offset
-                vals &= (2**bit_count) - 1
+        try:
+            vals = vals.view(fmt).ravel()
+        except:
+            vals = np.frombuffer(vals.tobytes(), dtype=fmt)
 
-    else:
-        if big_endian:
-            if std_size > 8:
-                fmt = f"({std_size},)u1"
-            elif is_float:
-                fmt = f">f{std_size}"
+        if std_size <= 8 and not layout.is_float:
+            if layout.big_endian:
+                vals = vals >> (extra_bytes * 8 + layout.bit_offset)
             else:
-                fmt = f">u{std_size}"
-
-            try:
-                vals = vals[:, start_byte : start_byte + byte_size].view(fmt).ravel()
-            except:
-                vals = np.frombuffer(
-                    vals[:, start_byte : start_byte + byte_size].tobytes(),
-                    dtype=fmt,
-                )
-
-            if std_size <= 8 and not is_float:
-                vals = vals >> bit_offset
-                vals &= (2**bit_count) - 1
-        else:
-            if std_size > 8:
-                fmt = f"({std_size},)u1"
-            elif is_float:
-                fmt = f"<f{std_size}"
+                vals = vals >> layout.bit_offset
+            vals &= (2**layout.bit_count) - 1
+
+        if layout.signed:
+            if layout.bit_count not in (8, 16, 32, 64):
+                vals = as_non_byte_sized_signed_int(vals, layout.bit_count)
             else:
-                fmt = f"<u{std_size}"
-
-            try:
-                vals = vals[:, start_byte : start_byte + byte_size].view(fmt).ravel()
-            except:
-                vals = np.frombuffer(
-                    vals[:, start_byte : start_byte + byte_size].tobytes(),
-                    dtype=fmt,
-                )
-
-            if std_size <= 8 and not is_float:
-                vals = vals >> bit_offset
-                vals &= (2**bit_count) - 1
-
-    if signed and not is_float:
-        if bit_count not in (8, 16, 32, 64):
-            vals = as_non_byte_sized_signed_int(vals, bit_count)
-        else:
-            vals = vals.view(f"i{std_size}")
+                vals = vals.view(f"i{std_size}")
 
     if not raw:
         vals = apply_conversion(vals, signal, ignore_value2text_conversion)
@@ -271,6 +298,203 @@ class ExtractedSignal(TypedDict):
     invalidation_bits: NDArray[Any]
 
 
+class MessagePlan:
+    """bit extraction plan of a CAN message
+
+    The signals layout is computed once and then all the signals that share
+    the same multiplexors are decoded in a single pass over the payload rows
+    using *cutils.extract_bit_fields*. The plan can be reused for all the
+    occurrences of the message in the measurement.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    message : canmatrix.Frame
+        CAN message description parsed by canmatrix
+
+    """
+
+    def __init__(self, message: Frame) -> None:
+        self.message = message
+
+        if message.is_multiplexed:
+            for sig in message:
+                if sig.multiplex == "Multiplexor" and sig.muxer_for_signal is None:
+                    multiplexor_name = sig.name
+                    break
+            for sig in message:
+                if sig.multiplex not in (None, "Multiplexor") and sig.muxer_for_signal is None:
+                    sig.muxer_for_signal = multiplexor_name
+                    sig.mux_val_min = sig.mux_val_max = int(sig.multiplex)
+                    sig.mux_val_grp.insert(0, (int(sig.multiplex), int(sig.multiplex)))
+
+        self._pairs = {}
+        self._layouts = {}
+        self._conversions = {}
+
+    def pairs(self, muxer: str | None) -> dict[tuple[int, int], list[Signal]]:
+        """signals that depend on the *muxer* grouped by the multiplexor
+        values range"""
+        pairs = self._pairs.get(muxer, None)
+
+        if pairs is None:
+            pairs = self._pairs[muxer] = {}
+            for signal in self.message:
+                if signal.muxer_for_signal == muxer:
+                    try:
+                        entry = signal.mux_val_min, signal.mux_val_max
+                    except:
+                        entry = tuple(signal.mux_val_grp[0]) if signal.mux_val_grp else (0, 0)
+                    pair_signals = pairs.setdefault(entry, [])
+                    pair_signals.append(signal)
+
+        return pairs
+
+    def layouts(self, muxer: str | None, pair: tuple[int, int]) -> tuple[list[SignalLayout], NDArray[Any]]:
+        """layouts of the pair signals and the *cutils.extract_bit_fields*
+        plan for the signals that fit in 8 bytes"""
+        key = muxer, pair
+        layouts = self._layouts.get(key, None)
+
+        if layouts is None:
+            layouts = [signal_layout(signal) for signal in self.pairs(muxer)[pair]]
+            plan = np.array(
+                [layout.bit_fields for layout in layouts if layout.std_size <= 8],
+                dtype="<i8",
+            ).reshape(-1, 5)
+            layouts = self._layouts[key] = layouts, plan
+
+        return layouts
+
+    def conversion(self, signal: Signal) -> ChannelConversion:
+        conversion = self._conversions.get(signal.name, None)
+        if conversion is None:
+            conversion = self._conversions[signal.name] = value2text_conversion(signal)
+        return conversion
+
+    def extract(
+        self,
+        payload: NDArray[Any],
+        message_id: int,
+        bus: int,
+        t: NDArray[Any],
+        rows: NDArray[Any] | None = None,
+        muxer: str | None = None,
+        muxer_values: NDArray[Any] | None = None,
+        original_message_id: int | None = None,
+        raw: bool = False,
+        include_message_name: bool = False,
+        ignore_value2text_conversion: bool = True,
+        is_j1939: bool = False,
+        is_extended: bool = False,
+    ) -> dict[tuple[Any, ...], dict[str, ExtractedSignal]]:
+        """extract the message signals from the raw payload; see
+        *extract_mux*
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            indexes of the payload rows that belong to the message; by
+            default all the rows are used. The timestamps *t* must match the
+            selected rows
+
+        """
+        message = self.message
+
+        extracted_signals = {}
+
+        if message.size > payload.shape[1] or message.size == 0:
+            return extracted_signals
+
+        native = payload.dtype == np.uint8
+
+        for pair, pair_signals in self.pairs(muxer).items():
+            entry = bus, message_id, is_extended, original_message_id, muxer, *pair
+
+            extracted_signals[entry] = signals = {}
+
+            if muxer_values is not None:
+                min_, max_ = pair
+                idx = np.argwhere((min_ <= muxer_values) & (muxer_values <= max_)).ravel()
+                rows_ = idx if rows is None else rows[idx]
+                t_ = t[idx]
+            else:
+                t_ = t
+                rows_ = rows
+
+            layouts, plan = self.layouts(muxer, pair)
+            for sig, layout in zip(pair_signals, layouts):
+                check_payload_size(sig, layout, payload)
+
+            if native:
+                fields = iter(extract_bit_fields(payload, rows_, plan))
+
+            for sig, layout in zip(pair_signals, layouts):
+                if native and layout.std_size <= 8:
+                    samples = samples_from_bit_fields(next(fields), layout)
+                else:
+                    samples = extract_signal(
+                        sig,
+                        payload if rows_ is None else payload[rows_],
+                        raw=True,
+                    )
+
+                if len(samples) == 0 and len(t_):
+                    continue
+
+                if include_message_name:
+                    sig_name = f"{message.name}.{sig.name}"
+                else:
+                    sig_name = sig.name
+
+                try:
+                    if raw:
+                        vals = samples
+                    elif sig.values and not ignore_value2text_conversion:
+                        vals = self.conversion(sig).convert(samples)
+                    else:
+                        vals = apply_conversion(samples, sig, ignore_value2text_conversion)
+
+                    signals[sig_name] = {
+                        "name": sig_name,
+                        "comment": sig.comment or "",
+                        "unit": sig.unit or "",
+                        "samples": vals,
+                        "t": t_,
+                        "invalidation_bits": None,
+                    }
+
+                    if is_j1939:
+                        signals[sig_name]["invalidation_bits"] = samples > MAX_VALID_J1939[defined_j1939_bit_count(sig)]
+
+                except:
+                    print(format_exc())
+                    print(message, sig)
+                    print(samples, set(samples), samples.dtype, samples.shape)
+                    raise
+
+                if sig.multiplex == "Multiplexor":
+                    extracted_signals.update(
+                        self.extract(
+                            payload,
+                            message_id,
+                            bus,
+                            t_,
+                            rows=rows_,
+                            muxer=sig.name,
+                            muxer_values=samples,
+                            original_message_id=original_message_id,
+                            ignore_value2text_conversion=ignore_value2text_conversion,
+                            raw=raw,
+                            is_j1939=is_j1939,
+                            is_extended=is_extended,
+                        )
+                    )
+
+        return extracted_signals
+
+
 def extract_mux(
     payload: NDArray[Any],
     message: Frame,
@@ -285,6 +509,8 @@ def extract_mux(
     ignore_value2text_conversion: bool = True,
     is_j1939: bool = False,
     is_extended: bool = False,
+    plan: MessagePlan | None = None,
+    rows: NDArray[Any] | None = None,
 ) -> dict[tuple[Any, ...], dict[str, ExtractedSignal]]:
     """extract multiplexed CAN signals from the raw payload
 
@@ -311,6 +537,18 @@ def extract_mux(
 
         .. versionadded:: 5.23.0
 
+    plan (None): MessagePlan
+        precompiled bit extraction plan of the message; reuse the plan when
+        the same message is extracted several times
+
+        .. versionadded:: 7.5.0
+
+    rows (None): np.ndarray
+        indexes of the *payload* rows that belong to the message; the
+        timestamps *t* must match the selected rows
+
+        .. versionadded:: 7.5.0
+
 
     Returns
     -------
@@ -320,97 +558,21 @@ def extract_mux(
 
     """
 
-    if muxer is None:
-        if message.is_multiplexed:
-            for sig in message:
-                if sig.multiplex == "Multiplexor" and sig.muxer_for_signal is None:
-                    multiplexor_name = sig.name
-                    break
-            for sig in message:
-                if sig.multiplex not in (None, "Multiplexor") and sig.muxer_for_signal is None:
-                    sig.muxer_for_signal = multiplexor_name
-                    sig.mux_val_min = sig.mux_val_max = int(sig.multiplex)
-                    sig.mux_val_grp.insert(0, (int(sig.multiplex), int(sig.multiplex)))
-
-    extracted_signals = {}
-
-    if message.size > payload.shape[1] or message.size == 0:
-        return extracted_signals
-
-    pairs = {}
-    for signal in message:
-        if signal.muxer_for_signal == muxer:
-            try:
-                entry = signal.mux_val_min, signal.mux_val_max
-            except:
-                entry = tuple(signal.mux_val_grp[0]) if signal.mux_val_grp else (0, 0)
-            pair_signals = pairs.setdefault(entry, [])
-            pair_signals.append(signal)
-
-    for pair, pair_signals in pairs.items():
-        entry = bus, message_id, is_extended, original_message_id, muxer, *pair
-
-        extracted_signals[entry] = signals = {}
-
-        if muxer_values is not None:
-            min_, max_ = pair
-            idx = np.argwhere((min_ <= muxer_values) & (muxer_values <= max_)).ravel()
-            payload_ = payload[idx]
-            t_ = t[idx]
-        else:
-            t_ = t
-            payload_ = payload
-
-        for sig in pair_signals:
-            samples = extract_signal(
-                sig,
-                payload_,
-                ignore_value2text_conversion=ignore_value2text_conversion,
-                raw=True,
-            )
-            if len(samples) == 0 and len(t_):
-                continue
-
-            if include_message_name:
-                sig_name = f"{message.name}.{sig.name}"
-            else:
-                sig_name = sig.name
-
-            try:
-                signals[sig_name] = {
-                    "name": sig_name,
-                    "comment": sig.comment or "",
-                    "unit": sig.unit or "",
-                    "samples": samples if raw else apply_conversion(samples, sig, ignore_value2text_conversion),
-                    "t": t_,
-                    "invalidation_bits": None,
-                }
-
-                if is_j1939:
-                    signals[sig_name]["invalidation_bits"] = samples > MAX_VALID_J1939[defined_j1939_bit_count(sig)]
-
-            except:
-                print(format_exc())
-                print(message, sig)
-                print(samples, set(samples), samples.dtype, samples.shape)
-                raise
-
-            if sig.multiplex == "Multiplexor":
-                extracted_signals.update(
-                    extract_mux(
-                        payload_,
-                        message,
-                        message_id,
-                        bus,
-                        t_,
-                        muxer=sig.name,
-                        muxer_values=samples,
-                        original_message_id=original_message_id,
-                        ignore_value2text_conversion=ignore_value2text_conversion,
-                        raw=raw,
-                        is_j1939=is_j1939,
-                        is_extended=is_extended,
-                    )
-                )
-
-    return extracted_signals
+    if plan is None:
+        plan = MessagePlan(message)
+
+    return plan.extract(
+        payload,
+        message_id,
+        bus,
+        t,
+        rows=rows,
+        muxer=muxer,
+        muxer_values=muxer_values,
+        original_message_id=original_message_id,
+        raw=raw,
+        include_message_name=include_message_name,
+        ignore_value2text_conversion=ignore_value2text_conversion,
+        is_j1939=is_j1939,
+        is_extended=is_extended,
+    )
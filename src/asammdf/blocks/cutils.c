@@ -8,149 +8,174 @@
 #include <stdbool.h>
 #include <stdint.h>
 #include <time.h>
+#include <math.h>
 
 #define PY_PRINTF(o) \
     PyObject_Print(o, stdout, 0); printf("\n");
 
 char err_string[1024];
 
-struct rec_info {
-    unsigned long id;
-    unsigned long size;
-    PyObject* mlist;
-}; 
-
-struct node {
-    struct node * next;
-    struct rec_info info;
+struct sort_slot {
+    uint64_t id;
+    uint64_t size;
+    uint64_t total;
+    PyObject *key;
+    unsigned char *out;
 };
 
+static inline struct sort_slot* find_sort_slot(struct sort_slot *slots, Py_ssize_t count, uint64_t id)
+{
+    Py_ssize_t low = 0, high = count - 1, middle;
 
+    while (low <= high) {
+        middle = (low + high) / 2;
+        if (slots[middle].id == id) return &slots[middle];
+        else if (slots[middle].id < id) low = middle + 1;
+        else high = middle - 1;
+    }
 
+    return NULL;
+}
 
-static PyObject* sort_data_block(PyObject* self, PyObject* args)
+// walk the records of the unsorted block and return the position of the first
+// record that is incomplete or that has an unknown record id. If *scatter* is
+// false only the bytes of each record id are counted, else the records are
+// copied to the output buffers of their slots
+static Py_ssize_t scan_sort_records(unsigned char *buf, Py_ssize_t size, Py_ssize_t id_size,
+                                    struct sort_slot *slots, Py_ssize_t count, int scatter, int *unknown_id)
 {
-    unsigned long long id_size=0, position=0, size;
-    unsigned long rec_size, length, rec_id;
-    PyObject *signal_data, *partial_records, *record_size, *optional, *mlist;
-    PyObject *bts, *key, *value, *rem=NULL;
-    unsigned char *buf, *end, *orig;
-    struct node * head = NULL, *last=NULL, *item;
-    
-    if (!PyArg_ParseTuple(args, "OOOK|O", &signal_data, &partial_records, &record_size, &id_size, &optional))
-    {
-        return 0;
-    }
-    else
-    {
-        Py_ssize_t pos = 0;
-		position = 0;
-       
-        while (PyDict_Next(record_size, &pos, &key, &value)) 
-        {
-            item = malloc(sizeof(struct node));
-            item->info.id = PyLong_AsUnsignedLong(key);
-            item->info.size = PyLong_AsUnsignedLong(value);
-            item->info.mlist = PyDict_GetItem(partial_records, key);
-            item->next = NULL;
-            if (last)
-                last->next = item;
-            if (!head)
-                head = item;
-            last = item; 
+    Py_ssize_t position = 0;
+    uint64_t rec_id, length;
+    struct sort_slot *slot = NULL;
+
+    *unknown_id = 0;
+
+    while (position + id_size < size) {
+        rec_id = 0;
+        for (Py_ssize_t i = 0; i < id_size; i++) {
+            rec_id |= ((uint64_t) buf[position + i]) << (i << 3);
         }
- 
-        buf = (unsigned char *) PyBytes_AS_STRING(signal_data);
-        orig = buf;
-        size = (unsigned long long) PyBytes_GET_SIZE(signal_data);
-        end = buf + size;
-        
-        while ((buf + id_size) < end)
-        {
- 
-            rec_id = 0; 
-            for (unsigned char i=0; i<id_size; i++, buf++) {
-                rec_id += (*buf) << (i <<3);
-            }  
-
-            key = PyLong_FromUnsignedLong(rec_id);
-            value = PyDict_GetItem(record_size, key);
-
-            if (!value) {
-                rem = PyBytes_FromStringAndSize(NULL, 0);
-                Py_XDECREF(key);
-                return rem;
-            }
-            else {
-                rec_size = PyLong_AsUnsignedLong(value);
+
+        if (!slot || slot->id != rec_id) {
+            slot = find_sort_slot(slots, count, rec_id);
+            if (!slot) {
+                *unknown_id = 1;
+                break;
             }
+        }
 
-            mlist = PyDict_GetItem(partial_records, key);
+        if (slot->size) {
+            length = slot->size;
+        }
+        else {
+            // VLSD record: 4 bytes length followed by the sample bytes
+            if ((uint64_t) (position + id_size + 4) > (uint64_t) size) break;
+            length = 4 + ((uint64_t) buf[position + id_size] |
+                          (uint64_t) buf[position + id_size + 1] << 8 |
+                          (uint64_t) buf[position + id_size + 2] << 16 |
+                          (uint64_t) buf[position + id_size + 3] << 24);
+        }
 
-            if (!mlist) {
-                rem = PyBytes_FromStringAndSize(NULL, 0);
-                Py_XDECREF(key);
-                return rem;
-            }
+        if ((uint64_t) (position + id_size) + length > (uint64_t) size) break;
 
-            Py_XDECREF(key);
-            
-            if (rec_size)
-            {
-                if (rec_size + position + id_size > size) {
-                    break;
-                }
-                bts = PyBytes_FromStringAndSize((const char *)buf, (Py_ssize_t) rec_size);
-                PyList_Append(
-                    mlist,
-                    bts
-                );
-                Py_XDECREF(bts);
+        if (scatter) {
+            memcpy(slot->out, buf + position + id_size, (size_t) length);
+            slot->out += length;
+        }
+        else {
+            slot->total += length;
+        }
 
-                buf += rec_size;
+        position += id_size + (Py_ssize_t) length;
+    }
 
-            }
-            else
-            {
-                if (4 + position + id_size > size) {
-                    break;
-                }
-                rec_size = (buf[3] << 24) + (buf[2] << 16) +(buf[1] << 8) + buf[0];
-                length = rec_size + 4;
-                if (position + length + id_size > size) {
-                    break;
-                }
-                bts = PyBytes_FromStringAndSize((const char *)buf, (Py_ssize_t) length);
-                PyList_Append(mlist, bts);
-                Py_XDECREF(bts);
-                buf += length;
-            }
+    return position;
+}
 
-            position = (unsigned long long) (buf - orig);
-        } 
-        
-        while (head != NULL) {
-            item = head;
-            item->info.mlist = NULL;
-     
-            head = head->next;
-            item->next = NULL;
-            free(item);
+static PyObject* sort_data_records(PyObject* self, PyObject* args)
+{
+    Py_buffer data;
+    PyObject *record_size, *key, *value, *partial_records=NULL, *bts, *result=NULL;
+    Py_ssize_t id_size, count, pos=0, i=0, position, rem_position;
+    struct sort_slot *slots, slot;
+    int unknown_id, ignored;
+
+    if (!PyArg_ParseTuple(args, "y*O!n", &data, &PyDict_Type, &record_size, &id_size)) {
+        return NULL;
+    }
+
+    if (id_size < 1 || id_size > 8) {
+        PyBuffer_Release(&data);
+        PyErr_Format(PyExc_ValueError, "invalid record id size %zd", id_size);
+        return NULL;
+    }
+
+    count = PyDict_Size(record_size);
+    slots = (struct sort_slot *) calloc(count ? count : 1, sizeof(struct sort_slot));
+    if (!slots) {
+        PyBuffer_Release(&data);
+        return PyErr_NoMemory();
+    }
+
+    while (PyDict_Next(record_size, &pos, &key, &value)) {
+        slots[i].id = PyLong_AsUnsignedLongLong(key);
+        slots[i].size = PyLong_AsUnsignedLongLong(value);
+        slots[i].key = key;
+        if (PyErr_Occurred()) goto cleanup;
+        i++;
+    }
+
+    // the slots are sorted by record id for the binary search
+    for (i = 1; i < count; i++) {
+        slot = slots[i];
+        pos = i - 1;
+        while (pos >= 0 && slots[pos].id > slot.id) {
+            slots[pos + 1] = slots[pos];
+            pos--;
         }
-        
-        head = NULL;
-        last = NULL;
-        item = NULL;
-		mlist = NULL;
-		
-        rem = PyBytes_FromStringAndSize((const char *) (orig + position), (Py_ssize_t) (size - position));
-		
-		buf = NULL;
-		orig = NULL;
-		end = NULL;
-	
-        return rem;
+        slots[pos + 1] = slot;
+    }
+
+    // first pass: find the record boundaries and the bytes count of each record id
+    Py_BEGIN_ALLOW_THREADS
+    position = scan_sort_records((unsigned char *) data.buf, data.len, id_size, slots, count, 0, &unknown_id);
+    Py_END_ALLOW_THREADS
+
+    partial_records = PyDict_New();
+    if (!partial_records) goto cleanup;
+
+    for (i = 0; i < count; i++) {
+        if (!slots[i].total) continue;
+
+        bts = PyBytes_FromStringAndSize(NULL, (Py_ssize_t) slots[i].total);
+        if (!bts) goto cleanup;
+        slots[i].out = (unsigned char *) PyBytes_AS_STRING(bts);
+        if (PyDict_SetItem(partial_records, slots[i].key, bts) < 0) {
+            Py_DECREF(bts);
+            goto cleanup;
+        }
+        Py_DECREF(bts);
     }
+
+    // second pass: copy the records to the bytes of their record id
+    Py_BEGIN_ALLOW_THREADS
+    scan_sort_records((unsigned char *) data.buf, position, id_size, slots, count, 1, &ignored);
+    Py_END_ALLOW_THREADS
+
+    // the rest of the data is lost after an unknown record id
+    rem_position = unknown_id ? data.len : position;
+    bts = PyBytes_FromStringAndSize((const char *) data.buf + rem_position, data.len - rem_position);
+    if (!bts) goto cleanup;
+
+    result = PyTuple_Pack(2, partial_records, bts);
+    Py_DECREF(bts);
+
+cleanup:
+    Py_XDECREF(partial_records);
+    free(slots);
+    PyBuffer_Release(&data);
+
+    return result;
 }
 
 static Py_ssize_t calc_size(char* buf)
@@ -1134,6 +1159,7 @@ static PyObject* get_channel_raw_bytes(PyObject* self, PyObject* args)
 {
     Py_ssize_t count, size, actual_byte_count, delta;
     PyObject *data_block, *out;
+    Py_buffer buffer;
     
     Py_ssize_t record_size, byte_offset, byte_count;
 
@@ -1145,7 +1171,13 @@ static PyObject* get_channel_raw_bytes(PyObject* self, PyObject* args)
     }
     else
     {
-        size = PyBytes_GET_SIZE(data_block);
+        // any object that supports the buffer protocol can be used (bytes,
+        // bytearray or memoryview slices of a memory mapped file); this way
+        // only the channel bytes are copied from the data records
+        if (PyObject_GetBuffer(data_block, &buffer, PyBUF_SIMPLE) < 0) {
+            return 0;
+        }
+        size = buffer.len;
         if (!record_size) {
             out = PyByteArray_FromStringAndSize(NULL, 0);
         }
@@ -1156,17 +1188,19 @@ static PyObject* get_channel_raw_bytes(PyObject* self, PyObject* args)
             count = size / record_size;
             
             out = PyByteArray_FromStringAndSize(NULL, count * byte_count);
-            outptr = PyByteArray_AsString(out);
-            inptr = PyBytes_AsString(data_block);
-            
-            inptr += byte_offset;
-            
-            for (int i=0; i<count; i++) {
-                memcpy(outptr, inptr, actual_byte_count);
-                inptr += record_size;
-                outptr += actual_byte_count;
-                for (int j=0; j< delta; j++) {
-                    *outptr++ = '\0';
+            if (out) {
+                outptr = PyByteArray_AsString(out);
+                inptr = (char *) buffer.buf;
+
+                inptr += byte_offset;
+
+                for (Py_ssize_t i=0; i<count; i++) {
+                    memcpy(outptr, inptr, actual_byte_count);
+                    inptr += record_size;
+                    outptr += actual_byte_count;
+                    for (Py_ssize_t j=0; j< delta; j++) {
+                        *outptr++ = '\0';
+                    }
                 }
             }
         }
@@ -1174,20 +1208,22 @@ static PyObject* get_channel_raw_bytes(PyObject* self, PyObject* args)
             count = size / record_size;
        
             out = PyByteArray_FromStringAndSize(NULL, count * byte_count);
-            outptr = PyByteArray_AsString(out);
-            inptr = PyBytes_AsString(data_block);
-            
-            inptr += byte_offset;
-            
-            delta = record_size - byte_count;
-            
-            for (int i=0; i<count; i++) {
-                memcpy(outptr, inptr, byte_count);
-                inptr += record_size;
-                outptr += byte_count;
+            if (out) {
+                outptr = PyByteArray_AsString(out);
+                inptr = (char *) buffer.buf;
+
+                inptr += byte_offset;
+
+                for (Py_ssize_t i=0; i<count; i++) {
+                    memcpy(outptr, inptr, byte_count);
+                    inptr += record_size;
+                    outptr += byte_count;
+                }
             }
            
         }
+
+        PyBuffer_Release(&buffer);
    
         return out;
     }
@@ -1296,6 +1332,340 @@ static PyObject* get_idx_with_edges(PyObject* self, PyObject* args)
 }
 
 
+// the conversion tables lookups use the same ordering as numpy.searchsorted:
+// NaN values are sorted after all the other values
+#define LT_DOUBLE(a, b) ((a) < (b) || ((b) != (b) && (a) == (a)))
+#define LT_INT64(a, b) ((a) < (b))
+
+#define LOWER_BOUND(NAME, TYPE, LT)                                         \
+static inline npy_intp NAME(TYPE *keys, npy_intp count, TYPE value)         \
+{                                                                           \
+    npy_intp low = 0, high = count, middle;                                 \
+    while (low < high) {                                                    \
+        middle = low + ((high - low) >> 1);                                 \
+        if (LT(keys[middle], value)) low = middle + 1;                      \
+        else high = middle;                                                 \
+    }                                                                       \
+    return low;                                                             \
+}
+
+#define UPPER_BOUND(NAME, TYPE, LT)                                         \
+static inline npy_intp NAME(TYPE *keys, npy_intp count, TYPE value)         \
+{                                                                           \
+    npy_intp low = 0, high = count, middle;                                 \
+    while (low < high) {                                                    \
+        middle = low + ((high - low) >> 1);                                 \
+        if (LT(value, keys[middle])) high = middle;                         \
+        else low = middle + 1;                                              \
+    }                                                                       \
+    return low;                                                             \
+}
+
+LOWER_BOUND(lower_bound_double, double, LT_DOUBLE)
+UPPER_BOUND(upper_bound_double, double, LT_DOUBLE)
+LOWER_BOUND(lower_bound_int64, int64_t, LT_INT64)
+UPPER_BOUND(upper_bound_int64, int64_t, LT_INT64)
+
+
+#define LOOKUP_INDEXES(NAME, TYPE, LOWER, UPPER)                            \
+static void NAME(TYPE *values, npy_intp count, TYPE *keys, npy_intp keys_count, npy_intp *out) \
+{                                                                           \
+    npy_intp low, high;                                                     \
+    for (npy_intp i = 0; i < count; i++) {                                  \
+        low = LOWER(keys, keys_count, values[i]);                           \
+        high = UPPER(keys, keys_count, values[i]);                          \
+        out[i] = (high - low == 1) ? low : keys_count;                      \
+    }                                                                       \
+}
+
+LOOKUP_INDEXES(lookup_indexes_double, double, lower_bound_double, upper_bound_double)
+LOOKUP_INDEXES(lookup_indexes_int64, int64_t, lower_bound_int64, upper_bound_int64)
+
+
+#define RANGE_LOOKUP_INDEXES(NAME, TYPE, LOWER, UPPER)                      \
+static void NAME(TYPE *values, npy_intp count, TYPE *lower, TYPE *upper, npy_intp keys_count, npy_intp *out) \
+{                                                                           \
+    npy_intp idx1, idx2;                                                    \
+    for (npy_intp i = 0; i < count; i++) {                                  \
+        idx1 = UPPER(lower, keys_count, values[i]) - 1;                     \
+        idx2 = LOWER(upper, keys_count, values[i]);                         \
+        out[i] = (idx1 == idx2) ? idx1 : keys_count;                        \
+    }                                                                       \
+}
+
+RANGE_LOOKUP_INDEXES(range_lookup_indexes_double, double, lower_bound_double, upper_bound_double)
+RANGE_LOOKUP_INDEXES(range_lookup_indexes_int64, int64_t, lower_bound_int64, upper_bound_int64)
+
+
+static int check_lookup_arrays(PyArrayObject **arrays, int count)
+{
+    int type_num = PyArray_TYPE(arrays[0]);
+
+    if (type_num != NPY_DOUBLE && type_num != NPY_INT64) {
+        PyErr_SetString(PyExc_TypeError, "the arrays must have the float64 or int64 dtype");
+        return -1;
+    }
+
+    for (int i = 0; i < count; i++) {
+        if (PyArray_NDIM(arrays[i]) != 1 || !PyArray_IS_C_CONTIGUOUS(arrays[i]) || PyArray_TYPE(arrays[i]) != type_num) {
+            PyErr_SetString(PyExc_TypeError, "the arrays must be 1D, C contiguous and have the same dtype");
+            return -1;
+        }
+    }
+
+    return type_num;
+}
+
+
+static PyObject* lookup_indexes(PyObject* self, PyObject* args)
+{
+    PyArrayObject *values, *keys, *result;
+    PyArrayObject *arrays[2];
+    npy_intp dims[1];
+    int type_num;
+
+    if (!PyArg_ParseTuple(args, "O!O!", &PyArray_Type, &values, &PyArray_Type, &keys)) {
+        return NULL;
+    }
+
+    arrays[0] = values;
+    arrays[1] = keys;
+    type_num = check_lookup_arrays(arrays, 2);
+    if (type_num < 0) return NULL;
+
+    dims[0] = PyArray_SIZE(values);
+    result = (PyArrayObject *) PyArray_EMPTY(1, dims, NPY_INTP, 0);
+    if (!result) return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+    if (type_num == NPY_DOUBLE) {
+        lookup_indexes_double(
+            (double *) PyArray_DATA(values), dims[0],
+            (double *) PyArray_DATA(keys), PyArray_SIZE(keys),
+            (npy_intp *) PyArray_DATA(result)
+        );
+    }
+    else {
+        lookup_indexes_int64(
+            (int64_t *) PyArray_DATA(values), dims[0],
+            (int64_t *) PyArray_DATA(keys), PyArray_SIZE(keys),
+            (npy_intp *) PyArray_DATA(result)
+        );
+    }
+    Py_END_ALLOW_THREADS
+
+    return (PyObject *) result;
+}
+
+
+static PyObject* range_lookup_indexes(PyObject* self, PyObject* args)
+{
+    PyArrayObject *values, *lower, *upper, *result;
+    PyArrayObject *arrays[3];
+    npy_intp dims[1];
+    int type_num;
+
+    if (!PyArg_ParseTuple(args, "O!O!O!", &PyArray_Type, &values, &PyArray_Type, &lower, &PyArray_Type, &upper)) {
+        return NULL;
+    }
+
+    arrays[0] = values;
+    arrays[1] = lower;
+    arrays[2] = upper;
+    type_num = check_lookup_arrays(arrays, 3);
+    if (type_num < 0) return NULL;
+
+    if (PyArray_SIZE(lower) != PyArray_SIZE(upper)) {
+        PyErr_SetString(PyExc_ValueError, "the lower and upper arrays must have the same size");
+        return NULL;
+    }
+
+    dims[0] = PyArray_SIZE(values);
+    result = (PyArrayObject *) PyArray_EMPTY(1, dims, NPY_INTP, 0);
+    if (!result) return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+    if (type_num == NPY_DOUBLE) {
+        range_lookup_indexes_double(
+            (double *) PyArray_DATA(values), dims[0],
+            (double *) PyArray_DATA(lower), (double *) PyArray_DATA(upper), PyArray_SIZE(lower),
+            (npy_intp *) PyArray_DATA(result)
+        );
+    }
+    else {
+        range_lookup_indexes_int64(
+            (int64_t *) PyArray_DATA(values), dims[0],
+            (int64_t *) PyArray_DATA(lower), (int64_t *) PyArray_DATA(upper), PyArray_SIZE(lower),
+            (npy_intp *) PyArray_DATA(result)
+        );
+    }
+    Py_END_ALLOW_THREADS
+
+    return (PyObject *) result;
+}
+
+
+static PyObject* nearest_indexes(PyObject* self, PyObject* args)
+{
+    PyArrayObject *values, *keys, *result;
+    PyArrayObject *arrays[2];
+    npy_intp dims[1], count, keys_count, idx1, idx2;
+    double *values_ptr, *keys_ptr, value;
+    npy_intp *out;
+
+    if (!PyArg_ParseTuple(args, "O!O!", &PyArray_Type, &values, &PyArray_Type, &keys)) {
+        return NULL;
+    }
+
+    arrays[0] = values;
+    arrays[1] = keys;
+    if (check_lookup_arrays(arrays, 2) != NPY_DOUBLE) {
+        if (!PyErr_Occurred()) PyErr_SetString(PyExc_TypeError, "the arrays must have the float64 dtype");
+        return NULL;
+    }
+
+    keys_count = PyArray_SIZE(keys);
+    if (!keys_count) {
+        PyErr_SetString(PyExc_ValueError, "the keys array is empty");
+        return NULL;
+    }
+
+    count = PyArray_SIZE(values);
+    dims[0] = count;
+    result = (PyArrayObject *) PyArray_EMPTY(1, dims, NPY_INTP, 0);
+    if (!result) return NULL;
+
+    values_ptr = (double *) PyArray_DATA(values);
+    keys_ptr = (double *) PyArray_DATA(keys);
+    out = (npy_intp *) PyArray_DATA(result);
+
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp i = 0; i < count; i++) {
+        value = values_ptr[i];
+        idx1 = lower_bound_double(keys_ptr, keys_count, value);
+        if (idx1 >= keys_count) idx1 = keys_count - 1;
+        idx2 = idx1 ? idx1 - 1 : 0;
+
+        out[i] = (fabs(value - keys_ptr[idx1]) >= fabs(value - keys_ptr[idx2])) ? idx2 : idx1;
+    }
+    Py_END_ALLOW_THREADS
+
+    return (PyObject *) result;
+}
+
+
+static PyObject* extract_bit_fields(PyObject* self, PyObject* args)
+{
+    PyArrayObject *payload, *plan, *result, *rows_array=NULL;
+    PyObject *rows;
+    npy_intp dims[2], row_count, columns, row_stride, column_stride, fields, row;
+    int64_t *plan_ptr;
+    npy_intp *rows_ptr=NULL;
+    uint64_t *out, value, mask;
+    unsigned char *data, *record;
+    int64_t start_byte, byte_count, bit_offset, bit_count, big_endian;
+
+    if (!PyArg_ParseTuple(args, "O!OO!", &PyArray_Type, &payload, &rows, &PyArray_Type, &plan)) {
+        return NULL;
+    }
+
+    if (PyArray_NDIM(payload) != 2 || PyArray_TYPE(payload) != NPY_UINT8) {
+        PyErr_SetString(PyExc_TypeError, "the payload must be a 2D uint8 array");
+        return NULL;
+    }
+
+    if (PyArray_NDIM(plan) != 2 || PyArray_DIM(plan, 1) != 5 || !PyArray_IS_C_CONTIGUOUS(plan) || PyArray_TYPE(plan) != NPY_INT64) {
+        PyErr_SetString(PyExc_TypeError, "the plan must be a C contiguous int64 array with 5 columns");
+        return NULL;
+    }
+
+    columns = PyArray_DIM(payload, 1);
+    row_stride = PyArray_STRIDE(payload, 0);
+    column_stride = PyArray_STRIDE(payload, 1);
+    fields = PyArray_DIM(plan, 0);
+    plan_ptr = (int64_t *) PyArray_DATA(plan);
+
+    for (npy_intp i = 0; i < fields; i++) {
+        start_byte = plan_ptr[i * 5];
+        byte_count = plan_ptr[i * 5 + 1];
+        bit_offset = plan_ptr[i * 5 + 2];
+        bit_count = plan_ptr[i * 5 + 3];
+        if (start_byte < 0 || byte_count < 1 || byte_count > 8 || start_byte + byte_count > columns ||
+            bit_offset < 0 || bit_count < 1 || bit_count > 64 || bit_offset + bit_count > byte_count * 8) {
+            PyErr_Format(PyExc_ValueError, "invalid bit field %zd for a payload with %zd bytes", i, columns);
+            return NULL;
+        }
+    }
+
+    if (rows == Py_None) {
+        row_count = PyArray_DIM(payload, 0);
+    }
+    else {
+        rows_array = (PyArrayObject *) PyArray_FROM_OTF(rows, NPY_INTP, NPY_ARRAY_IN_ARRAY);
+        if (!rows_array) return NULL;
+        if (PyArray_NDIM(rows_array) != 1) {
+            Py_DECREF(rows_array);
+            PyErr_SetString(PyExc_TypeError, "the rows must be a 1D array");
+            return NULL;
+        }
+        row_count = PyArray_SIZE(rows_array);
+        rows_ptr = (npy_intp *) PyArray_DATA(rows_array);
+        for (npy_intp i = 0; i < row_count; i++) {
+            if (rows_ptr[i] < 0 || rows_ptr[i] >= PyArray_DIM(payload, 0)) {
+                Py_DECREF(rows_array);
+                PyErr_SetString(PyExc_IndexError, "row index out of bounds");
+                return NULL;
+            }
+        }
+    }
+
+    dims[0] = fields;
+    dims[1] = row_count;
+    result = (PyArrayObject *) PyArray_EMPTY(2, dims, NPY_UINT64, 0);
+    if (!result) {
+        Py_XDECREF(rows_array);
+        return NULL;
+    }
+
+    data = (unsigned char *) PyArray_DATA(payload);
+    out = (uint64_t *) PyArray_DATA(result);
+
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp i = 0; i < row_count; i++) {
+        row = rows_ptr ? rows_ptr[i] : i;
+        record = data + row * row_stride;
+
+        for (npy_intp j = 0; j < fields; j++) {
+            start_byte = plan_ptr[j * 5];
+            byte_count = plan_ptr[j * 5 + 1];
+            bit_offset = plan_ptr[j * 5 + 2];
+            bit_count = plan_ptr[j * 5 + 3];
+            big_endian = plan_ptr[j * 5 + 4];
+
+            value = 0;
+            if (big_endian) {
+                for (int64_t k = 0; k < byte_count; k++) {
+                    value = (value << 8) | record[(start_byte + k) * column_stride];
+                }
+            }
+            else {
+                for (int64_t k = byte_count - 1; k >= 0; k--) {
+                    value = (value << 8) | record[(start_byte + k) * column_stride];
+                }
+            }
+
+            mask = bit_count == 64 ? UINT64_MAX : (((uint64_t) 1) << bit_count) - 1;
+            out[j * row_count + i] = (value >> bit_offset) & mask;
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    Py_XDECREF(rows_array);
+
+    return (PyObject *) result;
+}
+
+
 // Our Module's Function Definition struct
 // We require this `NULL` to signal the end of our method
 // definition
@@ -1305,11 +1675,15 @@ static PyMethodDef myMethods[] =
     { "lengths", lengths, METH_VARARGS, "lengths" },
     { "get_vlsd_offsets", get_vlsd_offsets, METH_VARARGS, "get_vlsd_offsets" },
     { "get_vlsd_max_sample_size", get_vlsd_max_sample_size, METH_VARARGS, "get_vlsd_max_sample_size" },
-    { "sort_data_block", sort_data_block, METH_VARARGS, "sort raw data group block" },
+    { "sort_data_records", sort_data_records, METH_VARARGS, "split the records of an unsorted data block by record id" },
     { "positions", positions, METH_VARARGS, "positions" },
     { "get_channel_raw_bytes", get_channel_raw_bytes, METH_VARARGS, "get_channel_raw_bytes" },
     { "data_block_from_arrays", data_block_from_arrays, METH_VARARGS, "data_block_from_arrays" },
     { "get_idx_with_edges", get_idx_with_edges, METH_VARARGS, "get_idx_with_edges" },
+    { "lookup_indexes", lookup_indexes, METH_VARARGS, "indexes of the values in the sorted conversion keys" },
+    { "range_lookup_indexes", range_lookup_indexes, METH_VARARGS, "indexes of the conversion ranges that contain the values" },
+    { "nearest_indexes", nearest_indexes, METH_VARARGS, "indexes of the nearest conversion keys" },
+    { "extract_bit_fields", extract_bit_fields, METH_VARARGS, "extract the bit fields of the selected payload rows" },
     
     
     { NULL, NULL, 0, NULL }
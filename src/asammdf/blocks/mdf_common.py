@@ -7,6 +7,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from numpy import searchsorted
 from numpy.typing import NDArray
 
 from .utils import MdfException
@@ -22,6 +23,50 @@ class MDF_Common:
     def _set_temporary_master(self, master: NDArray[Any] | None) -> None:
         self._master = master
 
+    def get_record_window(
+        self,
+        index: int,
+        start: float | None = None,
+        stop: float | None = None,
+    ) -> tuple[int, int]:
+        """record offset and record count of the group *index* that contain
+        all the samples between *start* and *stop*, and the samples right
+        before *start* and right after *stop* (needed for interpolation)
+
+        .. versionadded:: 7.5.0
+
+        Parameters
+        ----------
+        index : int
+            group index
+        start : float | None
+            start timestamp; default *None* for the start of the measurement
+        stop : float | None
+            stop timestamp; default *None* for the end of the measurement
+
+        Returns
+        -------
+        record_offset, record_count : int, int
+            records window
+
+        """
+
+        cycles_nr = self.groups[index].channel_group.cycles_nr
+        if start is None and stop is None:
+            return 0, cycles_nr
+
+        timestamps = self.get_master(index)
+
+        offset = 0
+        if start is not None:
+            offset = max(int(searchsorted(timestamps, start, side="left")) - 1, 0)
+
+        end = cycles_nr
+        if stop is not None:
+            end = min(int(searchsorted(timestamps, stop, side="right")) + 1, cycles_nr)
+
+        return offset, max(end - offset, 0)
+
     # @lru_cache(maxsize=1024)
     def _validate_channel_selection(
         self,
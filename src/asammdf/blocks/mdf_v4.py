@@ -5,11 +5,12 @@ ASAM MDF version 4 file format module
 from __future__ import annotations
 
 import bisect
-from collections import defaultdict
-from collections.abc import Iterator, Sequence
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future
 from copy import deepcopy
 from datetime import datetime
-from functools import lru_cache
+from functools import lru_cache, partial
 from hashlib import md5
 from io import BufferedReader, BytesIO
 import logging
@@ -17,12 +18,15 @@ from math import ceil, floor
 import mmap
 import os
 from pathlib import Path
+import pickle
 import re
 import shutil
 import sys
 from tempfile import gettempdir, NamedTemporaryFile
+from threading import RLock
 from traceback import format_exc
 from typing import Any, overload
+from weakref import finalize
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from typing_extensions import Literal
@@ -54,6 +58,7 @@ from numpy import (
     frombuffer,
     full,
     linspace,
+    ndarray,
     nonzero,
     searchsorted,
     transpose,
@@ -102,18 +107,18 @@ from .utils import (
     fmt_to_datatype_v4,
     get_fmt_v4,
     get_text_v4,
+    get_thread_pool,
     Group,
     InvalidationBlockInfo,
     is_file_like,
     load_can_database,
+    LockedIterator,
     MdfException,
     SignalDataBlockInfo,
     TERMINATED,
-    UINT8_uf,
-    UINT16_uf,
+    ThreadSafeStream,
     UINT32_p,
     UINT32_uf,
-    UINT64_uf,
     UniqueDB,
     validate_version_argument,
     VirtualChannelGroup,
@@ -133,6 +138,7 @@ from .v4_blocks import (
     FileIdentificationBlock,
     HeaderBlock,
     HeaderList,
+    LazyChannelMetadata,
     ListData,
     SourceInformation,
     TextBlock,
@@ -158,11 +164,39 @@ EMPTY_TUPLE = ()
 
 # 100 extra steps for the sorting, 1 step after sorting and 1 step at finish
 SORT_STEPS = 102
+# the unsorted DT blocks are split by record id in fragments of this size
+SORT_FRAGMENT_SIZE = 32 * 1024 * 1024
+
+# increment when the layout of the pickled objects (for example Channel or
+# LazyChannelMetadata) changes; the library version is also part of the index key
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".asammdf_index"
+INDEX_HASH_SIZE = 64 * 1024
+INDEX_ATTRIBUTES = (
+    "identification",
+    "header",
+    "version",
+    "file_limit",
+    "file_history",
+    "attachments",
+    "groups",
+    "channels_db",
+    "masters_db",
+    "events",
+    "bus_logging_map",
+    "virtual_groups",
+    "virtual_groups_map",
+    "progress",
+)
+
+
+# records between the anchors of the time index built from the master channel
+TIME_INDEX_STEP = 2**16
 
 
 logger = logging.getLogger("asammdf")
 
-__all__ = ["MDF4"]
+__all__ = ["MDF4", "index_file_name"]
 
 
 from .cutils import (
@@ -170,10 +204,52 @@ from .cutils import (
     extract,
     get_channel_raw_bytes,
     get_vlsd_max_sample_size,
-    sort_data_block,
+    sort_data_records,
 )
 
 
+def index_file_name(name: StrPathType) -> Path:
+    """get the name of the index file used for the measurement file *name*"""
+    name = Path(name)
+    return name.with_name(name.name + INDEX_SUFFIX)
+
+
+def _decompress_data_block(
+    data: bytes, block_type: int, original_size: int, param: int, block_limit: int | None = None
+) -> bytes:
+    """decompress the raw bytes of a DZ block; uncompressed (DT) bytes are
+    returned unchanged. This is called from the decompression worker threads
+    so it must not touch any shared state"""
+    if block_type == v4c.DZ_BLOCK_DEFLATE:
+        data = decompress(data, bufsize=original_size)
+    elif block_type == v4c.DZ_BLOCK_TRANSPOSED:
+        data = decompress(data, bufsize=original_size)
+        cols = param
+        lines = original_size // cols
+
+        nd = frombuffer(data[: lines * cols], dtype=uint8)
+        nd = nd.reshape((cols, lines))
+        data = nd.T.ravel().tobytes() + data[lines * cols :]
+    elif block_type == v4c.DZ_BLOCK_LZ:
+        data = lz_decompress(data)
+
+    if block_limit is not None:
+        data = data[:block_limit]
+
+    return data
+
+
+def _release_mapped_file(file: BufferedReader, temporary: Path | None) -> None:
+    """close the file used by a memory mapping that outlived its MDF4 object
+    and remove it if it is a temporary file"""
+    file.close()
+    if temporary is not None:
+        try:
+            temporary.unlink()
+        except OSError:
+            pass
+
+
 class MDF4(MDF_Common):
     """The *header* attibute is a *HeaderBlock*.
 
@@ -214,13 +290,38 @@ class MDF4(MDF_Common):
     remove_source_from_channel_names (True) : bool
 
     copy_on_get (True) : bool
-        copy channel values (np.array) to avoid high memory usage
+        copy channel values (np.array) to avoid high memory usage. If *False*,
+        the samples of byte aligned channels from groups stored in a single
+        uncompressed DTBLOCK are returned as read-only arrays that use the
+        memory mapped file as buffer (zero-copy)
     compact_vlsd (False) : bool
         use slower method to save the exact sample size for VLSD channels
     column_storage (True) : bool
         use column storage for MDF version >= 4.20
     password : bytes | str
         use this password to decode encrypted attachments
+    use_index (False) : bool
+        store the parsed file structure in an index file next to the
+        measurement file and use it on the next opening of the same file to
+        skip the parsing of the blocks. The index is validated against the
+        library version, file size, modification time and a hash of the file
+        start; it is not used for unfinalized or unsorted files.
+
+        .. warning::
+
+            the index file is loaded with *pickle*, so a crafted index file can
+            execute arbitrary code. Only enable this option for measurement
+            files in folders where nobody else can write to
+    lazy_channels (False) : bool
+        read the channel conversion, source and comment (if *use_display_names*
+        is *False*) blocks from the file only when they are first accessed.
+        This reduces the loading time for files with many channels, but the
+        file must stay open while the channel metadata is used
+    thread_safe (False) : bool
+        allow concurrent *get* and *select* calls from several threads on the
+        same object. Memory mapped files are always read without a shared
+        file position; for the other file objects, this wraps the file in a
+        stream that keeps the file position per thread
 
     Attributes
     ----------
@@ -314,6 +415,9 @@ class MDF4(MDF_Common):
 
         self._read_fragment_size = get_global_option("read_fragment_size")
         self._write_fragment_size = get_global_option("write_fragment_size")
+        self._decompression_workers = get_global_option("decompression_workers")
+        self._decompression_prefetch = get_global_option("decompression_prefetch")
+        self._compression_workers = get_global_option("compression_workers")
         self._single_bit_uint_as_bool = get_global_option("single_bit_uint_as_bool")
         self._integer_interpolation = get_global_option("integer_interpolation")
         self._float_interpolation = get_global_option("float_interpolation")
@@ -332,6 +436,11 @@ class MDF4(MDF_Common):
         self._force_attachment_encryption = kwargs.get("force_attachment_encryption", False)
         self.copy_on_get = kwargs.get("copy_on_get", True)
         self.compact_vlsd = kwargs.get("compact_vlsd", False)
+        self._use_index = kwargs.get("use_index", False)
+        self._thread_safe = kwargs.get("thread_safe", False)
+        self._lock = RLock()
+        self._lazy_channels = kwargs.get("lazy_channels", False)
+        self._lazy_metadata = None
 
         self.virtual_groups = {}  # master group 2 referencing groups
         self.virtual_groups_map = {}  # group index 2 master group
@@ -339,6 +448,7 @@ class MDF4(MDF_Common):
         self.vlsd_max_length = {}  # hint about the maximum vlsd length for group_index, name pairs
 
         self._master = None
+        self._time_indexes = {}
 
         self.last_call_info = None
 
@@ -347,12 +457,13 @@ class MDF4(MDF_Common):
 
         self._delete_on_close = False
         self._mapped_file = None
+        self._mapped = False
 
         progress = kwargs.get("progress", None)
 
         if name:
             if is_file_like(name):
-                self._file = name
+                self._file = self._thread_safe_stream(name)
                 self.name = self.original_name = Path("From_FileLike.mf4")
                 self._from_filelike = True
                 self._read(mapped=False, progress=progress)
@@ -367,22 +478,27 @@ class MDF4(MDF_Common):
                     tmpdir = Path(gettempdir())
                     self.name = tmpdir / f"{os.urandom(6).hex()}_{Path(name).name}"
                     shutil.copy(name, self.name)
-                    self._file = open(self.name, "rb+")
+                    self._file = self._thread_safe_stream(open(self.name, "rb+"))
                     self._from_filelike = False
                     self._delete_on_close = True
                     self._read(mapped=False, progress=progress)
                 else:
                     if sys.maxsize < 2**32:
                         self.name = Path(name)
-                        self._file = open(self.name, "rb")
+                        self._file = self._thread_safe_stream(open(self.name, "rb"))
                         self._from_filelike = False
-                        self._read(mapped=False, progress=progress)
+                        mapped = False
                     else:
                         self.name = Path(name)
                         self._mapped_file = open(self.name, "rb")
                         self._file = mmap.mmap(self._mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
                         self._from_filelike = False
-                        self._read(mapped=True, progress=progress)
+                        mapped = True
+
+                    if not (self._use_index and self._load_index(mapped=mapped)):
+                        self._read(mapped=mapped, progress=progress)
+                        if self._use_index:
+                            self._save_index()
 
         else:
             self._from_filelike = False
@@ -402,6 +518,27 @@ class MDF4(MDF_Common):
     def __del__(self) -> None:
         self.close()
 
+    def _thread_safe_stream(self, stream: ReadableBufferType) -> ReadableBufferType:
+        """wrap the file object if the thread safe read mode is used"""
+        if self._thread_safe:
+            return ThreadSafeStream(stream)
+        else:
+            return stream
+
+    def _read_block(self, stream: ReadableBufferType, address: int, size: int) -> bytes:
+        """read *size* bytes starting from *address* without relying on a
+        shared stream position for memory maps and thread safe streams"""
+        if isinstance(stream, mmap.mmap):
+            return stream[address : address + size]
+        elif isinstance(stream, ThreadSafeStream):
+            # the stream position is kept per thread
+            stream.seek(address)
+            return stream.read(size)
+        else:
+            with self._lock:
+                stream.seek(address)
+                return stream.read(size)
+
     def _check_finalised(self) -> int:
         flags = self.identification["unfinalized_standard_flags"]
 
@@ -481,6 +618,9 @@ class MDF4(MDF_Common):
 
         stream = self._file
 
+        if self._lazy_channels:
+            self._lazy_metadata = LazyChannelMetadata(stream, mapped=mapped, lock=self._lock)
+
         self.header = HeaderBlock(address=0x40, stream=stream, mapped=mapped)
 
         # read file history
@@ -618,14 +758,17 @@ class MDF4(MDF_Common):
                 total_size = int(10**12)
                 inval_total_size = int(10**12)
 
-            data_blocks_info = self._get_data_blocks_info(
-                address=address,
-                stream=stream,
-                block_type=block_type,
-                mapped=mapped,
-                total_size=total_size,
-                inval_total_size=inval_total_size,
-                record_size=record_size,
+            data_blocks_info = LockedIterator(
+                self._get_data_blocks_info(
+                    address=address,
+                    stream=stream,
+                    block_type=block_type,
+                    mapped=mapped,
+                    total_size=total_size,
+                    inval_total_size=inval_total_size,
+                    record_size=record_size,
+                ),
+                self._lock,
             )
             data_blocks = []
             uses_ld = self._uses_ld(
@@ -795,6 +938,99 @@ class MDF4(MDF_Common):
 
         self.progress = cg_count, cg_count
 
+    def _index_key(self) -> tuple:
+        """the key used to validate the index file: library version, file size,
+        modification time, hash of the file start and the loading options that
+        change the parsed structure"""
+        stat = self.name.stat()
+        self._file.seek(0)
+        digest = md5(self._file.read(INDEX_HASH_SIZE)).hexdigest()
+
+        return (
+            tool.__version__,
+            stat.st_size,
+            stat.st_mtime_ns,
+            digest,
+            self._use_display_names,
+            self._remove_source_from_channel_names,
+            self._kwargs.get("process_bus_logging", True),
+            sorted(self.load_filter) if self.use_load_filter else None,
+        )
+
+    def _load_index(self, mapped: bool = False) -> bool:
+        """restore the parsed file structure from the index file
+
+        Returns
+        -------
+        loaded : bool
+            *True* if a valid index was found and loaded
+
+        """
+
+        index_file = index_file_name(self.name)
+        if not index_file.is_file():
+            return False
+
+        try:
+            with open(index_file, "rb") as f:
+                index = pickle.load(f)
+            valid = index["version"] == INDEX_VERSION and index["key"] == self._index_key()
+        except:
+            logger.warning(f"Cannot load the index file {index_file}; the file will be parsed\n{format_exc()}")
+            return False
+
+        if not valid:
+            return False
+
+        for attr, value in index["state"].items():
+            setattr(self, attr, value)
+
+        self._mapped = mapped
+
+        return True
+
+    def _save_index(self) -> None:
+        """store the parsed file structure in the index file"""
+
+        # sorted data is stored in the temporary file, so the index would be useless
+        if any(grp.data_location != v4c.LOCATION_ORIGINAL_FILE for grp in self.groups):
+            return
+
+        index_file = index_file_name(self.name)
+
+        try:
+            for grp in self.groups:
+                # resolve the lazily loaded data blocks info
+                for _ in grp.get_data_blocks():
+                    pass
+                grp.data_blocks_info_generator = iter(EMPTY_TUPLE)
+
+                for i, signal_data in enumerate(grp.signal_data):
+                    if signal_data is not None:
+                        for _ in grp.get_signal_data_blocks(i):
+                            pass
+                        grp.signal_data[i] = signal_data[0], iter(EMPTY_TUPLE)
+
+                # the lazily loaded channel metadata references the file handle
+                for channel in grp.channels:
+                    channel.comment = channel.comment
+                    channel.conversion = channel.conversion
+                    channel.source = channel.source
+
+            index = {
+                "version": INDEX_VERSION,
+                "key": self._index_key(),
+                "state": {attr: getattr(self, attr) for attr in INDEX_ATTRIBUTES},
+            }
+
+            tmp_file = index_file.with_suffix(f".{os.urandom(6).hex()}.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, index_file)
+
+        except:
+            logger.warning(f"Cannot write the index file {index_file}\n{format_exc()}")
+
     def _read_channels(
         self,
         ch_addr: int,
@@ -885,7 +1121,10 @@ class MDF4(MDF_Common):
                     or (use_display_names and any(dsp_name in self.load_filter for dsp_name in display_names))
                 ):
                     if comment is None:
-                        comment = get_text_v4(comment_addr, stream, mapped=mapped)
+                        if self._lazy_metadata is None:
+                            comment = get_text_v4(comment_addr, stream, mapped=mapped)
+                        else:
+                            comment = self._lazy_metadata
                     channel = Channel(
                         address=ch_addr,
                         stream=stream,
@@ -897,6 +1136,7 @@ class MDF4(MDF_Common):
                         tx_map=self._interned_strings,
                         file_limit=self.file_limit,
                         parsed_strings=(name, display_names, comment),
+                        lazy_metadata=self._lazy_metadata,
                     )
 
                 elif not component_addr:
@@ -941,6 +1181,7 @@ class MDF4(MDF_Common):
                     tx_map=self._interned_strings,
                     file_limit=self.file_limit,
                     parsed_strings=None,
+                    lazy_metadata=self._lazy_metadata,
                 )
 
             if channel.data_type not in VALID_DATA_TYPES:
@@ -974,7 +1215,9 @@ class MDF4(MDF_Common):
             # signal data
             cn_data_addr = channel.data_block_addr
             if cn_data_addr:
-                grp.signal_data.append(([], self._get_signal_data_blocks_info(cn_data_addr, stream)))
+                grp.signal_data.append(
+                    ([], LockedIterator(self._get_signal_data_blocks_info(cn_data_addr, stream), self._lock))
+                )
             else:
                 grp.signal_data.append(None)
 
@@ -1193,6 +1436,137 @@ class MDF4(MDF_Common):
 
         return ch_cntr, composition, composition_dtype
 
+    def _prefetch_data_blocks(
+        self,
+        blocks: Iterator[tuple[DataBlockInfo | SignalDataBlockInfo, ReadableBufferType | None]],
+    ) -> Iterator[tuple[DataBlockInfo | SignalDataBlockInfo, bytes | None]]:
+        """read and decompress data blocks in the order given by *blocks*
+
+        The raw block bytes are always read on the calling thread. If the
+        *decompression_workers* option is set, the DZ blocks are decompressed in
+        a shared thread pool, up to *decompression_prefetch* blocks ahead of
+        the block that is currently consumed.
+
+        Parameters
+        ----------
+        blocks : iterator
+            (block info, stream) pairs; the stream is *None* for the blocks
+            that can be skipped
+
+        Yields
+        ------
+        info, data : (DataBlockInfo | SignalDataBlockInfo, bytes | None)
+            block info and uncompressed block bytes; *data* is *None* for the
+            skipped blocks
+
+        """
+
+        workers = self._decompression_workers
+
+        if not workers:
+            for info, stream in blocks:
+                if stream is None:
+                    yield info, None
+                else:
+                    yield info, _decompress_data_block(
+                        self._read_block(stream, info.address, info.compressed_size),
+                        info.block_type,
+                        info.original_size,
+                        info.param,
+                        getattr(info, "block_limit", None),
+                    )
+
+        else:
+            submit = get_thread_pool(workers).submit
+            depth = self._decompression_prefetch + 1
+            pending = deque()
+
+            try:
+                for info, stream in blocks:
+                    if stream is None:
+                        data = None
+                    else:
+                        data = self._read_block(stream, info.address, info.compressed_size)
+                        args = (
+                            data,
+                            info.block_type,
+                            info.original_size,
+                            info.param,
+                            getattr(info, "block_limit", None),
+                        )
+                        if info.block_type == v4c.DT_BLOCK:
+                            data = _decompress_data_block(*args)
+                        else:
+                            data = submit(_decompress_data_block, *args)
+
+                    pending.append((info, data))
+
+                    if len(pending) >= depth:
+                        info, data = pending.popleft()
+                        if isinstance(data, Future):
+                            data = data.result()
+                        yield info, data
+
+                while pending:
+                    info, data = pending.popleft()
+                    if isinstance(data, Future):
+                        data = data.result()
+                    yield info, data
+
+            finally:
+                for _, data in pending:
+                    if isinstance(data, Future):
+                        data.cancel()
+
+    def _build_data_blocks(
+        self,
+        fragments: Iterator[bytes],
+        build_block: Callable[..., DataBlock | DataZippedBlock],
+    ) -> Iterator[DataBlock | DataZippedBlock]:
+        """build the data blocks for the *fragments* in their original order
+
+        If the *compression_workers* option is set, the blocks are built
+        (compressed) in a shared thread pool while the calling thread keeps
+        reading the next fragments and writing the finished blocks.
+
+        Parameters
+        ----------
+        fragments : iterator
+            raw bytes of each data block
+        build_block : callable
+            called with the *data* keyword argument to create each block
+
+        Yields
+        ------
+        block : DataBlock | DataZippedBlock
+            new data block
+
+        """
+
+        workers = self._compression_workers
+
+        if not workers:
+            for data in fragments:
+                yield build_block(data=data)
+
+        else:
+            submit = get_thread_pool(workers).submit
+            pending = deque()
+
+            try:
+                for data in fragments:
+                    pending.append(submit(build_block, data=data))
+
+                    if len(pending) >= 2 * workers:
+                        yield pending.popleft().result()
+
+                while pending:
+                    yield pending.popleft().result()
+
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def _load_signal_data(
         self,
         group: Group | None = None,
@@ -1224,80 +1598,47 @@ class MDF4(MDF_Common):
 
             if info_blocks is not None:
                 if start_offset is None and end_offset is None:
-                    for info in group.get_signal_data_blocks(index):
-                        address, original_size, compressed_size, block_type, param = (
-                            info.address,
-                            info.original_size,
-                            info.compressed_size,
-                            info.block_type,
-                            info.param,
-                        )
 
-                        if not info.original_size:
-                            continue
-                        if info.location == v4c.LOCATION_TEMPORARY_FILE:
-                            stream = self._tempfile
-                        else:
-                            stream = self._file
-
-                        stream.seek(address)
-                        new_data = stream.read(compressed_size)
-                        if block_type == v4c.DZ_BLOCK_DEFLATE:
-                            new_data = decompress(new_data, bufsize=original_size)
-                        elif block_type == v4c.DZ_BLOCK_TRANSPOSED:
-                            new_data = decompress(new_data, bufsize=original_size)
-                            cols = param
-                            lines = original_size // cols
-
-                            nd = frombuffer(new_data[: lines * cols], dtype=uint8)
-                            nd = nd.reshape((cols, lines))
-                            new_data = nd.T.ravel().tobytes() + new_data[lines * cols :]
-                        elif block_type == v4c.DZ_BLOCK_LZ:
-                            new_data = lz_decompress(new_data)
+                    def needed_blocks():
+                        for info in group.get_signal_data_blocks(index):
+                            if not info.original_size:
+                                yield info, None
+                            elif info.location == v4c.LOCATION_TEMPORARY_FILE:
+                                yield info, self._tempfile
+                            else:
+                                yield info, self._file
 
-                        data.append(new_data)
+                    for info, new_data in self._prefetch_data_blocks(needed_blocks()):
+                        if new_data is not None:
+                            data.append(new_data)
 
                 else:
                     start_offset = int(start_offset)
                     end_offset = int(end_offset)
 
+                    def needed_blocks():
+                        position = 0
+                        for info in group.get_signal_data_blocks(index):
+                            if not info.original_size or position + info.original_size < start_offset:
+                                yield info, None
+                            elif info.location == v4c.LOCATION_TEMPORARY_FILE:
+                                yield info, self._tempfile
+                            else:
+                                yield info, self._file
+                            position += info.original_size
+
                     current_offset = 0
 
-                    for info in group.get_signal_data_blocks(index):
-                        address, original_size, compressed_size, block_type, param = (
-                            info.address,
-                            info.original_size,
-                            info.compressed_size,
-                            info.block_type,
-                            info.param,
-                        )
+                    for info, new_data in self._prefetch_data_blocks(needed_blocks()):
+                        original_size = info.original_size
 
-                        if not info.original_size:
+                        if not original_size:
                             continue
-                        if info.location == v4c.LOCATION_TEMPORARY_FILE:
-                            stream = self._tempfile
-                        else:
-                            stream = self._file
 
                         if current_offset + original_size < start_offset:
                             current_offset += original_size
                             continue
 
-                        stream.seek(address)
-                        new_data = stream.read(compressed_size)
-                        if block_type == v4c.DZ_BLOCK_DEFLATE:
-                            new_data = decompress(new_data, bufsize=original_size)
-                        elif block_type == v4c.DZ_BLOCK_TRANSPOSED:
-                            new_data = decompress(new_data, bufsize=original_size)
-                            cols = param
-                            lines = original_size // cols
-
-                            nd = frombuffer(new_data[: lines * cols], dtype=uint8)
-                            nd = nd.reshape((cols, lines))
-                            new_data = nd.T.ravel().tobytes() + new_data[lines * cols :]
-                        elif block_type == v4c.DZ_BLOCK_LZ:
-                            new_data = lz_decompress(new_data)
-
                         if current_offset + original_size > end_offset:
                             start_index = max(0, start_offset - current_offset)
                             (last_sample_size,) = UINT32_uf(new_data, end_offset - current_offset)
@@ -1327,15 +1668,18 @@ class MDF4(MDF_Common):
         record_offset: int = 0,
         record_count: int | None = None,
         optimize_read: bool = False,
+        read_split_count: int | None = None,
     ) -> Iterator[tuple[bytes, int, int, bytes | None]]:
         """get group's data block bytes"""
 
+        if read_split_count is None:
+            read_split_count = group.read_split_count
+
         offset = 0
         invalidation_offset = 0
         has_yielded = False
         _count = 0
         data_group = group.data_group
-        data_blocks_info_generator = group.data_blocks_info_generator
         channel_group = group.channel_group
 
         if group.data_location == v4c.LOCATION_ORIGINAL_FILE:
@@ -1343,9 +1687,6 @@ class MDF4(MDF_Common):
         else:
             stream = self._tempfile
 
-        read = stream.read
-        seek = stream.seek
-
         if group.uses_ld:
             samples_size = channel_group.samples_byte_nr
             invalidation_size = channel_group.invalidation_bytes_nr
@@ -1369,9 +1710,9 @@ class MDF4(MDF_Common):
             else:
                 yield b"", offset, _count, None
         else:
-            if group.read_split_count:
-                split_size = group.read_split_count * samples_size
-                invalidation_split_size = group.read_split_count * invalidation_size
+            if read_split_count:
+                split_size = read_split_count * samples_size
+                invalidation_split_size = read_split_count * invalidation_size
             else:
                 if self._read_fragment_size:
                     split_size = self._read_fragment_size // samples_size
@@ -1400,7 +1741,22 @@ class MDF4(MDF_Common):
 
             invalidation_split_size = int(invalidation_split_size)
 
-            blocks = iter(group.data_blocks)
+            if record_count is not None:
+                records_end = record_offset + record_count
+            else:
+                records_end = None
+
+            def needed_blocks():
+                position = 0
+                for info in group.get_data_blocks():
+                    if position + info.original_size < record_offset + 1:
+                        yield info, None
+                    elif records_end is not None and position >= records_end:
+                        # the blocks after the requested records are not needed
+                        break
+                    else:
+                        yield info, stream
+                    position += info.original_size
 
             cur_size = 0
             data = []
@@ -1408,55 +1764,13 @@ class MDF4(MDF_Common):
             cur_invalidation_size = 0
             invalidation_data = []
 
-            while True:
-                try:
-                    info = next(blocks)
-                    (
-                        address,
-                        original_size,
-                        compressed_size,
-                        block_type,
-                        param,
-                        block_limit,
-                    ) = (
-                        info.address,
-                        info.original_size,
-                        info.compressed_size,
-                        info.block_type,
-                        info.param,
-                        info.block_limit,
-                    )
-
-                    if rm and invalidation_size:
-                        invalidation_info = info.invalidation_block
-                    else:
-                        invalidation_info = None
-                except StopIteration:
-                    try:
-                        info = next(data_blocks_info_generator)
-                        (
-                            address,
-                            original_size,
-                            compressed_size,
-                            block_type,
-                            param,
-                            block_limit,
-                        ) = (
-                            info.address,
-                            info.original_size,
-                            info.compressed_size,
-                            info.block_type,
-                            info.param,
-                            info.block_limit,
-                        )
+            for info, new_data in self._prefetch_data_blocks(needed_blocks()):
+                original_size = info.original_size
 
-                        if rm and invalidation_size:
-                            invalidation_info = info.invalidation_block
-                        else:
-                            invalidation_info = None
-                        group.data_blocks.append(info)
-                    except StopIteration:
-                        break
+                if rm and invalidation_size:
+                    invalidation_info = info.invalidation_block
+                else:
+                    invalidation_info = None
 
                 if offset + original_size < record_offset + 1:
                     offset += original_size
@@ -1468,25 +1782,6 @@ class MDF4(MDF_Common):
                             invalidation_offset += invalidation_info.original_size
                     continue
 
-                seek(address)
-                new_data = read(compressed_size)
-
-                if block_type == v4c.DZ_BLOCK_DEFLATE:
-                    new_data = decompress(new_data, bufsize=original_size)
-                elif block_type == v4c.DZ_BLOCK_TRANSPOSED:
-                    new_data = decompress(new_data, bufsize=original_size)
-                    cols = param
-                    lines = original_size // cols
-
-                    nd = frombuffer(new_data[: lines * cols], dtype=uint8)
-                    nd = nd.reshape((cols, lines))
-                    new_data = nd.T.ravel().tobytes() + new_data[lines * cols :]
-                elif block_type == v4c.DZ_BLOCK_LZ:
-                    new_data = lz_decompress(new_data)
-
-                if block_limit is not None:
-                    new_data = new_data[:block_limit]
-
                 if len(data) > split_size - cur_size:
                     new_data = memoryview(new_data)
 
@@ -1496,8 +1791,9 @@ class MDF4(MDF_Common):
                         new_invalidation_data = b"\0" * (count * invalidation_size)
 
                     else:
-                        seek(invalidation_info.address)
-                        new_invalidation_data = read(invalidation_info.size)
+                        new_invalidation_data = self._read_block(
+                            stream, invalidation_info.address, invalidation_info.size
+                        )
                         if invalidation_info.block_type == v4c.DZ_BLOCK_DEFLATE:
                             new_invalidation_data = decompress(
                                 new_invalidation_data,
@@ -1665,6 +1961,233 @@ class MDF4(MDF_Common):
                 else:
                     yield b"", 0, 0, None
 
+    def _mapped_selection_possible(self, group_index: int, channels: Sequence[int]) -> bool:
+        """check if the selected channels can be extracted from the memory
+        mapped file without materializing the data records (see
+        `_load_mapped_data`)
+
+        This is only possible for memory mapped groups stored in the original
+        file, if the selected channels can be extracted with byte level access
+        and if they cover at most half of the record; otherwise copying the
+        plain fragments is cheaper.
+
+        Parameters
+        ----------
+        group_index : int
+            group index
+        channels : list
+            selected channel indexes
+
+        Returns
+        -------
+        possible : bool
+
+        """
+        group = self.groups[group_index]
+        channel_group = group.channel_group
+
+        if (
+            not self._mapped
+            or group.data_location != v4c.LOCATION_ORIGINAL_FILE
+            or group.uses_ld
+            or channel_group.flags & v4c.FLAG_CG_VLSD
+        ):
+            return False
+
+        record_size = channel_group.samples_byte_nr + channel_group.invalidation_bytes_nr
+        if not record_size:
+            return False
+
+        self._prepare_record(group)
+        record = group.record
+
+        needed = set(channels)
+        master_index = self.masters_db.get(group_index, None)
+        if master_index is not None:
+            needed.add(master_index)
+
+        # the channels can share bytes, so the needed bytes are marked in a mask
+        used = bytearray(record_size)
+        for ch_nr in needed:
+            channel = group.channels[ch_nr]
+            if channel.channel_type in v4c.VIRTUAL_TYPES:
+                continue
+            if (
+                channel.channel_type not in (v4c.CHANNEL_TYPE_VALUE, v4c.CHANNEL_TYPE_MASTER)
+                or group.channel_dependencies[ch_nr]
+                or record[ch_nr] is None
+            ):
+                return False
+
+            _, byte_size, byte_offset, _ = record[ch_nr]
+            used[byte_offset : byte_offset + byte_size] = b"\x01" * byte_size
+
+        used[channel_group.samples_byte_nr :] = b"\x01" * channel_group.invalidation_bytes_nr
+
+        return used.count(1) * 2 <= record_size
+
+    def _load_mapped_data(
+        self,
+        group: Group,
+        record_offset: int = 0,
+        record_count: int | None = None,
+        read_split_count: int | None = None,
+    ) -> Iterator[tuple[bytes | memoryview, int, int, None]]:
+        """get group's data fragments as read-only views of the memory mapped
+        file
+
+        The fragments have the same boundaries as the ones returned by
+        `_load_data`, but only the fragments that span several data blocks are
+        copied. The channel bytes are then extracted directly from the file
+        mapping, without materializing the complete records. Groups that are
+        not stored in uncompressed data blocks fall back to `_load_data`.
+
+        """
+        blocks = []
+        for info in group.get_data_blocks():
+            if info.block_type != v4c.DT_BLOCK:
+                yield from self._load_data(
+                    group,
+                    record_offset=record_offset,
+                    record_count=record_count,
+                    read_split_count=read_split_count,
+                )
+                return
+
+            size = info.original_size
+            if info.block_limit is not None:
+                size = min(size, info.block_limit)
+            blocks.append((info.address, size))
+
+        channel_group = group.channel_group
+        samples_size = channel_group.samples_byte_nr + channel_group.invalidation_bytes_nr
+        if read_split_count is None:
+            read_split_count = group.read_split_count
+        split_size = (read_split_count or 1) * samples_size
+
+        start = cursor = record_offset * samples_size
+        end = sum(size for _, size in blocks)
+        if record_count is not None:
+            end = min(end, start + record_count * samples_size)
+        fragment_end = min(start + split_size, end)
+
+        mapping = memoryview(self._file)
+        pieces = []
+        position = 0
+        has_yielded = False
+
+        for address, size in blocks:
+            block_start = position
+            position += size
+
+            while block_start <= cursor < position and cursor < end:
+                stop = min(position, fragment_end)
+                pieces.append(mapping[address + cursor - block_start : address + stop - block_start])
+                cursor = stop
+
+                if cursor == fragment_end:
+                    data = pieces[0] if len(pieces) == 1 else b"".join(pieces)
+                    yield data, start // samples_size, len(data) // samples_size, None
+                    has_yielded = True
+
+                    pieces = []
+                    start = fragment_end
+                    fragment_end = min(start + split_size, end)
+
+            if cursor >= end:
+                break
+
+        mapping.release()
+
+        if not has_yielded:
+            yield b"", 0, 0, None
+
+    def _get_mapped_channel(
+        self,
+        group: Group,
+        ch_nr: int,
+        record_offset: int = 0,
+        record_count: int | None = None,
+    ) -> NDArray[Any] | None:
+        """get the raw channel samples as an array that uses the memory mapped
+        file as buffer
+
+        This is only possible for byte aligned channels with standard C types
+        from groups that are stored in a single uncompressed DTBLOCK. If
+        *copy_on_get* is set then a private copy of the samples is returned,
+        otherwise the array is a read-only view of the file.
+
+        Returns
+        -------
+        vals : numpy.ndarray | None
+            channel samples or *None* if the samples cannot be mapped
+
+        """
+        if not self._mapped or group.data_location != v4c.LOCATION_ORIGINAL_FILE or group.uses_ld:
+            return None
+
+        channel = group.channels[ch_nr]
+        if (
+            channel.channel_type not in (v4c.CHANNEL_TYPE_VALUE, v4c.CHANNEL_TYPE_MASTER)
+            or not channel.standard_C_size
+            or group.channel_dependencies[ch_nr]
+        ):
+            return None
+
+        self._prepare_record(group)
+        info = group.record[ch_nr]
+        if info is None:
+            return None
+
+        dtype_, byte_size, byte_offset, _ = info
+        if dtype_.kind not in "uif":
+            return None
+
+        # the DTBLOCK is split in several blocks info that must be contiguous
+        address = size = 0
+        for info in group.get_data_blocks():
+            if info.block_type != v4c.DT_BLOCK or (size and info.address != address + size):
+                return None
+            if not size:
+                address = info.address
+            if info.block_limit is not None:
+                size += min(info.original_size, info.block_limit)
+            else:
+                size += info.original_size
+
+        channel_group = group.channel_group
+        record_size = channel_group.samples_byte_nr + channel_group.invalidation_bytes_nr
+        if not size or not record_size or byte_offset + byte_size > record_size:
+            return None
+
+        cycles_nr = size // record_size
+        count = cycles_nr - min(record_offset, cycles_nr)
+        if record_count is not None:
+            count = min(count, record_count)
+        if not count:
+            return None
+
+        # frombuffer keeps an export of the mapping alive, so the file mapping
+        # is not released while the returned array is in use
+        records = frombuffer(
+            self._file,
+            dtype=uint8,
+            count=count * record_size,
+            offset=address + record_offset * record_size,
+        )
+        vals = ndarray(
+            shape=(count,),
+            dtype=dtype_,
+            buffer=records,
+            offset=byte_offset,
+            strides=(record_size,),
+        )
+
+        if self.copy_on_get:
+            vals = vals.copy()
+
+        return vals
+
     def _prepare_record(self, group: Group) -> list:
         """compute record
 
@@ -1736,6 +2259,61 @@ class MDF4(MDF_Common):
 
         return record
 
+    def _record_layout(self, index: int, channels: Sequence[int] | None = None) -> tuple | None:
+        """layout of the records of the group *index* for the *channels*
+        (default all channels); two groups with the same layout can exchange
+        raw records. *None* is returned if the records reference other blocks
+        (VLSD, compositions, arrays) or if the group uses column storage
+
+        Parameters
+        ----------
+        index : int
+            group index
+        channels : list | None
+            channel indexes
+
+        Returns
+        -------
+        layout : tuple | None
+            samples and invalidation bytes and the position and data type of
+            each channel
+
+        """
+
+        group = self.groups[index]
+        if (
+            group.uses_ld
+            or group.channel_group.flags & (v4c.FLAG_CG_VLSD | v4c.FLAG_CG_REMOTE_MASTER)
+            or any(group.channel_dependencies)
+        ):
+            return None
+
+        if channels is None:
+            channels = range(len(group.channels))
+
+        layout = []
+        for ch_nr in channels:
+            channel = group.channels[ch_nr]
+            if channel.channel_type not in (v4c.CHANNEL_TYPE_VALUE, v4c.CHANNEL_TYPE_MASTER):
+                return None
+
+            layout.append(
+                (
+                    channel.byte_offset,
+                    channel.bit_offset,
+                    channel.bit_count,
+                    channel.data_type,
+                    channel.flags & (v4c.FLAG_CN_ALL_INVALID | v4c.FLAG_CN_INVALIDATION_PRESENT),
+                    channel.pos_invalidation_bit,
+                )
+            )
+
+        return (
+            group.channel_group.samples_byte_nr,
+            group.channel_group.invalidation_bytes_nr,
+            tuple(layout),
+        )
+
     def _uses_ld(
         self,
         address: int,
@@ -5953,21 +6531,112 @@ class MDF4(MDF_Common):
                 if invalidation_bytes_nr:
                     addr = stream.tell()
 
-                    data = inval_bits.tobytes()
-                    raw_size = len(data)
-                    data = lz_compress(data)
-                    size = len(data)
-                    stream.write(data)
+                    data = inval_bits.tobytes()
+                    raw_size = len(data)
+                    data = lz_compress(data)
+                    size = len(data)
+                    stream.write(data)
+
+                    gp.data_blocks[-1].invalidation_block(
+                        InvalidationBlockInfo(
+                            address=addr,
+                            block_type=v4c.DT_BLOCK_LZ,
+                            original_size=raw_size,
+                            compressed_size=size,
+                            param=None,
+                        )
+                    )
+
+    def _extend_raw(self, index: int, data: bytes) -> None:
+        """extend the group *index* with raw records that already have the
+        group record layout (see *_record_layout*)
+
+        Parameters
+        ----------
+        index : int
+            group index
+        data : bytes
+            raw records, including the invalidation bytes
+
+        """
+
+        gp = self.groups[index]
+        record_size = gp.channel_group.samples_byte_nr + gp.channel_group.invalidation_bytes_nr
+        added_cycles = len(data) // record_size
+
+        if not added_cycles:
+            return
+
+        stream = self._tempfile
+        stream.seek(0, 2)
+        addr = stream.tell()
+
+        raw_size = len(data)
+        data = lz_compress(data)
+        size = len(data)
+        stream.write(data)
+
+        gp.data_blocks.append(
+            DataBlockInfo(
+                address=addr,
+                block_type=v4c.DZ_BLOCK_LZ,
+                original_size=raw_size,
+                compressed_size=size,
+                param=0,
+            )
+        )
+
+        gp.channel_group.cycles_nr += added_cycles
+        self.virtual_groups[index].cycles_nr += added_cycles
+
+    def _extend_raw_block(self, index: int, mdf: MDF4, group_index: int, info: DataBlockInfo) -> None:
+        """extend the group *index* with a copy of the data block *info* of
+        the group *group_index* of *mdf*, without decompressing it. The
+        groups must have the same record layout (see *_record_layout*) and the
+        block must contain whole records
+
+        Parameters
+        ----------
+        index : int
+            group index
+        mdf : MDF4
+            source measurement
+        group_index : int
+            source group index
+        info : DataBlockInfo
+            source data block
+
+        """
+
+        gp = self.groups[index]
+        record_size = gp.channel_group.samples_byte_nr + gp.channel_group.invalidation_bytes_nr
+
+        source = mdf.groups[group_index]
+        if source.data_location == v4c.LOCATION_ORIGINAL_FILE:
+            source_stream = mdf._file
+        else:
+            source_stream = mdf._tempfile
+
+        data = mdf._read_block(source_stream, info.address, info.compressed_size)
+
+        stream = self._tempfile
+        stream.seek(0, 2)
+        addr = stream.tell()
+        stream.write(data)
+
+        gp.data_blocks.append(
+            DataBlockInfo(
+                address=addr,
+                block_type=info.block_type,
+                original_size=info.original_size,
+                compressed_size=info.compressed_size,
+                param=info.param,
+            )
+        )
 
-                    gp.data_blocks[-1].invalidation_block(
-                        InvalidationBlockInfo(
-                            address=addr,
-                            block_type=v4c.DT_BLOCK_LZ,
-                            original_size=raw_size,
-                            compressed_size=size,
-                            param=None,
-                        )
-                    )
+        added_cycles = info.original_size // record_size
+        gp.channel_group.cycles_nr += added_cycles
+        self.virtual_groups[index].cycles_nr += added_cycles
 
     def _extend_column_oriented(self, index: int, signals: list[tuple[NDArray[Any], NDArray[Any] | None]]) -> None:
         """
@@ -6266,30 +6935,40 @@ class MDF4(MDF_Common):
         self._parent = None
         if self._tempfile is not None:
             self._tempfile.close()
+
+        temporary = self._delete_on_close or (
+            self.original_name is not None
+            and Path(self.original_name).suffix.lower() in (".bz2", ".gzip", ".mf4z", ".zip")
+        )
+
         if not self._from_filelike and self._file is not None:
-            self._file.close()
+            try:
+                self._file.close()
+            except BufferError:
+                # arrays returned with copy_on_get=False reference the file
+                # mapping through their base; the mapping and the file stay
+                # open until they are garbage collected
+                logger.warning(
+                    f'The file "{self.name}" stays open until the arrays returned with copy_on_get=False are released'
+                )
+                finalize(
+                    self._file,
+                    _release_mapped_file,
+                    self._mapped_file,
+                    Path(self.name) if temporary else None,
+                )
+                self._file = self._mapped_file = None
+                temporary = False
 
         if self._mapped_file is not None:
             self._mapped_file.close()
 
-        if self._delete_on_close:
+        if temporary:
             try:
                 Path(self.name).unlink()
             except:
                 pass
 
-        if self.original_name is not None:
-            if Path(self.original_name).suffix.lower() in (
-                ".bz2",
-                ".gzip",
-                ".mf4z",
-                ".zip",
-            ):
-                try:
-                    Path(self.name).unlink()
-                except:
-                    pass
-
         for gp in self.groups:
             gp.clear()
         self.groups.clear()
@@ -7502,6 +8181,11 @@ class MDF4(MDF_Common):
 
                 info = grp.record[ch_nr]
 
+                if info is None or channel_invalidation_present:
+                    mapped_vals = None
+                else:
+                    mapped_vals = self._get_mapped_channel(grp, ch_nr, record_offset, record_count)
+
                 if info is None:
                     for count, fragment in enumerate(data, 1):
                         data_bytes, offset, _count, invalidation_bytes = fragment
@@ -7518,6 +8202,11 @@ class MDF4(MDF_Common):
 
                         channel_values.append(vals)
                     vals = concatenate(channel_values)
+                elif mapped_vals is not None:
+                    vals = mapped_vals
+                    if master_is_required:
+                        timestamps = self.get_master(gp_nr, record_offset=record_offset, record_count=record_count)
+                    invalidation_bits = None
                 else:
                     dtype_, byte_size, byte_offset, bit_offset = info
 
@@ -8112,14 +8801,23 @@ class MDF4(MDF_Common):
         data_streams = []
         for idx, group_index in enumerate(groups):
             grp = self.groups[group_index]
-            grp.read_split_count = count
-            data_streams.append(self._load_data(grp, record_offset=record_offset, record_count=record_count))
+            if self._mapped_selection_possible(group_index, groups[group_index]):
+                load_data = self._load_mapped_data
+            else:
+                load_data = self._load_data
+            data_streams.append(
+                load_data(
+                    grp,
+                    record_offset=record_offset,
+                    record_count=record_count,
+                    read_split_count=count,
+                )
+            )
             if group_index == index:
                 master_index = idx
 
         encodings = {group_index: [None] for group_index in groups}
 
-        self._set_temporary_master(None)
         idx = 0
 
         while True:
@@ -8128,89 +8826,95 @@ class MDF4(MDF_Common):
             except:
                 break
 
-            _master = self.get_master(index, data=fragments[master_index])
-            self._set_temporary_master(_master)
+            # the temporary master is shared by the threads that use this
+            # object, so it is only set while holding the lock
+            with self._lock:
+                _master = self.get_master(index, data=fragments[master_index])
+                self._set_temporary_master(_master)
+                try:
+                    if idx == 0:
+                        signals = []
+                    else:
+                        signals = [(_master, None)]
 
-            if idx == 0:
-                signals = []
-            else:
-                signals = [(_master, None)]
-
-            vlsd_max_sizes = []
-
-            for fragment, (group_index, channels) in zip(fragments, groups.items()):
-                grp = self.groups[group_index]
-                if not grp.single_channel_dtype:
-                    self._prepare_record(grp)
-
-                if idx == 0:
-                    for channel_index in channels:
-                        signal = self.get(
-                            group=group_index,
-                            index=channel_index,
-                            data=fragment,
-                            raw=True,
-                            ignore_invalidation_bits=True,
-                            samples_only=False,
-                        )
+                    vlsd_max_sizes = []
 
-                        signals.append(signal)
+                    for fragment, (group_index, channels) in zip(fragments, groups.items()):
+                        grp = self.groups[group_index]
+                        if not grp.single_channel_dtype:
+                            self._prepare_record(grp)
 
-                else:
-                    for channel_index in channels:
-                        signal, invalidation_bits = self.get(
-                            group=group_index,
-                            index=channel_index,
-                            data=fragment,
-                            raw=True,
-                            ignore_invalidation_bits=True,
-                            samples_only=True,
-                        )
+                        if idx == 0:
+                            for channel_index in channels:
+                                signal = self.get(
+                                    group=group_index,
+                                    index=channel_index,
+                                    data=fragment,
+                                    raw=True,
+                                    ignore_invalidation_bits=True,
+                                    samples_only=False,
+                                )
 
-                        signals.append((signal, invalidation_bits))
+                                signals.append(signal)
 
-                if version < "4.00":
-                    if idx == 0:
-                        for sig, channel_index in zip(signals, channels):
-                            if sig.samples.dtype.kind == "S":
-                                strsig = self.get(
+                        else:
+                            for channel_index in channels:
+                                signal, invalidation_bits = self.get(
                                     group=group_index,
                                     index=channel_index,
-                                    samples_only=True,
+                                    data=fragment,
+                                    raw=True,
                                     ignore_invalidation_bits=True,
-                                )[0]
+                                    samples_only=True,
+                                )
 
-                                _dtype = strsig.dtype
-                                sig.samples = sig.samples.astype(_dtype)
-                                encodings[group_index].append((sig.encoding, _dtype))
-                                del strsig
-                                if sig.encoding != "latin-1":
-                                    if sig.encoding == "utf-16-le":
-                                        sig.samples = sig.samples.view(uint16).byteswap().view(sig.samples.dtype)
-                                        sig.samples = encode(decode(sig.samples, "utf-16-be"), "latin-1")
+                                signals.append((signal, invalidation_bits))
+
+                        if version < "4.00":
+                            if idx == 0:
+                                for sig, channel_index in zip(signals, channels):
+                                    if sig.samples.dtype.kind == "S":
+                                        strsig = self.get(
+                                            group=group_index,
+                                            index=channel_index,
+                                            samples_only=True,
+                                            ignore_invalidation_bits=True,
+                                        )[0]
+
+                                        _dtype = strsig.dtype
+                                        sig.samples = sig.samples.astype(_dtype)
+                                        encodings[group_index].append((sig.encoding, _dtype))
+                                        del strsig
+                                        if sig.encoding != "latin-1":
+                                            if sig.encoding == "utf-16-le":
+                                                sig.samples = (
+                                                    sig.samples.view(uint16).byteswap().view(sig.samples.dtype)
+                                                )
+                                                sig.samples = encode(decode(sig.samples, "utf-16-be"), "latin-1")
+                                            else:
+                                                sig.samples = encode(
+                                                    decode(sig.samples, sig.encoding),
+                                                    "latin-1",
+                                                )
+                                        sig.samples = sig.samples.astype(_dtype)
                                     else:
-                                        sig.samples = encode(
-                                            decode(sig.samples, sig.encoding),
-                                            "latin-1",
-                                        )
-                                sig.samples = sig.samples.astype(_dtype)
+                                        encodings[group_index].append(None)
                             else:
-                                encodings[group_index].append(None)
-                    else:
-                        for i, (sig, encoding_tuple) in enumerate(zip(signals, encodings[group_index])):
-                            if encoding_tuple:
-                                encoding, _dtype = encoding_tuple
-                                samples = sig[0]
-                                if encoding != "latin-1":
-                                    if encoding == "utf-16-le":
-                                        samples = samples.view(uint16).byteswap().view(samples.dtype)
-                                        samples = encode(decode(samples, "utf-16-be"), "latin-1")
-                                    else:
-                                        samples = encode(decode(samples, encoding), "latin-1")
-                                samples = samples.astype(_dtype)
-                                signals[i] = (samples, sig[1])
+                                for i, (sig, encoding_tuple) in enumerate(zip(signals, encodings[group_index])):
+                                    if encoding_tuple:
+                                        encoding, _dtype = encoding_tuple
+                                        samples = sig[0]
+                                        if encoding != "latin-1":
+                                            if encoding == "utf-16-le":
+                                                samples = samples.view(uint16).byteswap().view(samples.dtype)
+                                                samples = encode(decode(samples, "utf-16-be"), "latin-1")
+                                            else:
+                                                samples = encode(decode(samples, encoding), "latin-1")
+                                        samples = samples.astype(_dtype)
+                                        signals[i] = (samples, sig[1])
+                finally:
+                    self._set_temporary_master(None)
 
-            self._set_temporary_master(None)
             idx += 1
             yield signals
 
@@ -8254,8 +8958,11 @@ class MDF4(MDF_Common):
             PendingDeprecationWarning(
                 "the argument raster is deprecated since version 5.13.0 " "and will be removed in a future release"
             )
-        if self._master is not None:
-            return self._master
+        # the temporary master is set by select while holding the lock
+        with self._lock:
+            master = self._master
+        if master is not None:
+            return master
 
         group = self.groups[index]
         if group.channel_group.flags & v4c.FLAG_CG_REMOTE_MASTER:
@@ -8315,9 +9022,17 @@ class MDF4(MDF_Common):
             else:
                 virtual_conv = None
 
+                if fragment is None:
+                    mapped_t = self._get_mapped_channel(group, time_ch_nr, record_offset, record_count)
+                else:
+                    mapped_t = None
+
+                if mapped_t is not None:
+                    t = mapped_t
+
                 # check if the channel group contains just the master channel
                 # and that there are no padding bytes
-                if len(group.channels) == 1 and time_ch.dtype_fmt.itemsize == record_size:
+                elif len(group.channels) == 1 and time_ch.dtype_fmt.itemsize == record_size:
                     if one_piece:
                         data_bytes, offset, _count, _ = data
 
@@ -8430,6 +9145,238 @@ class MDF4(MDF_Common):
             timestamps = t
         return timestamps
 
+    def _time_value_format(self, index: int) -> tuple[int, tuple, str] | None:
+        """master channel index, record field and the 8 bytes format of the
+        DL time values of the group *index*, or *None* if the group has no
+        time master channel that is stored in the records"""
+
+        group = self.groups[index]
+        time_ch_nr = self.masters_db.get(index, None)
+        if time_ch_nr is None or group.channel_group.flags & v4c.FLAG_CG_REMOTE_MASTER:
+            return None
+
+        time_ch = group.channels[time_ch_nr]
+        if time_ch.channel_type != v4c.CHANNEL_TYPE_MASTER or time_ch.sync_type != v4c.SYNC_TYPE_TIME:
+            return None
+
+        record = self._prepare_record(group)[time_ch_nr]
+        if record is None or not time_ch.standard_C_size:
+            return None
+
+        kind = record[0].kind
+        if kind == "f":
+            fmt = "<f8"
+        elif kind == "u":
+            fmt = "<u8"
+        else:
+            fmt = "<i8"
+
+        return time_ch_nr, record, fmt
+
+    def _time_value(self, index: int, fragment: bytes) -> bytes:
+        """raw master value of the first record of the data block *fragment*
+        of the group *index* as the 8 bytes of a DL or LD time value"""
+
+        _, record, fmt = self._time_value_format(index)
+        dtype_, byte_offset = record[0], record[2]
+
+        return frombuffer(fragment, dtype=dtype_, count=1, offset=byte_offset).astype(fmt).tobytes()
+
+    def _with_time_values(self, index: int, fragments: Iterator[bytes], data_list: DataList) -> Iterator[bytes]:
+        """yield the *fragments* and store the time value of each fragment in
+        the *data_list*"""
+
+        for i, fragment in enumerate(fragments):
+            data_list[f"time_value_{i}"] = self._time_value(index, fragment)
+            yield fragment
+
+    def _time_index_from_data_lists(self, index: int) -> tuple[NDArray[Any], NDArray[Any]] | None:
+        """time index of the group *index* read from the time values of the
+        DL or LD blocks, or *None* if the blocks have no time values"""
+
+        group = self.groups[index]
+        time_value_format = self._time_value_format(index)
+        address = group.data_group.data_block_addr
+
+        if group.uses_ld:
+            # the LD blocks reference the samples
+            record_size = 1
+            block_id, time_values_flag = b"##LD", v4c.FLAG_LD_TIME_VALUES
+        else:
+            record_size = group.channel_group.samples_byte_nr + group.channel_group.invalidation_bytes_nr
+            block_id, time_values_flag = b"##DL", v4c.FLAG_DL_TIME_VALUES
+
+        if (
+            time_value_format is None
+            or group.data_location != v4c.LOCATION_ORIGINAL_FILE
+            or not address
+            or not group.channel_group.samples_byte_nr
+        ):
+            return None
+
+        # the blocks are read through the shared file position
+        with self._lock:
+            stream = self._file
+            stream.seek(address)
+            id_string, block_len = COMMON_SHORT_u(stream.read(COMMON_SHORT_SIZE))
+            if id_string == b"##HL":
+                address = HeaderList(address=address, stream=stream).first_dl_addr
+            elif id_string != block_id:
+                return None
+
+            records = []
+            values = []
+            position = 0
+            while address:
+                if group.uses_ld:
+                    stream.seek(address)
+                    id_string, block_len = COMMON_SHORT_u(stream.read(COMMON_SHORT_SIZE))
+                    stream.seek(address)
+                    block = ListData(address=0, stream=stream.read(block_len))
+                    equal_length = block.flags & v4c.FLAG_LD_EQUAL_LENGHT
+                    next_address = block.next_ld_addr
+                else:
+                    block = DataList(address=address, stream=stream)
+                    equal_length = block.flags & v4c.FLAG_DL_EQUAL_LENGHT
+                    next_address = block.next_dl_addr
+
+                if not block.flags & time_values_flag:
+                    return None
+
+                for i in range(block.data_block_nr):
+                    if equal_length:
+                        records.append((position + i * block.data_block_len) // record_size)
+                    else:
+                        records.append(block[f"offset_{i}"] // record_size)
+                    values.append(block[f"time_value_{i}"])
+
+                if equal_length:
+                    position += block.data_block_nr * block.data_block_len
+                address = next_address
+
+        time_ch_nr, _, fmt = time_value_format
+        timestamps = frombuffer(b"".join(values), dtype=fmt)
+        conversion = group.channels[time_ch_nr].conversion
+        if conversion:
+            timestamps = conversion.convert(timestamps)
+
+        return array(records, dtype="i8"), timestamps.astype(float64)
+
+    def get_time_index(self, index: int) -> tuple[NDArray[Any], NDArray[Any]] | None:
+        """sparse time index of the channel group: the record index and the
+        master timestamp of anchor records, sorted by record index
+
+        The time values of the DL blocks (MDF 4.20) are used if they are
+        available, otherwise the master channel is read once and an anchor is
+        kept every *TIME_INDEX_STEP* records. The index is cached.
+
+        .. versionadded:: 7.5.0
+
+        Parameters
+        ----------
+        index : int
+            group index
+
+        Returns
+        -------
+        time_index : (numpy.array, numpy.array) | None
+            anchor records and timestamps, or *None* if the master channel is
+            not monotonic
+
+        """
+
+        group = self.groups[index]
+        key = (index, group.data_group.data_block_addr, group.channel_group.cycles_nr)
+
+        if key not in self._time_indexes:
+            time_index = self._time_index_from_data_lists(index)
+            if time_index is None:
+                timestamps = self.get_master(index)
+                records = arange(0, len(timestamps), TIME_INDEX_STEP, dtype="i8")
+                time_index = records, timestamps[records]
+                if np.any(np.diff(timestamps) < 0):
+                    time_index = None
+            elif np.any(np.diff(time_index[1]) < 0):
+                time_index = None
+
+            self._time_indexes[key] = time_index
+
+        return self._time_indexes[key]
+
+    def get_record_window(
+        self,
+        index: int,
+        start: float | None = None,
+        stop: float | None = None,
+    ) -> tuple[int, int]:
+        """record offset and record count of the group *index* that contain
+        all the samples between *start* and *stop*, and the samples right
+        before *start* and right after *stop* (needed for interpolation). The
+        window is found using the sparse time index of the group.
+
+        .. versionadded:: 7.5.0
+
+        Parameters
+        ----------
+        index : int
+            group index
+        start : float | None
+            start timestamp; default *None* for the start of the measurement
+        stop : float | None
+            stop timestamp; default *None* for the end of the measurement
+
+        Returns
+        -------
+        record_offset, record_count : int, int
+            records window
+
+        """
+
+        cycles_nr = self.groups[index].channel_group.cycles_nr
+        if start is None and stop is None:
+            return 0, cycles_nr
+
+        time_index = self.get_time_index(index)
+        if time_index is None:
+            return 0, cycles_nr
+
+        records, timestamps = time_index
+
+        offset = 0
+        if start is not None:
+            position = searchsorted(timestamps, start, side="left") - 1
+            if position >= 0:
+                offset = int(records[position])
+
+        end = cycles_nr
+        if stop is not None:
+            position = searchsorted(timestamps, stop, side="right")
+            if position < len(records):
+                end = min(int(records[position]) + 1, cycles_nr)
+
+        return offset, max(end - offset, 0)
+
+    def _find_record(self, index: int, timestamp: float, side: str = "left") -> int:
+        """index of the first record of the group *index* with the master
+        value >= *timestamp* (*side="left"*) or > *timestamp* (*side="right"*).
+        Only the master samples between the time index anchors around the
+        *timestamp* are read."""
+
+        cycles_nr = self.groups[index].channel_group.cycles_nr
+        time_index = self.get_time_index(index)
+        if time_index is None:
+            return int(searchsorted(self.get_master(index), timestamp, side=side))
+
+        records, timestamps = time_index
+        position = searchsorted(timestamps, timestamp, side=side)
+
+        offset = int(records[position - 1]) if position else 0
+        end = min(int(records[position]) + 1, cycles_nr) if position < len(records) else cycles_nr
+
+        master = self.get_master(index, record_offset=offset, record_count=end - offset)
+
+        return offset + int(searchsorted(master, timestamp, side=side))
+
     def get_bus_signal(
         self,
         bus: BusType,
@@ -9243,10 +10190,13 @@ class MDF4(MDF_Common):
                         if self.version >= "4.20" and gp.uses_ld:
                             dv_addr = []
                             di_addr = []
+                            time_values = [] if self._time_value_format(gp_nr) is not None else None
                             block_size = 0
                             for i, (data_, _1, _2, inval_) in enumerate(data):
                                 if i == 0:
                                     block_size = len(data_)
+                                if time_values is not None:
+                                    time_values.append(self._time_value(gp_nr, data_))
                                 if compression:
                                     if compression == 1:
                                         param = 0
@@ -9305,6 +10255,11 @@ class MDF4(MDF_Common):
                                 for i, addr in enumerate(di_addr):
                                     kwargs[f"invalidation_bits_addr_{i}"] = addr
 
+                            if time_values is not None:
+                                kwargs["flags"] |= v4c.FLAG_LD_TIME_VALUES
+                                for i, value in enumerate(time_values):
+                                    kwargs[f"time_value_{i}"] = value
+
                             ld_block = ListData(**kwargs)
                             write(bytes(ld_block))
 
@@ -9330,30 +10285,30 @@ class MDF4(MDF_Common):
                                 "data_block_nr": chunks,
                                 "data_block_len": split_size,
                             }
+                            # MDF 4.20 data lists can store the first master value of each block
+                            time_values = self.version >= "4.20" and self._time_value_format(gp_nr) is not None
+                            if time_values:
+                                kwargs["flags"] |= v4c.FLAG_DL_TIME_VALUES
                             dl_block = DataList(**kwargs)
 
-                            for i, data__ in enumerate(data):
-                                data_ = data__[0]
-
-                                if compression and self.version >= "4.10":
-                                    if compression == 1:
-                                        zip_type = v4c.FLAG_DZ_DEFLATE
-                                    else:
-                                        zip_type = v4c.FLAG_DZ_TRANPOSED_DEFLATE
-                                    if compression == 1:
-                                        param = 0
-                                    else:
-                                        param = (
-                                            gp.channel_group.samples_byte_nr + gp.channel_group.invalidation_bytes_nr
-                                        )
-                                    kwargs = {
-                                        "data": data_,
-                                        "zip_type": zip_type,
-                                        "param": param,
-                                    }
-                                    block = DataZippedBlock(**kwargs)
+                            if compression and self.version >= "4.10":
+                                if compression == 1:
+                                    zip_type = v4c.FLAG_DZ_DEFLATE
+                                else:
+                                    zip_type = v4c.FLAG_DZ_TRANPOSED_DEFLATE
+                                if compression == 1:
+                                    param = 0
                                 else:
-                                    block = DataBlock(data=data_)
+                                    param = gp.channel_group.samples_byte_nr + gp.channel_group.invalidation_bytes_nr
+                                build_block = partial(DataZippedBlock, zip_type=zip_type, param=param)
+                            else:
+                                build_block = DataBlock
+
+                            fragments = (data__[0] for data__ in data)
+                            if time_values:
+                                fragments = self._with_time_values(gp_nr, fragments, dl_block)
+
+                            for i, block in enumerate(self._build_data_blocks(fragments, build_block)):
                                 address = tell()
                                 block.address = address
 
@@ -9829,7 +10784,7 @@ class MDF4(MDF_Common):
             self._ch_map.clear()
 
             self._tempfile = NamedTemporaryFile(dir=self.temporary_folder)
-            self._file = open(self.name, "rb")
+            self._file = self._thread_safe_stream(open(self.name, "rb"))
             self._read()
 
         return dst
@@ -10130,6 +11085,28 @@ class MDF4(MDF_Common):
         max_progress_count: int = 0,
         progress=None,
     ) -> None:
+        """split the records of the unsorted data groups by record id
+
+        Parameters
+        ----------
+        compress : bool
+            LZ compress the split records stored in the temporary file
+        current_progress_index : int
+            progress value at the start of the sorting
+        max_progress_count : int
+            progress maximum value
+        progress : callable | Worker | None
+            progress callback or GUI worker
+
+        Raises
+        ------
+        MdfException :
+            if the stop flag of the *progress* worker is set. Unlike the
+            operations that return *TERMINATED*, the sorting runs while the
+            object is created, so the cancellation is raised from the
+            constructor
+
+        """
         if self._file is None:
             return
 
@@ -10146,13 +11123,8 @@ class MDF4(MDF_Common):
             except:
                 continue
 
-        read = self._file.read
-        seek = self._file.seek
-
-        self._tempfile.seek(0, 2)
-
-        tell = self._tempfile.tell
-        write = self._tempfile.write
+        if progress is not None and not callable(progress):
+            progress.signals.setMaximum.emit(max_progress_count)
 
         for address, groups in common.items():
             cg_map = {rec_id: self.groups[index_].channel_group for index_, rec_id in groups}
@@ -10169,221 +11141,71 @@ class MDF4(MDF_Common):
             record_id_nr = group.data_group.record_id_len
             cg_size = group.record_size
 
-            if record_id_nr == 1:
-                _unpack_stuct = UINT8_uf
-            elif record_id_nr == 2:
-                _unpack_stuct = UINT16_uf
-            elif record_id_nr == 4:
-                _unpack_stuct = UINT32_uf
-            elif record_id_nr == 8:
-                _unpack_stuct = UINT64_uf
-            else:
+            if record_id_nr not in (1, 2, 4, 8):
                 message = f"invalid record id size {record_id_nr}"
                 raise MdfException(message)
 
-            rem = b""
-            blocks = list(group.get_data_blocks())  # might be expensive ?
+            blocks = self._split_sort_blocks(group.get_data_blocks())
             # most of the steps are for sorting, but the last 2 are after we've done sorting
             # so remove the 2 steps that are not related to sorting from the count
-            step = float(SORT_STEPS - 2) / len(blocks) / len(common)
+            step = float(SORT_STEPS - 2) / max(len(blocks), 1) / len(common)
             index = float(current_progress_index)
             previous = index
-            for info in blocks:
-                dtblock_address, dtblock_raw_size, dtblock_size, block_type, param = (
-                    info.address,
-                    info.original_size,
-                    info.compressed_size,
-                    info.block_type,
-                    info.param,
-                )
-
-                index += step
-
-                # if we've been told to notify about progress
-                # and we've been given a max progress count (only way we can do progress updates)
-                # and there's a tick update (at least 1 integer between the last update and the current index)
-                # then we can notify about the callback progress
 
-                if callable(progress) and max_progress_count and floor(previous) < floor(index):
-                    progress(floor(index), max_progress_count)
-                    previous = index
-
-                seek(dtblock_address)
-
-                if block_type != v4c.DT_BLOCK:
-                    partial_records = {id_: [] for _, id_ in groups}
-                    new_data = read(dtblock_size)
-
-                    if block_type == v4c.DZ_BLOCK_DEFLATE:
-                        new_data = decompress(new_data, bufsize=dtblock_raw_size)
-                    elif block_type == v4c.DZ_BLOCK_TRANSPOSED:
-                        new_data = decompress(new_data, bufsize=dtblock_raw_size)
-                        cols = param
-                        lines = dtblock_raw_size // cols
-
-                        nd = fromstring(new_data[: lines * cols], dtype=uint8)
-                        nd = nd.reshape((cols, lines))
-                        new_data = nd.T.ravel().tobytes() + new_data[lines * cols :]
-
-                    new_data = rem + new_data
+            if compress and self._compression_workers:
+                submit = get_thread_pool(self._compression_workers).submit
+                depth = 2 * self._compression_workers
+            else:
+                submit = None
+                depth = 0
 
-                    try:
-                        rem = sort_data_block(
-                            new_data,
-                            partial_records,
-                            cg_size,
-                            record_id_nr,
-                            _unpack_stuct,
-                        )
-                    except:
-                        print(format_exc())
-                        raise
+            # the blocks are read, decompressed and split by record id in the
+            # calling thread while the decompression of the next blocks and the
+            # compression of the split records can run in the worker threads
+            rem = b""
+            pending = deque()
 
-                    for rec_id, new_data in partial_records.items():
-                        channel_group = cg_map[rec_id]
+            try:
+                for info, new_data in self._prefetch_data_blocks((info, self._file) for info in blocks):
+                    index += step
+
+                    # if we've been told to notify about progress
+                    # and we've been given a max progress count (only way we can do progress updates)
+                    # and there's a tick update (at least 1 integer between the last update and the current index)
+                    # then we can notify about the callback progress
+                    if progress is not None and floor(previous) < floor(index):
+                        if not callable(progress):
+                            progress.signals.setValue.emit(floor(index))
+                        elif max_progress_count:
+                            progress(floor(index), max_progress_count)
+                        previous = index
+
+                    if progress is not None and not callable(progress) and progress.stop:
+                        raise MdfException(f"Sorting of {self.name} was cancelled")
 
-                        if channel_group.address in self._cn_data_map:
-                            dg_cntr, ch_cntr = self._cn_data_map[channel_group.address]
-                        else:
-                            dg_cntr, ch_cntr = None, None
-
-                        if new_data:
-                            tempfile_address = tell()
-
-                            new_data = b"".join(new_data)
-                            original_size = len(new_data)
-                            if original_size:
-                                if compress:
-                                    new_data = lz_compress(new_data)
-                                    compressed_size = len(new_data)
-
-                                    write(new_data)
-
-                                    if dg_cntr is not None:
-                                        info = SignalDataBlockInfo(
-                                            address=tempfile_address,
-                                            compressed_size=compressed_size,
-                                            original_size=original_size,
-                                            block_type=v4c.DZ_BLOCK_LZ,
-                                            location=v4c.LOCATION_TEMPORARY_FILE,
-                                        )
-                                        self.groups[dg_cntr].signal_data[ch_cntr][0].append(info)
+                    if rem:
+                        new_data = rem + new_data
 
-                                    else:
-                                        block_info = DataBlockInfo(
-                                            address=tempfile_address,
-                                            block_type=v4c.DZ_BLOCK_LZ,
-                                            compressed_size=compressed_size,
-                                            original_size=original_size,
-                                            param=0,
-                                        )
-                                        final_records[rec_id].append(block_info)
-                                else:
-                                    write(new_data)
-
-                                    if dg_cntr is not None:
-                                        info = SignalDataBlockInfo(
-                                            address=tempfile_address,
-                                            compressed_size=original_size,
-                                            original_size=original_size,
-                                            block_type=v4c.DT_BLOCK,
-                                            location=v4c.LOCATION_TEMPORARY_FILE,
-                                        )
-                                        self.groups[dg_cntr].signal_data[ch_cntr][0].append(info)
+                    partial_records, rem = sort_data_records(new_data, cg_size, record_id_nr)
 
-                                    else:
-                                        block_info = DataBlockInfo(
-                                            address=tempfile_address,
-                                            block_type=v4c.DT_BLOCK,
-                                            compressed_size=original_size,
-                                            original_size=original_size,
-                                            param=0,
-                                        )
-                                        final_records[rec_id].append(block_info)
-
-                else:  # DTBLOCK
-                    seek(dtblock_address)
-                    limit = 32 * 1024 * 1024  # 32MB
-                    while dtblock_size:
-                        if dtblock_size > limit:
-                            dtblock_size -= limit
-                            new_data = rem + read(limit)
+                    for rec_id, records in partial_records.items():
+                        if not compress:
+                            pending.append((rec_id, len(records), False, records))
+                        elif submit is None:
+                            pending.append((rec_id, len(records), True, lz_compress(records)))
                         else:
-                            new_data = rem + read(dtblock_size)
-                            dtblock_size = 0
-                        partial_records = {id_: [] for _, id_ in groups}
-
-                        rem = sort_data_block(
-                            new_data,
-                            partial_records,
-                            cg_size,
-                            record_id_nr,
-                            _unpack_stuct,
-                        )
-
-                        for rec_id, new_data in partial_records.items():
-                            channel_group = cg_map[rec_id]
-
-                            if channel_group.address in self._cn_data_map:
-                                dg_cntr, ch_cntr = self._cn_data_map[channel_group.address]
-                            else:
-                                dg_cntr, ch_cntr = None, None
-
-                            if new_data:
-                                tempfile_address = tell()
-                                new_data = b"".join(new_data)
+                            pending.append((rec_id, len(records), True, submit(lz_compress, records)))
 
-                                original_size = len(new_data)
-                                if original_size:
-                                    if compress:
-                                        new_data = lz_compress(new_data)
-                                        compressed_size = len(new_data)
-
-                                        write(new_data)
-
-                                        if dg_cntr is not None:
-                                            info = SignalDataBlockInfo(
-                                                address=tempfile_address,
-                                                compressed_size=compressed_size,
-                                                original_size=original_size,
-                                                block_type=v4c.DZ_BLOCK_LZ,
-                                                location=v4c.LOCATION_TEMPORARY_FILE,
-                                            )
-                                            self.groups[dg_cntr].signal_data[ch_cntr][0].append(info)
-
-                                        else:
-                                            block_info = DataBlockInfo(
-                                                address=tempfile_address,
-                                                block_type=v4c.DZ_BLOCK_LZ,
-                                                compressed_size=compressed_size,
-                                                original_size=original_size,
-                                                param=None,
-                                            )
-
-                                            final_records[rec_id].append(block_info)
-                                    else:
-                                        write(new_data)
-
-                                        if dg_cntr is not None:
-                                            info = SignalDataBlockInfo(
-                                                address=tempfile_address,
-                                                compressed_size=original_size,
-                                                original_size=original_size,
-                                                block_type=v4c.DT_BLOCK,
-                                                location=v4c.LOCATION_TEMPORARY_FILE,
-                                            )
-                                            self.groups[dg_cntr].signal_data[ch_cntr][0].append(info)
+                    while len(pending) > depth:
+                        self._write_sorted_records(cg_map[pending[0][0]], final_records, *pending.popleft())
 
-                                        else:
-                                            block_info = DataBlockInfo(
-                                                address=tempfile_address,
-                                                block_type=v4c.DT_BLOCK,
-                                                compressed_size=original_size,
-                                                original_size=original_size,
-                                                param=None,
-                                            )
+                while pending:
+                    self._write_sorted_records(cg_map[pending[0][0]], final_records, *pending.popleft())
 
-                                            final_records[rec_id].append(block_info)
+            finally:
+                for *_, records in pending:
+                    if isinstance(records, Future):
+                        records.cancel()
 
             # after we read all DTBLOCKs in the original file,
             # we assign freshly created blocks from temporary file to
@@ -10423,6 +11245,89 @@ class MDF4(MDF_Common):
         if self.identification["unfinalized_standard_flags"] & v4c.FLAG_UNFIN_UPDATE_VLSD_BYTES:
             self.identification["unfinalized_standard_flags"] -= v4c.FLAG_UNFIN_UPDATE_VLSD_BYTES
 
+    def _split_sort_blocks(self, blocks: Iterator[DataBlockInfo]) -> list[DataBlockInfo]:
+        """unsorted data blocks to be split by record id; the DT blocks are
+        read in fragments of at most SORT_FRAGMENT_SIZE bytes. The block limits
+        are ignored since they are computed from the cycles counters without the
+        record ids"""
+
+        limit = SORT_FRAGMENT_SIZE
+        split_blocks = []
+
+        for info in blocks:
+            if info.block_type != v4c.DT_BLOCK:
+                split_blocks.append(
+                    DataBlockInfo(
+                        address=info.address,
+                        block_type=info.block_type,
+                        original_size=info.original_size,
+                        compressed_size=info.compressed_size,
+                        param=info.param,
+                    )
+                )
+                continue
+
+            for offset in range(0, info.original_size, limit):
+                size = min(limit, info.original_size - offset)
+                split_blocks.append(
+                    DataBlockInfo(
+                        address=info.address + offset,
+                        block_type=v4c.DT_BLOCK,
+                        original_size=size,
+                        compressed_size=size,
+                        param=0,
+                    )
+                )
+
+        return split_blocks
+
+    def _write_sorted_records(
+        self,
+        channel_group: ChannelGroup,
+        final_records: dict[int, list[DataBlockInfo]],
+        rec_id: int,
+        original_size: int,
+        compressed: bool,
+        data: bytes | Future,
+    ) -> None:
+        """write the records of *rec_id* that were split from an unsorted
+        block to the temporary file; VLSD records are stored as signal data of
+        the channel that references the VLSD channel group"""
+
+        if isinstance(data, Future):
+            data = data.result()
+
+        stream = self._tempfile
+        stream.seek(0, 2)
+        tempfile_address = stream.tell()
+        stream.write(data)
+
+        if compressed:
+            block_type = v4c.DZ_BLOCK_LZ
+        else:
+            block_type = v4c.DT_BLOCK
+
+        if channel_group.address in self._cn_data_map:
+            dg_cntr, ch_cntr = self._cn_data_map[channel_group.address]
+            info = SignalDataBlockInfo(
+                address=tempfile_address,
+                compressed_size=len(data),
+                original_size=original_size,
+                block_type=block_type,
+                location=v4c.LOCATION_TEMPORARY_FILE,
+            )
+            self.groups[dg_cntr].signal_data[ch_cntr][0].append(info)
+
+        else:
+            info = DataBlockInfo(
+                address=tempfile_address,
+                block_type=block_type,
+                compressed_size=len(data),
+                original_size=original_size,
+                param=0,
+            )
+            final_records[rec_id].append(info)
+
     def _process_bus_logging(self) -> None:
         groups_count = len(self.groups)
         for index in range(groups_count):
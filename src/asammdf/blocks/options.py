@@ -24,6 +24,17 @@ _GLOBAL_OPTIONS = {
     "temporary_folder": None,
     "raise_on_multiple_occurrences": True,
     "fill_0_for_missing_computation_channels": False,
+    "decompression_workers": 0,
+    "decompression_prefetch": 4,
+    "compression_workers": 0,
+    "computation_workers": 0,
+    # folder used to store the compiled CAN databases between sessions
+    # (disabled by default). The files are pickled objects: they are signed
+    # with a secret stored in the folder and unsigned files are ignored, but
+    # anyone that can write to the folder and read the secret can make the
+    # application execute arbitrary code, so only use a folder that is
+    # private to the user
+    "can_database_cache": None,
 }
 
 
@@ -33,6 +44,8 @@ def set_global_option(opt, value):
 
     if opt == "read_fragment_size":
         value = int(value)
+    elif opt in ("decompression_workers", "decompression_prefetch", "compression_workers", "computation_workers"):
+        value = max(int(value), 0)
     elif opt == "write_fragment_size":
         value = min(int(value), 4 * 1024 * 1024)
     elif opt in (
@@ -47,7 +60,7 @@ def set_global_option(opt, value):
         value = IntegerInterpolation(value)
     elif opt == "float_interpolation":
         value = FloatInterpolation(value)
-    elif opt == "temporary_folder":
+    elif opt in ("temporary_folder", "can_database_cache"):
         value = value or None
         if value is not None:
             os.makedirs(value, exist_ok=True)
@@ -4,13 +4,20 @@ asammdf utility functions and classes
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from copy import deepcopy
 from functools import lru_cache
+import hashlib
+import hmac
 from io import StringIO
 import json
 import logging
+import os
 from pathlib import Path
+import pickle
 from random import randint
 import re
 import string
@@ -18,10 +25,24 @@ from struct import Struct
 import subprocess
 import sys
 from tempfile import TemporaryDirectory
+from threading import local, Lock
 from time import perf_counter
 from traceback import format_exc
 from typing import Any, Dict, overload, Tuple
 import xml.etree.ElementTree as ET
+import zlib
+
+# the private regular expression parser is only used to narrow the channel
+# search; the search falls back to a full scan if it is not available
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    try:
+        import sre_constants
+        import sre_parse
+    except ImportError:
+        sre_constants = sre_parse = None
 
 import lxml
 from typing_extensions import Literal, TypedDict
@@ -102,6 +123,7 @@ from ..types import (
 )
 from . import v2_v3_constants as v3c
 from . import v4_constants as v4c
+from .options import get_global_option
 
 UINT8_u = Struct("<B").unpack
 UINT16_u = Struct("<H").unpack
@@ -130,6 +152,8 @@ __all__ = [
     "CONVERT",
     "MERGE",
     "ChannelsDB",
+    "ChannelsSearchIndex",
+    "InterpolationPlan",
     "UniqueDB",
     "MdfException",
     "get_fmt_v3",
@@ -328,7 +352,9 @@ def get_text_v4(address: int, stream: ReadableBufferType, mapped: bool = False,
     address : int
         TextBlock address
     stream : handle
-        file IO handle
+        file IO handle; if it is not memory mapped, the block is read through
+        the stream position, so the callers that share the stream between
+        threads must hold the lock of the file
 
     Returns
     -------
@@ -1028,9 +1054,326 @@ def validate_version_argument(version: str, hint: int = 4) -> str:
     return valid_version
 
 
+class ChannelsSearchIndex:
+    """search index of the channel names
+
+    The index uses the casefolded channel names: a sorted array for the
+    prefix queries and a trigram posting index that gives the candidates of
+    the plain, regex and wildcard searches. The candidates are then checked
+    with the actual pattern, so the same index is used for the case sensitive
+    and the case insensitive searches.
+
+    The names are packed in numpy arrays; the names added after packing are
+    kept in a small dictionary index until the next packing.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    names : iterable
+        initial channel names
+
+    """
+
+    # number of names that are added before the index is packed again
+    RECENT_NAMES_LIMIT = 2**16
+
+    def __init__(self, names: Iterator[str] = ()) -> None:
+        self.names: list[str] = list(names)
+        self.casefolded: list[str] = [name.casefold() for name in self.names]
+        self._recent: dict[str, list[int]] = {}
+        self._pack()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _pack(self) -> None:
+        casefolded = self.casefolded
+        count = len(casefolded)
+
+        self._packed = count
+        self._recent = {}
+        # the sorted names are created on the first prefix query
+        self._sorted_indexes = None
+        self._sorted_names = None
+
+        # the trigrams are computed on the code points of all the names joined by "\0"
+        chars = np.frombuffer("\0".join(casefolded).encode("utf-32-le"), dtype="<u4")
+        present = np.bincount(chars, minlength=1) if len(chars) else np.zeros(1, dtype="i8")
+        present[0] = 1
+        alphabet = np.flatnonzero(present)
+        size = len(alphabet)
+
+        self._char_codes = {chr(char): code for code, char in enumerate(alphabet.tolist())}
+        self._alphabet_size = size
+
+        if count and size**3 * count < 2**63:
+            lookup = np.zeros(len(present), dtype="i8")
+            lookup[alphabet] = np.arange(size)
+            codes = lookup[chars]
+
+            first, second, third = codes[:-2], codes[1:-1], codes[2:]
+            trigrams = (first * size + second) * size + third
+            owners = np.repeat(
+                np.arange(count, dtype="i8"),
+                np.fromiter(map(len, casefolded), dtype="i8", count=count) + 1,
+            )[: len(trigrams)]
+
+            # the trigrams that contain the separator are dropped
+            valid = (first != 0) & (second != 0) & (third != 0)
+            keys = np.unique(trigrams[valid] * count + owners[valid])
+
+            trigrams = keys // count
+            bounds = np.flatnonzero(np.diff(trigrams)) + 1
+            self._trigram_codes = trigrams[np.concatenate([[0], bounds])] if len(keys) else trigrams
+            self._trigram_starts = np.concatenate([[0], bounds, [len(keys)]])
+            self._postings = (keys % count).astype("i4")
+
+        else:
+            self._trigram_codes = np.array([], dtype="i8")
+            self._trigram_starts = np.array([0], dtype="i8")
+            self._postings = np.array([], dtype="i4")
+            for index, name in enumerate(casefolded):
+                for trigram in _trigrams(name):
+                    self._recent.setdefault(trigram, []).append(index)
+
+    def add(self, name: str) -> None:
+        """add a new channel name to the index"""
+        index = len(self.names)
+        casefolded = name.casefold()
+
+        self.names.append(name)
+        self.casefolded.append(casefolded)
+
+        for trigram in _trigrams(casefolded):
+            self._recent.setdefault(trigram, []).append(index)
+
+    def _packed_postings(self, trigram: str) -> NDArray[Any]:
+        char_codes = self._char_codes
+        size = self._alphabet_size
+
+        code = 0
+        for char in trigram:
+            char_code = char_codes.get(char, None)
+            if char_code is None:
+                return self._postings[:0]
+            code = code * size + char_code
+
+        position = np.searchsorted(self._trigram_codes, code)
+        if position == len(self._trigram_codes) or self._trigram_codes[position] != code:
+            return self._postings[:0]
+
+        return self._postings[self._trigram_starts[position] : self._trigram_starts[position + 1]]
+
+    def prefix_candidates(self, prefix: str) -> list[int]:
+        """indexes of the names that start with *prefix*, ignoring the case"""
+        if len(self.names) - self._packed > self.RECENT_NAMES_LIMIT:
+            self._pack()
+
+        if self._sorted_indexes is None:
+            casefolded = self.casefolded
+            self._sorted_indexes = sorted(range(self._packed), key=casefolded.__getitem__)
+            self._sorted_names = [casefolded[index] for index in self._sorted_indexes]
+
+        prefix = prefix.casefold()
+        sorted_names = self._sorted_names
+        start = bisect_left(sorted_names, prefix)
+        stop = start
+        while stop < len(sorted_names) and sorted_names[stop].startswith(prefix):
+            stop += 1
+
+        candidates = self._sorted_indexes[start:stop]
+        candidates.extend(
+            index for index in range(self._packed, len(self.names)) if self.casefolded[index].startswith(prefix)
+        )
+
+        return sorted(candidates)
+
+    def trigram_candidates(self, literals: list[str]) -> list[int] | None:
+        """indexes of the names that contain all the *literals*, ignoring the
+        case, or *None* if the literals are too short for the trigrams"""
+        if len(self.names) - self._packed > self.RECENT_NAMES_LIMIT:
+            self._pack()
+
+        trigrams = set()
+        for literal in literals:
+            trigrams |= _trigrams(literal.casefold())
+        if not trigrams:
+            return None
+
+        postings = sorted((self._packed_postings(trigram) for trigram in trigrams), key=len)
+        candidates = postings[0]
+        for trigram_postings in postings[1:]:
+            if not len(candidates):
+                break
+            candidates = np.intersect1d(candidates, trigram_postings, assume_unique=True)
+        candidates = candidates.tolist()
+
+        if self._recent:
+            recent = None
+            for trigram in trigrams:
+                indexes = self._recent.get(trigram, ())
+                recent = set(indexes) if recent is None else recent.intersection(indexes)
+                if not recent:
+                    break
+            candidates.extend(sorted(recent))
+
+        return candidates
+
+    def _candidates(self, literals: list[str], prefix: str = "") -> list[int] | range:
+        candidates = self.trigram_candidates(literals)
+
+        if prefix:
+            prefixed = self.prefix_candidates(prefix)
+            if candidates is None or len(prefixed) < len(candidates):
+                candidates = prefixed
+
+        if candidates is None:
+            return range(len(self.names))
+        else:
+            return candidates
+
+    def find(self, text: str, case_insensitive: bool = False) -> list[str]:
+        """names that contain the *text*
+
+        Parameters
+        ----------
+        text : str
+            searched text
+        case_insensitive : bool
+            ignore the case
+
+        Returns
+        -------
+        names : list
+            matching channel names in the order they were added
+
+        """
+        names = self.names
+        candidates = self._candidates([text])
+
+        if case_insensitive:
+            text = text.casefold()
+            casefolded = self.casefolded
+            return [names[i] for i in candidates if text in casefolded[i]]
+        else:
+            return [names[i] for i in candidates if text in names[i]]
+
+    def search(self, pattern: re.Pattern, fullmatch: bool = False) -> list[str]:
+        """names that match the regular expression *pattern*
+
+        The literal parts of the pattern select the candidate names from the
+        index; the candidates are then checked with the *pattern*.
+
+        Parameters
+        ----------
+        pattern : re.Pattern
+            compiled regular expression
+        fullmatch : bool
+            the pattern must match the complete name instead of any part of it
+
+        Returns
+        -------
+        names : list
+            matching channel names in the order they were added
+
+        """
+        literals, prefix = _pattern_literals(pattern, fullmatch)
+
+        match = pattern.fullmatch if fullmatch else pattern.search
+        names = self.names
+        return [names[i] for i in self._candidates(literals, prefix) if match(names[i])]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _special_case_folding(char: str) -> bool:
+    """*re.IGNORECASE* can match *char* with characters that have a different
+    casefold (for example "i" matches the dotless and the dotted capital i)"""
+    return not char.isascii() or char in "iI"
+
+
+def _pattern_literals(pattern: re.Pattern, anchored: bool = False) -> tuple[list[str], str]:
+    """literal strings that must be contained by the names that match the
+    *pattern* and the literal prefix of the anchored patterns
+
+    For the case insensitive patterns the literals are split at the characters
+    with special case folding, because the index uses the casefolded names.
+    No literals are returned, meaning a full scan of the names, if the pattern
+    cannot be analyzed with the private *re* parser.
+    """
+
+    if sre_parse is None:
+        return [], ""
+
+    try:
+        return _parsed_pattern_literals(pattern, anchored)
+    except Exception:
+        logger.debug(f"full scan for the search pattern {pattern.pattern!r}: {format_exc()}")
+        return [], ""
+
+
+def _parsed_pattern_literals(pattern: re.Pattern, anchored: bool) -> tuple[list[str], str]:
+    items = list(sre_parse.parse(pattern.pattern, pattern.flags))
+
+    literals = []
+    current = []
+    prefix = None
+
+    if items and items[0][0] is sre_constants.AT and items[0][1] is sre_constants.AT_BEGINNING:
+        items = items[1:]
+        anchored = anchored or not pattern.flags & re.MULTILINE
+
+    ignore_case = pattern.flags & re.IGNORECASE
+
+    for op, value in items:
+        if op is sre_constants.LITERAL and not (ignore_case and _special_case_folding(chr(value))):
+            current.append(chr(value))
+            continue
+
+        if prefix is None:
+            prefix = "".join(current)
+        if current:
+            literals.append("".join(current))
+            current = []
+
+        if op is sre_constants.BRANCH or (op is sre_constants.AT and value is not sre_constants.AT_END):
+            # the literals after a top level alternation are optional
+            break
+
+    else:
+        if prefix is None:
+            prefix = "".join(current)
+        if current:
+            literals.append("".join(current))
+
+    return literals, prefix if anchored else ""
+
+
 class ChannelsDB(Dict[str, Tuple[Tuple[int, int], ...]]):
+    _search_index: ChannelsSearchIndex | None = None
+
     def __init__(self) -> None:
         super().__init__()
+        self._search_index = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the search index is not saved; it is built again on first use
+        return {}
+
+    @property
+    def search_index(self) -> ChannelsSearchIndex:
+        """search index of the channel names; it is built on first use and
+        then updated by *add*
+
+        .. versionadded:: 7.5.0
+
+        """
+        if self._search_index is None or len(self._search_index) != len(self):
+            self._search_index = ChannelsSearchIndex(self)
+        return self._search_index
 
     def add(self, channel_name: str, entry: tuple[int, int]) -> None:
         """add name to channels database and check if it contains a source
@@ -1047,6 +1390,8 @@ class ChannelsDB(Dict[str, Tuple[Tuple[int, int], ...]]):
         if channel_name:
             if channel_name not in self:
                 self[channel_name] = (entry,)
+                if self._search_index is not None:
+                    self._search_index.add(channel_name)
             else:
                 self[channel_name] += (entry,)
 
@@ -1055,9 +1400,36 @@ class ChannelsDB(Dict[str, Tuple[Tuple[int, int], ...]]):
 
                 if channel_name not in self:
                     self[channel_name] = (entry,)
+                    if self._search_index is not None:
+                        self._search_index.add(channel_name)
                 elif entry not in self[channel_name]:
                     self[channel_name] += (entry,)
 
+    def search(self, pattern: re.Pattern, fullmatch: bool = False) -> list[str]:
+        """channel names that match the regular expression *pattern*; see
+        *ChannelsSearchIndex.search*
+
+        .. versionadded:: 7.5.0
+
+        """
+        return self.search_index.search(pattern, fullmatch)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._search_index = None
+
+    def pop(self, *args):
+        self._search_index = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._search_index = None
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self._search_index = None
+
 
 def randomized_string(size: int) -> bytes:
     """get a \0 terminated string of size length
@@ -1275,27 +1647,59 @@ class Group:
         self.data_blocks_info_generator = None
 
     def get_data_blocks(self) -> Iterator[DataBlockInfo]:
-        yield from self.data_blocks
-
-        while True:
-            try:
-                info = next(self.data_blocks_info_generator)
-                self.data_blocks.append(info)
-                yield info
-            except StopIteration:
-                break
+        yield from _iter_blocks_info(self.data_blocks, self.data_blocks_info_generator)
 
     def get_signal_data_blocks(self, index: int) -> Iterator[SignalDataBlockInfo]:
         signal_data = self.signal_data[index]
         if signal_data is not None:
             signal_data, signal_generator = signal_data
-            yield from signal_data
+            yield from _iter_blocks_info(signal_data, signal_generator)
+
+
+class LockedIterator:
+    """iterator that is advanced while holding the reentrant *lock*; the lazy
+    blocks info generators read from the shared file object, so they are
+    wrapped with the lock of the file
+
+    .. versionadded:: 7.5.0
+
+    """
+
+    __slots__ = ("iterator", "lock")
+
+    def __init__(self, iterator: Iterator[Any], lock: Any) -> None:
+        self.iterator = iterator
+        self.lock = lock
+
+    def __iter__(self) -> LockedIterator:
+        return self
+
+    def __next__(self) -> Any:
+        with self.lock:
+            return next(self.iterator)
+
+
+def _iter_blocks_info(blocks: list[Any], generator: Iterator[Any]) -> Iterator[Any]:
+    """iterate the already known blocks info and then continue with the lazy
+    generator; a *LockedIterator* is advanced while holding its lock, so that
+    the same group can be read from several threads"""
+
+    lock = getattr(generator, "lock", None)
+    if lock is None:
+        lock = nullcontext()
 
-            while True:
+    i = 0
+    while True:
+        if i < len(blocks):
+            yield blocks[i]
+            i += 1
+        else:
+            with lock:
+                # another thread could have advanced the generator
+                if i < len(blocks):
+                    continue
                 try:
-                    info = next(signal_generator)
-                    signal_data.append(info)
-                    yield info
+                    blocks.append(next(generator))
                 except StopIteration:
                     break
 
@@ -1566,6 +1970,125 @@ class SignalDataBlockInfo:
         )
 
 
+class ThreadSafeStream:
+    """binary file wrapper that keeps a separate stream position for each
+    thread, so that several threads can use the same file object without
+    corrupting each other's reads
+
+    The reads and writes use *os.pread* and *os.pwrite* if the wrapped object
+    has a file descriptor and the platform supports them; otherwise the
+    wrapped object is positioned and accessed while holding a lock.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    stream : file-like
+        wrapped binary file object
+
+    """
+
+    def __init__(self, stream: Any) -> None:
+        self.stream = stream
+        self._position = local()
+        self._lock = Lock()
+
+        try:
+            self._fd = stream.fileno()
+        except:
+            self._fd = None
+
+        if not hasattr(os, "pread"):
+            self._fd = None
+        elif self._fd is not None and hasattr(stream, "flush"):
+            stream.flush()
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.stream, item)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.stream)
+
+    def _size(self) -> int:
+        if self._fd is not None:
+            return os.fstat(self._fd).st_size
+        else:
+            with self._lock:
+                position = self.stream.tell()
+                size = self.stream.seek(0, 2)
+                self.stream.seek(position)
+            return size
+
+    def tell(self) -> int:
+        return getattr(self._position, "value", 0)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 1:
+            offset += self.tell()
+        elif whence == 2:
+            offset += self._size()
+        self._position.value = offset
+        return offset
+
+    def read(self, size: int = -1) -> bytes:
+        position = self.tell()
+        if size is None or size < 0:
+            size = max(self._size() - position, 0)
+
+        if self._fd is not None:
+            data = os.pread(self._fd, size, position)
+        else:
+            with self._lock:
+                self.stream.seek(position)
+                data = self.stream.read(size)
+
+        self._position.value = position + len(data)
+        return data
+
+    def write(self, data: bytes) -> int:
+        position = self.tell()
+
+        if self._fd is not None:
+            size = os.pwrite(self._fd, data, position)
+        else:
+            with self._lock:
+                self.stream.seek(position)
+                size = self.stream.write(data)
+
+        self._position.value = position + size
+        return size
+
+
+_THREAD_POOLS = {}
+_THREAD_POOLS_LOCK = Lock()
+
+
+def get_thread_pool(workers: int) -> ThreadPoolExecutor:
+    """get a shared thread pool with the requested number of workers. The
+    pools are created on first use and reused for the lifetime of the process
+
+    Parameters
+    ----------
+    workers : int
+        number of worker threads
+
+    Returns
+    -------
+    pool : concurrent.futures.ThreadPoolExecutor
+        thread pool executor
+
+    """
+    with _THREAD_POOLS_LOCK:
+        pool = _THREAD_POOLS.get(workers, None)
+        if pool is None:
+            pool = _THREAD_POOLS[workers] = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="asammdf",
+            )
+
+    return pool
+
+
 def get_fields(obj: object) -> list[Any]:
     fields = []
     for attr in dir(obj):
@@ -1662,6 +2185,93 @@ def master_using_raster(mdf: MDF_v2_v3_v4, raster: RasterType, endpoint: bool =
     return master
 
 
+class InterpolationPlan:
+    """index and weight vectors used to resample all the channels that share
+    the *timestamps* time base on the *new_timestamps* raster
+
+    The previous sample index is computed once and the linear interpolation
+    weights are computed on the first linear interpolation. The results are
+    identical to the *np.searchsorted* previous sample lookup and to
+    *np.interp*.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    timestamps : np.array
+        time base of the channels
+    new_timestamps : np.array
+        new raster
+
+    """
+
+    def __init__(self, timestamps: NDArray[Any], new_timestamps: NDArray[Any]) -> None:
+        self.timestamps = timestamps
+        self.new_timestamps = new_timestamps
+
+        index = np.searchsorted(timestamps, new_timestamps, side="right")
+        index -= 1
+        index[index < 0] = 0
+        self.index = index
+
+        self._inner = None
+        self._right = None
+        self._span = None
+        self._offset = None
+
+    def _prepare_linear(self) -> None:
+        timestamps, index = self.timestamps, self.index
+
+        # the new timestamps that are strictly between two timestamps; all the
+        # others use the sample at the previous sample index
+        offset = self.new_timestamps - timestamps[index]
+        inner = (offset > 0) & (index < len(timestamps) - 1)
+
+        right = np.minimum(index + 1, len(timestamps) - 1)
+
+        self._inner = inner
+        self._right = right
+        self._span = np.where(inner, timestamps[right] - timestamps[index], 1.0)
+        self._offset = np.where(inner, offset, 0.0)
+
+    def previous(self, samples: NDArray[Any]) -> NDArray[Any]:
+        """samples at the previous sample index; *samples* can have any number
+        of dimensions"""
+        return samples[self.index]
+
+    def linear(self, samples: NDArray[Any]) -> NDArray[Any]:
+        """linear interpolation of the 1D numeric *samples* as float64"""
+
+        if self._inner is None:
+            self._prepare_linear()
+
+        samples = samples.astype("f8", copy=False)
+        inner, right = self._inner, self._right
+
+        with np.errstate(invalid="ignore"):
+            start = samples[self.index]
+            slope = samples[right]
+            slope -= start
+            slope /= self._span
+
+            values = slope * self._offset
+            values += start
+
+            # same fallback as np.interp for the infinite samples
+            nans = np.flatnonzero(np.isnan(values))
+            nans = nans[inner[nans]]
+            if len(nans):
+                stop = samples[right[nans]]
+                fallback = slope[nans] * (self.new_timestamps[nans] - self.timestamps[right[nans]]) + stop
+                equal = np.isnan(fallback) & (start[nans] == stop)
+                fallback[equal] = stop[equal]
+                values[nans] = fallback
+
+        np.copyto(values, start, where=~inner)
+
+        return values
+
+
 def csv_int2bin(val) -> str:
     """format CAN id as bin
 
@@ -1722,9 +2332,167 @@ def pandas_query_compatible(name: str) -> str:
     return name
 
 
-def load_can_database(path: StrPathType, contents: bytes | str | None = None, **kwargs) -> CanMatrix | None:
+# bump when the layout of the compiled databases changes
+CAN_DATABASE_CACHE_VERSION = 2
+CAN_DATABASE_CACHE_MAGIC = b"ASAMMDF-CANDB"
+CAN_DATABASE_CACHE_KEY_FILE = "cache.key"
+CAN_DATABASE_MEMO_SIZE = 16
+_can_database_memo = {}
+_can_database_memo_lock = Lock()
+
+
+def can_database_key(path: StrPathType, contents: bytes | str | None = None, **kwargs) -> str:
+    """content hash used to identify a compiled CAN database
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    path : StrPathType
+        database path
+    contents: bytes | str | None = None
+        optional database content
+    kwargs : dict
+        see *load_can_database*
+
+    Returns
+    -------
+    key : str
+        hex digest of the database contents and of the loading options
+
     """
+    path = Path(path)
+    if contents is None:
+        contents = path.read_bytes()
+    elif isinstance(contents, str):
+        contents = contents.encode("utf-8")
+
+    options = repr(sorted(kwargs.items()))
+    header = f"{CAN_DATABASE_CACHE_VERSION}|{canmatrix.__version__}|{path.suffix.lower()}|{options}|"
+
+    digest = hashlib.sha256(header.encode("utf-8"))
+    digest.update(contents)
+    return digest.hexdigest()
+
+
+def _can_database_cache_secret(cache: Path) -> bytes:
+    """secret used to sign the compiled databases written in the *cache*
+    folder; it is created on first use and readable only by the user"""
+    file_name = cache / CAN_DATABASE_CACHE_KEY_FILE
+    try:
+        return file_name.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    try:
+        fd = os.open(file_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return file_name.read_bytes()
+
+    secret = os.urandom(32)
+    with os.fdopen(fd, "wb") as file:
+        file.write(secret)
+    return secret
+
+
+def _can_database_signature(secret: bytes, key: str, payload: bytes) -> bytes:
+    signature = hmac.new(secret, CAN_DATABASE_CACHE_MAGIC, "sha256")
+    signature.update(f"|{CAN_DATABASE_CACHE_VERSION}|{key}|".encode("ascii"))
+    signature.update(payload)
+    return signature.digest()
+
+
+def _load_compiled_can_database(key: str) -> bytes | None:
+    with _can_database_memo_lock:
+        compiled = _can_database_memo.get(key, None)
+    if compiled is not None:
+        return compiled
+
+    cache = get_global_option("can_database_cache")
+    if cache is None:
+        return None
+
+    cache = Path(cache)
+    file_name = cache / f"{key}.candb"
+    try:
+        data = file_name.read_bytes()
+    except:
+        return None
+
+    # only files signed with the secret of this cache folder are unpickled
+    size = len(CAN_DATABASE_CACHE_MAGIC)
+    signature, payload = data[size : size + 32], data[size + 32 :]
+    try:
+        valid = data[:size] == CAN_DATABASE_CACHE_MAGIC and hmac.compare_digest(
+            signature, _can_database_signature(_can_database_cache_secret(cache), key, payload)
+        )
+    except OSError:
+        valid = False
+
+    if not valid:
+        logger.warning(f'The compiled CAN database "{file_name}" is not signed by this cache and is ignored')
+        return None
 
+    try:
+        compiled = zlib.decompress(payload)
+    except:
+        return None
+
+    _memoize_compiled_can_database(key, compiled)
+    return compiled
+
+
+def _memoize_compiled_can_database(key: str, compiled: bytes) -> None:
+    with _can_database_memo_lock:
+        _can_database_memo.pop(key, None)
+        _can_database_memo[key] = compiled
+        while len(_can_database_memo) > CAN_DATABASE_MEMO_SIZE:
+            del _can_database_memo[next(iter(_can_database_memo))]
+
+
+def _store_compiled_can_database(key: str, can_matrix: CanMatrix) -> None:
+    try:
+        compiled = pickle.dumps(can_matrix, protocol=pickle.HIGHEST_PROTOCOL)
+    except:
+        logger.warning(f"The CAN database cannot be compiled:\n{format_exc()}")
+        return
+
+    _memoize_compiled_can_database(key, compiled)
+
+    cache = get_global_option("can_database_cache")
+    if cache is None:
+        return
+
+    cache = Path(cache)
+    file_name = cache / f"{key}.candb"
+    temporary = file_name.parent / f"{key}.{os.getpid()}.{randint(0, 2**32)}.tmp"
+    try:
+        payload = zlib.compress(compiled, 1)
+        signature = _can_database_signature(_can_database_cache_secret(cache), key, payload)
+        temporary.write_bytes(CAN_DATABASE_CACHE_MAGIC + signature + payload)
+        os.replace(temporary, file_name)
+    except:
+        logger.warning(f'Cannot write the compiled CAN database "{file_name}":\n{format_exc()}')
+        try:
+            temporary.unlink()
+        except:
+            pass
+
+
+def load_can_database(path: StrPathType, contents: bytes | str | None = None, **kwargs) -> CanMatrix | None:
+    """load a CAN database
+
+    The parsed databases are compiled and identified by the hash of their
+    contents; loading the same database again returns a copy of the
+    compiled database instead of parsing the file. The last compiled
+    databases are kept in memory and, if the *can_database_cache* global
+    option is set to a folder, they are also stored on disk so that they are
+    shared between processes and sessions. The files on disk are pickled
+    objects signed with a secret kept in the cache folder; files without a
+    valid signature are ignored.
+
+    .. versionchanged:: 7.5.0
+        added the compiled database cache
 
     Parameters
     ----------
@@ -1751,6 +2519,19 @@ def load_can_database(path: StrPathType, contents: bytes | str | None = None, **
 
     """
     path = Path(path)
+
+    try:
+        key = can_database_key(path, contents, **kwargs)
+    except:
+        key = None
+    else:
+        compiled = _load_compiled_can_database(key)
+        if compiled is not None:
+            try:
+                return pickle.loads(compiled)
+            except:
+                logger.warning(f"The compiled CAN database is not valid and it will be loaded again:\n{format_exc()}")
+
     import_type = path.suffix.lstrip(".").lower()
     if contents is None:
         func = canmatrix.formats.loadp
@@ -1801,6 +2582,9 @@ def load_can_database(path: StrPathType, contents: bytes | str | None = None, **
     else:
         can_matrix = None
 
+    if can_matrix is not None and key is not None:
+        _store_compiled_can_database(key, can_matrix)
+
     return can_matrix
 
 
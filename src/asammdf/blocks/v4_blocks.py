@@ -11,6 +11,7 @@ from pathlib import Path
 import re
 from struct import pack, unpack, unpack_from
 from textwrap import wrap
+from threading import RLock
 import time
 from traceback import format_exc
 from typing import Any, TYPE_CHECKING
@@ -42,6 +43,7 @@ import numpy as np
 
 from ..version import __version__
 from . import v4_constants as v4c
+from .cutils import lookup_indexes, nearest_indexes, range_lookup_indexes
 from .utils import (
     block_fields,
     escape_xml_string,
@@ -57,6 +59,9 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ..types import ReadableBufferType
     from .source_utils import Source
 
 SEEK_START = v4c.SEEK_START
@@ -74,6 +79,42 @@ EIGHT_BYTES = bytes(8)
 
 logger = logging.getLogger("asammdf")
 
+
+def _lookup_arrays(values: NDArray[Any], *keys: NDArray[Any]) -> list[NDArray[Any]] | None:
+    """cast the values and the conversion keys to the dtype that
+    *numpy.searchsorted* uses to compare them; *None* if the native lookup
+    functions cannot be used"""
+    if values.ndim != 1:
+        return None
+
+    kind = np.result_type(values.dtype, *[key.dtype for key in keys]).kind
+    if kind == "f":
+        dtype = np.float64
+    elif kind in "biu":
+        dtype = np.int64
+    else:
+        return None
+
+    return [np.ascontiguousarray(array, dtype=dtype) for array in (values, *keys)]
+
+
+def _value_to_text_table(texts: list[bytes | ChannelConversion]) -> tuple[list[bytes], list[int]] | None:
+    """texts table used to convert the lookup indexes; *None* if there are
+    referenced conversions"""
+    if all(isinstance(text, bytes) for text in texts):
+        return texts, [len(text) for text in texts]
+    else:
+        return None
+
+
+def _texts_from_indexes(indexes: NDArray[Any], texts: list[bytes], lengths: list[int]) -> NDArray[Any]:
+    """build the converted values; the bytes itemsize is given only by the
+    texts that are used, like for the conversion of an object array"""
+    used = np.flatnonzero(np.bincount(indexes, minlength=len(texts))).tolist()
+    itemsize = max([lengths[i] for i in used], default=0) or 1
+    return np.array(texts, dtype=f"S{itemsize}")[indexes]
+
+
 __all__ = [
     "AttachmentBlock",
     "Channel",
@@ -367,6 +408,117 @@ class AttachmentBlock:
 CN = b"##CN"
 
 
+class LazyChannelMetadata:
+    """Deferred loader for the channel metadata blocks (conversion, source and
+    comment). A single instance is shared by all the channels of a file and it
+    is stored in place of the unresolved values; the blocks are parsed from the
+    file on the first attribute access.
+
+    Parameters
+    ----------
+    stream : handle
+        file handle
+    mapped : bool
+        the stream is a memory map
+    lock : threading.RLock
+        lock of the file handle; the blocks are read while holding it, because
+        the stream position is shared with the other readers of the file
+
+    .. versionadded:: 7.5.0
+
+    """
+
+    __slots__ = ("cc_map", "lock", "mapped", "si_map", "stream", "tx_map")
+
+    def __init__(self, stream: ReadableBufferType, mapped: bool = False, lock: RLock | None = None) -> None:
+        self.stream = stream
+        self.mapped = mapped
+        self.lock = RLock() if lock is None else lock
+        self.cc_map = {}
+        self.si_map = {}
+        self.tx_map = {}
+
+    def __copy__(self) -> LazyChannelMetadata:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> LazyChannelMetadata:
+        return self
+
+    def _read(self, address: int, size: int) -> bytes:
+        if self.mapped:
+            return self.stream[address : address + size]
+        else:
+            self.stream.seek(address)
+            return self.stream.read(size)
+
+    def comment(self, address: int) -> str:
+        with self.lock:
+            return get_text_v4(address, self.stream, mapped=self.mapped)
+
+    def conversion(self, address: int) -> ChannelConversion | None:
+        with self.lock:
+            return self._conversion(address)
+
+    def source(self, address: int) -> SourceInformation | None:
+        with self.lock:
+            return self._source(address)
+
+    def _conversion(self, address: int) -> ChannelConversion | None:
+        cc_map = self.cc_map
+        try:
+            if address in cc_map:
+                conv = cc_map[address]
+            else:
+                (size,) = UINT64_u(self._read(address + 8, 8))
+                raw_bytes = self._read(address, size)
+
+                if raw_bytes in cc_map:
+                    conv = cc_map[raw_bytes]
+                else:
+                    conv = ChannelConversion(
+                        raw_bytes=raw_bytes,
+                        stream=self.stream,
+                        address=address,
+                        mapped=self.mapped,
+                        tx_map=self.tx_map,
+                    )
+                    cc_map[raw_bytes] = cc_map[address] = conv
+        except:
+            logger.warning(
+                f"Channel conversion parsing error: {format_exc()}. The error is ignored and the channel conversion is None"
+            )
+            conv = None
+
+        return conv
+
+    def _source(self, address: int) -> SourceInformation | None:
+        si_map = self.si_map
+        try:
+            if address in si_map:
+                source = si_map[address]
+            else:
+                raw_bytes = self._read(address, v4c.SI_BLOCK_SIZE)
+
+                if raw_bytes in si_map:
+                    source = si_map[raw_bytes]
+                else:
+                    source = SourceInformation(
+                        raw_bytes=raw_bytes,
+                        stream=self.stream,
+                        address=address,
+                        mapped=self.mapped,
+                        tx_map=self.tx_map,
+                    )
+                    si_map[raw_bytes] = si_map[address] = source
+        except:
+            logger.warning(
+                f"Channel source parsing error: {format_exc()}. The error is ignored and the channel source is None"
+            )
+            source = None
+
+        return source
+
+
 class Channel:
     """If the `load_metadata` keyword argument is not provided or is False,
     then the conversion, source and display name information is not processed.
@@ -450,6 +602,13 @@ class Channel:
     parse_xml_comment : bool
         option to parse XML channel comment to search for display name; default
         *True*
+    lazy_metadata : LazyChannelMetadata
+        if given then the conversion, the source and the comment (if
+        *use_display_names* is *False*) are read from the file on the first
+        access; default *None*
+
+        .. versionadded:: 7.5.0
+
     for dynamically created objects :
         see the key-value pairs
 
@@ -458,10 +617,10 @@ class Channel:
     __slots__ = (
         "name",
         "unit",
-        "comment",
+        "_comment",
         "display_names",
-        "conversion",
-        "source",
+        "_conversion",
+        "_source",
         "attachment",
         "address",
         "dtype_fmt",
@@ -641,15 +800,20 @@ class Channel:
                     ) = params
 
                 tx_map = kwargs["tx_map"]
+                lazy_metadata = kwargs.get("lazy_metadata", None)
 
                 parsed_strings = kwargs["parsed_strings"]
                 if parsed_strings is None:
                     self.name = get_text_v4(self.name_addr, stream, mapped=mapped)
-                    self.comment = get_text_v4(self.comment_addr, stream, mapped=mapped)
 
                     if kwargs["use_display_names"]:
+                        self.comment = get_text_v4(self.comment_addr, stream, mapped=mapped)
                         self.display_names = extract_display_names(self.comment)
                     else:
+                        if lazy_metadata is None:
+                            self.comment = get_text_v4(self.comment_addr, stream, mapped=mapped)
+                        else:
+                            self.comment = lazy_metadata
                         self.display_names = {}
                 else:
                     self.name, self.display_names, self.comment = parsed_strings
@@ -662,7 +826,9 @@ class Channel:
                     tx_map[addr] = self.unit
 
                 address = self.conversion_addr
-                if address:
+                if address and lazy_metadata is not None:
+                    self.conversion = lazy_metadata
+                elif address:
                     cc_map = kwargs["cc_map"]
                     try:
                         if address in cc_map:
@@ -693,7 +859,9 @@ class Channel:
                     self.conversion = None
 
                 address = self.source_addr
-                if address:
+                if address and lazy_metadata is not None:
+                    self.source = lazy_metadata
+                elif address:
                     si_map = kwargs["si_map"]
                     try:
                         if address in si_map:
@@ -857,15 +1025,20 @@ class Channel:
                     ) = params
 
                 tx_map = kwargs["tx_map"]
+                lazy_metadata = kwargs.get("lazy_metadata", None)
                 parsed_strings = kwargs["parsed_strings"]
 
                 if parsed_strings is None:
                     self.name = get_text_v4(self.name_addr, stream)
-                    self.comment = get_text_v4(self.comment_addr, stream)
 
                     if kwargs["use_display_names"]:
+                        self.comment = get_text_v4(self.comment_addr, stream)
                         self.display_names = extract_display_names(self.comment)
                     else:
+                        if lazy_metadata is None:
+                            self.comment = get_text_v4(self.comment_addr, stream)
+                        else:
+                            self.comment = lazy_metadata
                         self.display_names = {}
                 else:
                     self.name, self.display_names, self.comment = parsed_strings
@@ -880,7 +1053,9 @@ class Channel:
                 cc_map = kwargs["cc_map"]
 
                 address = self.conversion_addr
-                if address:
+                if address and lazy_metadata is not None:
+                    self.conversion = lazy_metadata
+                elif address:
                     try:
                         if address in cc_map:
                             conv = cc_map[address]
@@ -911,7 +1086,9 @@ class Channel:
                     self.conversion = None
 
                 address = self.source_addr
-                if address:
+                if address and lazy_metadata is not None:
+                    self.source = lazy_metadata
+                elif address:
                     try:
                         if address in si_map:
                             source = si_map[address]
@@ -1022,6 +1199,39 @@ class Channel:
 
         self.standard_C_size = True
 
+    @property
+    def comment(self) -> str:
+        comment = self._comment
+        if type(comment) is LazyChannelMetadata:
+            comment = self._comment = comment.comment(self.comment_addr)
+        return comment
+
+    @comment.setter
+    def comment(self, comment: str) -> None:
+        self._comment = comment
+
+    @property
+    def conversion(self) -> ChannelConversion | None:
+        conversion = self._conversion
+        if type(conversion) is LazyChannelMetadata:
+            conversion = self._conversion = conversion.conversion(self.conversion_addr)
+        return conversion
+
+    @conversion.setter
+    def conversion(self, conversion: ChannelConversion | None) -> None:
+        self._conversion = conversion
+
+    @property
+    def source(self) -> SourceInformation | None:
+        source = self._source
+        if type(source) is LazyChannelMetadata:
+            source = self._source = source.source(self.source_addr)
+        return source
+
+    @source.setter
+    def source(self, source: SourceInformation | None) -> None:
+        self._source = source
+
     def __getitem__(self, item: str) -> Any:
         return self.__getattribute__(item)
 
@@ -3236,6 +3446,13 @@ class ChannelConversion(_ChannelConversionBase):
 
             if conversion_type == v4c.CONVERSION_TYPE_TABI:
                 values = np.interp(values, raw_vals, phys)
+            elif nr and values.dtype.kind in "biuf":
+                shape = values.shape
+                inds = nearest_indexes(
+                    np.ascontiguousarray(values, dtype=np.float64).ravel(),
+                    np.ascontiguousarray(raw_vals, dtype=np.float64),
+                )
+                values = phys[inds].reshape(shape)
             else:
                 dim = raw_vals.shape[0]
 
@@ -3312,7 +3529,12 @@ class ChannelConversion(_ChannelConversionBase):
                     raw_vals = np.array([e[0] for e in x], dtype="<i8")
                     phys = [e[1] for e in x]
 
-                    self._cache = {"phys": phys, "raw_vals": raw_vals, "type": "big"}
+                    self._cache = {
+                        "phys": phys,
+                        "raw_vals": raw_vals,
+                        "table": _value_to_text_table([*phys, self.referenced_blocks["default_addr"]]),
+                        "type": "big",
+                    }
                 else:
                     phys = self._cache["phys"]
                     raw_vals = self._cache["raw_vals"]
@@ -3377,6 +3599,15 @@ class ChannelConversion(_ChannelConversionBase):
                     dtype=[(name, ret.dtype, ret.shape[1:])]
                     + [(name, values[name].dtype, values[name].shape[1:]) for name in names[1:]],
                 )
+
+            elif (
+                not ignore_value2text_conversions
+                and self._cache.get("table") is not None
+                and (arrays := _lookup_arrays(values, raw_vals)) is not None
+            ):
+                # all the physical values are texts: a single native lookup
+                values = _texts_from_indexes(lookup_indexes(*arrays), *self._cache["table"])
+
             else:
                 ret = np.full(values.size, None, "O")
 
@@ -3634,10 +3865,17 @@ class ChannelConversion(_ChannelConversionBase):
                     upper = np.array([e[1] for e in x], dtype="<i8")
                     phys = [e[2] for e in x]
 
+                    # the native lookup needs both range limits sorted
+                    if np.all(upper[1:] >= upper[:-1]):
+                        table = _value_to_text_table([*phys, self.referenced_blocks["default_addr"]])
+                    else:
+                        table = None
+
                     self._cache = {
                         "phys": phys,
                         "lower": lower,
                         "upper": upper,
+                        "table": table,
                         "type": "big",
                     }
                 else:
@@ -3647,56 +3885,65 @@ class ChannelConversion(_ChannelConversionBase):
 
                 default = self.referenced_blocks["default_addr"]
 
-            ret = np.full(values.size, None, "O")
+            if (
+                not ignore_value2text_conversions
+                and self._cache.get("table") is not None
+                and (arrays := _lookup_arrays(values, lower, upper)) is not None
+            ):
+                # all the physical values are texts: a single native lookup
+                values = _texts_from_indexes(range_lookup_indexes(*arrays), *self._cache["table"])
 
-            idx1 = np.searchsorted(lower, values, side="right") - 1
-            idx2 = np.searchsorted(upper, values, side="left")
+            else:
+                ret = np.full(values.size, None, "O")
 
-            idx_ne = np.argwhere(idx1 != idx2).ravel()
-            idx_eq = np.argwhere(idx1 == idx2).ravel()
+                idx1 = np.searchsorted(lower, values, side="right") - 1
+                idx2 = np.searchsorted(upper, values, side="left")
 
-            if isinstance(default, bytes):
-                ret[idx_ne] = default
-            else:
-                ret[idx_ne] = default.convert(
-                    values[idx_ne], ignore_value2text_conversions=ignore_value2text_conversions
-                )
+                idx_ne = np.argwhere(idx1 != idx2).ravel()
+                idx_eq = np.argwhere(idx1 == idx2).ravel()
 
-            if idx_eq.size:
-                indexes = idx1[idx_eq]
-                unique = np.unique(indexes)
-                for val in unique:
-                    item = phys[val]
-                    idx_ = np.argwhere(indexes == val).ravel()
+                if isinstance(default, bytes):
+                    ret[idx_ne] = default
+                else:
+                    ret[idx_ne] = default.convert(
+                        values[idx_ne], ignore_value2text_conversions=ignore_value2text_conversions
+                    )
 
-                    if isinstance(item, bytes):
-                        ret[idx_eq[idx_]] = item
-                    else:
-                        try:
-                            ret[idx_eq[idx_]] = item.convert(
-                                values[idx_eq[idx_]], ignore_value2text_conversions=ignore_value2text_conversions
-                            )
-                        except:
-                            raise
+                if idx_eq.size:
+                    indexes = idx1[idx_eq]
+                    unique = np.unique(indexes)
+                    for val in unique:
+                        item = phys[val]
+                        idx_ = np.argwhere(indexes == val).ravel()
 
-            all_bytes = True
-            for v in ret.tolist():
-                if not isinstance(v, bytes):
-                    all_bytes = False
-                    break
+                        if isinstance(item, bytes):
+                            ret[idx_eq[idx_]] = item
+                        else:
+                            try:
+                                ret[idx_eq[idx_]] = item.convert(
+                                    values[idx_eq[idx_]], ignore_value2text_conversions=ignore_value2text_conversions
+                                )
+                            except:
+                                raise
 
-            if not all_bytes:
-                try:
-                    ret = ret.astype("f8")
-                except:
-                    if as_bytes:
-                        ret = ret.astype(bytes)
-                    elif not as_object:
-                        ret = np.array([np.nan if isinstance(v, bytes) else v for v in ret.tolist()])
-            else:
-                ret = ret.astype(bytes)
+                all_bytes = True
+                for v in ret.tolist():
+                    if not isinstance(v, bytes):
+                        all_bytes = False
+                        break
 
-            values = ret
+                if not all_bytes:
+                    try:
+                        ret = ret.astype("f8")
+                    except:
+                        if as_bytes:
+                            ret = ret.astype(bytes)
+                        elif not as_object:
+                            ret = np.array([np.nan if isinstance(v, bytes) else v for v in ret.tolist()])
+                else:
+                    ret = ret.astype(bytes)
+
+                values = ret
 
         elif conversion_type == v4c.CONVERSION_TYPE_RTABX:
             if ignore_value2text_conversions:
@@ -3825,8 +4072,14 @@ class ChannelConversion(_ChannelConversionBase):
             phys = [self[f"val_{i}"] for i in range(nr)]
             default = self.val_default
 
+            # convert only the unique texts
+            if values.dtype.kind == "S" and values.ndim == 1:
+                unique, inverse = np.unique(values, return_inverse=True)
+            else:
+                unique, inverse = values, None
+
             new_values = []
-            for val in values:
+            for val in unique:
                 try:
                     val = phys[raw_values.index(val)]
                 except ValueError:
@@ -3834,6 +4087,8 @@ class ChannelConversion(_ChannelConversionBase):
                 new_values.append(val)
 
             values = np.array(new_values)
+            if inverse is not None:
+                values = values[inverse]
 
         elif conversion_type == v4c.CONVERSION_TYPE_TRANS:
             if not ignore_value2text_conversions:
@@ -3844,8 +4099,14 @@ class ChannelConversion(_ChannelConversionBase):
                 out_ = [self.referenced_blocks[f"output_{i}_addr"] for i in range(nr)]
                 default = self.referenced_blocks["default_addr"]
 
+                # convert only the unique texts
+                if values.dtype.kind == "S" and values.ndim == 1:
+                    unique, inverse = np.unique(values, return_inverse=True)
+                else:
+                    unique, inverse = values, None
+
                 new_values = []
-                for val in values:
+                for val in unique:
                     try:
                         val = out_[in_.index(val.strip(b"\0"))]
                     except ValueError:
@@ -3853,6 +4114,8 @@ class ChannelConversion(_ChannelConversionBase):
                     new_values.append(val)
 
                 values = np.array(new_values)
+                if inverse is not None:
+                    values = values[inverse]
 
         elif conversion_type == v4c.CONVERSION_TYPE_BITFIELD:
             if not ignore_value2text_conversions:
@@ -4825,6 +5088,11 @@ class DataList(_DataListBase):
 
         * ``offset_<N>`` - int : byte offset of N-th data block
 
+    * if the time values flag is set
+
+        * ``time_value_<N>`` - bytes : raw master value of the first record
+          of the N-th data block
+
     Other attributes
 
     * ``address`` - int : data list address
@@ -4868,6 +5136,11 @@ class DataList(_DataListBase):
                     )
                     for i, offset in enumerate(offsets):
                         self[f"offset_{i}"] = offset
+
+                if self.flags & v4c.FLAG_DL_TIME_VALUES:
+                    values = stream.read(self.data_block_nr * 8)
+                    for i in range(self.data_block_nr):
+                        self[f"time_value_{i}"] = values[i * 8 : (i + 1) * 8]
             else:
                 stream.seek(address)
 
@@ -4898,6 +5171,11 @@ class DataList(_DataListBase):
                     for i, offset in enumerate(offsets):
                         self[f"offset_{i}"] = offset
 
+                if self.flags & v4c.FLAG_DL_TIME_VALUES:
+                    values = stream.read(self.data_block_nr * 8)
+                    for i in range(self.data_block_nr):
+                        self[f"time_value_{i}"] = values[i * 8 : (i + 1) * 8]
+
         except KeyError:
             self.address = 0
             self.id = b"##DL"
@@ -4919,6 +5197,11 @@ class DataList(_DataListBase):
                 for i in range(self.data_block_nr):
                     self[f"offset_{i}"] = kwargs[f"offset_{i}"]
 
+            if self.flags & v4c.FLAG_DL_TIME_VALUES:
+                self.block_len += 8 * self.data_block_nr
+                for i in range(self.data_block_nr):
+                    self[f"time_value_{i}"] = kwargs.get(f"time_value_{i}", b"\0" * 8)
+
     def __getitem__(self, item: str) -> Any:
         return self.__getattribute__(item)
 
@@ -4936,6 +5219,10 @@ class DataList(_DataListBase):
             keys += tuple(f"offset_{i}" for i in range(self.data_block_nr))
             fmt = v4c.FMT_DATA_LIST.format(self.links_nr, self.data_block_nr)
 
+        if self.flags & v4c.FLAG_DL_TIME_VALUES:
+            keys += tuple(f"time_value_{i}" for i in range(self.data_block_nr))
+            fmt += "8s" * self.data_block_nr
+
         result = pack(fmt, *[getattr(self, key) for key in keys])
 
         return result
@@ -5953,17 +6240,17 @@ class ListData(_ListDataBase):
 
     * if time values flag is set
 
-        * ``time_value_<N>`` - int | float : first raw timestamp value of
+        * ``time_value_<N>`` - bytes : first raw timestamp value of
           N-th data block
 
     * if angle values flag is set
 
-        * ``angle_value_<N>`` - int | float : first raw angle value of
+        * ``angle_value_<N>`` - bytes : first raw angle value of
           N-th data block
 
     * if distance values flag is set
 
-        * ``distance_value_<N>`` - int | float : first raw distance value of
+        * ``distance_value_<N>`` - bytes : first raw distance value of
           N-th data block
 
     Other attributes
@@ -6005,22 +6292,22 @@ class ListData(_ListDataBase):
                         self[f"offset_{i}"] = offset
 
                 if self.flags & v4c.FLAG_LD_TIME_VALUES:
-                    values = unpack_from(f"<{8 * self.data_block_nr}s", stream, address)
+                    (values,) = unpack_from(f"<{8 * self.data_block_nr}s", stream, address)
                     address += self.data_block_nr * 8
-                    for i, value in enumerate(values):
-                        self[f"time_value_{i}"] = value
+                    for i in range(self.data_block_nr):
+                        self[f"time_value_{i}"] = values[i * 8 : (i + 1) * 8]
 
                 if self.flags & v4c.FLAG_LD_ANGLE_VALUES:
-                    values = unpack_from(f"<{8 * self.data_block_nr}s", stream, address)
+                    (values,) = unpack_from(f"<{8 * self.data_block_nr}s", stream, address)
                     address += self.data_block_nr * 8
-                    for i, value in enumerate(values):
-                        self[f"angle_value_{i}"] = value
+                    for i in range(self.data_block_nr):
+                        self[f"angle_value_{i}"] = values[i * 8 : (i + 1) * 8]
 
                 if self.flags & v4c.FLAG_LD_DISTANCE_VALUES:
-                    values = unpack_from(f"<{8 * self.data_block_nr}s", stream, address)
+                    (values,) = unpack_from(f"<{8 * self.data_block_nr}s", stream, address)
                     address += self.data_block_nr * 8
-                    for i, value in enumerate(values):
-                        self[f"distance_value_{i}"] = value
+                    for i in range(self.data_block_nr):
+                        self[f"distance_value_{i}"] = values[i * 8 : (i + 1) * 8]
 
                 self.next_ld_addr = links[0]
 
@@ -6108,6 +6395,11 @@ class ListData(_ListDataBase):
 
             self.block_len = 24 + self.links_nr * 8 + 16
 
+            if self.flags & v4c.FLAG_LD_TIME_VALUES:
+                self.block_len += 8 * self.data_block_nr
+                for i in range(self.data_block_nr):
+                    self[f"time_value_{i}"] = kwargs.get(f"time_value_{i}", b"\0" * 8)
+
     def __getitem__(self, item: str) -> Any:
         return self.__getattribute__(item)
 
@@ -223,7 +223,7 @@ class AdvancedSearch(Ui_SearchDialog, QtWidgets.QDialog):
                                             break
 
                 else:
-                    found_names = [name for name in self.channels_db if pattern.fullmatch(name)]
+                    found_names = self.channels_db.search(pattern, fullmatch=True)
 
                     matches = {}
                     for name in found_names:
@@ -66,7 +66,7 @@ class MultiSearch(Ui_MultiSearchDialog, QtWidgets.QDialog):
                 else:
                     pattern = re.compile(f"(?i){pattern}")
                 for i, channels_db in enumerate(self.channels_dbs, 1):
-                    match_results = [f"{i:> 2}: {name}" for name in channels_db if pattern.fullmatch(name)]
+                    match_results = [f"{i:> 2}: {name}" for name in channels_db.search(pattern, fullmatch=True)]
                     results.extend(match_results)
 
             except Exception as err:
@@ -1,19 +1,22 @@
+from collections import OrderedDict
 import ctypes
 from datetime import datetime
-from functools import reduce
+import hashlib
 import inspect
 from io import StringIO
+import json
 import math
 import os
 import random
 import re
 import sys
 from textwrap import indent
-from threading import Thread
+from threading import Lock, Thread
 from time import sleep
 import traceback
 from traceback import format_exc
 from typing import Dict, Union
+import weakref
 
 import numpy as np
 import pandas as pd
@@ -21,7 +24,8 @@ from pyqtgraph import functions as fn
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import QThreadPool
 
-from ..blocks.options import FloatInterpolation, IntegerInterpolation
+from ..blocks.options import FloatInterpolation, get_global_option, IntegerInterpolation
+from ..blocks.utils import get_thread_pool, MdfException
 from ..signal import Signal
 from .dialogs.error_dialog import ErrorDialog
 from .dialogs.messagebox import MessageBox
@@ -31,6 +35,8 @@ RANGE_INDICATOR_ICON = None
 NO_ERROR_ICON = None
 
 COMPUTED_FUNCTION_ERROR_VALUE = float("nan")
+COMPUTATION_CACHE_SIZE = 256 * 1024 * 1024
+COMPILED_FUNCTIONS_CACHE_SIZE = 16
 
 
 COLORS = [
@@ -244,6 +250,14 @@ class Worker(QtCore.QRunnable):
     def run(self):
         try:
             result = self.function(*self.args, **self.kwargs)
+        except MdfException:
+            # sorting an unsorted MDF4 file raises MdfException when it is cancelled
+            if self.stop:
+                self.signals.result.emit(self.TERMINATED)
+            else:
+                traceback.print_exc()
+                exctype, value = sys.exc_info()[:2]
+                self.signals.error.emit((exctype, value, traceback.format_exc()))
         except Exception:
             traceback.print_exc()
             exctype, value = sys.exc_info()[:2]
@@ -386,43 +400,201 @@ def get_data_function(signals, fill_0_for_missing_computation_channels):
     return get_data
 
 
+class ComputationCache:
+    """least recently used results of the computed channels
+
+    The results are stored with the objects of the input signals; a cached
+    result is used only if the same objects are passed again. The input arrays
+    are referenced weakly, so the cache does not keep the signals of closed
+    files alive.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    size : int
+        maximum size in bytes of the cached results
+
+    """
+
+    def __init__(self, size=COMPUTATION_CACHE_SIZE):
+        self.size = size
+        self.nbytes = 0
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _result_size(result):
+        return sum(
+            array.nbytes
+            for array in (result.samples, result.timestamps, result.invalidation_bits)
+            if isinstance(array, np.ndarray)
+        )
+
+    def get(self, key, inputs):
+        with self._lock:
+            entry = self._results.get(key, None)
+            if entry is None:
+                return None
+
+            cached_inputs, result, _ = entry
+            if len(cached_inputs) != len(inputs) or any(
+                (a() if isinstance(a, weakref.ref) else a) is not b for a, b in zip(cached_inputs, inputs)
+            ):
+                return None
+
+            self._results.move_to_end(key)
+            return result
+
+    def put(self, key, inputs, result):
+        nbytes = self._result_size(result)
+        if nbytes > self.size:
+            return
+
+        inputs = [weakref.ref(item) if isinstance(item, np.ndarray) else item for item in inputs]
+
+        with self._lock:
+            if key in self._results:
+                self.nbytes -= self._results.pop(key)[2]
+
+            self._results[key] = inputs, result, nbytes
+            self.nbytes += nbytes
+
+            while self.nbytes > self.size:
+                self.nbytes -= self._results.popitem(last=False)[1][2]
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.nbytes = 0
+
+
+computation_cache = ComputationCache()
+_compiled_functions = OrderedDict()
+_compiled_functions_lock = Lock()
+
+
+def functions_hash(functions):
+    """hash of the user defined functions sources"""
+    return hashlib.sha1(repr(sorted(functions.items())).encode("utf-8")).hexdigest()
+
+
+def compile_functions(functions):
+    """compile the user defined functions in a common namespace
+
+    The compiled functions are cached by the hash of their sources, so each
+    set of definitions is executed only once.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    functions : dict
+        function name and definition items
+
+    Returns
+    -------
+    compiled : dict
+        function name and (function, trace) items
+
+    """
+    key = functions_hash(functions)
+
+    with _compiled_functions_lock:
+        compiled = _compiled_functions.get(key, None)
+        if compiled is not None:
+            _compiled_functions.move_to_end(key)
+            return compiled
+
+    _globals = {
+        "math": math,
+        "np": np,
+        "pd": pd,
+    }
+    compiled = {
+        function_name: generate_python_function(definition, _globals) for function_name, definition in functions.items()
+    }
+
+    with _compiled_functions_lock:
+        _compiled_functions[key] = compiled
+        while len(_compiled_functions) > COMPILED_FUNCTIONS_CACHE_SIZE:
+            _compiled_functions.popitem(last=False)
+
+    return compiled
+
+
+def _computation_inputs(description, measured_signals):
+    names = [name for alternative_names in description["args"].values() for name in alternative_names]
+    if description.get("triggering", "triggering_on_all") == "triggering_on_channel":
+        names.append(description["triggering_value"])
+
+    return {name: measured_signals[name] for name in names if name in measured_signals}
+
+
+def _computed_copy(signal):
+    return Signal(
+        name="_",
+        samples=signal.samples,
+        timestamps=signal.timestamps,
+        flags=Signal.Flags.computed,
+    )
+
+
+def _interp(signal, timebase, increasing):
+    if isinstance(signal, (int, float)):
+        return signal
+    elif increasing and (signal.timestamps is timebase or np.array_equal(signal.timestamps, timebase)):
+        # the interpolation on the own strictly increasing timestamps returns the same samples
+        return signal
+    else:
+        return signal.interp(timebase)
+
+
 def compute_signal(
     description,
     measured_signals,
     all_timebase,
     functions,
 ):
+    type_ = description["type"]
+
+    key = None
+    if type_ == "python_function":
+        measured_signals = _computation_inputs(description, measured_signals)
+
+        inputs = []
+        for sig in measured_signals.values():
+            inputs.extend((sig.samples, sig.timestamps, sig.conversion, sig.invalidation_bits))
+        if not measured_signals:
+            inputs.append(all_timebase)
+
+        key = (
+            json.dumps(description, sort_keys=True, default=str),
+            functions_hash(functions),
+            tuple(measured_signals),
+            tuple(id(item) for item in inputs),
+        )
+        result = computation_cache.get(key, inputs)
+        if result is not None:
+            return _computed_copy(result)
+
     required_channels = {}
-    for key, sig in measured_signals.items():
+    for name, sig in measured_signals.items():
         signal = sig.physical(copy=False)
         if signal.samples.dtype.kind in "fui":
-            required_channels[key] = signal
+            required_channels[name] = signal
         else:
-            required_channels[key] = sig
+            required_channels[name] = sig
 
     measured_signals = required_channels
 
-    type_ = description["type"]
-
     try:
         if type_ == "python_function":
-            func, trace = (
-                None,
-                f"{description['function']} not found in the user defined functions",
+            func, trace = compile_functions(functions).get(
+                description["function"],
+                (None, f"{description['function']} not found in the user defined functions"),
             )
 
-            _globals = {
-                "math": math,
-                "np": np,
-                "pd": pd,
-            }
-
-            for function_name, definition in functions.items():
-                _func, _trace = generate_python_function(definition, _globals)
-
-                if function_name == description["function"]:
-                    func, trace = _func, _trace
-
             if func is None:
                 raise Exception(trace)
 
@@ -463,13 +635,18 @@ def compute_signal(
 
             triggering = description.get("triggering", "triggering_on_all")
             if triggering == "triggering_on_all":
-                timestamps = [sig.timestamps for sig in signals if not isinstance(sig, (int, float))]
+                timestamps = list(
+                    {
+                        id(sig.timestamps): sig.timestamps for sig in signals if not isinstance(sig, (int, float))
+                    }.values()
+                )
 
-                if timestamps:
-                    common_timebase = reduce(np.union1d, timestamps)
+                if len(timestamps) == 1:
+                    common_timebase = timestamps[0]
+                elif timestamps:
+                    common_timebase = np.unique(np.concatenate(timestamps))
                 else:
                     common_timebase = all_timebase
-                signals = [sig.interp(common_timebase) if not isinstance(sig, (int, float)) else sig for sig in signals]
 
             elif triggering == "triggering_on_channel":
                 triggering_channel = description["triggering_value"]
@@ -478,7 +655,6 @@ def compute_signal(
                     common_timebase = measured_signals[triggering_channel].timestamps
                 else:
                     common_timebase = np.array([])
-                signals = [sig.interp(common_timebase) if not isinstance(sig, (int, float)) else sig for sig in signals]
             else:
                 step = float(description["triggering_value"])
 
@@ -493,7 +669,7 @@ def compute_signal(
 
                 common_timebase = common_timebase or all_timebase
 
-                if common_timebase:
+                if len(common_timebase):
                     common_timebase = np.unique(common_timebase)
                     start = common_timebase[0]
                     stop = common_timebase[-1]
@@ -503,7 +679,8 @@ def compute_signal(
                 else:
                     common_timebase = np.array([])
 
-                signals = [sig.interp(common_timebase) if not isinstance(sig, (int, float)) else sig for sig in signals]
+            increasing = len(common_timebase) < 2 or bool(np.all(np.diff(common_timebase) > 0))
+            signals = [_interp(sig, common_timebase, increasing) for sig in signals]
 
             for i, (signal, arg_name) in enumerate(zip(signals, found_args)):
                 if isinstance(signal, (int, float)):
@@ -562,6 +739,10 @@ def compute_signal(
                     flags=Signal.Flags.computed,
                 )
 
+            if key is not None:
+                computation_cache.put(key, inputs, result)
+                result = _computed_copy(result)
+
     except:
         print(format_exc())
         result = Signal(
@@ -574,6 +755,290 @@ def compute_signal(
     return result
 
 
+def compute_signals(channels, measured_signals, all_timebase, functions):
+    """evaluate the computed channels
+
+    The computed channels that use other computed channels are evaluated after
+    their dependencies. The independent computations are evaluated in a
+    thread pool with *computation_workers* threads.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    channels : list
+        computed channels configurations
+    measured_signals : dict
+        name and *Signal* items of the measured channels
+    all_timebase : np.ndarray
+        union of the measured channels timestamps
+    functions : dict
+        user defined function name and definition items
+
+    Returns
+    -------
+    signals : list
+        computed *Signal* objects in the same order as the *channels*
+
+    """
+    indexes = {channel["name"]: i for i, channel in enumerate(channels)}
+
+    dependencies = []
+    for i, channel in enumerate(channels):
+        dependencies.append(
+            {
+                indexes[name]
+                for name in get_required_from_computed(channel["computation"])
+                if name not in measured_signals and indexes.get(name, i) != i
+            }
+        )
+
+    available = dict(measured_signals)
+    results = [None] * len(channels)
+    pending = set(range(len(channels)))
+    workers = get_global_option("computation_workers")
+
+    def compute(i):
+        return compute_signal(channels[i]["computation"], available, all_timebase, functions)
+
+    while pending:
+        level = sorted(i for i in pending if not dependencies[i] & pending)
+        if not level:
+            # circular dependencies are evaluated without the computed channels
+            level = sorted(pending)
+
+        if workers and len(level) > 1:
+            signals = list(get_thread_pool(workers).map(compute, level))
+        else:
+            signals = [compute(i) for i in level]
+
+        for i, signal in zip(level, signals):
+            results[i] = signal
+            available.setdefault(channels[i]["name"], signal)
+
+        pending.difference_update(level)
+
+    return results
+
+
+class ComputationGraph:
+    """dependency tracking of the computed channels of a window
+
+    The computed channels are recomputed only when one of their inputs
+    changes: *invalidate* marks the computed channels that use the changed
+    channels or functions, and all the computed channels downstream of them,
+    as dirty and *evaluate* recomputes the requested dirty channels together
+    with the dirty computed channels they depend on. The latest result of each
+    computed channel is kept so that the chained computations can use it.
+
+    .. versionadded:: 7.5.0
+
+    """
+
+    def __init__(self):
+        self.channels = {}
+        self.results = {}
+        self.dirty = set()
+
+    def __contains__(self, uuid):
+        return uuid in self.channels
+
+    def add(self, uuid, name, computation, signal=None):
+        """add or update a computed channel; the channel is dirty if the
+        *signal* result is not given"""
+
+        self.channels[uuid] = name, computation
+        if signal is None:
+            self.results.pop(uuid, None)
+            self.dirty.add(uuid)
+        else:
+            self.results[uuid] = signal
+            self.dirty.discard(uuid)
+
+    def remove(self, uuid):
+        self.channels.pop(uuid, None)
+        self.results.pop(uuid, None)
+        self.dirty.discard(uuid)
+
+    def dependents(self, names=(), functions=()):
+        """uuids of the computed channels that use the *names* channels or the
+        *functions* user defined functions, directly or through other computed
+        channels"""
+
+        names = set(names)
+        functions = set(functions)
+        found = set()
+
+        while True:
+            new = {
+                uuid
+                for uuid, (name, computation) in self.channels.items()
+                if uuid not in found
+                and (
+                    computation.get("function", None) in functions
+                    or not names.isdisjoint(get_required_from_computed(computation))
+                )
+            }
+            if not new:
+                break
+
+            found |= new
+            names |= {self.channels[uuid][0] for uuid in new}
+
+        return found
+
+    def invalidate(self, names=(), functions=()):
+        """mark the dependents of the *names* channels and of the *functions*
+        as dirty and return their uuids"""
+
+        uuids = self.dependents(names, functions)
+        self.dirty |= uuids
+        for uuid in uuids:
+            self.results.pop(uuid, None)
+
+        return uuids
+
+    def evaluate(self, uuids, select, functions):
+        """recompute the dirty computed channels from *uuids*
+
+        Parameters
+        ----------
+        uuids : iterable
+            uuids of the computed channels that are needed
+        select : callable
+            returns the name and *Signal* items of the measured channels for
+            a list of channel names
+        functions : dict
+            user defined function name and definition items
+
+        Returns
+        -------
+        signals : dict
+            uuid and *Signal* items of all the recomputed channels, including
+            the dirty computed channels that the requested channels use
+
+        """
+        computed = {name: uuid for uuid, (name, computation) in self.channels.items()}
+
+        required = set()
+        stack = [uuid for uuid in uuids if uuid in self.dirty]
+        while stack:
+            uuid = stack.pop()
+            if uuid in required:
+                continue
+            required.add(uuid)
+
+            for name in get_required_from_computed(self.channels[uuid][1]):
+                dependency = computed.get(name, None)
+                if dependency in self.dirty:
+                    stack.append(dependency)
+
+        if not required:
+            return {}
+
+        order = [uuid for uuid in self.channels if uuid in required]
+
+        names = set()
+        for uuid in order:
+            names.update(get_required_from_computed(self.channels[uuid][1]))
+
+        # the measured channels have priority over the computed channels with the same name
+        available = select(sorted(names))
+        for name in names:
+            if name in computed and computed[name] in self.results:
+                available.setdefault(name, self.results[computed[name]])
+
+        if available:
+            all_timebase = np.unique(
+                np.concatenate(list({id(sig.timestamps): sig.timestamps for sig in available.values()}.values()))
+            )
+        else:
+            all_timebase = []
+
+        signals = compute_signals(
+            [{"name": self.channels[uuid][0], "computation": self.channels[uuid][1]} for uuid in order],
+            available,
+            all_timebase,
+            functions,
+        )
+
+        for uuid, signal in zip(order, signals):
+            self.results[uuid] = signal
+            self.dirty.discard(uuid)
+
+        return dict(zip(order, signals))
+
+
+def get_required_from_computed(channel):
+    names = []
+    if "computed" in channel:
+        if channel["computed"]:
+            computation = channel["computation"]
+            if computation["type"] == "arithmetic":
+                for op in (
+                    computation["operand1"],
+                    computation["operand2"],
+                ):
+                    if isinstance(op, str):
+                        names.append(op)
+                    elif isinstance(op, (int, float)):
+                        pass
+                    else:
+                        names.extend(get_required_from_computed(op))
+            elif computation["type"] == "function":
+                op = computation["channel"]
+                if isinstance(op, str):
+                    names.append(op)
+                else:
+                    names.extend(get_required_from_computed(op))
+            elif computation["type"] == "expression":
+                expression_string = computation["expression"]
+                names.extend([match.group("name") for match in SIG_RE.finditer(expression_string)])
+            elif computation["type"] == "python_function":
+                for alternative_names in computation["args"].values():
+                    for name in alternative_names:
+                        if name:
+                            names.append(name)
+
+                triggering = computation.get("triggering", "triggering_on_all")
+
+                if triggering == "triggering_on_channel":
+                    triggering_channel = computation["triggering_value"]
+                    if triggering_channel:
+                        names.append(triggering_channel)
+
+        else:
+            names.append(channel["name"])
+    else:
+        if channel["type"] == "arithmetic":
+            for op in (channel["operand1"], channel["operand2"]):
+                if isinstance(op, str):
+                    names.append(op)
+                elif isinstance(op, (int, float)):
+                    pass
+                else:
+                    names.extend(get_required_from_computed(op))
+
+        elif channel["type"] == "expression":
+            expression_string = channel["expression"]
+            names.extend([match.group("name") for match in SIG_RE.finditer(expression_string)])
+
+        elif channel["type"] == "function":
+            op = channel["channel"]
+            if isinstance(op, str):
+                names.append(op)
+            else:
+                names.extend(get_required_from_computed(op))
+
+        elif channel["type"] == "python_function":
+            for alternative_names in channel["args"].values():
+                for name in alternative_names:
+                    if name:
+                        names.append(name)
+
+    return names
+
+
 def computation_to_python_function(description):
     type_ = description["type"]
 
@@ -1,8 +1,10 @@
 from pathlib import Path
 
-from PySide6 import QtWidgets
+from PySide6 import QtGui, QtWidgets
 
+from ...blocks.utils import load_can_database
 from ..ui.bus_database_manager import Ui_BusDatabaseManager
+from ..utils import TERMINATED
 from .database_item import DatabaseItem
 
 
@@ -56,6 +58,30 @@ class BusDatabaseManager(Ui_BusDatabaseManager, QtWidgets.QWidget):
 
         return dbs
 
+    @staticmethod
+    def compile_databases_thread(databases, progress):
+        """parse the configured databases so that the next bus logging
+        extractions use the compiled databases"""
+
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/database.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        progress.signals.setWindowIcon.emit(icon)
+        progress.signals.setWindowTitle.emit("Compiling bus databases")
+
+        file_names = list(dict.fromkeys(database for _, database in databases["CAN"] + databases["LIN"]))
+        count = len(file_names)
+
+        for i, database in enumerate(file_names):
+            if progress.stop:
+                return TERMINATED
+
+            progress.signals.setLabelText.emit(f"Compiling database {i+1} of {count}\n{database}")
+            try:
+                load_can_database(database)
+            except:
+                pass
+            progress.signals.setValue.emit(int((i + 1) * 100 / count))
+
     def load_can_database(self, event):
         file_names, _ = QtWidgets.QFileDialog.getOpenFileNames(
             self,
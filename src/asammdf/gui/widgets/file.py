@@ -43,7 +43,13 @@ from ..dialogs.gps_dialog import GPSDialog
 from ..dialogs.messagebox import MessageBox
 from ..dialogs.window_selection_dialog import WindowSelectionDialog
 from ..ui.file_widget import Ui_file_widget
-from ..utils import GREEN, HelperChannel, run_thread_with_progress, setup_progress
+from ..utils import (
+    computation_cache,
+    GREEN,
+    HelperChannel,
+    run_thread_with_progress,
+    setup_progress,
+)
 from .attachment import Attachment
 from .can_bus_trace import CANBusTrace
 from .database_item import DatabaseItem
@@ -1585,6 +1591,7 @@ MultiRasterSeparator;&
         self.filter_tree.clear()
 
         self.clear_windows()
+        computation_cache.clear()
 
         self.mdf = None
 
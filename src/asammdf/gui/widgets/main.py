@@ -12,6 +12,7 @@ import pyqtgraph as pg
 from PySide6 import __version__ as pyside6_version
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from ...blocks.options import set_global_option
 from ...version import __version__ as libversion
 from ..dialogs.bus_database_manager import BusDatabaseManagerDialog
 from ..dialogs.dependencies_dlg import DependenciesDlg
@@ -19,8 +20,9 @@ from ..dialogs.functions_manager import FunctionsManagerDialog
 from ..dialogs.messagebox import MessageBox
 from ..dialogs.multi_search import MultiSearch
 from ..ui.main_window import Ui_PyMDFMainWindow
-from ..utils import draw_color_icon
+from ..utils import draw_color_icon, setup_progress
 from .batch import BatchWidget
+from .bus_database_manager import BusDatabaseManager
 from .file import FileWidget
 from .mdi_area import MdiAreaWidget, WithMDIArea
 from .plot import Plot
@@ -43,6 +45,12 @@ class MainWindow(WithMDIArea, Ui_PyMDFMainWindow, QtWidgets.QMainWindow):
 
         self.float_interpolation = int(self._settings.value("float_interpolation", "1 - linear interpolation")[0])
 
+        self.can_database_cache = self._settings.value("can_database_cache", False, type=bool)
+        if self.can_database_cache:
+            self.set_can_database_cache_option(True)
+
+        self._progress = None
+
         self.batch = BatchWidget(
             self.ignore_value2text_conversions,
             self.integer_interpolation,
@@ -196,6 +204,13 @@ class MainWindow(WithMDIArea, Ui_PyMDFMainWindow, QtWidgets.QMainWindow):
         subplot_action.setChecked(self.display_cg_name)
         menu.addAction(subplot_action)
 
+        # Cache compiled CAN databases
+        subplot_action = QtGui.QAction("Cache compiled CAN databases", menu)
+        subplot_action.setCheckable(True)
+        subplot_action.toggled.connect(self.set_can_database_cache_option)
+        subplot_action.setChecked(self.can_database_cache)
+        menu.addAction(subplot_action)
+
         # plot background
         plot_background_option = QtGui.QActionGroup(self)
 
@@ -1105,6 +1120,23 @@ class MainWindow(WithMDIArea, Ui_PyMDFMainWindow, QtWidgets.QMainWindow):
             self.files.widget(i).ignore_value2text_conversions = state
         self.batch.ignore_value2text_conversions = state
 
+    def set_can_database_cache_option(self, state):
+        if isinstance(state, str):
+            state = True if state == "true" else False
+        self.can_database_cache = state
+        self._settings.setValue("can_database_cache", state)
+
+        cache = None
+        if state:
+            location = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.StandardLocation.CacheLocation)
+            if location:
+                cache = Path(location) / "can_databases"
+
+        try:
+            set_global_option("can_database_cache", cache)
+        except:
+            pass
+
     def set_display_cg_name_option(self, state):
         if isinstance(state, str):
             state = True if state == "true" else False
@@ -1481,6 +1513,20 @@ class MainWindow(WithMDIArea, Ui_PyMDFMainWindow, QtWidgets.QMainWindow):
         if dlg.pressed_button == "apply":
             dlg.store()
 
+            databases = dlg.widget.to_config()
+            if databases["CAN"] or databases["LIN"]:
+                self._progress = setup_progress(parent=self, autoclose=False)
+                self._progress.qfinished.connect(self.compile_bus_databases_finished)
+
+                self._progress.run_thread_with_progress(
+                    target=BusDatabaseManager.compile_databases_thread,
+                    args=(databases,),
+                    kwargs={},
+                )
+
+    def compile_bus_databases_finished(self):
+        self._progress = None
+
     def show_about(self):
         bits = "x86" if sys.maxsize < 2**32 else "x64"
         cpython = ".".join(str(e) for e in sys.version_info[:3])
@@ -35,8 +35,10 @@ from ..dialogs.messagebox import MessageBox
 from ..dialogs.window_selection_dialog import WindowSelectionDialog
 from ..utils import (
     computation_to_python_function,
-    compute_signal,
+    ComputationGraph,
+    compute_signals,
     copy_ranges,
+    get_required_from_computed,
     replace_computation_dependency,
 )
 from .can_bus_trace import CANBusTrace
@@ -44,11 +46,11 @@ from .flexray_bus_trace import FlexRayBusTrace
 from .gps import GPS
 from .lin_bus_trace import LINBusTrace
 from .numeric import Numeric
+from .paged_signal import select as paged_select
 from .plot import Plot
 from .tabular import Tabular
 
 COMPONENT = re.compile(r"\[(?P<index>\d+)\]$")
-SIG_RE = re.compile(r"\{\{(?!\}\})(?P<name>.*?)\}\}")
 NOT_FOUND = 0xFFFFFFFF
 
 
@@ -217,12 +219,11 @@ def extract_signals_using_pattern(
 
         matches = {}
 
-        for name, entries in channels_db.items():
-            if pattern.fullmatch(name):
-                for entry in entries:
-                    if entry in matches:
-                        continue
-                    matches[entry] = name
+        for name in channels_db.search(pattern, fullmatch=True):
+            for entry in channels_db[name]:
+                if entry in matches:
+                    continue
+                matches[entry] = name
 
         matches = natsorted((name, *entry) for entry, name in matches.items())
     except:
@@ -369,76 +370,6 @@ def get_pattern_groups(data):
     return groups
 
 
-def get_required_from_computed(channel):
-    names = []
-    if "computed" in channel:
-        if channel["computed"]:
-            computation = channel["computation"]
-            if computation["type"] == "arithmetic":
-                for op in (
-                    computation["operand1"],
-                    computation["operand2"],
-                ):
-                    if isinstance(op, str):
-                        names.append(op)
-                    elif isinstance(op, (int, float)):
-                        pass
-                    else:
-                        names.extend(get_required_from_computed(op))
-            elif computation["type"] == "function":
-                op = computation["channel"]
-                if isinstance(op, str):
-                    names.append(op)
-                else:
-                    names.extend(get_required_from_computed(op))
-            elif computation["type"] == "expression":
-                expression_string = computation["expression"]
-                names.extend([match.group("name") for match in SIG_RE.finditer(expression_string)])
-            elif computation["type"] == "python_function":
-                for alternative_names in computation["args"].values():
-                    for name in alternative_names:
-                        if name:
-                            names.append(name)
-
-                triggering = computation.get("triggering", "triggering_on_all")
-
-                if triggering == "triggering_on_channel":
-                    triggering_channel = computation["triggering_value"]
-                    if triggering_channel:
-                        names.append(triggering_channel)
-
-        else:
-            names.append(channel["name"])
-    else:
-        if channel["type"] == "arithmetic":
-            for op in (channel["operand1"], channel["operand2"]):
-                if isinstance(op, str):
-                    names.append(op)
-                elif isinstance(op, (int, float)):
-                    pass
-                else:
-                    names.extend(get_required_from_computed(op))
-
-        elif channel["type"] == "expression":
-            expression_string = channel["expression"]
-            names.extend([match.group("name") for match in SIG_RE.finditer(expression_string)])
-
-        elif channel["type"] == "function":
-            op = channel["channel"]
-            if isinstance(op, str):
-                names.append(op)
-            else:
-                names.extend(get_required_from_computed(op))
-
-        elif channel["type"] == "python_function":
-            for alternative_names in channel["args"].values():
-                for name in alternative_names:
-                    if name:
-                        names.append(name)
-
-    return names
-
-
 def substitude_mime_uuids(mime, uuid=None, force=False):
     if not mime:
         return mime
@@ -901,7 +832,8 @@ class WithMDIArea:
                         else:
                             not_found.append(entry)
 
-                    selected_signals = file.mdf.select(
+                    selected_signals = paged_select(
+                        file.mdf,
                         [
                             (
                                 entry["name"],
@@ -1056,15 +988,10 @@ class WithMDIArea:
 
                     computed_signals = {}
 
-                    for channel in computed:
-                        computation = channel["computation"]
-
-                        signal = compute_signal(
-                            computation,
-                            required_channels,
-                            all_timebase,
-                            self.functions,
-                        )
+                    for channel, signal in zip(
+                        computed,
+                        compute_signals(computed, required_channels, all_timebase, self.functions),
+                    ):
                         signal.name = channel["name"]
                         signal.unit = channel["unit"]
                         signal.color = channel["color"]
@@ -2192,7 +2119,8 @@ class WithMDIArea:
 
             file_index, file = file_info
 
-            selected_signals = file.mdf.select(
+            selected_signals = paged_select(
+                file.mdf,
                 [(entry["name"], entry["group_index"], entry["channel_index"]) for entry in uuids_signals.values()],
                 ignore_value2text_conversions=self.ignore_value2text_conversions,
                 copy_master=False,
@@ -2372,15 +2300,10 @@ class WithMDIArea:
 
             computed_signals = {}
 
-            for channel in computed.values():
-                computation = channel["computation"]
-
-                signal = compute_signal(
-                    computation,
-                    required_channels,
-                    all_timebase,
-                    self.functions,
-                )
+            for channel, signal in zip(
+                computed.values(),
+                compute_signals(list(computed.values()), required_channels, all_timebase, self.functions),
+            ):
                 signal.name = channel["name"]
                 signal.unit = channel["unit"]
                 signal.color = channel["color"]
@@ -2540,6 +2463,8 @@ class WithMDIArea:
 
         plot.add_channels_request.connect(partial(self.add_new_channels, widget=plot))
         plot.edit_channel_request.connect(partial(self.edit_channel, widget=plot))
+        plot.plot.signals_enable_changed.connect(partial(self.refresh_computed_channels, widget=plot))
+        plot.channels_changed.connect(partial(self.invalidate_computed_channels, widget=plot))
 
         plot.show_properties.connect(self._show_info)
 
@@ -2743,47 +2668,81 @@ class WithMDIArea:
         for mdi in self.mdi_area.subWindowList():
             wid = mdi.widget()
             if isinstance(wid, Plot):
-                iterator = QtWidgets.QTreeWidgetItemIterator(wid.channel_selection)
-                while item := iterator.value():
-                    if item.type() == item.Channel:
-                        if item.signal.flags & item.signal.Flags.computed:
-                            if item.signal.computation["function"] in deleted:
-                                self.edit_channel(wid.channel_item_to_config(item), item, wid)
+                self.computation_graph(wid).invalidate(functions=deleted)
+                self.refresh_computed_channels(wid)
+
+    def computation_graph(self, widget):
+        """dependency graph of the computed channels of the *widget* plot,
+        synchronized with the channels of the plot"""
+
+        graph = getattr(widget, "computation_graph", None)
+        if graph is None:
+            graph = widget.computation_graph = ComputationGraph()
+
+        uuids = set()
+        for sig in widget.plot.signals:
+            if sig.flags & sig.Flags.computed:
+                uuids.add(sig.uuid)
+                if sig.uuid in graph:
+                    graph.channels[sig.uuid] = sig.name, sig.computation
+                else:
+                    graph.add(
+                        sig.uuid,
+                        sig.name,
+                        sig.computation,
+                        Signal(sig.raw_samples, sig.timestamps, name=sig.name),
+                    )
 
-                    iterator += 1
+        for uuid in set(graph.channels) - uuids:
+            graph.remove(uuid)
 
-    def edit_channel(self, channel, item, widget):
-        required_channels = set(get_required_from_computed(channel))
+        return graph
 
-        required_channels = [
-            (channel, *self.mdf.whereis(channel)[0]) for channel in required_channels if channel in self.mdf
-        ]
-        required_channels = {
+    def invalidate_computed_channels(self, names, widget):
+        """recompute the computed channels of the *widget* plot that use the
+        *names* channels, after their conversion changed or they were added
+        again to the plot"""
+
+        self.computation_graph(widget).invalidate(names=names)
+        self.refresh_computed_channels(widget)
+
+    def _select_computation_inputs(self, names):
+        names = [(name, *self.mdf.whereis(name)[0]) for name in names if name in self.mdf]
+        return {
             sig.name: sig
             for sig in self.mdf.select(
-                required_channels,
+                names,
                 ignore_value2text_conversions=self.ignore_value2text_conversions,
                 copy_master=False,
             )
         }
 
-        if required_channels:
-            all_timebase = np.unique(
-                np.concatenate(
-                    list({id(sig.timestamps): sig.timestamps for sig in required_channels.values()}.values())
-                )
-            )
-        else:
-            all_timebase = []
+    def refresh_computed_channels(self, widget):
+        """recompute the dirty computed channels of the *widget* plot that are
+        enabled; the disabled ones are recomputed when they are enabled"""
 
-        computation = channel["computation"]
+        graph = self.computation_graph(widget)
 
-        signal = compute_signal(
-            computation,
-            required_channels,
-            all_timebase,
-            self.functions,
-        )
+        uuids = [uuid for uuid in graph.dirty if widget.plot.signal_by_uuid(uuid)[0].enable]
+        signals = graph.evaluate(uuids, self._select_computation_inputs, self.functions)
+
+        for uuid, signal in signals.items():
+            item = widget.item_by_uuid(uuid)
+            item.signal.samples = item.signal.raw_samples = item.signal.phys_samples = signal.samples
+            item.signal.timestamps = signal.timestamps
+            item.signal.trim(force=True)
+            item.signal._compute_basic_stats()
+
+        if signals:
+            widget.cursor_moved()
+            widget.range_modified()
+            widget.plot.update()
+
+    def edit_channel(self, channel, item, widget):
+        graph = self.computation_graph(widget)
+        graph.add(item.uuid, item.name, channel["computation"])
+
+        signal = graph.evaluate([item.uuid], self._select_computation_inputs, self.functions)[item.uuid]
         signal.name = channel["name"]
         signal.unit = channel["unit"]
         signal.color = channel["color"]
@@ -2826,21 +2785,20 @@ class WithMDIArea:
 
         widget.plot.update()
 
-        for channel in widget.plot.signals:
-            if channel.uuid == uuid:
-                continue
+        graph.add(uuid, new_name, signal.computation, signal)
 
-            if channel.flags & channel.Flags.computed:
-                required_channels = set(get_required_from_computed(channel.computation))
-                if old_name in required_channels:
-                    item = widget.item_by_uuid
+        if old_name != new_name:
+            for sig in widget.plot.signals:
+                if sig.uuid == uuid or not sig.flags & sig.Flags.computed:
+                    continue
 
-                    computed_channel = widget.plot.channel_item_to_config(item)
-                    computed_channel["computation"] = replace_computation_dependency(
-                        computed_channel["computation"], old_name, new_name
-                    )
+                if old_name in get_required_from_computed(sig.computation):
+                    sig.computation = replace_computation_dependency(sig.computation, old_name, new_name)
+                    graph.add(sig.uuid, sig.name, sig.computation)
 
-                    widget.edit_channel_request.emit(computed_channel, item)
+        # only the computed channels that use this channel are recomputed
+        graph.invalidate(names={old_name, new_name})
+        self.refresh_computed_channels(widget)
 
     def get_current_widget(self):
         mdi = self.mdi_area.currentSubWindow()
@@ -3249,15 +3207,10 @@ class WithMDIArea:
 
             required_channels.update(measured_signals)
 
-            for sig_uuid, channel in computed.items():
-                computation = channel["computation"]
-
-                signal = compute_signal(
-                    computation,
-                    required_channels,
-                    all_timebase,
-                    self.functions,
-                )
+            for (sig_uuid, channel), signal in zip(
+                computed.items(),
+                compute_signals(list(computed.values()), required_channels, all_timebase, self.functions),
+            ):
                 signal.color = channel["color"]
                 signal.flags |= signal.Flags.computed
                 signal.computation = channel["computation"]
@@ -3473,6 +3426,8 @@ class WithMDIArea:
 
         plot.add_channels_request.connect(partial(self.add_new_channels, widget=plot))
         plot.edit_channel_request.connect(partial(self.edit_channel, widget=plot))
+        plot.plot.signals_enable_changed.connect(partial(self.refresh_computed_channels, widget=plot))
+        plot.channels_changed.connect(partial(self.invalidate_computed_channels, widget=plot))
 
         self.set_subplots_link(self.subplots_link)
 
@@ -3950,6 +3905,7 @@ class WithMDIArea:
         for mdi in self.mdi_area.subWindowList():
             wid = mdi.widget()
             if isinstance(wid, Plot):
+                graph = self.computation_graph(wid)
                 iterator = QtWidgets.QTreeWidgetItemIterator(wid.channel_selection)
                 while item := iterator.value():
                     if item.type() == item.Channel:
@@ -3980,10 +3936,11 @@ class WithMDIArea:
                                 except:
                                     print(format_exc())
 
-                            self.edit_channel(wid.channel_item_to_config(item), item, wid)
-
                     iterator += 1
 
+                graph.invalidate(functions=new | changed | deleted | set(translation.values()))
+                self.refresh_computed_channels(wid)
+
         return bool(new or changed or deleted)
 
     def remove_region(self, widget):
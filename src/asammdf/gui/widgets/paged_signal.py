@@ -0,0 +1,376 @@
+""" paged plot signals for the channels that are too large to be loaded in RAM """
+
+from collections import OrderedDict
+from math import ceil
+from threading import Lock
+
+import numpy as np
+
+from ...signal import Signal
+
+# channels with at least this many records are paged
+PAGED_SIGNAL_MIN_RECORDS = 2**23
+PAGE_SIZE = 2**20
+# maximum number of min/max buckets of the resident overview
+OVERVIEW_BUCKETS = 2**16
+# maximum number of records that are loaded for the exact samples of a range
+EXACT_MAX_RECORDS = 8 * PAGE_SIZE
+PAGE_CACHE_BUDGET = 512 * 1024 * 1024
+
+
+class PageCache:
+    """least recently used pages of the paged signals, limited by their
+    total size in bytes
+
+    Parameters
+    ----------
+    budget : int
+        maximum size of the cached pages in bytes
+
+    """
+
+    def __init__(self, budget=PAGE_CACHE_BUDGET):
+        self.budget = budget
+        self.size = 0
+        self._pages = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            page = self._pages.get(key, None)
+            if page is not None:
+                self._pages.move_to_end(key)
+            return page
+
+    def put(self, key, page):
+        size = sum(array.nbytes for array in page)
+
+        with self._lock:
+            old = self._pages.pop(key, None)
+            if old is not None:
+                self.size -= sum(array.nbytes for array in old)
+
+            self._pages[key] = page
+            self.size += size
+
+            while self.size > self.budget and len(self._pages) > 1:
+                _, evicted = self._pages.popitem(last=False)
+                self.size -= sum(array.nbytes for array in evicted)
+
+    def discard(self, owner):
+        with self._lock:
+            for key in [key for key in self._pages if key[0] == owner]:
+                self.size -= sum(array.nbytes for array in self._pages.pop(key))
+
+
+page_cache = PageCache()
+
+
+class _Moments:
+    """running min, max, mean and variance of the finite samples"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.square_sum = 0.0
+        self.min = None
+        self.max = None
+
+    def update(self, samples):
+        samples = samples[np.isfinite(samples)]
+        count = len(samples)
+        if not count:
+            return
+
+        samples_min, samples_max = samples.min(), samples.max()
+        self.min = samples_min if self.min is None else min(self.min, samples_min)
+        self.max = samples_max if self.max is None else max(self.max, samples_max)
+
+        samples = samples.astype("f8")
+        mean = float(np.mean(samples))
+        m2 = float(np.sum(np.square(samples - mean)))
+        self.square_sum += float(np.sum(np.square(samples)))
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def stats(self):
+        if not self.count:
+            return None
+
+        return {
+            "min": self.min,
+            "max": self.max,
+            "avg": self.mean,
+            "rms": np.sqrt(self.square_sum / self.count),
+            "std": np.sqrt(self.m2 / self.count),
+        }
+
+
+class PagedSignal:
+    """samples source for a plotted channel that is read from the measurement
+    in pages of *PAGE_SIZE* records
+
+    Only a min/max overview of the channel is kept in RAM; the exact samples
+    are read on demand and the pages are cached in the shared LRU
+    *page_cache*. The overview and the overall statistics are computed in a
+    single pass over the channel group.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    mdf : MDF
+        measurement object
+    group_index, channel_index : int
+        channel location
+    records : int
+        number of records of the channel group
+
+    """
+
+    def __init__(self, mdf, group_index, channel_index, records):
+        self.mdf = mdf
+        self.group_index = group_index
+        self.channel_index = channel_index
+        self.records = records
+        self.pages_count = ceil(records / PAGE_SIZE)
+        self.bucket = max(ceil(records / OVERVIEW_BUCKETS), 1)
+
+        self.page_start = np.full(self.pages_count, np.inf)
+        self.page_stop = np.full(self.pages_count, -np.inf)
+
+        self.signal = None
+        self.raw_stats = _Moments()
+        self.phys_stats = _Moments()
+        self._overview = []
+
+    def __del__(self):
+        page_cache.discard(id(self))
+
+    def _with_samples(self, signal, samples, timestamps):
+        return Signal(
+            samples,
+            timestamps,
+            signal.unit,
+            signal.name,
+            signal.conversion,
+            signal.comment,
+            signal.raw,
+            signal.master_metadata,
+            signal.display_names,
+            signal.attachment,
+            signal.source,
+            signal.bit_count,
+            encoding=signal.encoding,
+            group_index=self.group_index,
+            channel_index=self.channel_index,
+            flags=signal.flags,
+        )
+
+    def _prepare_page(self, signal):
+        samples, timestamps = signal.samples, signal.timestamps
+        if samples.dtype.kind == "f":
+            finite = ~np.isnan(samples)
+            if not np.all(finite):
+                samples, timestamps = samples[finite], timestamps[finite]
+        return timestamps, samples
+
+    def add_page(self, index, signal):
+        """add the validated raw signal of the page *index* to the overview
+        and to the statistics"""
+
+        timestamps, samples = self._prepare_page(signal)
+
+        if self.signal is None:
+            # keep only the channel metadata
+            self.signal = self._with_samples(signal, samples[:0].copy(), timestamps[:0].copy())
+
+        size = len(samples)
+        if not size:
+            return
+
+        self.page_start[index] = timestamps[0]
+        self.page_stop[index] = timestamps[-1]
+
+        self.raw_stats.update(samples)
+        if signal.conversion is not None:
+            phys = signal.conversion.convert(samples, as_bytes=True)
+            if phys.dtype.kind in "uif":
+                self.phys_stats.update(phys)
+
+        bucket = self.bucket
+        count = size // bucket
+        data = samples[: count * bucket].reshape(count, bucket)
+        offsets = np.arange(0, count * bucket, bucket)
+
+        pos = np.concatenate(
+            [
+                [0, size - 1],
+                data.argmin(axis=1) + offsets,
+                data.argmax(axis=1) + offsets,
+            ]
+        )
+        if count * bucket < size:
+            rest = samples[count * bucket :]
+            pos = np.concatenate([pos, [rest.argmin() + count * bucket, rest.argmax() + count * bucket]])
+
+        pos = np.unique(pos)
+        self._overview.append((timestamps[pos], samples[pos]))
+
+    def overview(self):
+        """min/max overview of the channel as a *Signal* with the *paged*
+        attribute set to this object"""
+
+        signal = self.signal
+        if self._overview:
+            timestamps = np.concatenate([page[0] for page in self._overview])
+            samples = np.concatenate([page[1] for page in self._overview])
+        else:
+            timestamps, samples = signal.timestamps[:0], signal.samples[:0]
+
+        overview = self._with_samples(signal, samples, timestamps)
+        overview.paged = self
+        self._overview = []
+
+        return overview
+
+    def stats(self, raw=True):
+        """exact overall statistics of the channel or *None*"""
+        return self.raw_stats.stats() if raw else self.phys_stats.stats()
+
+    def page(self, index):
+        """timestamps and raw samples of the page *index*"""
+
+        page = page_cache.get((id(self), index))
+        if page is None:
+            signal = self.mdf.get(
+                group=self.group_index,
+                index=self.channel_index,
+                raw=True,
+                record_offset=index * PAGE_SIZE,
+                record_count=PAGE_SIZE,
+            ).validate(copy=False)
+            page = self._prepare_page(signal)
+            page_cache.put((id(self), index), page)
+
+        return page
+
+    def pages_between(self, start, stop):
+        """indexes of the pages that overlap the *start* - *stop* time range"""
+        return np.flatnonzero((self.page_stop >= start) & (self.page_start <= stop)).tolist()
+
+    def samples_between(self, start, stop):
+        """exact timestamps and raw samples of the pages that overlap the
+        *start* - *stop* time range, or *None* if there are more than
+        *EXACT_MAX_RECORDS* records in the range"""
+
+        pages = self.pages_between(start, stop)
+        if len(pages) * PAGE_SIZE > EXACT_MAX_RECORDS:
+            return None
+
+        if not pages:
+            return self.signal.timestamps[:0], self.signal.samples[:0]
+
+        pages = [self.page(index) for index in pages]
+        if len(pages) == 1:
+            return pages[0]
+
+        return (
+            np.concatenate([page[0] for page in pages]),
+            np.concatenate([page[1] for page in pages]),
+        )
+
+    def value_at_timestamp(self, timestamp):
+        """exact raw value of the first sample at or after *timestamp*, or of
+        the last sample"""
+
+        candidates = np.flatnonzero(self.page_stop >= timestamp)
+        if len(candidates):
+            timestamps, samples = self.page(int(candidates[0]))
+            index = min(np.searchsorted(timestamps, timestamp, side="left"), len(samples) - 1)
+        else:
+            candidates = np.flatnonzero(np.isfinite(self.page_stop))
+            timestamps, samples = self.page(int(candidates[-1]))
+            index = -1
+
+        return samples[index]
+
+
+def select(mdf, channels, **kwargs):
+    """*MDF.select* for plotting; the channels with at least
+    *PAGED_SIGNAL_MIN_RECORDS* records are returned as overview signals backed
+    by a *PagedSignal*
+
+    The numeric scalar channels of the same group are paged together so that
+    the group data is read once.
+
+    Parameters
+    ----------
+    mdf : MDF
+        measurement object
+    channels : list
+        (name, group index, channel index) items
+    kwargs :
+        *MDF.select* keyword arguments
+
+    Returns
+    -------
+    signals : list
+        list of *Signal* objects in the same order as the *channels*
+
+    """
+
+    large = {}
+    for i, (name, group_index, channel_index) in enumerate(channels):
+        try:
+            records = mdf.groups[group_index].channel_group.cycles_nr
+        except:
+            continue
+        if records >= PAGED_SIGNAL_MIN_RECORDS:
+            large.setdefault(group_index, []).append(i)
+
+    paged = {}
+    for group_index, items in large.items():
+        records = mdf.groups[group_index].channel_group.cycles_nr
+        group_channels = [(None, group_index, channels[i][2]) for i in items]
+        sources = [PagedSignal(mdf, group_index, channels[i][2], records) for i in items]
+
+        for page in range(ceil(records / PAGE_SIZE)):
+            signals = mdf.select(
+                group_channels,
+                record_offset=page * PAGE_SIZE,
+                record_count=PAGE_SIZE,
+                raw=True,
+                copy_master=False,
+                validate=True,
+            )
+
+            if page == 0:
+                # only the numeric scalar channels can be paged
+                keep = [
+                    j
+                    for j, signal in enumerate(signals)
+                    if signal.samples.dtype.kind in "uif" and signal.samples.ndim == 1
+                ]
+                group_channels = [group_channels[j] for j in keep]
+                sources = [sources[j] for j in keep]
+                items = [items[j] for j in keep]
+                signals = [signals[j] for j in keep]
+                if not items:
+                    break
+
+            for source, signal in zip(sources, signals):
+                source.add_page(page, signal)
+
+        for i, source in zip(items, sources):
+            paged[i] = source.overview()
+
+    loaded = [channel for i, channel in enumerate(channels) if i not in paged]
+    loaded = iter(mdf.select(loaded, **kwargs) if loaded else [])
+
+    return [paged[i] if i in paged else next(loaded) for i in range(len(channels))]
@@ -5,7 +5,7 @@ from math import ceil
 import os
 from pathlib import Path
 from tempfile import gettempdir
-from threading import Lock
+from threading import Lock, Thread
 from time import perf_counter
 from traceback import format_exc
 from zipfile import ZIP_DEFLATED, ZipFile
@@ -133,6 +133,13 @@ HONEYWELL_SECONDS_PER_CM = 0.1
 
 float64 = np.float64
 
+# signals with at least this many samples get a min/max pyramid
+PYRAMID_MIN_SIZE = 2**20
+PYRAMID_BASE_BLOCK = 64
+PYRAMID_FACTOR = 8
+PYRAMID_MIN_BLOCKS = 1024
+PYRAMID_CHUNK_SIZE = 2**22
+
 
 def simple_min(a, b):
     if b != b:  # noqa: PLR0124
@@ -163,6 +170,126 @@ def get_descriptions_by_uuid(mime):
     return descriptions
 
 
+class MinMaxPyramid:
+    """multi-resolution min/max decimation of the signal samples
+
+    Level *k* splits the samples in blocks of
+    *PYRAMID_BASE_BLOCK* * *PYRAMID_FACTOR* ** *k* samples and keeps the
+    position and value of the minimum and maximum of each block. A trim
+    request is answered from the coarsest level that still has at least one
+    block per pixel, so the cost depends on the plot width and not on the
+    number of samples.
+
+    Parameters
+    ----------
+    samples : np.ndarray
+        integer or float samples without NaN values
+
+    """
+
+    def __init__(self, samples):
+        if samples.dtype.kind not in "iuf":
+            raise TypeError(f"unsupported samples dtype {samples.dtype}")
+
+        self.samples = samples
+        self.levels = []
+
+        block = PYRAMID_BASE_BLOCK
+        count = samples.size // block
+
+        pos_min = np.empty(count, dtype="i8")
+        pos_max = np.empty(count, dtype="i8")
+
+        # build the first level in chunks so the GIL is released regularly
+        chunk = PYRAMID_CHUNK_SIZE // block
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            data = samples[start * block : stop * block].reshape(stop - start, block)
+            offsets = np.arange(start * block, stop * block, block)
+            pos_min[start:stop] = data.argmin(axis=1) + offsets
+            pos_max[start:stop] = data.argmax(axis=1) + offsets
+
+        mins = samples[pos_min]
+        maxs = samples[pos_max]
+
+        if samples.dtype.kind == "f" and (np.isnan(mins).any() or np.isnan(maxs).any()):
+            raise ValueError("the samples contain NaN values")
+
+        while True:
+            self.levels.append((block, pos_min, pos_max, mins, maxs))
+
+            count = count // PYRAMID_FACTOR
+            if count < PYRAMID_MIN_BLOCKS:
+                break
+
+            size = count * PYRAMID_FACTOR
+            offsets = np.arange(0, size, PYRAMID_FACTOR)
+            idx_min = mins[:size].reshape(count, PYRAMID_FACTOR).argmin(axis=1) + offsets
+            idx_max = maxs[:size].reshape(count, PYRAMID_FACTOR).argmax(axis=1) + offsets
+
+            block *= PYRAMID_FACTOR
+            pos_min = pos_min[idx_min]
+            pos_max = pos_max[idx_max]
+            mins = mins[idx_min]
+            maxs = maxs[idx_max]
+
+    def _extremes(self, start, stop):
+        samples = self.samples[start:stop]
+        pos_min = samples.argmin() + start
+        pos_max = samples.argmax() + start
+        return np.array([[min(pos_min, pos_max), max(pos_min, pos_max)]], dtype="i8")
+
+    def decimate(self, start, stop, step):
+        """positions of the minimum and maximum samples for consecutive
+        buckets of about *step* samples from the *start* to *stop* index
+        range
+
+        Parameters
+        ----------
+        start, stop : int
+            samples index range
+        step : int
+            samples per bucket
+
+        Returns
+        -------
+        pos : np.ndarray | None
+            sorted samples positions, two for each bucket, or *None* if the
+            range is too short for the pyramid levels
+
+        """
+        for level in reversed(self.levels):
+            if level[0] <= step:
+                break
+        else:
+            return None
+
+        block, pos_min, pos_max, mins, maxs = level
+        blocks_per_bucket = step // block
+
+        first = -(-start // block)
+        count = (stop // block - first) // blocks_per_bucket
+        if count <= 0:
+            return None
+
+        last = first + count * blocks_per_bucket
+        offsets = np.arange(first, last, blocks_per_bucket)
+        idx_min = mins[first:last].reshape(count, blocks_per_bucket).argmin(axis=1) + offsets
+        idx_max = maxs[first:last].reshape(count, blocks_per_bucket).argmax(axis=1) + offsets
+
+        pos = np.empty((count, 2), dtype="i8")
+        np.minimum(pos_min[idx_min], pos_max[idx_max], out=pos[:, 0])
+        np.maximum(pos_min[idx_min], pos_max[idx_max], out=pos[:, 1])
+
+        parts = [pos]
+        if start < first * block:
+            parts.insert(0, self._extremes(start, first * block))
+        if last * block < stop:
+            parts.append(self._extremes(last * block, stop))
+
+        return np.concatenate(parts).ravel()
+
+
 class PlotSignal(Signal):
     def __init__(self, signal, index=0, trim_info=None, duplication=1, allow_trim=True, allow_nans=False):
         super().__init__(
@@ -183,7 +310,7 @@ class PlotSignal(Signal):
             flags=signal.flags,
         )
 
-        self._pos = np.empty(2 * PLOT_BUFFER_SIZE, dtype="i4")
+        self._pos = np.empty(2 * PLOT_BUFFER_SIZE, dtype="l")
         self._plot_samples = np.empty(2 * PLOT_BUFFER_SIZE, dtype="i1")
         self._plot_timestamps = np.empty(2 * PLOT_BUFFER_SIZE, dtype="f8")
 
@@ -213,6 +340,13 @@ class PlotSignal(Signal):
         self.home = (0, -1)
 
         self.trim_info = None
+        self._pyramids = {}
+        # called with the uuid from the background thread when a pyramid is ready
+        self.pyramid_ready = None
+
+        # the samples of the paged signals are just the min/max overview
+        self.paged = getattr(signal, "paged", None)
+        self._viewport = None
 
         # take out NaN values
         samples = self.samples
@@ -465,10 +599,55 @@ class PlotSignal(Signal):
                 self._avg_raw = "n.a."
                 self._rms_raw = "n.a."
                 self._std_raw = "n.a."
+
+        if self.paged is not None and not self.empty:
+            self._set_paged_stats()
+
         self._stats_available = True
 
+    def _set_paged_stats(self):
+        # the overall statistics of the paged signals are computed from all
+        # the samples while the overview is built
+        stats = self.paged.stats(raw=True)
+        if stats is not None and not isinstance(self._avg_raw, str):
+            self._avg_raw, self._rms_raw, self._std_raw = stats["avg"], stats["rms"], stats["std"]
+
+        if self.phys_samples is self.raw_samples:
+            self._avg, self._rms, self._std = self._avg_raw, self._rms_raw, self._std_raw
+        else:
+            stats = self.paged.stats(raw=False)
+            if stats is not None and not self.is_string:
+                self._avg, self._rms, self._std = stats["avg"], stats["rms"], stats["std"]
+
     def cut(self, start=None, stop=None, include_ends=True, interpolation_mode=0):
-        cut_sig = super().cut(start, stop, include_ends, interpolation_mode)
+        exact = None
+        if self.paged is not None:
+            exact = self.paged.samples_between(
+                -np.inf if start is None else start,
+                np.inf if stop is None else stop,
+            )
+
+        if exact is not None:
+            timestamps, samples = exact
+            exact = Signal(
+                samples,
+                timestamps,
+                self.unit,
+                self.name,
+                self.conversion,
+                self.comment,
+                self.raw,
+                self.master_metadata,
+                self.display_names,
+                self.attachment,
+                self.source,
+                self.bit_count,
+                encoding=self.encoding,
+                flags=self.flags,
+            )
+            cut_sig = exact.cut(start, stop, include_ends, interpolation_mode)
+        else:
+            cut_sig = super().cut(start, stop, include_ends, interpolation_mode)
 
         cut_sig.group_index = self.group_index
         cut_sig.channel_index = self.channel_index
@@ -488,7 +667,7 @@ class PlotSignal(Signal):
         if self._enable != enable_state:
             self._enable = enable_state
             if enable_state:
-                self._pos = np.empty(2 * PLOT_BUFFER_SIZE, dtype="i4")
+                self._pos = np.empty(2 * PLOT_BUFFER_SIZE, dtype="l")
                 self._plot_samples = np.empty(2 * PLOT_BUFFER_SIZE, dtype=self._dtype)
                 self._plot_timestamps = np.empty(2 * PLOT_BUFFER_SIZE, dtype="f8")
 
@@ -979,6 +1158,12 @@ class PlotSignal(Signal):
             else:
                 signal_samples = self.phys_samples
 
+            if self.paged is not None:
+                viewport = self._paged_viewport(start, stop, width)
+                if viewport is not None:
+                    sig_timestamps, signal_samples = viewport
+                    dim = sig_timestamps.size
+
             start_t_sig, stop_t_sig = (
                 sig_timestamps[0],
                 sig_timestamps[-1],
@@ -1011,7 +1196,18 @@ class PlotSignal(Signal):
                     else:
                         visible_duplication = 0
 
+                pos = None
                 if visible_duplication > self.duplication:
+                    pos = self._pyramid_positions(signal_samples, start_, stop_, visible_duplication)
+
+                if pos is not None:
+                    self.plot_samples = signal_samples[pos]
+                    self.plot_timestamps = sig_timestamps[pos]
+
+                    if self.plot_samples.dtype.kind == "f" and self.plot_samples.itemsize == 2:
+                        self.plot_samples = self.plot_samples.astype("f8")
+
+                elif visible_duplication > self.duplication:
                     samples = signal_samples[start_:stop_]
                     timestamps = sig_timestamps[start_:stop_]
                     count, rest = divmod(samples.size, visible_duplication)
@@ -1217,6 +1413,77 @@ class PlotSignal(Signal):
 
         return pos
 
+    def _min_max_pyramid(self, samples):
+        """min/max pyramid of the samples; the pyramid is built in a
+        background thread on the first request and *None* is returned until
+        it is available"""
+
+        if samples.size < PYRAMID_MIN_SIZE or samples.dtype.kind not in "iuf":
+            return None
+
+        mode = self._mode
+        entry = self._pyramids.get(mode, None)
+        if entry is not None and entry[0] is samples:
+            return entry[1]
+
+        self._pyramids[mode] = (samples, None)
+        Thread(target=self._build_min_max_pyramid, args=(mode, samples), daemon=True).start()
+
+        return None
+
+    def _build_min_max_pyramid(self, mode, samples):
+        try:
+            pyramid = MinMaxPyramid(samples)
+        except:
+            return
+
+        entry = self._pyramids.get(mode, None)
+        if entry is not None and entry[0] is samples:
+            self._pyramids[mode] = (samples, pyramid)
+            if self.pyramid_ready is not None:
+                self.pyramid_ready(self.uuid)
+
+    def _paged_viewport(self, start, stop, width):
+        """exact samples of the paged signal for the visible range if the
+        overview is too coarse for the plot width"""
+
+        timestamps = self.timestamps
+        visible = np.searchsorted(timestamps, stop, side="right") - np.searchsorted(timestamps, start, side="left")
+        if visible >= 2 * width:
+            return None
+
+        key = (tuple(self.paged.pages_between(start, stop)), self._mode)
+        if self._viewport is not None and self._viewport[0] == key:
+            return self._viewport[1]
+
+        exact = self.paged.samples_between(start, stop)
+        if exact is None or not len(exact[0]):
+            return None
+
+        timestamps, samples = exact
+        if self._mode != "raw" and self.phys_samples is not self.raw_samples:
+            samples = self.conversion.convert(samples, as_bytes=True)
+            if samples.dtype.kind == "f":
+                finite = ~np.isnan(samples)
+                if not np.all(finite):
+                    timestamps, samples = timestamps[finite], samples[finite]
+
+        if samples.dtype.byteorder not in target_byte_order:
+            samples = samples.byteswap().view(samples.dtype.newbyteorder())
+
+        self._viewport = (key, (timestamps, samples))
+        return timestamps, samples
+
+    def _pyramid_positions(self, samples, start, stop, step):
+        if self.paged is not None:
+            # the overview and the viewport samples are already bounded
+            return None
+
+        pyramid = self._min_max_pyramid(samples)
+        if pyramid is None:
+            return None
+        return pyramid.decimate(start, stop, step)
+
     def trim(self, start=None, stop=None, width=1900, force=False):
         if self._enable:
             self.path = None
@@ -1280,6 +1547,11 @@ class PlotSignal(Signal):
 
             value = samples[index]
 
+            if self.paged is not None:
+                value = self.paged.value_at_timestamp(timestamp)
+                if samples is not self.raw_samples:
+                    value = self.conversion.convert(np.array([value]), as_bytes=True)[0]
+
             if kind == "S":
                 try:
                     value = value.decode("utf-8", errors="replace").strip(" \r\n\t\v\0")
@@ -1309,6 +1581,7 @@ from .signal_scale import ScaleDialog
 
 class Plot(QtWidgets.QWidget):
     add_channels_request = QtCore.Signal(list)
+    channels_changed = QtCore.Signal(list)
     close_request = QtCore.Signal()
     clicked = QtCore.Signal()
     cursor_moved_signal = QtCore.Signal(object, float)
@@ -2075,6 +2348,9 @@ class Plot(QtWidgets.QWidget):
         self.plot._can_paint = True
         self.plot.update()
 
+        if channels:
+            self.channels_changed.emit([sig.name for sig in channels.values()])
+
     def adjust_splitter(self, initial=False):
         size = sum(self.splitter.sizes())
 
@@ -3157,6 +3433,9 @@ class Plot(QtWidgets.QWidget):
         self.plot.set_conversion(uuid, conversion)
         self.cursor_moved()
 
+        sig, _ = self.plot.signal_by_uuid(uuid)
+        self.channels_changed.emit([sig.name])
+
     def set_font_size(self, size):
         font = self.font()
         font.setPointSize(size)
@@ -3497,6 +3776,7 @@ class PlotGraphics(pg.PlotWidget):
 
     add_channels_request = QtCore.Signal(list)
     zoom_changed = QtCore.Signal(bool)
+    pyramid_ready = QtCore.Signal(str)
 
     def __init__(
         self,
@@ -3751,6 +4031,10 @@ class PlotGraphics(pg.PlotWidget):
         self._enable_timer.setSingleShot(True)
         self._enable_timer.timeout.connect(self._signals_enabled_changed_handler)
 
+        # the pyramids are built in background threads; the queued signal
+        # redraws the plot in the GUI thread once a pyramid is available
+        self.pyramid_ready.connect(self._pyramid_ready_handler)
+
         self._inhibit = False
 
         self.viewbox.setXRange(0, 10, update=False)
@@ -3945,6 +4229,7 @@ class PlotGraphics(pg.PlotWidget):
 
         self.signals.extend(channels)
         for sig in channels:
+            sig.pyramid_ready = self.pyramid_ready.emit
             uuids = self._timebase_db.setdefault(id(sig.timestamps), set())
             uuids.add(sig.uuid)
         self._compute_all_timebase()
@@ -5907,6 +6192,16 @@ class PlotGraphics(pg.PlotWidget):
     def signal_by_uuid(self, uuid):
         return self._uuid_map[uuid]
 
+    def _pyramid_ready_handler(self, uuid):
+        entry = self._uuid_map.get(uuid, None)
+        if entry is None:
+            return
+
+        sig, _ = entry
+        self.trim(signals=[sig], force=True)
+        if self._can_paint:
+            self.update()
+
     def _signals_enabled_changed_handler(self):
         self._compute_all_timebase()
         if self.cursor1:
@@ -1,10 +1,11 @@
-""" common MDF file format module """
+"""common MDF file format module"""
 
 from __future__ import annotations
 
 import bz2
-from collections import defaultdict
-from collections.abc import Iterable, Iterator, Sequence
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 import csv
 from datetime import datetime, timezone
@@ -12,7 +13,9 @@ from enum import Enum
 from functools import reduce
 import gzip
 from io import BytesIO
+from itertools import islice, takewhile
 import logging
+from multiprocessing import Manager
 import os
 from pathlib import Path
 import re
@@ -43,6 +46,7 @@ from .blocks.utils import (
     components,
     csv_bytearray2hex,
     csv_int2hex,
+    DataBlockInfo,
     downcast,
     is_file_like,
     load_can_database,
@@ -72,9 +76,10 @@ from .blocks.v4_blocks import (
     SourceInformation,
 )
 from .blocks.v4_blocks import HeaderBlock as HeaderV4
-from .signal import Signal
+from .signal import interp_signals, Signal
 from .types import (
     BusType,
+    ChannelConversionType,
     ChannelGroupType,
     ChannelsType,
     DbcFileType,
@@ -102,6 +107,12 @@ LOCAL_TIMEZONE = datetime.now(timezone.utc).astimezone().tzinfo
 
 target_byte_order = "<=" if sys.byteorder == "little" else ">="
 
+# smaller groups and cut intervals are decoded in a single pass
+RAW_COPY_MIN_SIZE = 16 * 1024 * 1024
+# fragments that a worker process of MDF.concatenate and MDF.stack can read
+# ahead of the main process for each file
+PROCESS_POOL_FRAGMENTS = 4
+
 
 __all__ = ["MDF", "SUPPORTED_VERSIONS"]
 
@@ -147,6 +158,504 @@ def get_temporary_filename(path: Path = Path("temporary.mf4"), dir: str | Path |
     return tmp_path
 
 
+def _channel_group_signature(channel_group: ChannelGroupType) -> tuple[str, str, str, int] | None:
+    """identification of the channel group used to match the channel groups of
+    the concatenated files; *None* if the channel group has no acquisition source"""
+    acq_source = getattr(channel_group, "acq_source", None)
+    if not acq_source:
+        return None
+
+    return (
+        channel_group.acq_name,
+        acq_source.name,
+        acq_source.path,
+        channel_group.samples_byte_nr,
+    )
+
+
+def _concatenate_group_fragments(
+    mdf: MDF,
+    group_index: int,
+    included_channels: dict[int, list[int]],
+    remap: list[int] | None,
+) -> Iterator[list[tuple[NDArray[Any], NDArray[Any] | None]]]:
+    """yield the group fragments as (samples, invalidation bits) pairs, with
+    the master samples first and the channels in the order of the first
+    concatenated file"""
+
+    for idx, signals in enumerate(mdf._yield_selected_signals(group_index, groups=included_channels)):
+        if not signals:
+            break
+
+        if remap is not None:
+            new_signals = [None for _ in signals]
+            if idx == 0:
+                for new_index, sig in zip(remap, signals):
+                    new_signals[new_index] = sig
+            else:
+                for new_index, sig in zip(remap, signals[1:]):
+                    new_signals[new_index + 1] = sig
+                new_signals[0] = signals[0]
+
+            signals = new_signals
+
+        if idx == 0:
+            signals = [(signals[0].timestamps, None)] + [(sig.samples, sig.invalidation_bits) for sig in signals]
+
+        yield signals
+
+
+def _concatenate_file_groups(
+    mdf: MDF,
+    mdf_index: int,
+    included_channel_names: list[list[str]],
+    groups_signatures: list[tuple[str, str, str, int] | None],
+    vlsd_max_length: dict[tuple[str, int], int],
+) -> tuple[bool, list[tuple[int, int, int, Iterator[list[tuple[NDArray[Any], NDArray[Any] | None]]]]]]:
+    """check that the file has the same internal structure as the first
+    concatenated file, and return the channel groups fragments iterators
+
+    Returns
+    -------
+    reorder_channel_groups, groups : bool, list
+        *reorder_channel_groups* is *True* if the channel groups order is
+        different from the first file; *groups* contains (virtual group
+        position, group index, original group index, fragments) tuples
+
+    """
+    groups_nr = len(included_channel_names)
+
+    if len(mdf.virtual_groups) != groups_nr:
+        raise MdfException(f"internal structure of file <{mdf.name}> is different; different channel groups count")
+
+    reorder_channel_groups = False
+    cg_translations = dict.fromkeys(range(groups_nr))
+
+    # check if the order of the channel groups is the same
+    for i, group_index in enumerate(mdf.virtual_groups):
+        included_channels = mdf.included_channels(group_index)[group_index]
+        names = [
+            mdf.groups[gp_index].channels[ch_index].name
+            for gp_index, channels in included_channels.items()
+            for ch_index in channels
+        ]
+
+        if names != included_channel_names[i]:
+            if sorted(names) != sorted(included_channel_names[i]):
+                reorder_channel_groups = True
+                break
+
+    # Make a channel group translation dictionary if the order is different
+    if reorder_channel_groups:
+        signatures = [_channel_group_signature(group.channel_group) for group in mdf.groups]
+        for i, org_signature in enumerate(groups_signatures):
+            for j, new_signature in enumerate(signatures):
+                if org_signature is not None and new_signature == org_signature:
+                    new_included_channels = mdf.included_channels(j)[j]
+
+                    new_names = [
+                        mdf.groups[gp_index].channels[ch_index].name
+                        for gp_index, channels in new_included_channels.items()
+                        for ch_index in channels
+                    ]
+
+                    if sorted(new_names) == sorted(included_channel_names[i]):
+                        cg_translations[i] = j
+                        break
+
+    mdf.vlsd_max_length.clear()
+    mdf.vlsd_max_length.update(vlsd_max_length)
+
+    groups = []
+    for i, group_index in enumerate(mdf.virtual_groups):
+        # save original group index for extension
+        # replace with the translated group index
+        origin_gp_idx = group_index
+        if reorder_channel_groups:
+            group_index = cg_translations[group_index]
+
+        included_channels = mdf.included_channels(group_index)[group_index]
+
+        names = [
+            mdf.groups[gp_index].channels[ch_index].name
+            for gp_index, channels in included_channels.items()
+            for ch_index in channels
+        ]
+        remap = None
+        if names != included_channel_names[i]:
+            if sorted(names) != sorted(included_channel_names[i]):
+                raise MdfException(f"internal structure of file {mdf_index} is different; different channels")
+            else:
+                original_names = included_channel_names[i]
+                remap = [original_names.index(name) for name in names]
+
+        if not included_channels:
+            continue
+
+        groups.append(
+            (
+                i,
+                group_index,
+                origin_gp_idx,
+                _concatenate_group_fragments(mdf, group_index, included_channels, remap),
+            )
+        )
+
+    return reorder_channel_groups, groups
+
+
+def _read_concatenate_file(
+    queue: Any,
+    file: InputType,
+    mdf_index: int,
+    use_display_names: bool,
+    included_channel_names: list[list[str]],
+    groups_signatures: list[tuple[str, str, str, int] | None],
+    vlsd_max_length: dict[tuple[str, int], int],
+) -> None:
+    """send the fragments of a concatenated file to the main process
+    through *queue*; used by the *MDF.concatenate* worker processes"""
+
+    mdf = MDF(file, use_display_names=use_display_names)
+    try:
+        mdf.configure(copy_on_get=False)
+
+        reorder_channel_groups, groups = _concatenate_file_groups(
+            mdf,
+            mdf_index,
+            included_channel_names,
+            groups_signatures,
+            vlsd_max_length,
+        )
+
+        _put_file_groups(queue, (mdf.original_name, reorder_channel_groups), groups)
+    finally:
+        mdf.close()
+
+
+def _stack_file_groups(mdf: MDF, version: str) -> Iterator[tuple[int, ChannelGroupType, Iterator[list[Any]]]]:
+    """yield the (virtual group position, channel group, fragments) for the
+    channel groups of a stacked file"""
+
+    for i, group in enumerate(mdf.virtual_groups):
+        included_channels = mdf.included_channels(group)[group]
+        if not included_channels:
+            continue
+
+        yield (
+            i,
+            mdf.groups[group].channel_group,
+            takewhile(bool, mdf._yield_selected_signals(group, groups=included_channels, version=version)),
+        )
+
+
+def _read_stack_file(
+    queue: Any,
+    file: InputType,
+    mdf_index: int,
+    use_display_names: bool,
+    version: str,
+) -> None:
+    """send the fragments of a stacked file to the main process through
+    *queue*; used by the *MDF.stack* worker processes"""
+
+    mdf = MDF(file, use_display_names=use_display_names)
+    try:
+        mdf.configure(copy_on_get=False)
+
+        _put_file_groups(queue, (mdf.name,), list(_stack_file_groups(mdf, version)))
+    finally:
+        mdf.close()
+
+
+def _put_file_groups(queue: Any, header: tuple[Any, ...], groups: list[tuple[Any, ...]]) -> None:
+    """send the *header* and the groups description to the main process,
+    followed by the fragments of each group and a *None* marker after the
+    last fragment of the group; the last item of each group is the fragments
+    iterator"""
+
+    queue.put((*header, [group[:-1] for group in groups]))
+    for *_, fragments in groups:
+        for fragment in fragments:
+            queue.put(fragment)
+        queue.put(None)
+
+
+def _get_queue_item(queue: Any) -> Any:
+    item = queue.get()
+    if isinstance(item, BaseException):
+        raise item
+    return item
+
+
+def _get_queue_fragments(queue: Any) -> Iterator[Any]:
+    while (fragment := _get_queue_item(queue)) is not None:
+        yield fragment
+
+
+def _get_file_groups(queue: Any) -> tuple[Any, ...]:
+    """receive the result sent by *_put_file_groups*; the fragments iterators
+    of the groups read from the same queue so they must be consumed in
+    order"""
+
+    *header, groups = _get_queue_item(queue)
+    return (*header, [(*group, _get_queue_fragments(queue)) for group in groups])
+
+
+def _stream_file(read: Callable[..., None], queue: Any, *args: Any) -> None:
+    """call *read* in a worker process; the exceptions are also sent through
+    *queue* so that the main process does not wait for the fragments"""
+
+    try:
+        read(queue, *args)
+    except BaseException as exc:
+        try:
+            queue.put(exc)
+        except:
+            # the main process already closed the queues
+            pass
+        raise
+
+
+class _ProcessPoolReader:
+    """read the input files of *MDF.concatenate* and *MDF.stack* in a process
+    pool, ahead of the file that is processed in the main process
+
+    Only the files given as paths are read in the worker processes; the
+    *MDF* objects and the file-like objects are read in the main process.
+    The worker processes send the fragments through bounded queues, so at
+    most PROCESS_POOL_FRAGMENTS fragments are waiting to be processed for
+    each of the *workers* + 1 files that are read ahead.
+
+    """
+
+    def __init__(
+        self,
+        read: Callable[..., Any],
+        files: Sequence[MDF | InputType],
+        workers: int,
+        *args: Any,
+    ) -> None:
+        self.read = read
+        self.files = files
+        self.args = args
+        self.window = workers + 1
+        self.manager = Manager()
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.futures = {}
+        self.queues = {}
+        self.next_index = 1
+
+        self._submit(1)
+
+    def _submit(self, index: int) -> None:
+        last_index = min(index + self.window, len(self.files))
+        while self.next_index < last_index:
+            file = self.files[self.next_index]
+            if isinstance(file, (str, Path)):
+                queue = self.queues[self.next_index] = self.manager.Queue(PROCESS_POOL_FRAGMENTS)
+                self.futures[self.next_index] = self.executor.submit(
+                    _stream_file, self.read, queue, file, self.next_index, *self.args
+                )
+            self.next_index += 1
+
+    def result(self, index: int) -> Any:
+        """return the result for the file at *index*, or *None* if the file
+        must be read in the main process. The fragments iterators of the
+        result must be consumed in order"""
+        self._submit(index + 1)
+        self.futures.pop(index, None)
+        queue = self.queues.pop(index, None)
+        if queue is None:
+            return None
+        else:
+            return _get_file_groups(queue)
+
+    def close(self) -> None:
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+        self.queues.clear()
+        # the workers that wait to send fragments fail when the queues are closed
+        self.manager.shutdown()
+        self.executor.shutdown()
+
+
+def _process_pool_results(
+    function: Callable[..., Any],
+    arguments: Sequence[tuple[Any, ...]],
+    workers: int,
+) -> Iterator[Any]:
+    """yield the results of *function* called with each of the *arguments*
+    in a process pool, in the *arguments* order
+
+    At most *workers* + 1 results are computed ahead, to limit the memory
+    used by the results that are waiting to be processed.
+
+    """
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = deque()
+    pending = iter(arguments)
+
+    try:
+        for args in islice(pending, workers + 1):
+            futures.append(executor.submit(function, *args))
+
+        while futures:
+            result = futures.popleft().result()
+            for args in islice(pending, 1):
+                futures.append(executor.submit(function, *args))
+            yield result
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def _arrow_arrays(
+    name: str,
+    samples: NDArray[Any],
+    invalidation_bits: NDArray[Any] | None,
+    encoding: str,
+    dictionary: bool = False,
+) -> list[tuple[str, Any]]:
+    """(column name, *pyarrow* array) pairs for the *samples* of a channel
+    fragment. The structured samples are split in one column for each field,
+    the invalid samples become nulls and the texts of the value to text
+    conversions (*dictionary=True*) are dictionary encoded"""
+
+    import pyarrow as pa
+
+    if samples.dtype.names:
+        arrays = []
+        for field in samples.dtype.names:
+            arrays.extend(_arrow_arrays(f"{name}.{field}", samples[field], invalidation_bits, encoding, dictionary))
+        return arrays
+
+    if invalidation_bits is not None and not invalidation_bits.any():
+        invalidation_bits = None
+
+    if samples.ndim > 1:
+        size = int(np.prod(samples.shape[1:]))
+        values = np.ascontiguousarray(samples).reshape(-1)
+        if samples.dtype == np.uint8:
+            array = pa.FixedSizeBinaryArray.from_buffers(pa.binary(size), len(samples), [None, pa.py_buffer(values)])
+        else:
+            array = pa.FixedSizeListArray.from_arrays(pa.array(values), size)
+        return [(name, array)]
+
+    if samples.dtype.kind == "O":
+        samples = np.array(
+            [item.decode(encoding, "replace") if isinstance(item, bytes) else str(item) for item in samples.tolist()],
+            dtype="U",
+        )
+
+    if dictionary:
+        array = pa.array(samples).dictionary_encode()
+        values = array.dictionary
+        if pa.types.is_binary(values.type):
+            values = pa.array([item.decode(encoding, "replace") for item in values.to_pylist()], type=pa.string())
+        indices = pa.array(array.indices.to_numpy(zero_copy_only=False), mask=invalidation_bits)
+        return [(name, pa.DictionaryArray.from_arrays(indices, values))]
+
+    return [(name, pa.array(samples, mask=invalidation_bits))]
+
+
+def _value2text_conversion(conversion: ChannelConversionType | None) -> bool:
+    """the *conversion* translates the raw values to texts"""
+    if conversion is None:
+        return False
+    elif isinstance(conversion, ChannelConversionV3):
+        return conversion.conversion_type in (v23c.CONVERSION_TYPE_TABX, v23c.CONVERSION_TYPE_RTABX)
+    else:
+        return conversion.conversion_type in (
+            v4c.CONVERSION_TYPE_TABX,
+            v4c.CONVERSION_TYPE_RTABX,
+            v4c.CONVERSION_TYPE_BITFIELD,
+        )
+
+
+def _bus_logging_info() -> dict[str, Any]:
+    """statistics collected while decoding a bus logging group"""
+    return {
+        "total_unique_ids": set(),
+        "found_ids": set(),
+        "found_messages": set(),
+        "unknown_ids": defaultdict(list),
+    }
+
+
+def _can_database_messages(
+    dbc: CanMatrix,
+) -> tuple[dict[tuple[int, bool], Any], dict[tuple[int, int], Any], bool]:
+    """CAN database messages indexed by (ID, extended) and the J1939 messages
+    indexed by (PGN, source address)"""
+    messages = {(message.arbitration_id.id, message.arbitration_id.extended): message for message in dbc}
+
+    global_is_j1939 = dbc.attributes.get("ProtocolType", "").lower() == "j1939"
+
+    j1939_messages = {
+        (
+            message.arbitration_id.pgn,
+            message.arbitration_id.j1939_source,
+        ): message
+        for message in dbc
+        if message.is_j1939 or global_is_j1939
+    }
+
+    return messages, j1939_messages, global_is_j1939
+
+
+def _wrap_byte_order(extracted_signals: dict[tuple[Any, ...], dict[str, Any]], wrap: bool) -> None:
+    """numpy does not keep the big endian byte order of the arrays that are
+    pickled; these samples are sent to the main process as single field
+    structured arrays"""
+    for signals in extracted_signals.values():
+        for signal in signals.values():
+            samples = signal["samples"]
+            if wrap:
+                if samples.dtype.byteorder == ">":
+                    signal["samples"] = samples.view([("samples", samples.dtype)])
+            elif samples.dtype.names == ("samples",):
+                signal["samples"] = samples["samples"]
+
+
+def _decode_bus_logging_group(
+    file: Path,
+    bus_type: BusType,
+    index: int,
+    database: CanMatrix | Path,
+    bus_channel: int,
+    ignore_value2text_conversion: bool,
+) -> tuple[dict[str, Any], list[tuple[Any, ...]]]:
+    """decode a bus logging group; used by the *MDF.extract_bus_logging*
+    worker processes. The decoded messages are referenced by their index in
+    the database frames"""
+
+    if isinstance(database, CanMatrix):
+        dbc = database
+    else:
+        dbc = load_can_database(database)
+
+    message_indexes = {id(message): i for i, message in enumerate(dbc.frames)}
+
+    mdf = MDF(file, process_bus_logging=False)
+    try:
+        info = _bus_logging_info()
+        if bus_type == "CAN":
+            decoded = mdf._decode_can_logging_group(index, dbc, bus_channel, ignore_value2text_conversion, info)
+        else:
+            decoded = mdf._decode_lin_logging_group(index, dbc, bus_channel, ignore_value2text_conversion, info)
+
+        decoded = [(message_indexes[id(message)], *item) for message, *item in decoded]
+        for *_, extracted_signals in decoded:
+            _wrap_byte_order(extracted_signals, wrap=True)
+
+        return info, decoded
+    finally:
+        mdf.close()
+
+
 class MDF:
     """Unified access to MDF v3 and v4 files. Underlying _mdf's attributes and
     methods are linked to the `MDF` object via *setattr*. This is done to expose
@@ -184,7 +693,13 @@ class MDF:
     remove_source_from_channel_names (\*\*kwargs) : bool
         remove source from channel names ("Speed\XCP3" -> "Speed")
     copy_on_get (\*\*kwargs) : bool
-        copy arrays in the get method; default *True*
+        copy arrays in the get method; default *True*. For memory mapped MDF4
+        files the raw samples of byte aligned channels stored in uncompressed
+        data blocks are returned as read-only views of the file if this is
+        *False*; the file stays open after *close* until these arrays are
+        released
+
+        .. versionchanged:: 7.5.0
     expand_zippedfile (\*\*kwargs) : bool
         only for bz2.BZ2File and gzip.GzipFile, load the file content into a
         BytesIO before parsing (avoids the huge performance penalty of doing
@@ -200,6 +715,33 @@ class MDF:
 
         .. versionadded:: 7.0.0
 
+    use_index (\*\*kwargs) : bool
+        only for MDF4 files: store the parsed file structure in an index file
+        next to the measurement file (*<name>.asammdf_index*) and use it to skip
+        the blocks parsing the next time the same file is opened; default *False*.
+        See `MDF.invalidate_index`
+
+        .. warning::
+
+            the index file is loaded with *pickle*, so a crafted index file can
+            execute arbitrary code. Only enable this option for measurement
+            files in folders where nobody else can write to
+
+        .. versionadded:: 7.5.0
+
+    lazy_channels (\*\*kwargs) : bool
+        only for MDF4 files: read the channel conversion, source and comment
+        blocks only when they are first accessed; the comment is loaded at
+        opening if *use_display_names* is *True*; default *False*
+
+        .. versionadded:: 7.5.0
+
+    thread_safe (\*\*kwargs) : bool
+        only for MDF4 files: allow the concurrent reading of channels from
+        several threads using the same *MDF* object; default *False*
+
+        .. versionadded:: 7.5.0
+
     Examples
     --------
     >>> mdf = MDF(version='3.30') # new MDF object with version 3.30
@@ -678,7 +1220,8 @@ class MDF:
                     added hybrid mode interpolation
 
         copy_on_get : bool
-            copy arrays in the get method
+            copy arrays in the get method; if *False* the arrays can be
+            read-only views of the memory mapped MDF4 file
 
         float_interpolation : int
             interpolation mode for float channels:
@@ -787,26 +1330,13 @@ class MDF:
                 if progress.stop:
                     return TERMINATED
 
-        cg_nr = None
-
         self.configure(copy_on_get=False)
 
-        # walk through all groups and get all channels
+        # walk through all groups and get all channels; the unchanged MDF4
+        # data blocks are copied without decoding the records
         for i, virtual_group in enumerate(self.virtual_groups):
-            for idx, sigs in enumerate(self._yield_selected_signals(virtual_group, version=version)):
-                if idx == 0:
-                    if sigs:
-                        cg = self.groups[virtual_group].channel_group
-                        cg_nr = out.append(
-                            sigs,
-                            common_timebase=True,
-                            comment=cg.comment,
-                        )
-                        MDF._transfer_channel_group_data(out.groups[cg_nr].channel_group, cg)
-                    else:
-                        break
-                else:
-                    out.extend(cg_nr, sigs)
+            groups = self.included_channels(virtual_group)[virtual_group]
+            self._copy_group(out, virtual_group, groups, version)
 
             if progress is not None:
                 if callable(progress):
@@ -925,12 +1455,51 @@ class MDF:
             if not included_channels:
                 continue
 
+            # read only the data blocks that contain the cut interval
+            record_offset, record_count = self._mdf.get_record_window(group_index, start, stop)
+
+            raw_range = self._raw_cut_range(
+                group_index, included_channels, start, stop, version, time_from_zero, record_count
+            )
+            raw_copy = {"enabled": False}
+            if raw_range is None:
+                fragments = self._yield_selected_signals(
+                    group_index,
+                    groups=included_channels,
+                    record_offset=record_offset,
+                    record_count=record_count or None,
+                )
+            else:
+                # only the records around the cut limits are decoded; the
+                # records between them are copied raw if the new channel
+                # group has the same record layout
+                first, last = raw_range
+                segments = [
+                    (record_offset, first - record_offset, False),
+                    (first, last - first, True),
+                    (last, record_offset + record_count - last, False),
+                ]
+
+                fragments = self._yield_cut_fragments(group_index, included_channels, segments, raw_copy)
+
             idx = 0
+            cg_nr = None
             signals = []
-            for j, sigs in enumerate(self._yield_selected_signals(group_index, groups=included_channels)):
+            for sigs in fragments:
+                # the raw records are yielded as data blocks or as the data
+                # tuples of _load_data
+                if isinstance(sigs, DataBlockInfo):
+                    out._mdf._extend_raw_block(cg_nr, self._mdf, group_index, sigs)
+                    continue
+                elif isinstance(sigs, tuple):
+                    out._mdf._extend_raw(cg_nr, sigs[0])
+                    continue
+
                 if not sigs:
                     break
-                if j == 0:
+
+                first_fragment = isinstance(sigs[0], Signal)
+                if first_fragment:
                     master = sigs[0].timestamps
                     signals = sigs
                 else:
@@ -984,7 +1553,7 @@ class MDF:
                             needs_cutting = False
 
                 # update the signal if this is not the first yield
-                if j:
+                if not first_fragment:
                     for signal, (samples, invalidation) in zip(signals, sigs[1:]):
                         signal.samples = samples
                         signal.timestamps = master
@@ -1039,6 +1608,12 @@ class MDF:
                     )
                     MDF._transfer_channel_group_data(out.groups[cg_nr].channel_group, cg)
 
+                    if raw_range is not None:
+                        master_index = self.masters_db[group_index]
+                        raw_copy["enabled"] = self._mdf._record_layout(
+                            group_index, [master_index, *included_channels[group_index]]
+                        ) == out._mdf._record_layout(cg_nr)
+
                 else:
                     sigs = [(sig.samples, sig.invalidation_bits) for sig in signals]
                     sigs.insert(0, (master, None))
@@ -1086,6 +1661,185 @@ class MDF:
 
         return out
 
+    def _raw_cut_range(
+        self,
+        group_index: int,
+        groups: dict[int, list[int]],
+        start: float | None,
+        stop: float | None,
+        version: str,
+        time_from_zero: bool,
+        record_count: int,
+    ) -> tuple[int, int] | None:
+        """records range of the group *group_index* that can be copied raw by
+        *cut*: the records between the first and the last sample of the cut
+        interval. *None* if the records must be decoded"""
+
+        if (
+            time_from_zero
+            or not self._raw_copy_possible(group_index, groups, version, record_count)
+            or self._mdf.get_time_index(group_index) is None
+        ):
+            return None
+
+        channel_group = self.groups[group_index].channel_group
+
+        if start is None:
+            first = 0
+        else:
+            first = self._mdf._find_record(group_index, start, side="left")
+
+        if stop is None:
+            last = channel_group.cycles_nr
+        else:
+            last = self._mdf._find_record(group_index, stop, side="right")
+
+        # the first and the last sample are decoded
+        if last - first <= 2:
+            return None
+
+        return first + 1, last - 1
+
+    def _raw_copy_possible(
+        self,
+        group_index: int,
+        groups: dict[int, list[int]],
+        version: str,
+        record_count: int,
+    ) -> bool:
+        """the records of the group *group_index* can be copied raw to a new
+        measurement of the given *version*, provided that the new channel group
+        gets the same record layout (see *MDF4._record_layout*)"""
+
+        if self.version < "4.00" or not "4.00" <= version < "4.20" or list(groups) != [group_index]:
+            return False
+
+        channel_group = self.groups[group_index].channel_group
+        if record_count * (channel_group.samples_byte_nr + channel_group.invalidation_bytes_nr) < RAW_COPY_MIN_SIZE:
+            return False
+
+        master_index = self.masters_db.get(group_index, None)
+        return (
+            master_index is not None
+            and self._mdf._record_layout(group_index, [master_index, *groups[group_index]]) is not None
+        )
+
+    def _copy_group(self, out: MDF, group_index: int, groups: dict[int, list[int]], version: str) -> int | None:
+        """append the *groups* channels of the virtual group *group_index* to
+        *out*. If possible only the first record is decoded and the data blocks
+        are copied raw (see *_yield_cut_fragments*). Returns the index of the
+        new channel group or *None* if no channel was selected"""
+
+        cg = self.groups[group_index].channel_group
+        cycles_nr = self.virtual_groups[group_index].cycles_nr
+
+        raw_copy = {"enabled": False}
+        raw_possible = cycles_nr > 1 and self._raw_copy_possible(group_index, groups, version, cycles_nr)
+        if raw_possible:
+            segments = [(0, 1, False), (1, cycles_nr - 1, True)]
+            fragments = self._yield_cut_fragments(group_index, groups, segments, raw_copy)
+        else:
+            fragments = self._yield_selected_signals(group_index, groups=groups, version=version)
+
+        cg_nr = None
+        for sigs in fragments:
+            if isinstance(sigs, DataBlockInfo):
+                out._mdf._extend_raw_block(cg_nr, self._mdf, group_index, sigs)
+                continue
+            elif isinstance(sigs, tuple):
+                out._mdf._extend_raw(cg_nr, sigs[0])
+                continue
+
+            if not sigs:
+                break
+
+            if cg_nr is None:
+                cg_nr = out.append(
+                    sigs,
+                    common_timebase=True,
+                    comment=cg.comment,
+                )
+                MDF._transfer_channel_group_data(out.groups[cg_nr].channel_group, cg)
+
+                if raw_possible:
+                    master_index = self.masters_db.get(group_index, None)
+                    raw_copy["enabled"] = self._mdf._record_layout(
+                        group_index, [master_index, *groups[group_index]]
+                    ) == out._mdf._record_layout(cg_nr)
+
+            else:
+                # each decoded segment starts with Signal objects
+                if isinstance(sigs[0], Signal):
+                    sigs = [
+                        (sigs[0].timestamps, None),
+                        *((sig.samples, sig.invalidation_bits) for sig in sigs),
+                    ]
+                out.extend(cg_nr, sigs)
+
+        return cg_nr
+
+    def _yield_cut_fragments(
+        self,
+        group_index: int,
+        groups: dict[int, list[int]],
+        segments: list[tuple[int, int, bool]],
+        raw_copy: dict[str, bool],
+    ) -> Iterator[list | tuple | DataBlockInfo]:
+        """yield the fragments of the cut *segments* (record offset, record
+        count, raw flag). If *raw_copy["enabled"]* is set when a raw segment
+        starts, its data blocks that contain only whole records of the segment
+        are yielded as *DataBlockInfo* objects and the rest of its records as
+        the data tuples of *_load_data*. The other segments are decoded like in
+        *_yield_selected_signals*"""
+
+        group = self.groups[group_index]
+        record_size = group.channel_group.samples_byte_nr + group.channel_group.invalidation_bytes_nr
+
+        for record_offset, record_count, raw in segments:
+            if record_count <= 0:
+                continue
+
+            if raw and raw_copy["enabled"]:
+                start = pending = record_offset * record_size
+                end = (record_offset + record_count) * record_size
+
+                position = 0
+                for info in group.get_data_blocks():
+                    block_end = position + info.original_size
+                    if (
+                        position >= start
+                        and block_end <= end
+                        and info.block_limit is None
+                        and not position % record_size
+                        and not block_end % record_size
+                    ):
+                        if pending < position:
+                            yield from self._mdf._load_data(
+                                group,
+                                record_offset=pending // record_size,
+                                record_count=(position - pending) // record_size,
+                            )
+                        yield info
+                        pending = block_end
+
+                    position = block_end
+                    if position >= end:
+                        break
+
+                if pending < end:
+                    yield from self._mdf._load_data(
+                        group,
+                        record_offset=pending // record_size,
+                        record_count=(end - pending) // record_size,
+                    )
+            else:
+                yield from self._yield_selected_signals(
+                    group_index,
+                    groups=groups,
+                    record_offset=record_offset,
+                    record_count=record_count,
+                )
+
     def export(
         self,
         fmt: Literal["asc", "csv", "hdf5", "mat", "parquet"],
@@ -1118,7 +1872,13 @@ class MDF:
               master will be renamed to 'DM<cntr>_<channel name>'
               ( *<cntr>* is the data group index starting from 0)
 
-            * `parquet` : export to Apache parquet format
+            * `parquet` : export to Apache parquet format. If
+              *split_channel_groups==True* each channel group is written to a
+              separate parquet file
+              (<MDFNAME>.ChannelGroup_<cntr>[_<comment>].parquet) using its
+              own time base
+
+              .. versionchanged:: 7.5.0
             * `asc`: Vector ASCII format for bus logging
 
                 .. versionadded:: 7.3.3
@@ -1152,6 +1912,15 @@ class MDF:
               compression to be used
 
               * for ``parquet`` : "GZIP" or "SNAPPY"
+
+            * `split_channel_groups` : bool
+              only valid for *parquet* export; stream each channel group to a
+              separate file with its own time base using *pyarrow*, without
+              loading the measurement in memory. The *raster*,
+              *empty_channels*, *reduce_memory_usage* and *time_as_date*
+              arguments are ignored; default *False*
+
+              .. versionadded:: 7.5.0
               * for ``hfd5`` : "gzip", "lzf" or "szip"
               * for ``mat`` : bool
 
@@ -1240,7 +2009,34 @@ class MDF:
         ignore_value2text_conversions = kwargs.get("ignore_value2text_conversions", False)
         raw = bool(kwargs.get("raw", False))
 
-        if compression == "SNAPPY":
+        # on request each channel group is streamed to its own parquet file by
+        # the pyarrow writer
+        arrow_parquet = False
+        if fmt == "parquet" and kwargs.get("split_channel_groups", False):
+            if single_time_base:
+                logger.warning("split_channel_groups is ignored because single_time_base is set")
+            else:
+                try:
+                    import pyarrow.parquet  # noqa: F401
+                except ImportError:
+                    logger.warning("pyarrow not found; export to parquet will use a single file")
+                else:
+                    arrow_parquet = True
+
+                    ignored = [
+                        name
+                        for name, default in (
+                            ("raster", None),
+                            ("empty_channels", "skip"),
+                            ("reduce_memory_usage", False),
+                            ("time_as_date", False),
+                        )
+                        if kwargs.get(name, default) != default
+                    ]
+                    if ignored:
+                        logger.warning(f"arguments ignored by the parquet export with split_channel_groups: {ignored}")
+
+        if compression == "SNAPPY" and not arrow_parquet:
             try:
                 import snappy  # noqa: F401
             except ImportError:
@@ -1249,7 +2045,7 @@ class MDF:
 
         filename = Path(filename) if filename else self.name
 
-        if fmt == "parquet":
+        if fmt == "parquet" and not arrow_parquet:
             try:
                 from fastparquet import write as write_parquet
             except ImportError:
@@ -1277,7 +2073,7 @@ class MDF:
                     logger.warning("scipy not found; export to mat v4 and v5 is unavailable")
                     return
 
-        elif fmt not in ("csv", "asc"):
+        elif fmt not in ("csv", "asc", "parquet"):
             raise MdfException(f"Export to {fmt} is not implemented")
 
         if progress is not None:
@@ -1293,6 +2089,17 @@ class MDF:
         if fmt == "asc":
             return self._asc_export(filename.with_suffix(".asc"))
 
+        if arrow_parquet:
+            return self._parquet_export(
+                filename.with_suffix(".parquet"),
+                time_from_zero=time_from_zero,
+                use_display_names=use_display_names,
+                ignore_value2text_conversions=ignore_value2text_conversions,
+                raw=raw,
+                compression=compression,
+                progress=progress,
+            )
+
         if single_time_base or fmt == "parquet":
             df = self.to_dataframe(
                 raster=raster,
@@ -2057,24 +2864,9 @@ class MDF:
                     return TERMINATED
 
         for i, (group_index, groups) in enumerate(gps.items()):
-            for idx, sigs in enumerate(self._yield_selected_signals(group_index, groups=groups, version=version)):
-                if not sigs:
-                    break
-
-                if idx == 0:
-                    if sigs:
-                        cg = self.groups[group_index].channel_group
-                        cg_nr = mdf.append(
-                            sigs,
-                            common_timebase=True,
-                            comment=cg.comment,
-                        )
-                        MDF._transfer_channel_group_data(mdf.groups[cg_nr].channel_group, cg)
-                    else:
-                        break
-
-                else:
-                    mdf.extend(cg_nr, sigs)
+            # the groups that keep all their channels are copied without
+            # decoding the records
+            self._copy_group(mdf, group_index, groups, version)
 
             if progress is not None:
                 if callable(progress):
@@ -2172,6 +2964,7 @@ class MDF:
         add_samples_origin: bool = False,
         direct_timestamp_continuation: bool = False,
         progress=None,
+        workers: int = 0,
         **kwargs,
     ) -> MDF:
         """concatenates several files. The files
@@ -2206,6 +2999,14 @@ class MDF:
 
             ..versionadded:: 6.0.0
 
+        workers (0) : int
+            number of worker processes used to open and read the input files
+            given as paths, ahead of the file that is currently appended to
+            the output. The output is the same as for the serial processing;
+            default 0 (all the files are read in the current process)
+
+            .. versionadded:: 7.5.0
+
         kwargs :
 
             use_display_names (False) : bool
@@ -2309,300 +3110,260 @@ class MDF:
                 origin_conversion[f"text_{i}"] = str(mdf.original_name if isinstance(mdf, MDF) else str(mdf))
             origin_conversion = from_dict(origin_conversion)
 
-        for mdf_index, (offset, mdf) in enumerate(zip(offsets, files)):
-            if not isinstance(mdf, MDF):
-                mdf = MDF(mdf, use_display_names=use_display_names)
-                close = True
-            else:
-                close = False
+        reader = None
 
-            if progress is not None and not callable(progress):
-                progress.signals.setLabelText.emit(
-                    f"Concatenating the file {mdf_index + 1} of {mdf_nr}\n{mdf.original_name}"
-                )
+        try:
+            for mdf_index, (offset, mdf) in enumerate(zip(offsets, files)):
+                if mdf_index == 0:
+                    if not isinstance(mdf, MDF):
+                        mdf = MDF(mdf, use_display_names=use_display_names)
 
-            if mdf_index == 0:
-                version = validate_version_argument(version)
-                first_version = mdf.version
+                    if progress is not None and not callable(progress):
+                        progress.signals.setLabelText.emit(
+                            f"Concatenating the file {mdf_index + 1} of {mdf_nr}\n{mdf.original_name}"
+                        )
 
-                kwargs = dict(mdf._kwargs)
+                    version = validate_version_argument(version)
+                    first_version = mdf.version
 
-                merged = MDF(
-                    version=version,
-                    **kwargs,
-                )
+                    kwargs = dict(mdf._kwargs)
 
-                merged.configure(from_other=mdf)
+                    merged = MDF(
+                        version=version,
+                        **kwargs,
+                    )
 
-                merged.header.start_time = oldest
+                    merged.configure(from_other=mdf)
 
-            mdf.configure(copy_on_get=False)
+                    merged.header.start_time = oldest
 
-            reorder_channel_groups = False
-            cg_translations = {}
+                    mdf.configure(copy_on_get=False)
 
-            vlsd_max_length = {}
+                    vlsd_max_length = {}
 
-            if mdf_index == 0:
-                last_timestamps = [None for gp in mdf.virtual_groups]
-                groups_nr = len(last_timestamps)
-                first_mdf = mdf
+                    last_timestamps = [None for gp in mdf.virtual_groups]
+                    groups_nr = len(last_timestamps)
+                    first_mdf = mdf
 
-                if progress is not None:
-                    if callable(progress):
-                        progress(0, groups_nr * mdf_nr)
-                    else:
-                        progress.signals.setValue.emit(0)
-                        progress.signals.setMaximum.emit(groups_nr * mdf_nr)
+                    if progress is not None:
+                        if callable(progress):
+                            progress(0, groups_nr * mdf_nr)
+                        else:
+                            progress.signals.setValue.emit(0)
+                            progress.signals.setMaximum.emit(groups_nr * mdf_nr)
 
-                        if progress.stop:
-                            return TERMINATED
+                            if progress.stop:
+                                return TERMINATED
 
-                if first_version >= "4.00":
-                    w_mdf = first_mdf
+                    if first_version >= "4.00":
+                        w_mdf = first_mdf
 
-                    vlds_channels = []
+                        vlds_channels = []
 
-                    for _gp_idx, _gp in enumerate(w_mdf.groups):
-                        for _ch_idx, _ch in enumerate(_gp.channels):
-                            if _ch.channel_type == v4c.CHANNEL_TYPE_VLSD:
-                                vlds_channels.append((_ch.name, _gp_idx, _ch_idx))
+                        for _gp_idx, _gp in enumerate(w_mdf.groups):
+                            for _ch_idx, _ch in enumerate(_gp.channels):
+                                if _ch.channel_type == v4c.CHANNEL_TYPE_VLSD:
+                                    vlds_channels.append((_ch.name, _gp_idx, _ch_idx))
 
-                                vlsd_max_length[(_ch.name, _gp_idx)] = 0
+                                    vlsd_max_length[(_ch.name, _gp_idx)] = 0
 
-                    if vlsd_max_length:
-                        for i, _file in enumerate(files):
-                            if not isinstance(_file, MDF):
-                                _close = True
-                                _file = MDF(_file)
-                            else:
-                                _close = False
+                        if vlsd_max_length:
+                            for i, _file in enumerate(files):
+                                if not isinstance(_file, MDF):
+                                    _close = True
+                                    _file = MDF(_file)
+                                else:
+                                    _close = False
 
-                            _file.determine_max_vlsd_sample_size.cache_clear()
+                                _file.determine_max_vlsd_sample_size.cache_clear()
 
-                            for _ch_name, _gp_idx, _ch_idx in vlds_channels:
-                                key = (_ch_name, _gp_idx)
-                                for _second_gp_idx, _second_ch_idx in w_mdf.whereis(_ch_name):
-                                    if _second_gp_idx == _gp_idx:
-                                        vlsd_max_length[key] = max(
-                                            vlsd_max_length[key],
-                                            _file.determine_max_vlsd_sample_size(_second_gp_idx, _second_ch_idx),
+                                for _ch_name, _gp_idx, _ch_idx in vlds_channels:
+                                    key = (_ch_name, _gp_idx)
+                                    for _second_gp_idx, _second_ch_idx in w_mdf.whereis(_ch_name):
+                                        if _second_gp_idx == _gp_idx:
+                                            vlsd_max_length[key] = max(
+                                                vlsd_max_length[key],
+                                                _file.determine_max_vlsd_sample_size(_second_gp_idx, _second_ch_idx),
+                                            )
+                                            break
+                                    else:
+                                        raise MdfException(
+                                            f"internal structure of file {i} is different; different channels"
                                         )
-                                        break
-                                else:
-                                    raise MdfException(
-                                        f"internal structure of file {i} is different; different channels"
-                                    )
-
-                            if _close:
-                                _file.close()
 
-            else:
-                if len(mdf.virtual_groups) != groups_nr:
-                    raise MdfException(
-                        f"internal structure of file <{mdf.name}> is different; different channel groups count"
-                    )
-                else:
-                    cg_translations = dict.fromkeys(range(groups_nr))
+                                if _close:
+                                    _file.close()
 
-                    make_translation = False
+                    mdf.vlsd_max_length.clear()
+                    mdf.vlsd_max_length.update(vlsd_max_length)
 
-                    # check if the order of the channel groups is the same
+                    groups = []
                     for i, group_index in enumerate(mdf.virtual_groups):
                         included_channels = mdf.included_channels(group_index)[group_index]
-                        names = [
-                            mdf.groups[gp_index].channels[ch_index].name
-                            for gp_index, channels in included_channels.items()
-                            for ch_index in channels
-                        ]
+                        included_channel_names.append(
+                            [
+                                mdf.groups[gp_index].channels[ch_index].name
+                                for gp_index, channels in included_channels.items()
+                                for ch_index in channels
+                            ]
+                        )
+                        if included_channels:
+                            groups.append(
+                                (
+                                    i,
+                                    group_index,
+                                    group_index,
+                                    mdf._yield_selected_signals(group_index, groups=included_channels),
+                                )
+                            )
 
-                        if names != included_channel_names[i]:
-                            if sorted(names) != sorted(included_channel_names[i]):
-                                make_translation = reorder_channel_groups = True
-                                break
+                    groups_signatures = [_channel_group_signature(group.channel_group) for group in mdf.groups]
+                    reorder_channel_groups = False
+
+                    if workers and mdf_nr > 1:
+                        # start reading the next files while the first one is processed
+                        reader = _ProcessPoolReader(
+                            _read_concatenate_file,
+                            files,
+                            workers,
+                            use_display_names,
+                            included_channel_names,
+                            groups_signatures,
+                            vlsd_max_length,
+                        )
 
-                    # Make a channel group translation dictionary if the order is different
-                    if make_translation:
-                        for i, org_group in enumerate(first_mdf.groups):
-                            org_group_source = org_group.channel_group.acq_source
-                            for j, new_group in enumerate(mdf.groups):
-                                new_group_source = new_group.channel_group.acq_source
-                                if (
-                                    new_group.channel_group.acq_name == org_group.channel_group.acq_name
-                                    and (new_group_source and org_group_source)
-                                    and new_group_source.name == org_group_source.name
-                                    and new_group_source.path == org_group_source.path
-                                    and new_group.channel_group.samples_byte_nr
-                                    == org_group.channel_group.samples_byte_nr
-                                ):
-                                    new_included_channels = mdf.included_channels(j)[j]
-
-                                    new_names = [
-                                        mdf.groups[gp_index].channels[ch_index].name
-                                        for gp_index, channels in new_included_channels.items()
-                                        for ch_index in channels
-                                    ]
-
-                                    if sorted(new_names) == sorted(included_channel_names[i]):
-                                        cg_translations[i] = j
-                                        break
-
-            for i, group_index in enumerate(mdf.virtual_groups):
-                # save original group index for extension
-                # replace with the translated group index
-                if reorder_channel_groups:
-                    origin_gp_idx = group_index
-                    group_index = cg_translations[group_index]
-
-                included_channels = mdf.included_channels(group_index)[group_index]
+                else:
+                    result = reader.result(mdf_index) if reader is not None else None
 
-                if mdf_index == 0:
-                    included_channel_names.append(
-                        [
-                            mdf.groups[gp_index].channels[ch_index].name
-                            for gp_index, channels in included_channels.items()
-                            for ch_index in channels
-                        ]
-                    )
-                    different_channel_order = False
-                else:
-                    names = [
-                        mdf.groups[gp_index].channels[ch_index].name
-                        for gp_index, channels in included_channels.items()
-                        for ch_index in channels
-                    ]
-                    different_channel_order = False
-                    if names != included_channel_names[i]:
-                        if sorted(names) != sorted(included_channel_names[i]):
-                            raise MdfException(
-                                f"internal structure of file {mdf_index} is different; different channels"
-                            )
+                    if result is None:
+                        if not isinstance(mdf, MDF):
+                            mdf = MDF(mdf, use_display_names=use_display_names)
+                            close = True
                         else:
-                            original_names = included_channel_names[i]
-                            different_channel_order = True
-                            remap = [original_names.index(name) for name in names]
-
-                if not included_channels:
-                    continue
-
-                last_timestamp = last_timestamps[i]
-                first_timestamp = None
-                original_first_timestamp = None
+                            close = False
 
-                mdf.vlsd_max_length.clear()
-                mdf.vlsd_max_length.update(vlsd_max_length)
+                        original_name = mdf.original_name
 
-                for idx, signals in enumerate(mdf._yield_selected_signals(group_index, groups=included_channels)):
-                    if not signals:
-                        break
-                    if mdf_index == 0 and idx == 0:
-                        first_signal = signals[0]
-                        if len(first_signal):
-                            if offset > 0:
-                                timestamps = first_signal.timestamps + offset
-                                for sig in signals:
-                                    sig.timestamps = timestamps
-                            last_timestamp = first_signal.timestamps[-1]
-                            first_timestamp = first_signal.timestamps[0]
-                            original_first_timestamp = first_timestamp
-
-                        if add_samples_origin:
-                            signals.append(
-                                Signal(
-                                    samples=np.ones(len(first_signal), dtype="<u2") * mdf_index,
-                                    timestamps=first_signal.timestamps,
-                                    conversion=origin_conversion,
-                                    name="__samples_origin",
-                                )
-                            )
+                        mdf.configure(copy_on_get=False)
 
-                        cg = mdf.groups[group_index].channel_group
-                        cg_nr = merged.append(
-                            signals,
-                            common_timebase=True,
+                        reorder_channel_groups, groups = _concatenate_file_groups(
+                            mdf,
+                            mdf_index,
+                            included_channel_names,
+                            groups_signatures,
+                            vlsd_max_length,
                         )
-                        MDF._transfer_channel_group_data(merged.groups[cg_nr].channel_group, cg)
-                        cg_map[group_index] = cg_nr
-
                     else:
-                        if different_channel_order:
-                            new_signals = [None for _ in signals]
-                            if idx == 0:
-                                for new_index, sig in zip(remap, signals):
-                                    new_signals[new_index] = sig
-                            else:
-                                for new_index, sig in zip(remap, signals[1:]):
-                                    new_signals[new_index + 1] = sig
-                                new_signals[0] = signals[0]
-
-                            signals = new_signals
-
-                        if idx == 0:
-                            signals = [(signals[0].timestamps, None)] + [
-                                (sig.samples, sig.invalidation_bits) for sig in signals
-                            ]
-
-                        master = signals[0][0]
-                        _copied = False
+                        original_name, reorder_channel_groups, groups = result
 
-                        if len(master):
-                            if original_first_timestamp is None:
-                                original_first_timestamp = master[0]
-                            if offset > 0:
-                                master = master + offset
-                                _copied = True
-                            if last_timestamp is None:
-                                last_timestamp = master[-1]
-                            else:
-                                if last_timestamp >= master[0] or direct_timestamp_continuation:
-                                    if len(master) >= 2:
-                                        delta = master[1] - master[0]
-                                    else:
-                                        delta = 0.001
-                                    if _copied:
-                                        master -= master[0]
-                                    else:
-                                        master = master - master[0]
-                                        _copied = True
-                                    master += last_timestamp + delta
-                                last_timestamp = master[-1]
+                    if progress is not None and not callable(progress):
+                        progress.signals.setLabelText.emit(
+                            f"Concatenating the file {mdf_index + 1} of {mdf_nr}\n{original_name}"
+                        )
 
-                            signals[0] = master, None
+                for i, group_index, origin_gp_idx, fragments in groups:
+                    last_timestamp = last_timestamps[i]
+                    first_timestamp = None
+                    original_first_timestamp = None
+
+                    for idx, signals in enumerate(fragments):
+                        if not signals:
+                            break
+                        if mdf_index == 0 and idx == 0:
+                            first_signal = signals[0]
+                            if len(first_signal):
+                                if offset > 0:
+                                    timestamps = first_signal.timestamps + offset
+                                    for sig in signals:
+                                        sig.timestamps = timestamps
+                                last_timestamp = first_signal.timestamps[-1]
+                                first_timestamp = first_signal.timestamps[0]
+                                original_first_timestamp = first_timestamp
 
                             if add_samples_origin:
                                 signals.append(
-                                    (
-                                        np.ones(len(master), dtype="<u2") * mdf_index,
-                                        None,
+                                    Signal(
+                                        samples=np.ones(len(first_signal), dtype="<u2") * mdf_index,
+                                        timestamps=first_signal.timestamps,
+                                        conversion=origin_conversion,
+                                        name="__samples_origin",
                                     )
                                 )
-                            cg_nr = cg_map[group_index]
-                            # set the original channel group number back for extension
-                            if reorder_channel_groups:
-                                cg_nr = cg_map[origin_gp_idx]
-                            merged.extend(cg_nr, signals)
 
-                            if first_timestamp is None:
-                                first_timestamp = master[0]
+                            cg = mdf.groups[group_index].channel_group
+                            cg_nr = merged.append(
+                                signals,
+                                common_timebase=True,
+                            )
+                            MDF._transfer_channel_group_data(merged.groups[cg_nr].channel_group, cg)
+                            cg_map[group_index] = cg_nr
 
-                last_timestamps[i] = last_timestamp
+                        else:
+                            master = signals[0][0]
+                            _copied = False
+
+                            if len(master):
+                                if original_first_timestamp is None:
+                                    original_first_timestamp = master[0]
+                                if offset > 0:
+                                    master = master + offset
+                                    _copied = True
+                                if last_timestamp is None:
+                                    last_timestamp = master[-1]
+                                else:
+                                    if last_timestamp >= master[0] or direct_timestamp_continuation:
+                                        if len(master) >= 2:
+                                            delta = master[1] - master[0]
+                                        else:
+                                            delta = 0.001
+                                        if _copied:
+                                            master -= master[0]
+                                        else:
+                                            master = master - master[0]
+                                            _copied = True
+                                        master += last_timestamp + delta
+                                    last_timestamp = master[-1]
+
+                                signals[0] = master, None
+
+                                if add_samples_origin:
+                                    signals.append(
+                                        (
+                                            np.ones(len(master), dtype="<u2") * mdf_index,
+                                            None,
+                                        )
+                                    )
+                                cg_nr = cg_map[group_index]
+                                # set the original channel group number back for extension
+                                if reorder_channel_groups:
+                                    cg_nr = cg_map[origin_gp_idx]
+                                merged.extend(cg_nr, signals)
 
-            mdf.configure(copy_on_get=True)
+                                if first_timestamp is None:
+                                    first_timestamp = master[0]
 
-            if mdf_index == 0:
-                merged._transfer_metadata(mdf)
+                    last_timestamps[i] = last_timestamp
 
-            if progress is not None:
-                if callable(progress):
-                    progress(i + 1 + mdf_index * groups_nr, mdf_nr * groups_nr)
-                else:
-                    progress.signals.setValue.emit(i + 1 + mdf_index * groups_nr)
+                if mdf_index == 0:
+                    mdf.configure(copy_on_get=True)
+                    merged._transfer_metadata(mdf)
+                elif result is None:
+                    mdf.configure(copy_on_get=True)
+                    if close:
+                        mdf.close()
 
-                    if progress.stop:
-                        return TERMINATED
+                if progress is not None:
+                    if callable(progress):
+                        progress((mdf_index + 1) * groups_nr, mdf_nr * groups_nr)
+                    else:
+                        progress.signals.setValue.emit((mdf_index + 1) * groups_nr)
 
-            if close and mdf_index:
-                mdf.close()
+                        if progress.stop:
+                            return TERMINATED
+
+        finally:
+            if reader is not None:
+                reader.close()
 
         if not isinstance(files[0], MDF):
             first_mdf.close()
@@ -2620,6 +3381,7 @@ class MDF:
         version: str = "4.10",
         sync: bool = True,
         progress=None,
+        workers: int = 0,
         **kwargs,
     ) -> MDF:
         """stack several files and return the stacked *MDF* object
@@ -2637,6 +3399,13 @@ class MDF:
             merged file version
         sync : bool
             sync the files based on the start of measurement, default *True*
+        workers (0) : int
+            number of worker processes used to open and read the input files
+            given as paths, ahead of the file that is currently appended to
+            the output; default 0 (all the files are read in the current
+            process)
+
+            .. versionadded:: 7.5.0
 
         kwargs :
 
@@ -2708,84 +3477,99 @@ class MDF:
         else:
             offsets = [0 for file in files]
 
-        for mdf_index, (offset, mdf) in enumerate(zip(offsets, files)):
-            if not isinstance(mdf, MDF):
-                mdf = MDF(mdf, use_display_names=use_display_names)
+        reader = None
 
-            if mdf_index == 0:
-                version = validate_version_argument(version)
-
-                kwargs = dict(mdf._kwargs)
+        try:
+            for mdf_index, (offset, mdf) in enumerate(zip(offsets, files)):
+                result = reader.result(mdf_index) if reader is not None else None
 
-                stacked = MDF(
-                    version=version,
-                    **kwargs,
-                )
+                if result is None:
+                    if not isinstance(mdf, MDF):
+                        mdf = MDF(mdf, use_display_names=use_display_names)
 
-                stacked.configure(from_other=mdf)
+                    if mdf_index == 0:
+                        version = validate_version_argument(version)
 
-                if sync:
-                    stacked.header.start_time = oldest
-                else:
-                    stacked.header.start_time = mdf.header.start_time
+                        kwargs = dict(mdf._kwargs)
 
-            mdf.configure(copy_on_get=False)
+                        stacked = MDF(
+                            version=version,
+                            **kwargs,
+                        )
 
-            for i, group in enumerate(mdf.virtual_groups):
-                dg_cntr = None
-                included_channels = mdf.included_channels(group)[group]
-                if not included_channels:
-                    continue
+                        stacked.configure(from_other=mdf)
 
-                for idx, signals in enumerate(
-                    mdf._yield_selected_signals(group, groups=included_channels, version=version)
-                ):
-                    if not signals:
-                        break
-                    if idx == 0:
-                        if sync:
-                            timestamps = signals[0].timestamps + offset
-                            for sig in signals:
-                                sig.timestamps = timestamps
-                        cg = mdf.groups[group].channel_group
-                        dg_cntr = stacked.append(
-                            signals,
-                            common_timebase=True,
-                        )
-                        MDF._transfer_channel_group_data(stacked.groups[dg_cntr].channel_group, cg)
-                    else:
-                        master = signals[0][0]
                         if sync:
-                            master = master + offset
-                            signals[0] = master, None
+                            stacked.header.start_time = oldest
+                        else:
+                            stacked.header.start_time = mdf.header.start_time
 
-                        stacked.extend(dg_cntr, signals)
+                        if workers and files_nr > 1:
+                            # start reading the next files while the first one is processed
+                            reader = _ProcessPoolReader(_read_stack_file, files, workers, use_display_names, version)
 
-                if dg_cntr is not None:
-                    for index in range(dg_cntr, len(stacked.groups)):
-                        stacked.groups[index].channel_group.comment = (
-                            f'stacked from channel group {i} of "{mdf.name.parent}"'
-                        )
+                    mdf.configure(copy_on_get=False)
+
+                    name = mdf.name
+                    groups = _stack_file_groups(mdf, version)
 
-            if progress is not None:
-                if callable(progress):
-                    progress(mdf_index, files_nr)
                 else:
-                    progress.signals.setValue.emit(mdf_index)
+                    name, groups = result
 
-                    if progress.stop:
-                        return TERMINATED
+                for i, cg, fragments in groups:
+                    dg_cntr = None
 
-            mdf.configure(copy_on_get=True)
+                    for idx, signals in enumerate(fragments):
+                        if not signals:
+                            break
+                        if idx == 0:
+                            if sync:
+                                timestamps = signals[0].timestamps + offset
+                                for sig in signals:
+                                    sig.timestamps = timestamps
+                            dg_cntr = stacked.append(
+                                signals,
+                                common_timebase=True,
+                            )
+                            MDF._transfer_channel_group_data(stacked.groups[dg_cntr].channel_group, cg)
+                        else:
+                            master = signals[0][0]
+                            if sync:
+                                master = master + offset
+                                signals[0] = master, None
 
-            if mdf_index == 0:
-                stacked._transfer_metadata(mdf)
+                            stacked.extend(dg_cntr, signals)
 
-            if not input_types[mdf_index]:
-                mdf.close()
+                    if dg_cntr is not None:
+                        for index in range(dg_cntr, len(stacked.groups)):
+                            stacked.groups[index].channel_group.comment = (
+                                f'stacked from channel group {i} of "{name.parent}"'
+                            )
 
-            if progress is not None and progress.stop:
-                return TERMINATED
+                if progress is not None:
+                    if callable(progress):
+                        progress(mdf_index, files_nr)
+                    else:
+                        progress.signals.setValue.emit(mdf_index)
+
+                        if progress.stop:
+                            return TERMINATED
+
+                if result is None:
+                    mdf.configure(copy_on_get=True)
+
+                    if mdf_index == 0:
+                        stacked._transfer_metadata(mdf)
+
+                    if not input_types[mdf_index]:
+                        mdf.close()
+
+                if progress is not None and progress.stop:
+                    return TERMINATED
+
+        finally:
+            if reader is not None:
+                reader.close()
 
         try:
             stacked._process_bus_logging()
@@ -2922,6 +3706,12 @@ class MDF:
         """resample all channels using the given raster. See *configure* to select
         the interpolation method for interger channels
 
+        The channel groups are read and resampled in windows limited by the
+        *read_fragment_size* option, so the memory usage does not depend on the
+        measurement size.
+
+        .. versionchanged:: 7.5.0
+
         Parameters
         ----------
         raster : float | np.array | str
@@ -3115,38 +3905,35 @@ class MDF:
             mdf.header.start_time = self.header.start_time
 
         for i, (group_index, virtual_group) in enumerate(self.virtual_groups.items()):
-            channels = [
-                (None, gp_index, ch_index)
-                for gp_index, channel_indexes in self.included_channels(group_index)[group_index].items()
-                for ch_index in channel_indexes
-            ]
+            included_channels = self.included_channels(group_index)[group_index]
 
-            if not channels:
+            if not any(included_channels.values()):
                 continue
 
-            sigs = self.select(channels, raw=True)
-
-            sigs = [
-                sig.interp(
-                    raster,
-                    integer_interpolation_mode=integer_interpolation_mode,
-                    float_interpolation_mode=float_interpolation_mode,
-                )
-                for sig in sigs
-            ]
-
-            if new_raster is not None:
-                for sig in sigs:
-                    if len(sig):
-                        sig.timestamps = new_raster
+            dg_cntr = None
+            for sigs in self._yield_resampled_signals(
+                group_index,
+                included_channels,
+                raster,
+                integer_interpolation_mode,
+                float_interpolation_mode,
+            ):
+                master = sigs[0].timestamps if sigs else raster[:0]
+                if new_raster is not None and len(master):
+                    master = master - delta
+                    for sig in sigs:
+                        sig.timestamps = master
 
-            cg = self.groups[group_index].channel_group
-            dg_cntr = mdf.append(
-                sigs,
-                common_timebase=True,
-                comment=cg.comment,
-            )
-            MDF._transfer_channel_group_data(mdf.groups[dg_cntr].channel_group, cg)
+                if dg_cntr is None:
+                    cg = self.groups[group_index].channel_group
+                    dg_cntr = mdf.append(
+                        sigs,
+                        common_timebase=True,
+                        comment=cg.comment,
+                    )
+                    MDF._transfer_channel_group_data(mdf.groups[dg_cntr].channel_group, cg)
+                else:
+                    mdf.extend(dg_cntr, [(master, None), *((sig.samples, sig.invalidation_bits) for sig in sigs)])
 
             if progress is not None:
                 if callable(progress):
@@ -3161,6 +3948,132 @@ class MDF:
 
         return mdf
 
+    def _yield_resampled_signals(
+        self,
+        index: int,
+        groups: dict[int, list[int]],
+        raster: NDArray[Any],
+        integer_interpolation_mode: IntegerInterpolation,
+        float_interpolation_mode: FloatInterpolation,
+    ) -> Iterator[list[Signal]]:
+        """yield the channels of the virtual group *index* resampled on
+        consecutive windows of the *raster*
+
+        Only the records around the raster are read, in fragments of
+        *read_fragment_size*. The last sample of each fragment is carried over
+        to the next one so that the raster points between two fragments are
+        interpolated like for the complete signals. The raster windows are also
+        limited to *read_fragment_size*, so the memory usage does not depend on
+        the measurement size.
+        """
+
+        budget = self._read_fragment_size or 16 * 2**20
+
+        if len(raster):
+            record_offset, record_count = self._mdf.get_record_window(index, raster[0], raster[-1])
+        else:
+            record_offset, record_count = 0, 0
+
+        signals = []
+        carry = None
+        position = 0
+        window = 1
+
+        if record_count:
+            fragments = self._yield_selected_signals(
+                index,
+                groups=groups,
+                record_offset=record_offset,
+                record_count=record_count,
+            )
+
+            for sigs in fragments:
+                if not sigs:
+                    break
+
+                if isinstance(sigs[0], Signal):
+                    signals = sigs
+                    master = signals[0].timestamps
+
+                    size = 8
+                    for sig in signals:
+                        size += sig.samples.itemsize * int(np.prod(sig.samples.shape[1:]))
+                        if sig.invalidation_bits is not None:
+                            size += 1
+                    window = max(budget // size, 1)
+
+                else:
+                    master = sigs[0][0]
+                    for signal, (samples, invalidation_bits) in zip(signals, sigs[1:]):
+                        signal.samples = samples
+                        signal.timestamps = master
+                        signal.invalidation_bits = invalidation_bits
+
+                if not len(master):
+                    continue
+
+                if carry is not None:
+                    master = np.concatenate([carry[0].timestamps, master])
+                    for signal, last in zip(signals, carry):
+                        parts = [(last.samples, last.invalidation_bits), (signal.samples, signal.invalidation_bits)]
+                        signal.samples = np.concatenate([samples for samples, _ in parts])
+                        signal.timestamps = master
+                        if any(invalidation_bits is not None for _, invalidation_bits in parts):
+                            signal.invalidation_bits = np.concatenate(
+                                [
+                                    (
+                                        np.zeros(len(samples), dtype=bool)
+                                        if invalidation_bits is None
+                                        else invalidation_bits
+                                    )
+                                    for samples, invalidation_bits in parts
+                                ]
+                            )
+
+                # the raster points after the last sample are resampled with
+                # the next fragment
+                end = np.searchsorted(raster, master[-1], side="left")
+
+                for start in range(position, end, window):
+                    yield interp_signals(
+                        signals,
+                        raster[start : min(start + window, end)],
+                        integer_interpolation_mode=integer_interpolation_mode,
+                        float_interpolation_mode=float_interpolation_mode,
+                    )
+
+                position = max(position, end)
+                carry = interp_signals(
+                    signals,
+                    master[-1:],
+                    integer_interpolation_mode=IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE,
+                    float_interpolation_mode=FloatInterpolation.REPEAT_PREVIOUS_SAMPLE,
+                )
+
+        if not signals:
+            channels = [
+                (None, gp_index, ch_index)
+                for gp_index, channel_indexes in groups.items()
+                for ch_index in channel_indexes
+            ]
+            signals = self.select(channels, raw=True, copy_master=False, record_count=1)
+
+        if carry is None:
+            yield interp_signals(
+                signals,
+                raster[:0],
+                integer_interpolation_mode=integer_interpolation_mode,
+                float_interpolation_mode=float_interpolation_mode,
+            )
+        else:
+            for start in range(position, len(raster), window):
+                yield interp_signals(
+                    carry,
+                    raster[start : start + window],
+                    integer_interpolation_mode=integer_interpolation_mode,
+                    float_interpolation_mode=float_interpolation_mode,
+                )
+
     def select(
         self,
         channels: ChannelsType,
@@ -3170,6 +4083,8 @@ class MDF:
         ignore_value2text_conversions: bool = False,
         record_count: int | None = None,
         validate: bool = False,
+        start: float | None = None,
+        stop: float | None = None,
     ) -> list[Signal]:
         """retrieve the channels listed in *channels* argument as *Signal*
         objects
@@ -3206,6 +4121,17 @@ class MDF:
 
             .. versionadded:: 5.16.0
 
+        start : float | None
+            only return the samples with timestamps >= *start*; only the
+            data blocks that contain the time range are read
+
+            .. versionadded:: 7.5.0
+
+        stop : float | None
+            only return the samples with timestamps <= *stop*
+
+            .. versionadded:: 7.5.0
+
         Returns
         -------
         signals : list
@@ -3263,13 +4189,28 @@ class MDF:
                 (gp_index, ch_index) for gp_index, channel_indexes in groups.items() for ch_index in channel_indexes
             ]
 
-            if record_count is None:
-                cycles = cycles_nr - record_offset
+            group_offset, group_count = record_offset, record_count
+            empty_window = False
+            if start is not None or stop is not None:
+                window_offset, window_count = self._mdf.get_record_window(virtual_group, start, stop)
+                window_end = window_offset + window_count
+                if record_count is not None:
+                    window_end = min(window_end, record_offset + record_count)
+                group_offset = max(window_offset, record_offset)
+                if window_end > group_offset:
+                    group_count = window_end - group_offset
+                else:
+                    # a single record is still needed to get the channels metadata
+                    empty_window = True
+                    group_offset, group_count = window_offset, 1
+
+            if group_count is None:
+                cycles = cycles_nr - group_offset
             else:
-                if cycles_nr < record_count + record_offset:
-                    cycles = cycles_nr - record_offset
+                if cycles_nr < group_count + group_offset:
+                    cycles = cycles_nr - group_offset
                 else:
-                    cycles = record_count
+                    cycles = group_count
 
             signals = []
 
@@ -3279,8 +4220,8 @@ class MDF:
                 self._yield_selected_signals(
                     virtual_group,
                     groups=groups,
-                    record_offset=record_offset,
-                    record_count=record_count,
+                    record_offset=group_offset,
+                    record_count=group_count,
                 )
             ):
                 if not sigs:
@@ -3315,6 +4256,18 @@ class MDF:
 
                 current_pos = next_pos
 
+            if signals and (start is not None or stop is not None):
+                if empty_window:
+                    start_index = stop_index = 0
+                else:
+                    start_index = 0 if start is None else np.searchsorted(master, start, side="left")
+                    stop_index = len(master) if stop is None else np.searchsorted(master, stop, side="right")
+                master = master[start_index:stop_index]
+                for signal in signals:
+                    signal.samples = signal.samples[start_index:stop_index]
+                    if signal.invalidation_bits is not None:
+                        signal.invalidation_bits = signal.invalidation_bits[start_index:stop_index]
+
             for signal, pair in zip(signals, pairs):
                 signal.timestamps = master
                 output_signals[pair] = signal
@@ -3366,6 +4319,32 @@ class MDF:
 
         return signals
 
+    @staticmethod
+    def invalidate_index(name: StrPathType) -> bool:
+        """delete the index file that was created for the measurement file
+        *name* by opening it with *use_index=True*
+
+        .. versionadded:: 7.5.0
+
+        Parameters
+        ----------
+        name : str | pathlib.Path
+            measurement file name
+
+        Returns
+        -------
+        deleted : bool
+            *True* if an index file was found and deleted
+
+        """
+        index_file = mdf_v4.index_file_name(name)
+
+        if index_file.is_file():
+            index_file.unlink()
+            return True
+        else:
+            return False
+
     @staticmethod
     def scramble(name: StrPathType, skip_attachments: bool = False, progress=None, **kwargs) -> Path:
         """scramble text blocks and keep original file structure
@@ -4053,18 +5032,17 @@ class MDF:
 
                         cycles = len(group_master)
 
-                        signals = [
-                            (
-                                signal.interp(
-                                    master,
-                                    integer_interpolation_mode=self._integer_interpolation,
-                                    float_interpolation_mode=self._float_interpolation,
-                                )
-                                if not same_master or len(signal) != cycles
-                                else signal
-                            )
-                            for signal in signals
+                        indexes = [
+                            s_index for s_index, sig in enumerate(signals) if not same_master or len(sig) != cycles
                         ]
+                        interpolated = interp_signals(
+                            [signals[s_index] for s_index in indexes],
+                            master,
+                            integer_interpolation_mode=self._integer_interpolation,
+                            float_interpolation_mode=self._float_interpolation,
+                        )
+                        for s_index, sig in zip(indexes, interpolated):
+                            signals[s_index] = sig
 
                         if not same_master and interpolate_outwards_with_nan:
                             for sig in signals:
@@ -4433,18 +5411,15 @@ class MDF:
 
                 cycles = len(group_master)
 
-                signals = [
-                    (
-                        signal.interp(
-                            master,
-                            integer_interpolation_mode=self._integer_interpolation,
-                            float_interpolation_mode=self._float_interpolation,
-                        )
-                        if not same_master or len(signal) != cycles
-                        else signal
-                    )
-                    for signal in signals
-                ]
+                indexes = [s_index for s_index, sig in enumerate(signals) if not same_master or len(sig) != cycles]
+                interpolated = interp_signals(
+                    [signals[s_index] for s_index in indexes],
+                    master,
+                    integer_interpolation_mode=self._integer_interpolation,
+                    float_interpolation_mode=self._float_interpolation,
+                )
+                for s_index, sig in zip(indexes, interpolated):
+                    signals[s_index] = sig
 
                 if not same_master and interpolate_outwards_with_nan:
                     for sig in signals:
@@ -4578,6 +5553,7 @@ class MDF:
         ignore_value2text_conversion: bool = True,
         prefix: str = "",
         progress=None,
+        workers: int = 0,
     ) -> MDF:
         """extract all possible CAN signal using the provided databases.
 
@@ -4626,6 +5602,17 @@ class MDF:
 
             .. versionadded:: 6.3.0
 
+        workers (0) : int
+            number of worker processes used to decode the (database, bus
+            logging group) pairs; 0 decodes everything in the current
+            process. The worker processes reopen the measurement file, so
+            the *MDF* objects created from file-like objects or from scratch
+            are always decoded in the current process. The extracted signals
+            are appended to the output file in the same order as in the
+            serial processing
+
+            .. versionadded:: 7.5.0
+
 
         Returns
         -------
@@ -4683,6 +5670,7 @@ class MDF:
                 ignore_value2text_conversion,
                 prefix,
                 progress=progress,
+                workers=workers,
             )
 
         if database_files.get("LIN", None):
@@ -4692,10 +5680,172 @@ class MDF:
                 ignore_value2text_conversion,
                 prefix,
                 progress=progress,
+                workers=workers,
             )
 
         return out
 
+    def _bus_logging_file_backed(self) -> bool:
+        """the bus logging groups can be decoded by worker processes that
+        reopen the measurement file"""
+        mdf = self._mdf
+        return (
+            isinstance(mdf, mdf_v4.MDF4) and not mdf._from_filelike and not mdf.use_load_filter and mdf.name.is_file()
+        )
+
+    def _decode_can_logging_group(
+        self,
+        index: int,
+        dbc: CanMatrix,
+        bus_channel: int,
+        ignore_value2text_conversion: bool,
+        info: dict[str, Any],
+        plans: dict[int, bus_logging_utils.MessagePlan] | None = None,
+    ) -> Iterator[tuple[Any, ...]]:
+        """decode the CAN frames of the bus logging group *index*; the
+        messages statistics are collected in *info*"""
+        messages, j1939_messages, global_is_j1939 = _can_database_messages(dbc)
+        if plans is None:
+            plans = {}
+
+        group = self.groups[index]
+        pgn_number = source_address = None
+
+        self._prepare_record(group)
+        data = self._load_data(group, optimize_read=False)
+
+        for fragment in data:
+            self._set_temporary_master(None)
+            self._set_temporary_master(self.get_master(index, data=fragment))
+
+            bus_ids = self.get(
+                "CAN_DataFrame.BusChannel",
+                group=index,
+                data=fragment,
+                samples_only=True,
+            )[
+                0
+            ].astype("<u1")
+
+            msg_ids = self.get("CAN_DataFrame.ID", group=index, data=fragment).astype("<u4")
+            try:
+                msg_ide = self.get("CAN_DataFrame.IDE", group=index, data=fragment).samples.astype("<u1")
+            except:
+                msg_ide = ((msg_ids.samples & 0x80000000) >> 31).astype("<u1")
+
+            msg_ids &= 0x1FFFFFFF
+
+            data_bytes = self.get(
+                "CAN_DataFrame.DataBytes",
+                group=index,
+                data=fragment,
+                samples_only=True,
+            )[0]
+
+            timestamps = msg_ids.timestamps
+            msg_ids = msg_ids.samples
+
+            # group the rows by (bus, ID, IDE) with a single stable sort;
+            # the rows of each message stay in chronological order
+            keys = (bus_ids.astype("<u8") << 40) | (msg_ids.astype("<u8") << 8) | msg_ide
+            order = np.argsort(keys, kind="stable")
+            keys, starts = np.unique(keys[order], return_index=True)
+            ends = [*starts[1:].tolist(), len(order)]
+
+            j1939_keys = j1939_order = None
+
+            for key, start, end in zip(keys.tolist(), starts.tolist(), ends):
+                bus, msg_id, is_extended = key >> 40, (key >> 8) & 0xFFFFFFFF, key & 0xFF
+
+                if bus_channel and bus != bus_channel:
+                    continue
+
+                info["total_unique_ids"].add((msg_id, is_extended))
+
+                message = messages.get((msg_id, is_extended), None)
+
+                if message is None:
+                    tmp_pgn = msg_id >> 8
+                    ps = tmp_pgn & 0xFF
+                    pf = (msg_id >> 16) & 0xFF
+                    _pgn = tmp_pgn & 0x3FF00
+                    msg_pgn = _pgn + ps if pf >= 240 else _pgn
+
+                    for (_pgn, _sa), _msg in j1939_messages.items():
+                        if _pgn == msg_pgn:
+                            message = _msg
+                            break
+                    else:
+                        info["unknown_ids"][msg_id].append(True)
+                        continue
+
+                is_j1939 = message.is_j1939 or global_is_j1939
+                if is_j1939:
+                    source_address = msg_id & 0xFF
+                    pgn_number = message.arbitration_id.pgn
+                    key = (pgn_number, source_address, True)
+                    info["found_ids"].add((key, message.name))
+                    info["found_messages"].add((pgn_number, message.name))
+
+                else:
+                    key = msg_id, bool(is_extended), False
+
+                    info["found_ids"].add((key, message.name))
+                    info["found_messages"].add(((msg_id, is_extended), message.name))
+
+                info["unknown_ids"][(msg_id, is_extended)].append(False)
+
+                if is_j1939:
+                    # the J1939 messages are matched by (bus, PGN, SA)
+                    if j1939_keys is None:
+                        tmp_pgn = msg_ids >> 8
+                        ps = tmp_pgn & 0xFF
+                        pf = (msg_ids >> 16) & 0xFF
+                        _pgn = tmp_pgn & 0x3FF00
+                        j1939_msg_pgns = np.where(pf >= 240, _pgn + ps, _pgn)
+
+                        j1939_keys = (
+                            (bus_ids.astype("<u8") << 40) | (j1939_msg_pgns.astype("<u8") << 8) | (msg_ids & 0xFF)
+                        )
+                        j1939_order = np.argsort(j1939_keys, kind="stable")
+                        j1939_keys = j1939_keys[j1939_order]
+
+                    j1939_key = (bus << 40) | (pgn_number << 8) | source_address
+                    rows = j1939_order[
+                        np.searchsorted(j1939_keys, j1939_key, side="left") : np.searchsorted(
+                            j1939_keys, j1939_key, side="right"
+                        )
+                    ]
+                else:
+                    rows = order[start:end]
+
+                t = timestamps[rows]
+
+                plan = plans.get(id(message), None)
+                if plan is None:
+                    plan = plans[id(message)] = bus_logging_utils.MessagePlan(message)
+
+                try:
+                    extracted_signals = bus_logging_utils.extract_mux(
+                        data_bytes,
+                        message,
+                        msg_id,
+                        bus,
+                        t,
+                        original_message_id=source_address if is_j1939 else None,
+                        ignore_value2text_conversion=ignore_value2text_conversion,
+                        is_j1939=is_j1939,
+                        is_extended=is_extended,
+                        plan=plan,
+                        rows=rows,
+                    )
+                except:
+                    print(format_exc())
+                    raise
+
+                yield message, bus, msg_id, is_extended, is_j1939, pgn_number, source_address, extracted_signals
+            self._set_temporary_master(None)
+
     def _extract_can_logging(
         self,
         output_file: MDF,
@@ -4703,12 +5853,14 @@ class MDF:
         ignore_value2text_conversion: bool = True,
         prefix: str = "",
         progress=None,
+        workers: int = 0,
     ) -> MDF:
         out = output_file
 
         max_flags = []
 
         valid_dbc_files = []
+        databases = []
         unique_name = UniqueDB()
         for dbc_name, bus_channel in dbc_files:
             if isinstance(dbc_name, CanMatrix):
@@ -4719,12 +5871,14 @@ class MDF:
                         bus_channel,
                     )
                 )
+                databases.append(dbc_name)
             else:
                 dbc = load_can_database(Path(dbc_name))
                 if dbc is None:
                     continue
                 else:
                     valid_dbc_files.append((dbc, dbc_name, bus_channel))
+                    databases.append(Path(dbc_name))
 
         count = sum(
             1
@@ -4751,212 +5905,135 @@ class MDF:
         not_found_ids = defaultdict(list)
         unknown_ids = defaultdict(list)
 
+        current_not_found = []
         for dbc, dbc_name, bus_channel in valid_dbc_files:
-            messages = {(message.arbitration_id.id, message.arbitration_id.extended): message for message in dbc}
-
-            global_is_j1939 = dbc.attributes.get("ProtocolType", "").lower() == "j1939"
-
-            j1939_messages = {
-                (
-                    message.arbitration_id.pgn,
-                    message.arbitration_id.j1939_source,
-                ): message
-                for message in dbc
-                if message.is_j1939 or global_is_j1939
-            }
+            messages, _, global_is_j1939 = _can_database_messages(dbc)
 
-            current_not_found = {
-                (
+            current_not_found.append(
+                {
                     (
-                        (message.arbitration_id.id, message.arbitration_id.extended)
-                        if not message.is_j1939 and not global_is_j1939
-                        else message.arbitration_id.pgn
-                    ),
-                    message.name,
-                )
-                for msg_id, message in messages.items()
-            }
-
-            msg_map = {}
-
-            for i, group in enumerate(self.groups):
-                if (
-                    not group.channel_group.flags & v4c.FLAG_CG_BUS_EVENT
-                    or group.channel_group.acq_source.bus_type != v4c.BUS_TYPE_CAN
-                    or not "CAN_DataFrame" in [ch.name for ch in group.channels]
-                ):
-                    continue
-
-                self._prepare_record(group)
-                data = self._load_data(group, optimize_read=False)
-
-                for fragment in data:
-                    self._set_temporary_master(None)
-                    self._set_temporary_master(self.get_master(i, data=fragment))
-
-                    bus_ids = self.get(
-                        "CAN_DataFrame.BusChannel",
-                        group=i,
-                        data=fragment,
-                        samples_only=True,
-                    )[
-                        0
-                    ].astype("<u1")
-
-                    msg_ids = self.get("CAN_DataFrame.ID", group=i, data=fragment).astype("<u4")
-                    try:
-                        msg_ide = self.get("CAN_DataFrame.IDE", group=i, data=fragment).samples.astype("<u1")
-                    except:
-                        msg_ide = (msg_ids & 0x80000000) >> 31
+                        (
+                            (message.arbitration_id.id, message.arbitration_id.extended)
+                            if not message.is_j1939 and not global_is_j1939
+                            else message.arbitration_id.pgn
+                        ),
+                        message.name,
+                    )
+                    for msg_id, message in messages.items()
+                }
+            )
 
-                    msg_ids &= 0x1FFFFFFF
+        # the (database, bus logging group) pairs are always processed in
+        # this order, also when they are decoded by the worker processes
+        units = [
+            (dbc_index, i)
+            for dbc_index in range(len(valid_dbc_files))
+            for i, group in enumerate(self.groups)
+            if group.channel_group.flags & v4c.FLAG_CG_BUS_EVENT
+            and group.channel_group.acq_source.bus_type == v4c.BUS_TYPE_CAN
+            and "CAN_DataFrame" in [ch.name for ch in group.channels]
+        ]
 
-                    data_bytes = self.get(
-                        "CAN_DataFrame.DataBytes",
-                        group=i,
-                        data=fragment,
-                        samples_only=True,
-                    )[0]
+        if workers and len(units) > 1 and self._bus_logging_file_backed():
+            results = _process_pool_results(
+                _decode_bus_logging_group,
+                [
+                    (
+                        self.name,
+                        "CAN",
+                        i,
+                        databases[dbc_index],
+                        valid_dbc_files[dbc_index][2],
+                        ignore_value2text_conversion,
+                    )
+                    for dbc_index, i in units
+                ],
+                workers,
+            )
+        else:
+            results = None
 
-                    buses = np.unique(bus_ids)
+        msg_maps = [{} for _ in valid_dbc_files]
+        plans = [{} for _ in valid_dbc_files]
 
-                    for bus in buses:
-                        if bus_channel and bus != bus_channel:
+        try:
+            for dbc_index, i in units:
+                dbc, dbc_name, bus_channel = valid_dbc_files[dbc_index]
+                msg_map = msg_maps[dbc_index]
+
+                if results is None:
+                    info = _bus_logging_info()
+                    decoded = self._decode_can_logging_group(
+                        i,
+                        dbc,
+                        bus_channel,
+                        ignore_value2text_conversion,
+                        info,
+                        plans[dbc_index],
+                    )
+                else:
+                    info, decoded = next(results)
+                    for *_, extracted_signals in decoded:
+                        _wrap_byte_order(extracted_signals, wrap=False)
+                    decoded = ((dbc.frames[message_index], *item) for message_index, *item in decoded)
+
+                for (
+                    message,
+                    bus,
+                    msg_id,
+                    is_extended,
+                    is_j1939,
+                    pgn_number,
+                    source_address,
+                    extracted_signals,
+                ) in decoded:
+                    for entry, signals in extracted_signals.items():
+                        if len(next(iter(signals.values()))["samples"]) == 0:
                             continue
 
-                        idx = np.argwhere(bus_ids == bus).ravel()
-                        bus_t = msg_ids.timestamps[idx]
-                        bus_msg_ids = msg_ids.samples[idx]
-                        bus_msg_ide = msg_ide[idx]
-                        bus_data_bytes = data_bytes[idx]
-
-                        tmp_pgn = bus_msg_ids >> 8
-                        ps = tmp_pgn & 0xFF
-                        pf = (bus_msg_ids >> 16) & 0xFF
-                        _pgn = tmp_pgn & 0x3FF00
-                        j1939_msg_pgns = np.where(pf >= 240, _pgn + ps, _pgn)
-                        j9193_msg_sa = bus_msg_ids & 0xFF
-
-                        unique_ids = set(zip(bus_msg_ids.tolist(), bus_msg_ide.tolist()))
-
-                        total_unique_ids = total_unique_ids | set(unique_ids)
-
-                        for msg_id, is_extended in sorted(unique_ids):
-                            message = messages.get((msg_id, is_extended), None)
-
-                            if message is None:
-                                tmp_pgn = msg_id >> 8
-                                ps = tmp_pgn & 0xFF
-                                pf = (msg_id >> 16) & 0xFF
-                                _pgn = tmp_pgn & 0x3FF00
-                                msg_pgn = _pgn + ps if pf >= 240 else _pgn
-
-                                for (_pgn, _sa), _msg in j1939_messages.items():
-                                    if _pgn == msg_pgn:
-                                        message = _msg
-                                        break
-                                else:
-                                    unknown_ids[msg_id].append(True)
-                                    continue
-
-                            is_j1939 = message.is_j1939 or global_is_j1939
-                            if is_j1939:
-                                source_address = msg_id & 0xFF
-                                pgn_number = message.arbitration_id.pgn
-                                key = (pgn_number, source_address, True)
-                                found_ids[dbc_name].add((key, message.name))
-
-                                try:
-                                    current_not_found.remove((pgn_number, message.name))
-                                except KeyError:
-                                    pass
-
-                            else:
-                                key = msg_id, bool(is_extended), False
-
-                                found_ids[dbc_name].add((key, message.name))
-                                try:
-                                    current_not_found.remove(((msg_id, is_extended), message.name))
-                                except KeyError:
-                                    pass
+                        if entry not in msg_map:
+                            sigs = []
+
+                            index = len(out.groups)
+                            msg_map[entry] = index
+
+                            for name_, signal in signals.items():
+                                signal_name = f"{prefix}{signal['name']}"
+                                sig = Signal(
+                                    samples=signal["samples"],
+                                    timestamps=signal["t"],
+                                    name=signal_name,
+                                    comment=signal["comment"],
+                                    unit=signal["unit"],
+                                    invalidation_bits=signal["invalidation_bits"],
+                                    display_names={
+                                        f"CAN{bus}.{message.name}.{signal_name}": "bus",
+                                        f"{message.name}.{signal_name}": "message",
+                                    },
+                                )
 
-                            unknown_ids[(msg_id, is_extended)].append(False)
+                                sigs.append(sig)
 
                             if is_j1939:
-                                idx = np.argwhere(
-                                    (j1939_msg_pgns == pgn_number) & (j9193_msg_sa == source_address)
-                                ).ravel()
+                                if prefix:
+                                    comment = f"{prefix}: CAN{bus} ID=0x{msg_id:X} {message} PGN=0x{pgn_number:X} SA=0x{source_address:X}"
+                                else:
+                                    comment = f"CAN{bus} ID=0x{msg_id:X} {message} PGN=0x{pgn_number:X} SA=0x{source_address:X}"
+                                acq_name = f"SourceAddress = 0x{source_address}"
                             else:
-                                idx = np.argwhere((bus_msg_ids == msg_id) & (bus_msg_ide == is_extended)).ravel()
-
-                            payload = bus_data_bytes[idx]
-                            t = bus_t[idx]
-
-                            try:
-                                extracted_signals = bus_logging_utils.extract_mux(
-                                    payload,
-                                    message,
-                                    msg_id,
-                                    bus,
-                                    t,
-                                    original_message_id=source_address if is_j1939 else None,
-                                    ignore_value2text_conversion=ignore_value2text_conversion,
-                                    is_j1939=is_j1939,
-                                    is_extended=is_extended,
-                                )
-                            except:
-                                print(format_exc())
-                                raise
-
-                            for entry, signals in extracted_signals.items():
-                                if len(next(iter(signals.values()))["samples"]) == 0:
-                                    continue
-
-                                if entry not in msg_map:
-                                    sigs = []
-
-                                    index = len(out.groups)
-                                    msg_map[entry] = index
-
-                                    for name_, signal in signals.items():
-                                        signal_name = f"{prefix}{signal['name']}"
-                                        sig = Signal(
-                                            samples=signal["samples"],
-                                            timestamps=signal["t"],
-                                            name=signal_name,
-                                            comment=signal["comment"],
-                                            unit=signal["unit"],
-                                            invalidation_bits=signal["invalidation_bits"],
-                                            display_names={
-                                                f"CAN{bus}.{message.name}.{signal_name}": "bus",
-                                                f"{message.name}.{signal_name}": "message",
-                                            },
-                                        )
-
-                                        sigs.append(sig)
-
-                                    if is_j1939:
-                                        if prefix:
-                                            comment = f"{prefix}: CAN{bus} ID=0x{msg_id:X} {message} PGN=0x{pgn_number:X} SA=0x{source_address:X}"
-                                        else:
-                                            comment = f"CAN{bus} ID=0x{msg_id:X} {message} PGN=0x{pgn_number:X} SA=0x{source_address:X}"
-                                        acq_name = f"SourceAddress = 0x{source_address}"
-                                    else:
-                                        if prefix:
-                                            acq_name = (
-                                                f"{prefix}: CAN{bus} message ID=0x{msg_id:X} EXT={bool(is_extended)}"
-                                            )
-                                            comment = f'{prefix}: CAN{bus} - message "{message}" 0x{msg_id:X} EXT={bool(is_extended)}'
-                                        else:
-                                            acq_name = f"CAN{bus} message ID=0x{msg_id:X} EXT={bool(is_extended)}"
-                                            comment = (
-                                                f"CAN{bus} - message {message} 0x{msg_id:X} EXT={bool(is_extended)}"
-                                            )
+                                if prefix:
+                                    acq_name = f"{prefix}: CAN{bus} message ID=0x{msg_id:X} EXT={bool(is_extended)}"
+                                    comment = (
+                                        f'{prefix}: CAN{bus} - message "{message}" 0x{msg_id:X} EXT={bool(is_extended)}'
+                                    )
+                                else:
+                                    acq_name = f"CAN{bus} message ID=0x{msg_id:X} EXT={bool(is_extended)}"
+                                    comment = f"CAN{bus} - message {message} 0x{msg_id:X} EXT={bool(is_extended)}"
 
-                                    acq_source = Source(
-                                        name=acq_name,
-                                        path=f"CAN{int(bus)}.CAN_DataFrame.ID=0x{message.arbitration_id.id:X} EXT={bool(is_extended)}",
-                                        comment=f"""\
+                            acq_source = Source(
+                                name=acq_name,
+                                path=f"CAN{int(bus)}.CAN_DataFrame.ID=0x{message.arbitration_id.id:X} EXT={bool(is_extended)}",
+                                comment=f"""\
 <SIcomment>
     <TX>CAN{bus} data frame 0x{message.arbitration_id.id:X} EXT={bool(is_extended)} - {message.name}</TX>
     <bus name="CAN{int(bus)}"/>
@@ -4964,53 +6041,59 @@ class MDF:
         <e name="ChannelNo" type="integer">{int(bus)}</e>
     </common_properties>
 </SIcomment>""",
-                                        source_type=v4c.SOURCE_BUS,
-                                        bus_type=v4c.BUS_TYPE_CAN,
-                                    )
+                                source_type=v4c.SOURCE_BUS,
+                                bus_type=v4c.BUS_TYPE_CAN,
+                            )
 
-                                    for sig in sigs:
-                                        sig.source = acq_source
-
-                                    cg_nr = out.append(
-                                        sigs,
-                                        acq_name=acq_name,
-                                        acq_source=acq_source,
-                                        comment=comment,
-                                        common_timebase=True,
-                                    )
+                            for sig in sigs:
+                                sig.source = acq_source
 
-                                    out.groups[cg_nr].channel_group.flags = v4c.FLAG_CG_BUS_EVENT
+                            cg_nr = out.append(
+                                sigs,
+                                acq_name=acq_name,
+                                acq_source=acq_source,
+                                comment=comment,
+                                common_timebase=True,
+                            )
 
-                                    if is_j1939:
-                                        max_flags.append([[False]])
-                                        for ch_index, sig in enumerate(sigs, 1):
-                                            max_flags[cg_nr].append([np.all(sig.invalidation_bits)])
-                                    else:
-                                        max_flags.append([[False]] * (len(sigs) + 1))
+                            out.groups[cg_nr].channel_group.flags = v4c.FLAG_CG_BUS_EVENT
 
-                                else:
-                                    index = msg_map[entry]
+                            if is_j1939:
+                                max_flags.append([[False]])
+                                for ch_index, sig in enumerate(sigs, 1):
+                                    max_flags[cg_nr].append([np.all(sig.invalidation_bits)])
+                            else:
+                                max_flags.append([[False]] * (len(sigs) + 1))
 
-                                    sigs = []
+                        else:
+                            index = msg_map[entry]
 
-                                    for name_, signal in signals.items():
-                                        sigs.append(
-                                            (
-                                                signal["samples"],
-                                                signal["invalidation_bits"],
-                                            )
-                                        )
+                            sigs = []
+
+                            for name_, signal in signals.items():
+                                sigs.append(
+                                    (
+                                        signal["samples"],
+                                        signal["invalidation_bits"],
+                                    )
+                                )
+
+                                t = signal["t"]
 
-                                        t = signal["t"]
+                            if is_j1939:
+                                for ch_index, sig in enumerate(sigs, 1):
+                                    max_flags[index][ch_index].append(np.all(sig[1]))
 
-                                    if is_j1939:
-                                        for ch_index, sig in enumerate(sigs, 1):
-                                            max_flags[index][ch_index].append(np.all(sig[1]))
+                            sigs.insert(0, (t, None))
 
-                                    sigs.insert(0, (t, None))
+                            out.extend(index, sigs)
 
-                                    out.extend(index, sigs)
-                    self._set_temporary_master(None)
+                total_unique_ids |= info["total_unique_ids"]
+                if info["found_ids"]:
+                    found_ids[dbc_name] |= info["found_ids"]
+                current_not_found[dbc_index] -= info["found_messages"]
+                for msg_id, not_found in info["unknown_ids"].items():
+                    unknown_ids[msg_id].extend(not_found)
 
                 cntr += 1
                 if progress is not None:
@@ -5021,9 +6104,13 @@ class MDF:
 
                         if progress.stop:
                             return TERMINATED
+        finally:
+            if results is not None:
+                results.close()
 
-            if current_not_found:
-                not_found_ids[dbc_name] = list(current_not_found)
+        for (dbc, dbc_name, bus_channel), not_found in zip(valid_dbc_files, current_not_found):
+            if not_found:
+                not_found_ids[dbc_name] = list(not_found)
 
         unknown_ids = {msg_id for msg_id, not_found in unknown_ids.items() if all(not_found)}
 
@@ -5055,6 +6142,94 @@ class MDF:
 
         return out
 
+    def _decode_lin_logging_group(
+        self,
+        index: int,
+        dbc: CanMatrix,
+        bus_channel: int,
+        ignore_value2text_conversion: bool,
+        info: dict[str, Any],
+    ) -> Iterator[tuple[Any, ...]]:
+        """decode the LIN frames of the bus logging group *index*; the
+        messages statistics are collected in *info*"""
+        messages = {message.arbitration_id.id: message for message in dbc}
+
+        group = self.groups[index]
+
+        self._prepare_record(group)
+        data = self._load_data(group, optimize_read=False)
+
+        for fragment in data:
+            self._set_temporary_master(None)
+            self._set_temporary_master(self.get_master(index, data=fragment))
+
+            msg_ids = self.get("LIN_Frame.ID", group=index, data=fragment).astype("<u4") & 0x1FFFFFFF
+
+            original_ids = msg_ids.samples.copy()
+
+            data_bytes = self.get(
+                "LIN_Frame.DataBytes",
+                group=index,
+                data=fragment,
+                samples_only=True,
+            )[0]
+
+            try:
+                bus_ids = self.get(
+                    "LIN_Frame.BusChannel",
+                    group=index,
+                    data=fragment,
+                    samples_only=True,
+                )[
+                    0
+                ].astype("<u1")
+            except:
+                bus_ids = np.ones(len(original_ids), dtype="u1")
+
+            bus_t = msg_ids.timestamps
+            bus_msg_ids = msg_ids.samples
+            bus_data_bytes = data_bytes
+            original_msg_ids = original_ids
+
+            unique_ids = np.unique(np.rec.fromarrays([bus_msg_ids, bus_msg_ids]))
+
+            info["total_unique_ids"] |= {tuple(int(e) for e in f) for f in unique_ids}
+
+            buses = np.unique(bus_ids)
+
+            for bus in buses:
+                if bus_channel and bus != bus_channel:
+                    continue
+
+                for msg_id_record in sorted(unique_ids.tolist()):
+                    msg_id = int(msg_id_record[0])
+                    original_msg_id = int(msg_id_record[1])
+                    message = messages.get(msg_id, None)
+                    if message is None:
+                        info["unknown_ids"][msg_id].append(True)
+                        continue
+
+                    info["found_ids"].add((msg_id, message.name))
+
+                    info["unknown_ids"][msg_id].append(False)
+
+                    idx = np.argwhere(bus_msg_ids == msg_id).ravel()
+                    payload = bus_data_bytes[idx]
+                    t = bus_t[idx]
+
+                    extracted_signals = bus_logging_utils.extract_mux(
+                        payload,
+                        message,
+                        msg_id,
+                        bus,
+                        t,
+                        original_message_id=None,
+                        ignore_value2text_conversion=ignore_value2text_conversion,
+                    )
+
+                    yield message, bus, msg_id, extracted_signals
+            self._set_temporary_master(None)
+
     def _extract_lin_logging(
         self,
         output_file: MDF,
@@ -5062,12 +6237,14 @@ class MDF:
         ignore_value2text_conversion: bool = True,
         prefix: str = "",
         progress=None,
+        workers: int = 0,
     ) -> MDF:
         out = output_file
 
         max_flags = []
 
         valid_dbc_files = []
+        databases = []
         unique_name = UniqueDB()
         for dbc_name, bus_channel in dbc_files:
             if isinstance(dbc_name, CanMatrix):
@@ -5078,12 +6255,14 @@ class MDF:
                         bus_channel,
                     )
                 )
+                databases.append(dbc_name)
             else:
                 dbc = load_can_database(Path(dbc_name))
                 if dbc is None:
                     continue
                 else:
                     valid_dbc_files.append((dbc, dbc_name, bus_channel))
+                    databases.append(Path(dbc_name))
 
         count = sum(
             1
@@ -5110,131 +6289,99 @@ class MDF:
         not_found_ids = defaultdict(list)
         unknown_ids = defaultdict(list)
 
+        current_not_found_ids = []
         for dbc, dbc_name, bus_channel in valid_dbc_files:
             messages = {message.arbitration_id.id: message for message in dbc}
+            current_not_found_ids.append({(msg_id, message.name) for msg_id, message in messages.items()})
+
+        # the (database, bus logging group) pairs are always processed in
+        # this order, also when they are decoded by the worker processes
+        units = [
+            (dbc_index, i)
+            for dbc_index in range(len(valid_dbc_files))
+            for i, group in enumerate(self.groups)
+            if group.channel_group.flags & v4c.FLAG_CG_BUS_EVENT
+            and group.channel_group.acq_source.bus_type == v4c.BUS_TYPE_LIN
+            and "LIN_Frame" in [ch.name for ch in group.channels]
+        ]
 
-            current_not_found_ids = {(msg_id, message.name) for msg_id, message in messages.items()}
-
-            msg_map = {}
-
-            for i, group in enumerate(self.groups):
-                if (
-                    not group.channel_group.flags & v4c.FLAG_CG_BUS_EVENT
-                    or group.channel_group.acq_source.bus_type != v4c.BUS_TYPE_LIN
-                    or not "LIN_Frame" in [ch.name for ch in group.channels]
-                ):
-                    continue
-
-                self._prepare_record(group)
-                data = self._load_data(group, optimize_read=False)
-
-                for fragment in data:
-                    self._set_temporary_master(None)
-                    self._set_temporary_master(self.get_master(i, data=fragment))
-
-                    msg_ids = self.get("LIN_Frame.ID", group=i, data=fragment).astype("<u4") & 0x1FFFFFFF
-
-                    original_ids = msg_ids.samples.copy()
-
-                    data_bytes = self.get(
-                        "LIN_Frame.DataBytes",
-                        group=i,
-                        data=fragment,
-                        samples_only=True,
-                    )[0]
-
-                    try:
-                        bus_ids = self.get(
-                            "LIN_Frame.BusChannel",
-                            group=i,
-                            data=fragment,
-                            samples_only=True,
-                        )[
-                            0
-                        ].astype("<u1")
-                    except:
-                        bus_ids = np.ones(len(original_ids), dtype="u1")
-
-                    bus_t = msg_ids.timestamps
-                    bus_msg_ids = msg_ids.samples
-                    bus_data_bytes = data_bytes
-                    original_msg_ids = original_ids
-
-                    unique_ids = np.unique(np.rec.fromarrays([bus_msg_ids, bus_msg_ids]))
-
-                    total_unique_ids = total_unique_ids | {tuple(int(e) for e in f) for f in unique_ids}
+        if workers and len(units) > 1 and self._bus_logging_file_backed():
+            results = _process_pool_results(
+                _decode_bus_logging_group,
+                [
+                    (
+                        self.name,
+                        "LIN",
+                        i,
+                        databases[dbc_index],
+                        valid_dbc_files[dbc_index][2],
+                        ignore_value2text_conversion,
+                    )
+                    for dbc_index, i in units
+                ],
+                workers,
+            )
+        else:
+            results = None
 
-                    buses = np.unique(bus_ids)
+        msg_maps = [{} for _ in valid_dbc_files]
 
-                    for bus in buses:
-                        if bus_channel and bus != bus_channel:
+        try:
+            for dbc_index, i in units:
+                dbc, dbc_name, bus_channel = valid_dbc_files[dbc_index]
+                msg_map = msg_maps[dbc_index]
+
+                if results is None:
+                    info = _bus_logging_info()
+                    decoded = self._decode_lin_logging_group(
+                        i,
+                        dbc,
+                        bus_channel,
+                        ignore_value2text_conversion,
+                        info,
+                    )
+                else:
+                    info, decoded = next(results)
+                    for *_, extracted_signals in decoded:
+                        _wrap_byte_order(extracted_signals, wrap=False)
+                    decoded = ((dbc.frames[message_index], *item) for message_index, *item in decoded)
+
+                for message, bus, msg_id, extracted_signals in decoded:
+                    for entry, signals in extracted_signals.items():
+                        if len(next(iter(signals.values()))["samples"]) == 0:
                             continue
+                        if entry not in msg_map:
+                            sigs = []
+
+                            index = len(out.groups)
+                            msg_map[entry] = index
+
+                            for name_, signal in signals.items():
+                                signal_name = f"{prefix}{signal['name']}"
+                                sig = Signal(
+                                    samples=signal["samples"],
+                                    timestamps=signal["t"],
+                                    name=signal_name,
+                                    comment=signal["comment"],
+                                    unit=signal["unit"],
+                                    invalidation_bits=signal["invalidation_bits"],
+                                    display_names={
+                                        f"LIN{bus}.{message.name}.{signal_name}": "bus",
+                                        f"{message.name}.{signal_name}": "message",
+                                    },
+                                )
 
-                        for msg_id_record in sorted(unique_ids.tolist()):
-                            msg_id = int(msg_id_record[0])
-                            original_msg_id = int(msg_id_record[1])
-                            message = messages.get(msg_id, None)
-                            if message is None:
-                                unknown_ids[msg_id].append(True)
-                                continue
-
-                            found_ids[dbc_name].add((msg_id, message.name))
-                            try:
-                                current_not_found_ids.remove((msg_id, message.name))
-                            except KeyError:
-                                pass
-
-                            unknown_ids[msg_id].append(False)
-
-                            idx = np.argwhere(bus_msg_ids == msg_id).ravel()
-                            payload = bus_data_bytes[idx]
-                            t = bus_t[idx]
-
-                            extracted_signals = bus_logging_utils.extract_mux(
-                                payload,
-                                message,
-                                msg_id,
-                                bus,
-                                t,
-                                original_message_id=None,
-                                ignore_value2text_conversion=ignore_value2text_conversion,
-                            )
-
-                            for entry, signals in extracted_signals.items():
-                                if len(next(iter(signals.values()))["samples"]) == 0:
-                                    continue
-                                if entry not in msg_map:
-                                    sigs = []
-
-                                    index = len(out.groups)
-                                    msg_map[entry] = index
-
-                                    for name_, signal in signals.items():
-                                        signal_name = f"{prefix}{signal['name']}"
-                                        sig = Signal(
-                                            samples=signal["samples"],
-                                            timestamps=signal["t"],
-                                            name=signal_name,
-                                            comment=signal["comment"],
-                                            unit=signal["unit"],
-                                            invalidation_bits=signal["invalidation_bits"],
-                                            display_names={
-                                                f"LIN{bus}.{message.name}.{signal_name}": "bus",
-                                                f"{message.name}.{signal_name}": "message",
-                                            },
-                                        )
-
-                                        sigs.append(sig)
+                                sigs.append(sig)
 
-                                    if prefix:
-                                        acq_name = f"{prefix}: from LIN{bus} message ID=0x{msg_id:X}"
-                                    else:
-                                        acq_name = f"from LIN{bus} message ID=0x{msg_id:X}"
+                            if prefix:
+                                acq_name = f"{prefix}: from LIN{bus} message ID=0x{msg_id:X}"
+                            else:
+                                acq_name = f"from LIN{bus} message ID=0x{msg_id:X}"
 
-                                    acq_source = Source(
-                                        name=acq_name,
-                                        path=f"LIN{int(bus)}.LIN_Frame.ID=0x{message.arbitration_id.id:X}",
-                                        comment=f"""\
+                            acq_source = Source(
+                                name=acq_name,
+                                path=f"LIN{int(bus)}.LIN_Frame.ID=0x{message.arbitration_id.id:X}",
+                                comment=f"""\
 <SIcomment>
     <TX>LIN{bus} data frame 0x{message.arbitration_id.id:X} - {message.name}</TX>
     <bus name="LIN{int(bus)}"/>
@@ -5242,42 +6389,48 @@ class MDF:
         <e name="ChannelNo" type="integer">{int(bus)}</e>
     </common_properties>
 </SIcomment>""",
-                                        source_type=v4c.SOURCE_BUS,
-                                        bus_type=v4c.BUS_TYPE_LIN,
-                                    )
+                                source_type=v4c.SOURCE_BUS,
+                                bus_type=v4c.BUS_TYPE_LIN,
+                            )
 
-                                    for sig in sigs:
-                                        sig.source = acq_source
-
-                                    cg_nr = out.append(
-                                        sigs,
-                                        acq_name=acq_name,
-                                        acq_source=acq_source,
-                                        comment=f"from LIN{bus} - message {message} 0x{msg_id:X}",
-                                        common_timebase=True,
-                                    )
+                            for sig in sigs:
+                                sig.source = acq_source
 
-                                    out.groups[cg_nr].channel_group.flags = v4c.FLAG_CG_BUS_EVENT
+                            cg_nr = out.append(
+                                sigs,
+                                acq_name=acq_name,
+                                acq_source=acq_source,
+                                comment=f"from LIN{bus} - message {message} 0x{msg_id:X}",
+                                common_timebase=True,
+                            )
 
-                                else:
-                                    index = msg_map[entry]
+                            out.groups[cg_nr].channel_group.flags = v4c.FLAG_CG_BUS_EVENT
 
-                                    sigs = []
+                        else:
+                            index = msg_map[entry]
 
-                                    for name_, signal in signals.items():
-                                        sigs.append(
-                                            (
-                                                signal["samples"],
-                                                signal["invalidation_bits"],
-                                            )
-                                        )
+                            sigs = []
 
-                                        t = signal["t"]
+                            for name_, signal in signals.items():
+                                sigs.append(
+                                    (
+                                        signal["samples"],
+                                        signal["invalidation_bits"],
+                                    )
+                                )
+
+                                t = signal["t"]
+
+                            sigs.insert(0, (t, None))
 
-                                    sigs.insert(0, (t, None))
+                            out.extend(index, sigs)
 
-                                    out.extend(index, sigs)
-                    self._set_temporary_master(None)
+                total_unique_ids |= info["total_unique_ids"]
+                if info["found_ids"]:
+                    found_ids[dbc_name] |= info["found_ids"]
+                current_not_found_ids[dbc_index] -= info["found_ids"]
+                for msg_id, not_found in info["unknown_ids"].items():
+                    unknown_ids[msg_id].extend(not_found)
 
                 cntr += 1
                 if progress is not None:
@@ -5288,9 +6441,13 @@ class MDF:
 
                         if progress.stop:
                             return TERMINATED
+        finally:
+            if results is not None:
+                results.close()
 
-            if current_not_found_ids:
-                not_found_ids[dbc_name] = list(current_not_found_ids)
+        for (dbc, dbc_name, bus_channel), not_found in zip(valid_dbc_files, current_not_found_ids):
+            if not_found:
+                not_found_ids[dbc_name] = list(not_found)
 
         unknown_ids = {msg_id for msg_id, not_found in unknown_ids.items() if all(not_found)}
 
@@ -5494,8 +6651,14 @@ class MDF:
     ) -> list[str]:
         """search channels
 
+        The channel names are looked up in the *channels_db* search index.
+
         .. versionadded:: 7.0.0
 
+        .. versionchanged:: 7.5.0
+
+            use the channel names search index
+
         Parameters
         ----------
         pattern : str
@@ -5528,17 +6691,14 @@ class MDF:
         ['vehicleAverageSpeed', 'vehicleInstantSpeed']
         """
         search_mode = SearchMode(mode)
+        index = self.channels_db.search_index
 
         if search_mode is SearchMode.plain:
-            if case_insensitive:
-                pattern = pattern.casefold()
-                channels = [name for name in self.channels_db if pattern in name.casefold()]
-            else:
-                channels = [name for name in self.channels_db if pattern in name]
+            channels = index.find(pattern, case_insensitive)
         elif search_mode is SearchMode.regex:
             flags = re.IGNORECASE if case_insensitive else 0
             compiled_pattern = re.compile(pattern, flags=flags)
-            channels = [name for name in self.channels_db if compiled_pattern.search(name)]
+            channels = index.search(compiled_pattern)
         elif search_mode is SearchMode.wildcard:
             wildcard = f"{os.urandom(6).hex()}_WILDCARD_{os.urandom(6).hex()}"
             pattern = pattern.replace("*", wildcard)
@@ -5549,13 +6709,162 @@ class MDF:
 
             compiled_pattern = re.compile(pattern, flags=flags)
 
-            channels = [name for name in self.channels_db if compiled_pattern.search(name)]
+            channels = index.search(compiled_pattern)
 
         else:
             raise ValueError(f"unsupported mode {search_mode}")
 
         return channels
 
+    def _parquet_export(
+        self,
+        filename: Path,
+        time_from_zero: bool = True,
+        use_display_names: bool = True,
+        ignore_value2text_conversions: bool = False,
+        raw: bool = False,
+        compression: str = "",
+        progress=None,
+    ) -> None:
+        """export each channel group to a parquet file with its own time base
+
+        The group data is read in fragments and each fragment is written as
+        *pyarrow* record batches, so the group is never loaded completely in
+        memory. The row groups contain at most *write_fragment_size* bytes of
+        records. The channel unit and comment are stored in the field metadata.
+
+        .. versionadded:: 7.5.0
+
+        Parameters
+        ----------
+        filename : pathlib.Path
+            base file name; the files are named
+            <filename stem>.ChannelGroup_<cntr>[_<comment>].parquet
+
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        encoding = "utf-8" if self.version >= "4.00" else "latin-1"
+        compression = compression.lower() if compression else "none"
+
+        gp_count = len(self.virtual_groups)
+
+        if progress is not None:
+            if callable(progress):
+                progress(0, gp_count)
+            else:
+                progress.signals.setValue.emit(0)
+                progress.signals.setMaximum.emit(gp_count)
+
+                if progress.stop:
+                    return TERMINATED
+
+        for i, (group_index, virtual_group) in enumerate(self.virtual_groups.items()):
+            if progress is not None and not callable(progress) and progress.stop:
+                return TERMINATED
+
+            groups = self.included_channels(group_index)[group_index]
+            if not groups:
+                continue
+
+            if len(virtual_group.groups) == 1:
+                comment = self.groups[virtual_group.groups[0]].channel_group.comment
+            else:
+                comment = ""
+
+            if comment:
+                for char in '\n\t\r\b <>\\/:"?*|':
+                    comment = comment.replace(char, "_")
+                group_file_name = filename.parent / f"{filename.stem}.ChannelGroup_{i}_{comment}.parquet"
+            else:
+                group_file_name = filename.parent / f"{filename.stem}.ChannelGroup_{i}.parquet"
+
+            row_group_size = max(self._write_fragment_size // (virtual_group.record_size or 1), 1)
+
+            writer = None
+            try:
+                for sigs in self._yield_selected_signals(group_index, groups=groups):
+                    if not sigs:
+                        break
+
+                    if isinstance(sigs[0], Signal):
+                        signals = sigs
+                        master = signals[0].timestamps
+                        fragments = [(sig.samples, sig.invalidation_bits) for sig in signals]
+                        offset = master[0] if time_from_zero and len(master) else 0
+
+                        used_names = UniqueDB()
+                        names = []
+                        for sig in signals:
+                            if use_display_names and sig.display_names:
+                                name = list(sig.display_names)[0]
+                            else:
+                                name = sig.name
+                            names.append(used_names.get_unique_name(name))
+
+                        # the column type is decided by the conversion type and
+                        # not by the fragment data: a value to text conversion
+                        # with a numeric default can return numbers only for
+                        # some fragments
+                        dictionaries = [
+                            not raw
+                            and not ignore_value2text_conversions
+                            and sig.samples.dtype.kind in "uif"
+                            and _value2text_conversion(sig.conversion)
+                            for sig in signals
+                        ]
+                    else:
+                        master = sigs[0][0]
+                        fragments = sigs[1:]
+
+                    columns = [("timestamps", pa.array(master - offset))]
+                    metadata = [{"unit": "s"}]
+
+                    for sig, name, dictionary, (samples, invalidation_bits) in zip(
+                        signals, names, dictionaries, fragments
+                    ):
+                        if not raw and sig.conversion:
+                            samples = sig.conversion.convert(
+                                samples,
+                                as_object=dictionary,
+                                ignore_value2text_conversions=ignore_value2text_conversions,
+                            )
+                            # the numeric values of the text columns are
+                            # stored as texts
+                            if dictionary and samples.dtype.kind in "uif":
+                                samples = samples.astype("U")
+
+                        arrays = _arrow_arrays(name, samples, invalidation_bits, encoding, dictionary)
+                        unit = sig.unit or (sig.conversion.unit if sig.conversion and not raw else "")
+                        columns.extend(arrays)
+                        metadata.extend({"unit": unit, "comment": sig.comment} for _ in arrays)
+
+                    if writer is None:
+                        schema = pa.schema(
+                            pa.field(name, array.type, metadata=field_metadata)
+                            for (name, array), field_metadata in zip(columns, metadata)
+                        )
+                        writer = pq.ParquetWriter(group_file_name, schema, compression=compression)
+
+                    table = pa.Table.from_arrays([array for _, array in columns], names=schema.names)
+                    if not table.schema.equals(schema):
+                        table = table.cast(schema)
+                    writer.write_table(table, row_group_size=row_group_size)
+
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            if progress is not None:
+                if callable(progress):
+                    progress(i + 1, gp_count)
+                else:
+                    progress.signals.setValue.emit(i + 1)
+
+                    if progress.stop:
+                        return TERMINATED
+
     def _asc_export(self, file_name):
         if self.version < "4.00":
             return
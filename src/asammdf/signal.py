@@ -16,7 +16,12 @@ from .blocks import v4_blocks as v4b
 from .blocks.conversion_utils import from_dict
 from .blocks.options import FloatInterpolation, IntegerInterpolation
 from .blocks.source_utils import Source
-from .blocks.utils import extract_xml_comment, MdfException, SignalFlags
+from .blocks.utils import (
+    extract_xml_comment,
+    InterpolationPlan,
+    MdfException,
+    SignalFlags,
+)
 from .types import (
     ChannelConversionType,
     FloatInterpolationModeType,
@@ -960,96 +965,81 @@ class Signal:
                     virtual_master_conversion=self.virtual_master_conversion,
                 )
 
-            if len(signal.samples.shape) > 1:
+            if signal._linear_interpolation(integer_interpolation_mode, float_interpolation_mode):
+                s = np.interp(new_timestamps, signal.timestamps, signal.samples)
+
+                if invalidation_bits is not None:
+                    idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
+                    idx -= 1
+                    idx[idx < 0] = 0
+                    invalidation_bits = invalidation_bits[idx]
+
+            else:
                 idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
                 idx -= 1
                 idx[idx < 0] = 0
                 s = signal.samples[idx]
+
                 if invalidation_bits is not None:
                     invalidation_bits = invalidation_bits[idx]
-            else:
-                kind = signal.samples.dtype.kind
 
-                if kind == "f":
-                    if float_interpolation_mode == FloatInterpolation.REPEAT_PREVIOUS_SAMPLE:
-                        idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                        idx -= 1
-                        idx[idx < 0] = 0
-                        s = signal.samples[idx]
+            return self._interpolated(s, new_timestamps, invalidation_bits)
 
-                        if invalidation_bits is not None:
-                            invalidation_bits = invalidation_bits[idx]
-
-                    else:
-                        s = np.interp(new_timestamps, signal.timestamps, signal.samples)
-
-                        if invalidation_bits is not None:
-                            idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                            idx -= 1
-                            idx[idx < 0] = 0
-                            invalidation_bits = invalidation_bits[idx]
-
-                elif kind in "ui":
-                    if integer_interpolation_mode == IntegerInterpolation.HYBRID_INTERPOLATION:
-                        if signal.raw and signal.conversion:
-                            kind = signal.conversion.convert(signal.samples[:1]).dtype.kind
-                            if kind == "f":
-                                integer_interpolation_mode = IntegerInterpolation.LINEAR_INTERPOLATION
-
-                    if integer_interpolation_mode == IntegerInterpolation.HYBRID_INTERPOLATION:
-                        integer_interpolation_mode = IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE
-
-                    if integer_interpolation_mode == IntegerInterpolation.LINEAR_INTERPOLATION:
-                        s = np.interp(new_timestamps, signal.timestamps, signal.samples).astype(signal.samples.dtype)
+    def _linear_interpolation(
+        self,
+        integer_interpolation_mode: IntegerInterpolation,
+        float_interpolation_mode: FloatInterpolation,
+    ) -> bool:
+        """the non empty signal uses linear interpolation, otherwise the
+        previous sample is used"""
 
-                        if invalidation_bits is not None:
-                            idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                            idx -= 1
-                            idx[idx < 0] = 0
-                            invalidation_bits = invalidation_bits[idx]
+        if len(self.samples.shape) > 1:
+            return False
 
-                    elif integer_interpolation_mode == IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE:
-                        idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                        idx -= 1
-                        idx[idx < 0] = 0
+        kind = self.samples.dtype.kind
 
-                        s = signal.samples[idx]
+        if kind == "f":
+            return float_interpolation_mode == FloatInterpolation.LINEAR_INTERPOLATION
 
-                        if invalidation_bits is not None:
-                            invalidation_bits = invalidation_bits[idx]
+        elif kind in "ui":
+            if integer_interpolation_mode == IntegerInterpolation.HYBRID_INTERPOLATION:
+                if self.raw and self.conversion:
+                    return self.conversion.convert(self.samples[:1]).dtype.kind == "f"
+                return False
 
-                else:
-                    idx = np.searchsorted(signal.timestamps, new_timestamps, side="right")
-                    idx -= 1
-                    idx[idx < 0] = 0
-                    s = signal.samples[idx]
+            return integer_interpolation_mode == IntegerInterpolation.LINEAR_INTERPOLATION
 
-                    if invalidation_bits is not None:
-                        invalidation_bits = invalidation_bits[idx]
+        return False
 
-            if s.dtype != self.samples.dtype:
-                s = s.astype(self.samples.dtype)
+    def _interpolated(
+        self,
+        samples: NDArray[Any],
+        new_timestamps: NDArray[Any],
+        invalidation_bits: NDArray[np.bool_] | None,
+    ) -> Signal:
+        if samples.dtype != self.samples.dtype:
+            samples = samples.astype(self.samples.dtype)
 
-            return Signal(
-                s,
-                new_timestamps,
-                self.unit,
-                self.name,
-                comment=self.comment,
-                conversion=self.conversion,
-                source=self.source,
-                raw=self.raw,
-                master_metadata=self.master_metadata,
-                display_names=self.display_names,
-                attachment=self.attachment,
-                invalidation_bits=invalidation_bits,
-                encoding=self.encoding,
-                group_index=self.group_index,
-                channel_index=self.channel_index,
-                flags=self.flags,
-                virtual_conversion=self.virtual_conversion,
-                virtual_master_conversion=self.virtual_master_conversion,
-            )
+        return Signal(
+            samples,
+            new_timestamps,
+            self.unit,
+            self.name,
+            comment=self.comment,
+            conversion=self.conversion,
+            source=self.source,
+            raw=self.raw,
+            master_metadata=self.master_metadata,
+            display_names=self.display_names,
+            attachment=self.attachment,
+            invalidation_bits=invalidation_bits,
+            encoding=self.encoding,
+            group_index=self.group_index,
+            channel_index=self.channel_index,
+            flags=self.flags,
+            virtual_conversion=self.virtual_conversion,
+            virtual_master_conversion=self.virtual_master_conversion,
+        )
 
     def __apply_func(self, other: Signal | NDArray[Any] | None, func_name: str) -> Signal:
         """delegate operations to the *samples* attribute, but in a time
@@ -1434,5 +1424,99 @@ class Signal:
         )
 
 
+def interp_signals(
+    signals: list[Signal],
+    new_timestamps: NDArray[Any],
+    integer_interpolation_mode: IntInterpolationModeType | IntegerInterpolation = (
+        IntegerInterpolation.REPEAT_PREVIOUS_SAMPLE
+    ),
+    float_interpolation_mode: FloatInterpolationModeType | FloatInterpolation = (
+        FloatInterpolation.LINEAR_INTERPOLATION
+    ),
+) -> list[Signal]:
+    """returns new *Signal* objects interpolated using the *new_timestamps*
+
+    The signals that have the same time base are resampled using a single
+    *InterpolationPlan*, so the previous sample index and the linear
+    interpolation weights are computed once for all of them. The results are
+    the same as for *Signal.interp*.
+
+    .. versionadded:: 7.5.0
+
+    Parameters
+    ----------
+    signals : list
+        list of *Signal* objects
+    new_timestamps : np.array
+        timestamps used for interpolation
+    integer_interpolation_mode : int
+        interpolation mode for integer signals; see *Signal.interp*
+    float_interpolation_mode : int
+        interpolation mode for float channels; see *Signal.interp*
+
+    Returns
+    -------
+    signals : list
+        new interpolated *Signal* objects in the same order
+
+    """
+
+    integer_interpolation_mode = IntegerInterpolation(integer_interpolation_mode)
+    float_interpolation_mode = FloatInterpolation(float_interpolation_mode)
+
+    # group the signals by time base; the same array object is checked first
+    # and the equal arrays are merged afterwards
+    by_id = {}
+    for i, signal in enumerate(signals):
+        if len(signal.samples) and len(new_timestamps):
+            by_id.setdefault(id(signal.timestamps), (signal.timestamps, []))[1].append(i)
+
+    time_bases = {}
+    for timestamps, indexes in by_id.values():
+        candidates = time_bases.setdefault((len(timestamps), timestamps[0], timestamps[-1]), [])
+        for base, base_indexes in candidates:
+            if np.array_equal(base, timestamps):
+                base_indexes.extend(indexes)
+                break
+        else:
+            candidates.append((timestamps, indexes))
+
+    result = [None] * len(signals)
+
+    for candidates in time_bases.values():
+        for timestamps, indexes in candidates:
+            if len(indexes) == 1:
+                continue
+
+            plan = InterpolationPlan(timestamps, new_timestamps)
+
+            for i in indexes:
+                signal = signals[i]
+
+                if signal._linear_interpolation(integer_interpolation_mode, float_interpolation_mode):
+                    samples = plan.linear(signal.samples)
+                else:
+                    samples = plan.previous(signal.samples)
+
+                invalidation_bits = signal.invalidation_bits
+                if invalidation_bits is not None:
+                    invalidation_bits = plan.previous(invalidation_bits)
+
+                result[i] = signal._interpolated(samples, new_timestamps, invalidation_bits)
+
+    return [
+        (
+            signal.interp(
+                new_timestamps,
+                integer_interpolation_mode=integer_interpolation_mode,
+                float_interpolation_mode=float_interpolation_mode,
+            )
+            if interpolated is None
+            else interpolated
+        )
+        for signal, interpolated in zip(signals, result)
+    ]
+
+
 if __name__ == "__main__":
     pass
@@ -1,13 +1,24 @@
 import inspect
+import unittest
+from unittest import mock
+import weakref
+
+import numpy as np
+
+from asammdf import Signal
+from asammdf.gui import utils
+from asammdf.gui.utils import (
+    ComputationGraph,
+    compute_signal,
+    compute_signals,
+    generate_python_function,
+)
 from test.asammdf.gui.resources.functions import (
     Function1,
     gray2dec,
     maximum,
     rpm_to_rad_per_second,
 )
-import unittest
-
-from asammdf.gui.utils import generate_python_function
 
 
 class TestUtils(unittest.TestCase):
@@ -183,3 +194,149 @@ class TestUtils(unittest.TestCase):
                 self.assertIsInstance(result, tuple)
                 self.assertTrue(callable(result[0]))
                 self.assertEqual(None, result[1])
+
+    def test_ComputeSignals(self):
+        """
+        Events:
+            - Compute a channel that uses another computed channel.
+            - Compute the same channel again with the same input signals.
+        Evaluate:
+            - Evaluate that the dependency is computed first and used by the dependent channel.
+            - Evaluate that the function definitions are compiled once.
+            - Evaluate that the second computation uses the cached result.
+        """
+        functions = {
+            "add": "def add(a=0, b=0, t=0):\n    return a + b",
+            "double": "def double(x=0, t=0):\n    return x * 2",
+        }
+        t = np.arange(100) * 0.1
+        a = Signal(np.arange(100, dtype="f8"), t, name="A")
+        b = Signal(np.arange(50, dtype="i4"), t[::2], name="B")
+        add = {
+            "type": "python_function",
+            "function": "add",
+            "args": {"a": ["A"], "b": ["B"]},
+            "computation_mode": "complete_signal",
+        }
+        channels = [
+            {
+                "name": "Double",
+                "computation": {
+                    "type": "python_function",
+                    "function": "double",
+                    "args": {"x": ["Sum"]},
+                    "computation_mode": "complete_signal",
+                },
+            },
+            {"name": "Sum", "computation": add},
+        ]
+
+        # Event
+        utils.computation_cache.clear()
+        with mock.patch.object(utils, "generate_python_function", wraps=generate_python_function) as generate:
+            double, total = compute_signals(channels, {"A": a, "B": b}, t, functions)
+            cached = compute_signal(add, {"A": a, "B": b}, t, functions)
+
+        # Evaluate
+        expected = a.samples + b.interp(t).samples
+        self.assertTrue(np.array_equal(total.samples, expected))
+        self.assertTrue(np.array_equal(double.samples, expected * 2))
+        self.assertEqual(generate.call_count, len(functions))
+        self.assertIs(cached.samples, total.samples)
+
+    def test_ComputationGraph(self):
+        """
+        Events:
+            - Add a chain of computed channels and an independent computed channel to the graph.
+            - Invalidate the input channel of the chain.
+            - Evaluate the last computed channel of the chain.
+        Evaluate:
+            - Evaluate that only the computed channels downstream of the changed input are dirty.
+            - Evaluate that the dirty intermediate channel is recomputed with the last channel.
+            - Evaluate that the measured channels are selected only once.
+        """
+        functions = {"double": "def double(x=0, t=0):\n    return x * 2"}
+        t = np.arange(10) * 0.1
+        measured = {
+            "A": Signal(np.arange(10, dtype="f8"), t, name="A"),
+            "B": Signal(np.ones(10), t, name="B"),
+        }
+
+        def double(name):
+            return {
+                "type": "python_function",
+                "function": "double",
+                "args": {"x": [name]},
+                "computation_mode": "complete_signal",
+            }
+
+        graph = ComputationGraph()
+        for uuid, name, source in (("1", "A2", "A"), ("2", "A4", "A2"), ("3", "B2", "B")):
+            graph.add(uuid, name, double(source))
+
+        select = mock.Mock(side_effect=lambda names: {name: measured[name] for name in names if name in measured})
+        graph.evaluate(["1", "2", "3"], select, functions)
+        self.assertEqual(graph.dirty, set())
+
+        # Event
+        dirty = graph.invalidate(names={"A"})
+        select.reset_mock()
+        signals = graph.evaluate(["2"], select, functions)
+
+        # Evaluate
+        self.assertEqual(dirty, {"1", "2"})
+        self.assertEqual(set(signals), {"1", "2"})
+        self.assertTrue(np.array_equal(signals["2"].samples, measured["A"].samples * 4))
+        self.assertIn("3", graph.results)
+        self.assertEqual(select.call_count, 1)
+        self.assertEqual(graph.dirty, set())
+
+        # a changed intermediate computed channel (e.g. new conversion or added again to the plot)
+        # invalidates only the channels downstream of it
+        self.assertEqual(graph.invalidate(names={"A2"}), {"2"})
+        select.reset_mock()
+        signals = graph.evaluate(["1", "2", "3"], select, functions)
+        self.assertEqual(set(signals), {"2"})
+        select.assert_called_once_with(["A2"])
+        self.assertTrue(np.array_equal(signals["2"].samples, measured["A"].samples * 4))
+
+        # the functions are tracked as inputs of the computed channels
+        self.assertEqual(graph.invalidate(functions={"double"}), {"1", "2", "3"})
+
+    def test_ComputationCache(self):
+        """
+        Events:
+            - Store results in a cache that is sized for two results.
+            - Store a third result.
+            - Delete the inputs of a cached result.
+        Evaluate:
+            - Evaluate that the least recently used result is evicted.
+            - Evaluate that the cache does not keep the inputs alive.
+        """
+        t = np.arange(10, dtype="f8")
+        result = Signal(np.ones(10), t, name="_")
+        cache = utils.ComputationCache(size=2 * (result.samples.nbytes + result.timestamps.nbytes))
+
+        inputs = {key: [np.arange(10), t, None] for key in "ABC"}
+        cache.put("A", inputs["A"], result)
+        cache.put("B", inputs["B"], result)
+        self.assertIs(cache.get("A", inputs["A"]), result)
+
+        # Event
+        cache.put("C", inputs["C"], result)
+
+        # Evaluate
+        self.assertIsNone(cache.get("B", inputs["B"]))
+        self.assertIs(cache.get("A", inputs["A"]), result)
+        self.assertIs(cache.get("C", inputs["C"]), result)
+        self.assertIsNone(cache.get("A", [np.arange(10), t, None]))
+
+        # Event
+        samples = inputs["C"][0]
+        reference = weakref.ref(samples)
+        del inputs["C"], samples
+
+        # Evaluate
+        self.assertIsNone(reference())
+        cache.clear()
+        self.assertEqual(cache.nbytes, 0)
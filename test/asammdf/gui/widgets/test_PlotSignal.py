@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from asammdf import MDF, Signal
+from asammdf.gui.widgets import paged_signal
+from asammdf.gui.widgets.plot import MinMaxPyramid, PlotSignal, PYRAMID_MIN_SIZE
+
+
+class TestMinMaxPyramid(unittest.TestCase):
+    def test_decimate(self):
+        """
+        Events:
+            - Build the pyramid for random integer samples.
+            - Decimate the full range with bucket sizes that are multiples of the level blocks.
+        Evaluate:
+            - Evaluate that the positions are the sorted min/max positions of each bucket.
+        """
+        samples = np.random.default_rng(11).integers(0, 1000, 2_000_000).astype("i4")
+        pyramid = MinMaxPyramid(samples)
+
+        for step in (64, 512, 4096):
+            with self.subTest(step=step):
+                count = samples.size // step
+                data = samples[: count * step].reshape(count, step)
+                offsets = np.arange(count) * step
+                target = np.sort(np.stack([data.argmin(axis=1) + offsets, data.argmax(axis=1) + offsets], 1), 1)
+
+                pos = pyramid.decimate(0, samples.size, step)
+                self.assertTrue(np.array_equal(pos[: 2 * count], target.ravel()))
+
+        # the edges that are not aligned to the blocks are computed from the samples
+        start, stop = 12345, 1_500_001
+        pos = pyramid.decimate(start, stop, 777)
+        self.assertTrue(np.all(np.diff(pos) >= 0))
+        self.assertTrue(start <= pos[0] and pos[-1] < stop)
+        self.assertEqual(samples[pos].min(), samples[start:stop].min())
+        self.assertEqual(samples[pos].max(), samples[start:stop].max())
+
+        # a range shorter than a block cannot be answered
+        self.assertIsNone(pyramid.decimate(5, 70, 64))
+
+    def test_trim(self):
+        """
+        Events:
+            - Create a PlotSignal with more samples than PYRAMID_MIN_SIZE.
+            - Trim the signal before and after the pyramid is available.
+        Evaluate:
+            - Evaluate that the plotted envelope is the same.
+        """
+        size = PYRAMID_MIN_SIZE * 2
+        t = np.arange(size, dtype="f8")
+        samples = np.cumsum(np.random.default_rng(5).normal(size=size))
+        signal = Signal(samples, t, name="Signal")
+        signal.computation = {}
+        signal = PlotSignal(signal, allow_trim=False)
+
+        signal.trim(100.5, size - 100.5, 1000)
+        target_samples = signal.plot_samples.copy()
+
+        signal._build_min_max_pyramid(signal._mode, signal.phys_samples)
+        self.assertIsNotNone(signal._min_max_pyramid(signal.phys_samples))
+
+        signal.trim(100.5, size - 100.5, 1000, force=True)
+        self.assertEqual(signal.plot_samples.min(), target_samples.min())
+        self.assertEqual(signal.plot_samples.max(), target_samples.max())
+        self.assertTrue(np.all(np.diff(signal.plot_timestamps) >= 0))
+        self.assertLessEqual(signal.plot_samples.size, 4 * 1000 + 4)
+
+    def test_pyramid_ready(self):
+        """
+        Events:
+            - Create a PlotSignal with more samples than PYRAMID_MIN_SIZE and a pyramid_ready callback.
+            - Build the pyramid for the current samples and for outdated samples.
+        Evaluate:
+            - Evaluate that the callback is called with the signal uuid only for the current samples.
+        """
+        size = PYRAMID_MIN_SIZE * 2
+        signal = Signal(np.arange(size, dtype="f8"), np.arange(size, dtype="f8"), name="Signal")
+        signal.computation = {}
+        signal = PlotSignal(signal, allow_trim=False)
+        signal.pyramid_ready = mock.Mock()
+
+        with mock.patch("asammdf.gui.widgets.plot.Thread") as thread:
+            self.assertIsNone(signal._min_max_pyramid(signal.phys_samples))
+        thread.return_value.start.assert_called_once()
+
+        signal._build_min_max_pyramid(signal._mode, signal.phys_samples.copy())
+        signal.pyramid_ready.assert_not_called()
+
+        signal._build_min_max_pyramid(signal._mode, signal.phys_samples)
+        signal.pyramid_ready.assert_called_with(signal.uuid)
+
+
+class TestPagedSignal(unittest.TestCase):
+    def test_paged_select(self):
+        """
+        Events:
+            - Select a large channel and a small channel with the paged select.
+        Evaluate:
+            - Evaluate that only the large channel is paged.
+            - Evaluate the overview, the overall statistics and the exact samples against MDF.select.
+            - Evaluate that the PlotSignal uses the exact samples for a short visible range.
+        """
+        size = 300_000
+        t = np.arange(size) * 0.001
+        rng = np.random.default_rng(3)
+        samples = np.cumsum(rng.normal(size=size))
+        invalidation_bits = rng.random(size) < 0.01
+
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.multiple(
+            paged_signal,
+            PAGED_SIGNAL_MIN_RECORDS=100_000,
+            PAGE_SIZE=2**15,
+            EXACT_MAX_RECORDS=2**18,
+            OVERVIEW_BUCKETS=2**10,
+        ):
+            with MDF(version="4.10") as mdf:
+                mdf.append(
+                    [
+                        Signal(
+                            samples,
+                            t,
+                            name="Large",
+                            conversion={"a": 2.0, "b": 1.0},
+                            invalidation_bits=invalidation_bits,
+                        )
+                    ]
+                )
+                mdf.append([Signal(np.arange(10), np.arange(10.0), name="Small")])
+                file = mdf.save(Path(temp_dir) / "paged.mf4")
+
+            with MDF(file) as mdf:
+                channels = [("Large", 0, 1), ("Small", 1, 1)]
+                target, target_small = mdf.select(channels, raw=True, validate=True)
+                large, small = paged_signal.select(mdf, channels, raw=True, copy_master=False, validate=True)
+
+                self.assertFalse(hasattr(small, "paged"))
+                self.assertTrue(np.array_equal(small.samples, target_small.samples))
+
+                paged = large.paged
+                self.assertLess(len(large), len(target))
+                self.assertEqual(large.samples.min(), target.samples.min())
+                self.assertEqual(large.samples.max(), target.samples.max())
+                self.assertEqual(large.timestamps[0], target.timestamps[0])
+                self.assertEqual(large.timestamps[-1], target.timestamps[-1])
+
+                stats = paged.stats(raw=True)
+                self.assertAlmostEqual(stats["avg"], np.mean(target.samples))
+                self.assertAlmostEqual(stats["std"], np.std(target.samples))
+
+                timestamps, exact = paged.samples_between(10.0, 20.0)
+                idx = (target.timestamps >= timestamps[0]) & (target.timestamps <= timestamps[-1])
+                self.assertTrue(np.array_equal(exact, target.samples[idx]))
+                self.assertIsNone(paged.samples_between(-np.inf, np.inf))
+
+                for timestamp in (0.0, 123.4567, 1000.0):
+                    index = min(np.searchsorted(target.timestamps, timestamp), len(target) - 1)
+                    self.assertEqual(paged.value_at_timestamp(timestamp), target.samples[index])
+
+                large.computation = {}
+                signal = PlotSignal(large, allow_trim=False)
+                signal.trim(10.0, 10.5, 1000)
+                idx = (target.timestamps >= 10.0) & (target.timestamps <= 10.5)
+                # all the samples of the visible range are plotted
+                self.assertTrue(np.all(np.isin(target.timestamps[idx], signal.plot_timestamps)))
+                self.assertAlmostEqual(signal.avg, np.mean(target.samples * 2 + 1))
@@ -1,13 +1,25 @@
 #!/usr/bin/env python
 from pathlib import Path
+import pickle
 import tempfile
 import unittest
+from unittest import mock
 import urllib
 from zipfile import ZipFile
+import zlib
 
+from canmatrix import ArbitrationId, CanMatrix, Frame
+from canmatrix import Signal as CanSignal
+import canmatrix.formats
 import numpy as np
 
-from asammdf import MDF
+from asammdf import MDF, Signal
+from asammdf.blocks import utils
+from asammdf.blocks import v4_constants as v4c
+from asammdf.blocks.bus_logging_utils import extract_mux, MessagePlan
+from asammdf.blocks.options import get_global_option, set_global_option
+from asammdf.blocks.source_utils import Source
+from asammdf.blocks.v4_blocks import SourceInformation
 
 
 class TestCANBusLogging(unittest.TestCase):
@@ -105,5 +117,173 @@ class TestCANBusLogging(unittest.TestCase):
             self.assertTrue(np.array_equal(values, target))
 
 
+class TestMessagePlan(unittest.TestCase):
+    def test_extract(self):
+        message = Frame("Message", arbitration_id=ArbitrationId(0x100), size=8)
+        message.add_signal(CanSignal("mux", start_bit=0, size=2, is_signed=False, multiplex="Multiplexor"))
+        message.add_signal(CanSignal("little", start_bit=4, size=12, is_signed=True, factor=0.5))
+        message.add_signal(CanSignal("big", start_bit=23, size=13, is_signed=False, is_little_endian=False))
+        message.add_signal(CanSignal("page0", start_bit=40, size=16, is_signed=False, multiplex=0))
+        message.add_signal(CanSignal("page1", start_bit=40, size=7, multiplex=1, is_signed=True))
+
+        payload = np.random.default_rng(3).integers(0, 256, (1000, 8), dtype="u1")
+        raw = np.array([int.from_bytes(row.tobytes(), "little") for row in payload], dtype=object)
+        raw_big = np.array([int.from_bytes(row.tobytes(), "big") for row in payload], dtype=object)
+
+        def signed(values, bits):
+            return np.where(values >= 2 ** (bits - 1), values - 2**bits, values)
+
+        mux = (raw & 3).astype("u1")
+        little = signed((raw >> 4) & 0xFFF, 12) * 0.5
+        big = (raw_big >> 28) & 0x1FFF
+        page0 = (raw >> 40) & 0xFFFF
+        page1 = signed((raw >> 40) & 0x7F, 7)
+
+        rows = np.arange(1, 1000, 3)
+        t = np.arange(1000, dtype="f8")[rows]
+
+        plan = MessagePlan(message)
+        extracted = plan.extract(payload, 0x100, 1, t, rows=rows)
+
+        signals = extracted[(1, 0x100, False, None, None, 0, 0)]
+        self.assertTrue(np.array_equal(signals["mux"]["samples"], mux[rows]))
+        self.assertTrue(np.array_equal(signals["little"]["samples"], little[rows].astype("f8")))
+        self.assertTrue(np.array_equal(signals["big"]["samples"], big[rows].astype("u8")))
+
+        for value, name, expected in ((0, "page0", page0), (1, "page1", page1)):
+            idx = rows[mux[rows] == value]
+            signal = extracted[(1, 0x100, False, None, "mux", value, value)][name]
+            self.assertTrue(np.array_equal(signal["samples"], expected[idx].astype("i8")))
+            self.assertTrue(np.array_equal(signal["t"], idx.astype("f8")))
+
+        # the same plan gives the same results when the payload rows are selected up front
+        for entry, signals in extract_mux(payload[rows], message, 0x100, 1, t, plan=plan).items():
+            for name, signal in signals.items():
+                self.assertTrue(np.array_equal(signal["samples"], extracted[entry][name]["samples"]))
+                self.assertTrue(np.array_equal(signal["t"], extracted[entry][name]["t"]))
+
+
+class TestExtractWorkers(unittest.TestCase):
+    def test_workers(self):
+        database = CanMatrix()
+        for msg_id in (0x10, 0x20, 0x30):
+            message = Frame(f"Message_{msg_id}", arbitration_id=ArbitrationId(msg_id), size=8)
+            message.add_signal(CanSignal(f"Signal_{msg_id}_a", start_bit=0, size=12, factor=0.5))
+            message.add_signal(CanSignal(f"Signal_{msg_id}_b", start_bit=12, size=20, is_signed=True))
+            database.add_frame(message)
+
+        rng = np.random.default_rng(7)
+        source = Source(name="CAN", path="CAN", comment="", source_type=v4c.SOURCE_BUS, bus_type=v4c.BUS_TYPE_CAN)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with MDF(version="4.10") as mdf:
+                for bus in (1, 2, 3):
+                    frames = np.zeros(
+                        2000,
+                        dtype=[
+                            ("CAN_DataFrame.BusChannel", "u1"),
+                            ("CAN_DataFrame.ID", "<u4"),
+                            ("CAN_DataFrame.IDE", "u1"),
+                            ("CAN_DataFrame.DataBytes", "(8,)u1"),
+                        ],
+                    )
+                    frames["CAN_DataFrame.BusChannel"] = bus
+                    frames["CAN_DataFrame.ID"] = rng.choice([0x10, 0x20, 0x30, 0x40], 2000)
+                    frames["CAN_DataFrame.DataBytes"] = rng.integers(0, 256, (2000, 8))
+
+                    index = mdf.append(
+                        [Signal(frames, np.arange(2000) * 0.01 + bus, name="CAN_DataFrame", source=source)],
+                        acq_name="CAN",
+                        acq_source=source,
+                    )
+                    mdf.groups[index].channel_group.flags |= v4c.FLAG_CG_BUS_EVENT
+                    mdf.groups[index].channel_group.acq_source = SourceInformation.from_common_source(source)
+
+                file = mdf.save(Path(temp_dir) / "bus_logging.mf4")
+
+            with MDF(file) as mdf:
+                databases = {"CAN": [(database, 0), (database, 2)]}
+                target = mdf.extract_bus_logging(databases)
+                target_info = mdf.last_call_info["CAN"]
+                extracted = mdf.extract_bus_logging(databases, workers=2)
+
+                self.assertEqual(mdf.last_call_info["CAN"]["found_ids"], target_info["found_ids"])
+                self.assertEqual(mdf.last_call_info["CAN"]["unknown_ids"], target_info["unknown_ids"])
+
+                self.assertEqual(len(extracted.groups), 12)
+                self.assertEqual(len(extracted.groups), len(target.groups))
+                for group, target_group in zip(extracted.groups, target.groups):
+                    self.assertEqual(group.channel_group.acq_name, target_group.channel_group.acq_name)
+
+                for signal, target_signal in zip(extracted.iter_channels(), target.iter_channels()):
+                    self.assertEqual(signal.name, target_signal.name)
+                    self.assertTrue(np.array_equal(signal.samples, target_signal.samples))
+                    self.assertTrue(np.array_equal(signal.timestamps, target_signal.timestamps))
+
+                extracted.close()
+                target.close()
+
+
+class TestCanDatabaseCache(unittest.TestCase):
+    def test_cache(self):
+        database = CanMatrix()
+        message = Frame("Message", arbitration_id=ArbitrationId(0x100), size=8)
+        message.add_signal(CanSignal("Signal", start_bit=0, size=12, factor=0.5, values={0: "zero", 1: "one"}))
+        database.add_frame(message)
+
+        cache = get_global_option("can_database_cache")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_name = Path(temp_dir) / "database.dbc"
+            canmatrix.formats.dumpp({"": database}, str(file_name))
+
+            try:
+                set_global_option("can_database_cache", Path(temp_dir) / "cache")
+
+                target = utils.load_can_database(file_name)
+                key = utils.can_database_key(file_name)
+                self.assertTrue((Path(temp_dir) / "cache" / f"{key}.candb").exists())
+
+                # the compiled database is used from the disk cache and canmatrix is not called
+                utils._can_database_memo.clear()
+                with mock.patch.object(canmatrix.formats, "loadp", side_effect=AssertionError):
+                    db = utils.load_can_database(file_name)
+                    # each call returns a new object
+                    self.assertIsNot(db, utils.load_can_database(file_name))
+
+                signal = db.frame_by_id(ArbitrationId(0x100)).signal_by_name("Signal")
+                target_signal = target.frame_by_id(ArbitrationId(0x100)).signal_by_name("Signal")
+                self.assertEqual(signal.factor, target_signal.factor)
+                self.assertEqual(signal.size, target_signal.size)
+                self.assertEqual(signal.values, target_signal.values)
+
+                # a different content gives a different key
+                self.assertNotEqual(key, utils.can_database_key(file_name, file_name.read_bytes() + b"\n"))
+
+                # files that are not signed with the secret of the cache folder are not unpickled
+                compiled_file = Path(temp_dir) / "cache" / f"{key}.candb"
+                data = compiled_file.read_bytes()
+                size = len(utils.CAN_DATABASE_CACHE_MAGIC)
+                for tampered in (
+                    data[:size] + bytes(32) + data[size + 32 :],
+                    data[:-1] + bytes([data[-1] ^ 1]),
+                    zlib.compress(pickle.dumps(target)),
+                ):
+                    compiled_file.write_bytes(tampered)
+                    utils._can_database_memo.clear()
+                    with mock.patch.object(utils.pickle, "loads", side_effect=AssertionError):
+                        with self.assertLogs("asammdf", level="WARNING"):
+                            self.assertIsNone(utils._load_compiled_can_database(key))
+
+                # the database is parsed again and the cache file is replaced
+                db = utils.load_can_database(file_name)
+                self.assertEqual(db.frame_by_id(ArbitrationId(0x100)).signal_by_name("Signal").factor, 0.5)
+                utils._can_database_memo.clear()
+                self.assertIsNotNone(utils._load_compiled_can_database(key))
+            finally:
+                set_global_option("can_database_cache", cache)
+                utils._can_database_memo.clear()
+
+
 if __name__ == "__main__":
     unittest.main()
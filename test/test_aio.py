@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+import asyncio
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from asammdf import MDF, Signal
+from asammdf.aio import AsyncMDF
+from asammdf.blocks.utils import MdfException
+
+CHANNEL_LEN = 10000
+
+
+class TestAsyncMDF(unittest.IsolatedAsyncioTestCase):
+    tempdir = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tempdir = tempfile.TemporaryDirectory()
+
+        t = np.arange(CHANNEL_LEN, dtype="f8")
+        sigs = [
+            Signal(
+                np.arange(CHANNEL_LEN, dtype="u4") * i,
+                t,
+                name=f"Channel_{i}",
+                conversion={"a": 2.0, "b": float(i)},
+                invalidation_bits=np.arange(CHANNEL_LEN) % (i + 2) == 0,
+            )
+            for i in range(5)
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs, common_timebase=True)
+            mdf.append([Signal(t * 2, t, name="Other")])
+            cls.file = mdf.save(Path(cls.tempdir.name) / "aio", overwrite=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tempdir.cleanup()
+
+    async def test_get(self):
+        with MDF(self.file) as mdf:
+            target = {
+                (name, raw): mdf.get(name, raw=raw)
+                for name in ("Channel_1", "Channel_3", "Other")
+                for raw in (False, True)
+            }
+
+        async with await AsyncMDF.open(self.file) as mdf:
+            requests = [(name, raw) for name, raw in target] * 2
+            signals = await asyncio.gather(*[mdf.get(name, raw=raw) for name, raw in requests])
+
+            for (name, raw), sig in zip(requests, signals):
+                self.assertEqual(sig.name, name)
+                self.assertTrue(np.array_equal(sig.samples, target[(name, raw)].samples))
+                self.assertTrue(np.array_equal(sig.timestamps, target[(name, raw)].timestamps))
+
+            # duplicated requests get distinct Signal objects
+            self.assertIsNot(signals[0], signals[len(target)])
+
+            sig = await mdf.get("Channel_1", samples_only=True)
+            self.assertTrue(np.array_equal(sig[0], target[("Channel_1", False)].samples))
+
+            with self.assertRaises(MdfException):
+                await mdf.get("unknown channel")
+
+            # the channel selection is validated while the MDF calls are serialized
+            validate = mdf.mdf._validate_channel_selection
+
+            def locked_validate(*args):
+                self.assertTrue(mdf._lock.locked())
+                return validate(*args)
+
+            with mock.patch.object(mdf.mdf._mdf, "_validate_channel_selection", side_effect=locked_validate) as patched:
+                signals = await asyncio.gather(
+                    mdf.get("Channel_1"),
+                    mdf.get("unknown channel"),
+                    mdf.get("Other"),
+                    return_exceptions=True,
+                )
+
+            patched.assert_any_call("unknown channel", None, None)
+            self.assertTrue(np.array_equal(signals[0].samples, target[("Channel_1", False)].samples))
+            self.assertIsInstance(signals[1], MdfException)
+            self.assertTrue(np.array_equal(signals[2].samples, target[("Other", False)].samples))
+
+    async def test_select_and_dataframes(self):
+        names = ["Channel_2", "Channel_4"]
+
+        with MDF(self.file) as mdf:
+            target = mdf.select(names)
+
+        async with await AsyncMDF.open(self.file) as mdf:
+            selected = await mdf.select(names)
+            for sig, target_sig in zip(selected, target):
+                self.assertTrue(np.array_equal(sig.samples, target_sig.samples))
+
+            size = 0
+            async for df in mdf.iter_to_dataframe(channels=names, chunk_ram_size=16 * 1024):
+                self.assertEqual(list(df.columns), names)
+                size += len(df)
+            self.assertEqual(size, CHANNEL_LEN)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,10 @@
 from io import BytesIO
 from pathlib import Path
 import random
+import re
 import tempfile
 import unittest
+from unittest import mock
 import urllib
 import urllib.request
 from zipfile import ZipFile
@@ -13,6 +15,7 @@ import numpy as np
 from pandas import DataFrame
 
 from asammdf import MDF, Signal, SUPPORTED_VERSIONS
+from asammdf.blocks import utils
 from asammdf.blocks.utils import MdfException
 from asammdf.mdf import SearchMode
 
@@ -888,6 +891,80 @@ class TestMDF(unittest.TestCase):
             msg="wildcard match case-insensitive",
         )
 
+    def test_search_index(self):
+        words = ["Engine", "Speed", "Vehicle", "Temp", "Oil", "Brake", "Lamp", "Straße"]
+        names = [f"{words[i % 8]}_{words[i // 8 % 8]}_{i}" for i in range(2000)]
+
+        mdf = MDF()
+        mdf.append([Signal(np.ones(1), np.arange(1), name=name) for name in names[:1000]])
+
+        # the index is created by the first search and then updated by the appended channels
+        index = mdf.channels_db.search_index
+        mdf.append([Signal(np.ones(1), np.arange(1), name=name) for name in names[1000:]])
+        self.assertIs(mdf.channels_db.search_index, index)
+
+        names = list(mdf.channels_db)
+        for pattern, mode, case_insensitive in (
+            ("speed_1", "plain", True),
+            ("Oil_Lamp", "plain", False),
+            ("^vehicle_.*_1.2$", "regex", True),
+            ("(Oil|Lamp)_Brake", "regex", False),
+            ("STRAßE_*", "wildcard", True),
+            ("*Temp_1*", "wildcard", False),
+        ):
+            if mode == "plain":
+                if case_insensitive:
+                    expected = [name for name in names if pattern.casefold() in name.casefold()]
+                else:
+                    expected = [name for name in names if pattern in name]
+            else:
+                if mode == "wildcard":
+                    regex = re.escape(pattern).replace(r"\*", ".*")
+                else:
+                    regex = pattern
+                regex = re.compile(regex, re.IGNORECASE if case_insensitive else 0)
+                expected = [name for name in names if regex.search(name)]
+
+            self.assertTrue(expected)
+            self.assertEqual(mdf.search(pattern, mode=mode, case_insensitive=case_insensitive), expected)
+
+    def test_search_index_special_case_folding(self):
+        # re.IGNORECASE matches characters that have different casefolds
+        names = ["Xab\u0131", "Speed\u0130abc", "Straße", "\u017fpeed", "\u212aelvin_\u212a", "vehicle_abi"]
+
+        mdf = MDF()
+        mdf.append([Signal(np.ones(1), np.arange(1), name=name) for name in names])
+
+        for pattern, mode, expected in (
+            ("abi", "regex", ["Xab\u0131", "vehicle_abi"]),
+            ("iab", "regex", ["Speed\u0130abc"]),
+            ("^xabi$", "regex", ["Xab\u0131"]),
+            ("^speedi", "regex", ["Speed\u0130abc"]),
+            ("^\u017fpeed", "regex", ["Speed\u0130abc", "\u017fpeed"]),
+            ("kelvin_k", "regex", ["\u212aelvin_\u212a"]),
+            ("*ABI", "wildcard", ["Xab\u0131", "vehicle_abi"]),
+            ("STRASSE", "plain", ["Straße"]),
+        ):
+            self.assertEqual(mdf.search(pattern, mode=mode, case_insensitive=True), expected, msg=pattern)
+
+    def test_search_index_without_parser(self):
+        # the search scans all the names if the private re parser is missing or fails
+        names = ["Engine_Speed", "Vehicle_Speed", "Oil_Temp", "speedometer"]
+
+        mdf = MDF()
+        mdf.append([Signal(np.ones(1), np.arange(1), name=name) for name in names])
+
+        broken_parser = mock.Mock()
+        broken_parser.parse.side_effect = AttributeError("parse")
+
+        for sre_parse in (None, broken_parser):
+            with mock.patch.object(utils, "sre_parse", sre_parse):
+                self.assertEqual(utils._pattern_literals(re.compile("^Vehicle_Speed"), True), ([], ""))
+                self.assertEqual(mdf.search("^vehicle_.*", mode="regex"), [])
+                self.assertEqual(mdf.search("^vehicle_.*", mode="regex", case_insensitive=True), ["Vehicle_Speed"])
+                self.assertEqual(mdf.search("_speed", mode="plain", case_insensitive=True), names[:2])
+                self.assertEqual(mdf.search("*Speed", mode="wildcard"), names[:2])
+
 
 if __name__ == "__main__":
     unittest.main()
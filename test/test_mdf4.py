@@ -1,16 +1,161 @@
 #!/usr/bin/env python
+from concurrent.futures import ThreadPoolExecutor
+import gc
+from io import BytesIO
+import os
 from pathlib import Path
 import tempfile
 import unittest
+from unittest import mock
+from zipfile import ZipFile
 
 import numpy as np
 
-from asammdf import MDF, Signal
-from asammdf.blocks.mdf_v4 import MDF4
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+from asammdf import get_global_option, MDF, set_global_option, Signal
+from asammdf.blocks import v4_constants as v4c
+from asammdf.blocks.mdf_v4 import index_file_name, MDF4
+from asammdf.blocks.source_utils import Source
+from asammdf.blocks.utils import MdfException
+from asammdf.blocks.v4_blocks import (
+    ChannelGroup,
+    DataBlock,
+    DataGroup,
+    DataList,
+    DataZippedBlock,
+    LazyChannelMetadata,
+)
+from asammdf.signal import interp_signals
 
 CHANNEL_LEN = 100000
 
 
+def unsorted_copy(sorted_file, path, block_size, zipped=True):
+    """merge the two channel groups of *sorted_file* into an unsorted data
+    group, with the records interleaved by timestamp and split in DZ blocks
+    (or DT blocks if *zipped* is False) of *block_size* bytes"""
+
+    with MDF(sorted_file) as mdf:
+        groups = mdf._mdf.groups
+        records, timestamps = [], []
+        for index, group in enumerate(groups):
+            record_size = group.channel_group.samples_byte_nr + group.channel_group.invalidation_bytes_nr
+            data = b"".join(fragment[0] for fragment in mdf._mdf._load_data(group))
+            records.extend(bytes([index + 1]) + data[i : i + record_size] for i in range(0, len(data), record_size))
+            timestamps.append(mdf.get_master(index))
+        dg_address, next_dg_address = groups[0].data_group.address, groups[1].data_group.address
+        cg_addresses = groups[0].channel_group.address, groups[1].channel_group.address
+
+    payload = b"".join(records[i] for i in np.argsort(np.concatenate(timestamps), kind="stable"))
+
+    data = bytearray(Path(sorted_file).read_bytes())
+    addresses = []
+    for start in range(0, len(payload), block_size):
+        data += b"\0" * (-len(data) % 8)
+        addresses.append(len(data))
+        if zipped:
+            data += bytes(DataZippedBlock(data=payload[start : start + block_size], zip_type=0, original_type=b"DT"))
+        else:
+            data += bytes(DataBlock(data=payload[start : start + block_size], type="DT"))
+
+    data += b"\0" * (-len(data) % 8)
+    data_list_address = len(data)
+    data += bytes(
+        DataList(
+            flags=1,
+            links_nr=len(addresses) + 1,
+            data_block_nr=len(addresses),
+            data_block_len=block_size,
+            **{f"data_block_addr{i}": address for i, address in enumerate(addresses)},
+        )
+    )
+
+    data_group = DataGroup(address=dg_address, stream=bytes(data), mapped=True)
+    data_group.record_id_len = 1
+    data_group.data_block_addr = data_list_address
+    data_group.next_dg_addr = DataGroup(address=next_dg_address, stream=bytes(data), mapped=True).next_dg_addr
+    data[dg_address : dg_address + data_group.block_len] = bytes(data_group)
+
+    for record_id, (address, next_address) in enumerate(zip(cg_addresses, (cg_addresses[1], 0)), 1):
+        channel_group = ChannelGroup(address=address, stream=bytes(data), mapped=True, si_map={}, tx_map={})
+        channel_group.record_id = record_id
+        channel_group.next_cg_addr = next_address
+        data[address : address + channel_group.block_len] = bytes(channel_group)
+
+    path.write_bytes(data)
+
+    return path
+
+
+def unsorted_vlsd_copy(sorted_file, path, name):
+    """store the *name* string channel of the first group of *sorted_file* in
+    a VLSD channel group instead of a SD block; the VLSD records and the fixed
+    length records are interleaved in a single DT block"""
+
+    with MDF(sorted_file) as mdf:
+        group = mdf._mdf.groups[0]
+        record_size = group.channel_group.samples_byte_nr + group.channel_group.invalidation_bytes_nr
+        data = b"".join(fragment[0] for fragment in mdf._mdf._load_data(group))
+        channel = group.channels[mdf.whereis(name)[0][1]]
+        signal_data = DataBlock(address=channel.data_block_addr, stream=mdf._mdf._file, mapped=True).data
+        dg_address, cg_address, ch_address = group.data_group.address, group.channel_group.address, channel.address
+        byte_offset = channel.byte_offset
+
+    # the padding of the stored strings is removed to get variable length records
+    records = []
+    position = offset = 0
+    for i in range(len(data) // record_size):
+        size = int.from_bytes(signal_data[position : position + 4], "little")
+        value = signal_data[position + 4 : position + 4 + size].rstrip(b"\0")
+        position += 4 + size
+
+        record = bytearray(data[i * record_size : (i + 1) * record_size])
+        record[byte_offset : byte_offset + 8] = offset.to_bytes(8, "little")
+        offset += 4 + len(value)
+
+        records.append(b"\x02" + len(value).to_bytes(4, "little") + value)
+        records.append(b"\x01" + record)
+
+    data = bytearray(Path(sorted_file).read_bytes())
+
+    data += b"\0" * (-len(data) % 8)
+    vlsd_address = len(data)
+    data += bytes(
+        ChannelGroup(
+            flags=v4c.FLAG_CG_VLSD,
+            record_id=2,
+            cycles_nr=len(records) // 2,
+            samples_byte_nr=offset & 0xFFFFFFFF,
+            invalidation_bytes_nr=offset >> 32,
+        )
+    )
+
+    data += b"\0" * (-len(data) % 8)
+    data_block_address = len(data)
+    data += bytes(DataBlock(data=b"".join(records), type="DT"))
+
+    # link the channel to the VLSD channel group
+    data[ch_address + 64 : ch_address + 72] = vlsd_address.to_bytes(8, "little")
+
+    data_group = DataGroup(address=dg_address, stream=bytes(data), mapped=True)
+    data_group.record_id_len = 1
+    data_group.data_block_addr = data_block_address
+    data[dg_address : dg_address + data_group.block_len] = bytes(data_group)
+
+    channel_group = ChannelGroup(address=cg_address, stream=bytes(data), mapped=True, si_map={}, tx_map={})
+    channel_group.record_id = 1
+    channel_group.next_cg_addr = vlsd_address
+    data[cg_address : cg_address + channel_group.block_len] = bytes(channel_group)
+
+    path.write_bytes(data)
+
+    return path
+
+
 class TestMDF4(unittest.TestCase):
     tempdir = None
 
@@ -145,6 +290,726 @@ class TestMDF4(unittest.TestCase):
 
         self.assertTrue((record == signal.samples).all())
 
+    def test_decompression_workers(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8")
+        sigs = [Signal(np.arange(CHANNEL_LEN, dtype="u4") * i, t, name=f"Channel_{i}") for i in range(10)]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs, common_timebase=True)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "compressed", overwrite=True, compression=2)
+
+        workers = get_global_option("decompression_workers")
+        try:
+            for option in (0, 4):
+                set_global_option("decompression_workers", option)
+
+                with MDF(outfile) as mdf:
+                    mdf.configure(read_fragment_size=100 * 1024)
+                    for sig, ret_sig in zip(sigs, mdf.select([sig.name for sig in sigs])):
+                        self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+
+                    ret_sig = mdf.get(sigs[1].name, record_offset=1000, record_count=50000)
+                    self.assertTrue(np.array_equal(ret_sig.samples, sigs[1].samples[1000:51000]))
+        finally:
+            set_global_option("decompression_workers", workers)
+
+    def test_sort_unsorted(self):
+        t1 = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        t2 = np.arange(CHANNEL_LEN // 3, dtype="f8") * 3 / 100
+        sigs = [
+            Signal(np.arange(CHANNEL_LEN, dtype="u2"), t1, name="Channel_u2"),
+            Signal(np.sin(t1), t1, name="Channel_f8"),
+            Signal(np.arange(CHANNEL_LEN // 3, dtype="i4"), t2, name="Channel_i4"),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs[:2], common_timebase=True)
+            mdf.append(sigs[2:])
+            sorted_file = mdf.save(Path(TestMDF4.tempdir.name) / "sorted", overwrite=True)
+
+        # the block size is not a multiple of the record sizes
+        outfile = unsorted_copy(sorted_file, Path(TestMDF4.tempdir.name) / "unsorted.mf4", 100_003)
+
+        steps = []
+        workers = get_global_option("decompression_workers"), get_global_option("compression_workers")
+        try:
+            for option in (0, 4):
+                set_global_option("decompression_workers", option)
+                set_global_option("compression_workers", option)
+
+                steps.clear()
+                with MDF(outfile, callback=lambda index, count: steps.append(index)) as mdf:
+                    self.assertEqual(len(mdf.groups), 2)
+                    for sig in sigs:
+                        ret_sig = mdf.get(sig.name)
+                        self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+                        self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+                self.assertEqual(steps, sorted(steps))
+        finally:
+            set_global_option("decompression_workers", workers[0])
+            set_global_option("compression_workers", workers[1])
+
+        progress = mock.NonCallableMock(stop=True)
+        with self.assertRaises(MdfException):
+            MDF(outfile, progress=progress)
+        progress.signals.setValue.emit.assert_called()
+
+    def test_sort_unsorted_dt_blocks(self):
+        t1 = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        t2 = np.arange(CHANNEL_LEN // 3, dtype="f8") * 3 / 100
+        sigs = [
+            Signal(np.arange(CHANNEL_LEN, dtype="u2"), t1, name="Channel_u2"),
+            Signal(np.arange(CHANNEL_LEN // 3, dtype="i4"), t2, name="Channel_i4"),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs[:1])
+            mdf.append(sigs[1:])
+            sorted_file = mdf.save(Path(TestMDF4.tempdir.name) / "sorted_dt", overwrite=True)
+
+        outfile = unsorted_copy(sorted_file, Path(TestMDF4.tempdir.name) / "unsorted_dt.mf4", 100_003, zipped=False)
+
+        # the DT blocks are also split in fragments that are not a multiple of the record sizes
+        with mock.patch("asammdf.blocks.mdf_v4.SORT_FRAGMENT_SIZE", 7919):
+            with MDF(outfile) as mdf:
+                for sig in sigs:
+                    ret_sig = mdf.get(sig.name)
+                    self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+                    self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+
+            progress = mock.NonCallableMock(stop=True)
+            with self.assertRaises(MdfException):
+                MDF(outfile, progress=progress)
+
+    def test_sort_unsorted_vlsd(self):
+        t = np.arange(1000, dtype="f8") / 100
+        sigs = [
+            Signal(np.arange(1000, dtype="u2"), t, name="Channel_u2"),
+            Signal(
+                np.array([(f"sample {i} " * (i % 13 + 1)).encode("utf-8") for i in range(1000)]),
+                t,
+                name="Channel_str",
+                encoding="utf-8",
+            ),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs, common_timebase=True)
+            sorted_file = mdf.save(Path(TestMDF4.tempdir.name) / "sorted_vlsd", overwrite=True)
+
+        outfile = unsorted_vlsd_copy(sorted_file, Path(TestMDF4.tempdir.name) / "unsorted_vlsd.mf4", "Channel_str")
+
+        # the VLSD records span the boundaries of the DT block fragments
+        for fragment_size in (7919, 4, 32 * 1024 * 1024):
+            with mock.patch("asammdf.blocks.mdf_v4.SORT_FRAGMENT_SIZE", fragment_size):
+                with MDF(outfile) as mdf:
+                    self.assertEqual(len(mdf.groups), 2)
+                    for sig in sigs:
+                        ret_sig = mdf.get(sig.name)
+                        self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+                        self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+
+    def test_compression_workers(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8")
+        sigs = [Signal(np.arange(CHANNEL_LEN, dtype="u4") * i, t, name=f"Channel_{i}") for i in range(10)]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs, common_timebase=True)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "uncompressed", overwrite=True)
+
+        workers = get_global_option("compression_workers")
+        outputs = []
+        try:
+            for option in (0, 4):
+                set_global_option("compression_workers", option)
+
+                with MDF(outfile) as mdf:
+                    mdf.configure(write_fragment_size=64 * 1024)
+                    compressed = mdf.save(
+                        Path(TestMDF4.tempdir.name) / f"compressed_{option}",
+                        overwrite=True,
+                        compression=2,
+                        add_history_block=False,
+                    )
+                    outputs.append(compressed.read_bytes())
+        finally:
+            set_global_option("compression_workers", workers)
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_index_file(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8")
+        sigs = [
+            Signal(
+                np.arange(CHANNEL_LEN, dtype="u4") * i,
+                t,
+                name=f"Channel_{i}",
+                unit=f"unit_{i}",
+                conversion={"a": float(i), "b": 1.0},
+            )
+            for i in range(10)
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs, common_timebase=True)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "indexed", overwrite=True, compression=1)
+
+        index_file = index_file_name(outfile)
+        self.assertFalse(MDF.invalidate_index(outfile))
+
+        with MDF(outfile) as mdf:
+            target = [mdf.get(sig.name) for sig in sigs]
+
+        for i in range(2):
+            with MDF(outfile, use_index=True) as mdf:
+                self.assertTrue(index_file.is_file())
+                for sig in target:
+                    ret_sig = mdf.get(sig.name)
+                    self.assertEqual(ret_sig.unit, sig.unit)
+                    self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+                    self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+
+        # a modified file must not use the stale index
+        index_mtime = index_file.stat().st_mtime_ns
+        stat = outfile.stat()
+        os.utime(outfile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with MDF(outfile, use_index=True) as mdf:
+            self.assertEqual(len(mdf.get(sigs[1].name)), CHANNEL_LEN)
+        self.assertNotEqual(index_mtime, index_file.stat().st_mtime_ns)
+
+        # an index written by another library version must not be used
+        index_mtime = index_file.stat().st_mtime_ns
+        with mock.patch("asammdf.blocks.mdf_v4.tool.__version__", "0.0.0"):
+            with MDF(outfile, use_index=True) as mdf:
+                self.assertEqual(len(mdf.get(sigs[1].name)), CHANNEL_LEN)
+        self.assertNotEqual(index_mtime, index_file.stat().st_mtime_ns)
+
+        self.assertTrue(MDF.invalidate_index(outfile))
+        self.assertFalse(index_file.exists())
+
+    def test_lazy_channels(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8")
+        sigs = [
+            Signal(
+                np.arange(CHANNEL_LEN, dtype="u4") * i,
+                t,
+                name=f"Channel_{i}",
+                unit=f"unit_{i}",
+                comment=f"comment_{i}",
+                conversion={"a": float(i), "b": 1.0},
+                source=Source(
+                    name=f"source_{i % 2}",
+                    path="path",
+                    comment="",
+                    source_type=Source.SOURCE_ECU,
+                    bus_type=Source.BUS_TYPE_CAN,
+                ),
+            )
+            for i in range(10)
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs, common_timebase=True)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "lazy", overwrite=True)
+
+        with MDF(outfile, use_display_names=False) as mdf:
+            target = [mdf.get(sig.name, raw=True) for sig in sigs]
+
+        with MDF(outfile, use_display_names=False, lazy_channels=True) as mdf:
+            for sig in target:
+                group_index, channel_index = mdf.channels_db[sig.name][0]
+                channel = mdf.groups[group_index].channels[channel_index]
+                self.assertIsInstance(channel._conversion, LazyChannelMetadata)
+                self.assertIsInstance(channel._comment, LazyChannelMetadata)
+
+                ret_sig = mdf.get(sig.name, raw=True)
+                self.assertEqual(ret_sig.comment, sig.comment)
+                self.assertEqual(ret_sig.conversion.a, sig.conversion.a)
+                self.assertEqual(ret_sig.source.name, sig.source.name)
+                self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+                self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+                self.assertNotIsInstance(channel._conversion, LazyChannelMetadata)
+
+    def test_select_mapped_byte_ranges(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8")
+        sigs = [
+            Signal(
+                (np.arange(CHANNEL_LEN) * (i + 1)).astype("u4" if i % 2 else "f8"),
+                t,
+                name=f"Channel_{i}",
+            )
+            for i in range(64)
+        ]
+        sigs.append(
+            Signal(
+                (np.arange(CHANNEL_LEN) % 7).astype("u1"),
+                t,
+                name="Invalid",
+                invalidation_bits=np.arange(CHANNEL_LEN) % 5 == 0,
+            )
+        )
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs, common_timebase=True)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "wide", overwrite=True)
+
+        names = ["Channel_3", "Channel_40", "Invalid", "Channel_7"]
+
+        with MDF(outfile) as mdf:
+            self.assertTrue(mdf._mapped_selection_possible(0, [4, 41]))
+            self.assertFalse(mdf._mapped_selection_possible(0, list(range(65))))
+
+            target = [mdf.get(name, ignore_invalidation_bits=True) for name in names]
+
+            for record_offset, record_count in ((0, None), (1000, 7777)):
+                end = None if record_count is None else record_offset + record_count
+                selected = mdf.select(names, record_offset=record_offset, record_count=record_count)
+                for sig, target_sig in zip(selected, target):
+                    self.assertTrue(np.array_equal(sig.samples, target_sig.samples[record_offset:end]))
+                    self.assertTrue(np.array_equal(sig.timestamps, target_sig.timestamps[record_offset:end]))
+                    if target_sig.invalidation_bits is not None:
+                        self.assertTrue(
+                            np.array_equal(
+                                sig.invalidation_bits,
+                                target_sig.invalidation_bits[record_offset:end],
+                            )
+                        )
+
+    def test_zero_copy_get(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 10
+        sigs = [
+            Signal(np.arange(CHANNEL_LEN, dtype="u4") * 3, t, name="Channel_u4"),
+            Signal(np.arange(CHANNEL_LEN, dtype=">i2"), t, name="Channel_i2"),
+            Signal(np.sin(t), t, name="Channel_f8", conversion={"a": 2.0, "b": 1.0}),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.append(sigs, common_timebase=True)
+            outfile = mdf.save(Path(TestMDF4.tempdir.name) / "zero_copy", overwrite=True)
+
+        with MDF(outfile) as mdf:
+            target = [mdf.get(sig.name) for sig in sigs]
+            self.assertTrue(target[0].samples.flags.writeable)
+
+        mdf = MDF(outfile, copy_on_get=False)
+        for sig in target:
+            ret_sig = mdf.get(sig.name)
+            self.assertTrue(np.array_equal(ret_sig.samples, sig.samples))
+            self.assertTrue(np.array_equal(ret_sig.timestamps, sig.timestamps))
+
+        ret_sig = mdf.get("Channel_u4", record_offset=10, record_count=5)
+        self.assertFalse(ret_sig.samples.flags.writeable)
+        self.assertTrue(np.array_equal(ret_sig.samples, target[0].samples[10:15]))
+        self.assertTrue(np.array_equal(ret_sig.timestamps, target[0].timestamps[10:15]))
+
+        # the mapping stays valid while the returned arrays are used
+        with self.assertLogs("asammdf", level="WARNING"):
+            mdf.close()
+        self.assertTrue(np.array_equal(ret_sig.samples, target[0].samples[10:15]))
+
+        # the temporary file of a zipped measurement is removed once the
+        # returned arrays are released
+        zipped = outfile.with_suffix(".mf4z")
+        with ZipFile(zipped, "w") as archive:
+            archive.write(outfile, outfile.name)
+
+        mdf = MDF(zipped, copy_on_get=False)
+        temporary = Path(mdf.name)
+        ret_sig = mdf.get("Channel_u4")
+        with self.assertLogs("asammdf", level="WARNING"):
+            mdf.close()
+        self.assertTrue(temporary.exists())
+        self.assertTrue(np.array_equal(ret_sig.samples, target[0].samples))
+
+        del ret_sig
+        gc.collect()
+        self.assertFalse(temporary.exists())
+
+    def test_thread_safe_reads(self):
+        sigs = []
+        for i in range(4):
+            t = np.arange(CHANNEL_LEN // (i + 1), dtype="f8") / (i + 1)
+            sigs.append(
+                [
+                    Signal(np.arange(len(t), dtype="u4") * (i + 1), t, name=f"Channel_{i}_0"),
+                    Signal(np.cos(t), t, name=f"Channel_{i}_1"),
+                ]
+            )
+
+        with MDF(version="4.10") as mdf:
+            for group in sigs:
+                mdf.append(group)
+            files = [
+                mdf.save(
+                    Path(TestMDF4.tempdir.name) / f"thread_safe_{compression}", overwrite=True, compression=compression
+                )
+                for compression in (0, 2)
+            ]
+
+        names = [sig.name for group in sigs for sig in group]
+
+        for file in files:
+            with MDF(file) as mdf:
+                target = {name: mdf.get(name) for name in names}
+
+            for source, thread_safe in (
+                (file, True),
+                (BytesIO(file.read_bytes()), True),
+                (BytesIO(file.read_bytes()), False),
+            ):
+                with MDF(source, thread_safe=thread_safe, read_fragment_size=4096, lazy_channels=True) as mdf:
+                    with ThreadPoolExecutor(max_workers=4) as executor:
+                        signals = list(executor.map(mdf.get, names * 4))
+                        selections = list(executor.map(mdf.select, [names[i::2] for i in range(2)] * 4))
+
+                    for sig in signals:
+                        self.assertTrue(np.array_equal(sig.samples, target[sig.name].samples))
+                        self.assertTrue(np.array_equal(sig.timestamps, target[sig.name].timestamps))
+
+                    for selected in selections:
+                        for sig in selected:
+                            self.assertTrue(np.array_equal(sig.samples, target[sig.name].samples))
+                            self.assertTrue(np.array_equal(sig.timestamps, target[sig.name].timestamps))
+
+                    self.assertIsNone(mdf._master)
+
+    def test_concatenate_stack_workers(self):
+        files = []
+        for i in range(4):
+            t = np.arange(1000, dtype="f8") / 100
+            sigs = [
+                Signal(np.arange(1000, dtype="u4") * (i + 1), t, name="Channel_u4"),
+                Signal(np.sin(t + i), t, name="Channel_f8", invalidation_bits=np.arange(1000) % (i + 2) == 0),
+            ]
+            if i == 2:
+                sigs.reverse()
+
+            with MDF(version="4.10") as mdf:
+                mdf.append(sigs, common_timebase=True)
+                files.append(mdf.save(Path(TestMDF4.tempdir.name) / f"workers_{i}", overwrite=True))
+
+        def records(mdf):
+            return [b"".join(bytes(fragment[0]) for fragment in mdf._mdf._load_data(group)) for group in mdf.groups]
+
+        # the workers send the groups in several fragments
+        read_fragment_size = get_global_option("read_fragment_size")
+        try:
+            for fragment_size in (0, 1024):
+                set_global_option("read_fragment_size", fragment_size)
+                for operation in (MDF.concatenate, MDF.stack):
+                    with operation(files) as serial, operation(files, workers=2) as parallel:
+                        self.assertEqual(len(serial.groups), len(parallel.groups))
+                        self.assertEqual(records(serial), records(parallel))
+        finally:
+            set_global_option("read_fragment_size", read_fragment_size)
+
+        # the errors of the worker processes are raised in the main process
+        broken = Path(TestMDF4.tempdir.name) / "workers_broken.mf4"
+        broken.write_bytes(files[1].read_bytes()[:2000])
+        for operation in (MDF.concatenate, MDF.stack):
+            with self.assertRaises((MdfException, ValueError)):
+                operation([*files[:2], broken, files[3]], workers=2)
+
+    def test_time_index(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        sigs = [
+            Signal(np.arange(CHANNEL_LEN, dtype="u4"), t, name="Channel_u4"),
+            Signal(np.sin(t), t, name="Channel_f8"),
+        ]
+
+        files = []
+        for version in ("4.10", "4.20"):
+            with MDF(version=version) as mdf:
+                mdf.configure(write_fragment_size=64 * 1024)
+                mdf.append(sigs, common_timebase=True)
+                files.append(mdf.save(Path(TestMDF4.tempdir.name) / f"time_index_{version}", overwrite=True))
+
+        names = [sig.name for sig in sigs]
+
+        for file in files:
+            with MDF(file) as mdf:
+                # the 4.20 data lists store the time of the first record of each block
+                from_data_lists = mdf._mdf._time_index_from_data_lists(0)
+                self.assertEqual(from_data_lists is not None, mdf.version >= "4.20")
+
+                records, timestamps = mdf.get_time_index(0)
+                self.assertEqual(records[0], 0)
+                self.assertTrue(np.array_equal(timestamps, t[records]))
+
+                target = mdf.select(names)
+
+                for start, stop in ((100.0, 200.005), (None, 3.3), (999.5, None), (-5, -1), (2000, 3000)):
+                    offset, count = mdf.get_record_window(0, start, stop)
+                    self.assertLessEqual(offset + count, CHANNEL_LEN)
+
+                    selected = mdf.select(names, start=start, stop=stop)
+                    for sig, target_sig in zip(selected, target):
+                        idx = np.ones(CHANNEL_LEN, dtype=bool)
+                        if start is not None:
+                            idx &= target_sig.timestamps >= start
+                        if stop is not None:
+                            idx &= target_sig.timestamps <= stop
+                        self.assertTrue(np.array_equal(sig.samples, target_sig.samples[idx]))
+                        self.assertTrue(np.array_equal(sig.timestamps, target_sig.timestamps[idx]))
+
+                    with mdf.cut(start, stop) as cut:
+                        for name, target_sig in zip(names, target):
+                            target_sig = target_sig.cut(start, stop)
+                            sig = cut.get(name)
+                            self.assertTrue(np.array_equal(sig.samples, target_sig.samples))
+                            self.assertTrue(np.array_equal(sig.timestamps, target_sig.timestamps))
+
+    def test_streaming_cut(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        sigs = [
+            Signal(np.arange(CHANNEL_LEN, dtype="u4"), t, name="Channel_u4"),
+            Signal(np.sin(t), t, name="Channel_f8", invalidation_bits=np.arange(CHANNEL_LEN) % 3 == 0),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs, common_timebase=True)
+            file = mdf.save(Path(TestMDF4.tempdir.name) / "streaming_cut", overwrite=True, compression=2)
+
+        names = [sig.name for sig in sigs]
+
+        with MDF(file) as mdf, mock.patch("asammdf.mdf.RAW_COPY_MIN_SIZE", 0):
+            for start, stop, include_ends in ((100.005, 800.0, True), (100.005, 800.0, False), (None, 300.0, True)):
+                with mock.patch.object(
+                    MDF4, "_extend_raw_block", autospec=True, side_effect=MDF4._extend_raw_block
+                ) as copy:
+                    cut = mdf.cut(start, stop, include_ends=include_ends)
+                # the data blocks inside the cut interval are copied without decoding them
+                self.assertTrue(copy.called)
+
+                with mock.patch.object(MDF, "_raw_cut_range", return_value=None):
+                    target = mdf.cut(start, stop, include_ends=include_ends)
+
+                for name in names:
+                    sig = cut.get(name, ignore_invalidation_bits=True)
+                    target_sig = target.get(name, ignore_invalidation_bits=True)
+                    self.assertTrue(np.array_equal(sig.samples, target_sig.samples))
+                    self.assertTrue(np.array_equal(sig.timestamps, target_sig.timestamps))
+                    if target_sig.invalidation_bits is not None:
+                        self.assertTrue(np.array_equal(sig.invalidation_bits, target_sig.invalidation_bits))
+
+                cut.close()
+                target.close()
+
+    def test_mdf3_cut(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        with MDF(version="3.30") as mdf:
+            mdf.append(
+                [
+                    Signal(np.arange(CHANNEL_LEN, dtype="u4"), t, name="Channel_u4"),
+                    Signal(np.cos(t), t, name="Channel_f8"),
+                ],
+                common_timebase=True,
+            )
+            file = mdf.save(Path(TestMDF4.tempdir.name) / "mdf3_cut", overwrite=True)
+
+        # the MDF 3 groups are never copied raw
+        with MDF(file) as mdf, mock.patch("asammdf.mdf.RAW_COPY_MIN_SIZE", 0):
+            with mdf.cut(100.005, 800.0) as cut:
+                for name in ("Channel_u4", "Channel_f8"):
+                    sig = cut.get(name)
+                    target = mdf.get(name).cut(100.005, 800.0)
+                    self.assertTrue(np.array_equal(sig.samples, target.samples))
+                    self.assertTrue(np.array_equal(sig.timestamps, target.timestamps))
+
+    def test_streaming_resample(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 1000
+        sigs = [
+            Signal(np.arange(CHANNEL_LEN, dtype="u4") % 200, t, name="Channel_u4"),
+            Signal(np.sin(t), t, name="Channel_f8", invalidation_bits=np.arange(CHANNEL_LEN) % 3 == 0),
+            Signal(np.arange(CHANNEL_LEN, dtype="i2") % 50, t, name="Channel_hybrid", conversion={"a": 0.5, "b": 1}),
+        ]
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(sigs, common_timebase=True)
+            file = mdf.save(Path(TestMDF4.tempdir.name) / "streaming_resample", overwrite=True)
+
+        names = [sig.name for sig in sigs]
+
+        with MDF(file) as mdf:
+            mdf.configure(read_fragment_size=16 * 1024, integer_interpolation=2)
+
+            for raster in (0.0123, 0.0003, [-1.0, 20.0005, 20.0015, 200.0]):
+                with mock.patch.object(MDF4, "extend", autospec=True, side_effect=MDF4.extend) as extend:
+                    resampled = mdf.resample(raster)
+                # the output group is written in several windows
+                self.assertTrue(extend.called)
+
+                master = resampled.get(names[0]).timestamps
+                targets = interp_signals(mdf.select(names, raw=True), master, 2, 1)
+
+                for target in targets:
+                    sig = resampled.get(target.name, raw=True, ignore_invalidation_bits=True)
+                    self.assertTrue(np.array_equal(sig.samples, target.samples))
+                    self.assertTrue(np.array_equal(sig.timestamps, target.timestamps))
+                    if target.invalidation_bits is not None:
+                        self.assertTrue(np.array_equal(sig.invalidation_bits, target.invalidation_bits))
+
+                resampled.close()
+
+    def test_raw_copy_filter_convert(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(
+                [
+                    Signal(np.arange(CHANNEL_LEN, dtype="u4"), t, name="Kept_u4"),
+                    Signal(np.cos(t), t, name="Kept_f8", invalidation_bits=np.arange(CHANNEL_LEN) % 5 == 0),
+                ],
+                common_timebase=True,
+            )
+            mdf.append(
+                [
+                    Signal(np.sin(t), t, name="Partial_f8"),
+                    Signal(np.arange(CHANNEL_LEN, dtype="i2"), t, name="Removed_i2"),
+                ],
+                common_timebase=True,
+            )
+            file = mdf.save(Path(TestMDF4.tempdir.name) / "raw_copy", overwrite=True, compression=2)
+
+        with MDF(file) as mdf, mock.patch("asammdf.mdf.RAW_COPY_MIN_SIZE", 0):
+            operations = (
+                (lambda: mdf.filter(["Kept_u4", "Kept_f8", "Partial_f8"]), {0}),
+                (lambda: mdf.convert("4.11"), {0, 1}),
+            )
+            for operation, copied_groups in operations:
+                with mock.patch.object(
+                    MDF4, "_extend_raw_block", autospec=True, side_effect=MDF4._extend_raw_block
+                ) as copy:
+                    out = operation()
+                # only the groups that keep all their channels are copied raw
+                self.assertEqual({call.args[3] for call in copy.call_args_list}, copied_groups)
+
+                with mock.patch.object(MDF, "_raw_copy_possible", return_value=False):
+                    target = operation()
+
+                self.assertEqual(len(out.groups), len(target.groups))
+                for group_index, group in enumerate(target.groups):
+                    for channel in group.channels:
+                        sig = out.get(channel.name, group_index, ignore_invalidation_bits=True)
+                        target_sig = target.get(channel.name, group_index, ignore_invalidation_bits=True)
+                        self.assertTrue(np.array_equal(sig.samples, target_sig.samples))
+                        self.assertTrue(np.array_equal(sig.timestamps, target_sig.timestamps))
+                        if target_sig.invalidation_bits is not None:
+                            self.assertTrue(np.array_equal(sig.invalidation_bits, target_sig.invalidation_bits))
+
+                out.close()
+                target.close()
+
+    def test_mdf3_filter_convert(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        with MDF(version="3.30") as mdf:
+            mdf.append(
+                [
+                    Signal(np.arange(CHANNEL_LEN, dtype="u4"), t, name="Channel_u4"),
+                    Signal(np.cos(t), t, name="Channel_f8"),
+                ],
+                common_timebase=True,
+            )
+            file = mdf.save(Path(TestMDF4.tempdir.name) / "mdf3_filter_convert", overwrite=True)
+
+        names = ["Channel_u4", "Channel_f8"]
+
+        # the MDF 3 groups are never copied raw
+        with MDF(file) as mdf, mock.patch("asammdf.mdf.RAW_COPY_MIN_SIZE", 0):
+            with mdf.filter(names) as filtered:
+                for name in names:
+                    sig = filtered.get(name)
+                    target = mdf.get(name)
+                    self.assertTrue(np.array_equal(sig.samples, target.samples))
+                    self.assertTrue(np.array_equal(sig.timestamps, target.timestamps))
+
+            with mdf.convert("4.10") as converted:
+                for name in names:
+                    sig = converted.get(name)
+                    target = mdf.get(name)
+                    self.assertTrue(np.array_equal(sig.samples, target.samples))
+                    self.assertTrue(np.array_equal(sig.timestamps, target.timestamps))
+
+            with mdf.convert("3.30") as converted:
+                for name in names:
+                    sig = converted.get(name)
+                    target = mdf.get(name)
+                    self.assertTrue(np.array_equal(sig.samples, target.samples))
+                    self.assertTrue(np.array_equal(sig.timestamps, target.timestamps))
+
+    @unittest.skipIf(pq is None, "pyarrow is not installed")
+    def test_export_parquet(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        states = np.arange(CHANNEL_LEN) % 3
+        invalidation_bits = np.arange(CHANNEL_LEN) % 7 == 0
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append(
+                [
+                    Signal(np.sin(t), t + 10, name="Sine", unit="V", comment="sine wave"),
+                    Signal(
+                        states,
+                        t + 10,
+                        name="State",
+                        conversion={"val_0": 0, "text_0": "off", "val_1": 1, "text_1": "on", "default_addr": "error"},
+                        invalidation_bits=invalidation_bits,
+                    ),
+                ],
+                common_timebase=True,
+            )
+            mdf.append([Signal(np.arange(10, dtype="u2"), np.arange(10) * 0.5, name="Slow")])
+
+            mdf.export(
+                "parquet", Path(TestMDF4.tempdir.name) / "export", time_from_zero=False, split_channel_groups=True
+            )
+
+        table = pq.read_table(Path(TestMDF4.tempdir.name) / "export.ChannelGroup_0_Python.parquet")
+        self.assertEqual(table.column_names, ["timestamps", "Sine", "State"])
+        self.assertTrue(np.array_equal(table["timestamps"].to_numpy(), t + 10))
+        self.assertTrue(np.array_equal(table["Sine"].to_numpy(), np.sin(t)))
+        self.assertEqual(table.schema.field("Sine").metadata, {b"unit": b"V", b"comment": b"sine wave"})
+
+        # the value to text channels are dictionary encoded and the invalid samples are null
+        self.assertTrue(str(table.schema.field("State").type).startswith("dictionary"))
+        expected = [
+            None if invalid else ["off", "on", "error"][state] for state, invalid in zip(states, invalidation_bits)
+        ]
+        self.assertEqual(table["State"].to_pylist(), expected)
+
+        # each group keeps its own time base
+        table = pq.read_table(Path(TestMDF4.tempdir.name) / "export.ChannelGroup_1_Python.parquet")
+        self.assertEqual(table["timestamps"].to_pylist(), (np.arange(10) * 0.5).tolist())
+        self.assertEqual(table["Slow"].to_pylist(), list(range(10)))
+
+    @unittest.skipIf(pq is None, "pyarrow is not installed")
+    def test_export_parquet_fragments(self):
+        t = np.arange(CHANNEL_LEN, dtype="f8") / 100
+        # the texts are only found in the last records
+        states = np.full(CHANNEL_LEN, 5)
+        states[-100:] = np.arange(100) % 2
+        conversion = {"val_0": 0, "text_0": "zero", "val_1": 1, "text_1": "one", "default_addr": {"a": 0.5, "b": 0}}
+
+        with MDF(version="4.10") as mdf:
+            mdf.configure(write_fragment_size=64 * 1024)
+            mdf.append([Signal(states, t, name="State", conversion=conversion)])
+            file = mdf.save(Path(TestMDF4.tempdir.name) / "parquet_fragments", overwrite=True)
+
+        with MDF(file) as mdf:
+            mdf.configure(read_fragment_size=20000)
+            mdf.export(
+                "parquet", Path(TestMDF4.tempdir.name) / "fragments", time_from_zero=False, split_channel_groups=True
+            )
+
+        table = pq.read_table(Path(TestMDF4.tempdir.name) / "fragments.ChannelGroup_0_Python.parquet")
+        self.assertTrue(str(table.schema.field("State").type).startswith("dictionary"))
+        expected = ["2.5"] * (CHANNEL_LEN - 100) + ["zero", "one"] * 50
+        self.assertEqual(table["State"].to_pylist(), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
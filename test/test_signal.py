@@ -5,6 +5,7 @@ import numpy as np
 
 from asammdf import Signal
 from asammdf.blocks.utils import MdfException
+from asammdf.signal import interp_signals
 
 
 class TestSignal(unittest.TestCase):
@@ -483,6 +484,50 @@ class TestSignal(unittest.TestCase):
         res = s**3
         self.assertTrue(np.array_equal(res.samples, target))
 
+    def test_interp_signals(self):
+        rng = np.random.default_rng(7)
+        timestamps = np.unique(rng.choice(np.arange(0, 100, 0.5), 150))
+        size = len(timestamps)
+        new_timestamps = np.concatenate([np.linspace(-5, 105, 301), timestamps[::3]])
+        new_timestamps.sort()
+
+        floats = rng.normal(size=size)
+        floats[::17] = np.inf
+        floats[::23] = np.nan
+
+        signals = [
+            Signal(floats, timestamps, name="f8", invalidation_bits=rng.random(size) < 0.2),
+            Signal(floats.astype("f4"), timestamps.copy(), name="f4"),
+            Signal(rng.integers(0, 200, size).astype("u1"), timestamps.copy(), name="u1"),
+            Signal(
+                rng.integers(0, 200, size).astype("i2"),
+                timestamps.copy(),
+                name="hybrid",
+                conversion={"a": 0.5, "b": 1.0},
+            ),
+            Signal(rng.integers(0, 9, (size, 2)).astype("u2"), timestamps, name="array"),
+            Signal(np.array([b"a", b"bb"] * (size // 2) + [b"a"] * (size % 2)), timestamps, name="bytes"),
+            Signal(np.arange(3.0), np.arange(3.0), name="other time base"),
+            Signal(np.array([], dtype="f8"), np.array([], dtype="f8"), name="empty"),
+        ]
+
+        for integer_mode in (0, 1, 2):
+            for float_mode in (0, 1):
+                interpolated = interp_signals(signals, new_timestamps, integer_mode, float_mode)
+                for signal, result in zip(signals, interpolated):
+                    target = signal.interp(new_timestamps, integer_mode, float_mode)
+
+                    self.assertEqual(result.samples.dtype, target.samples.dtype)
+                    self.assertTrue(
+                        np.array_equal(result.samples, target.samples, equal_nan=target.samples.dtype.kind == "f"),
+                        msg=f"{signal.name} {integer_mode} {float_mode}",
+                    )
+                    self.assertTrue(np.array_equal(result.timestamps, target.timestamps))
+                    if target.invalidation_bits is None:
+                        self.assertIsNone(result.invalidation_bits)
+                    else:
+                        self.assertTrue(np.array_equal(result.invalidation_bits, target.invalidation_bits))
+
 
 if __name__ == "__main__":
     unittest.main()
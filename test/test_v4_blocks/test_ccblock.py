@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+import unittest
+
+import numpy as np
+
+from asammdf.blocks.conversion_utils import from_dict
+
+
+class TestCCBLOCK(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ints = np.arange(-10, 300) % 97
+        cls.floats = cls.ints * 0.5
+        cls.floats[::13] = np.nan
+
+    def test_value_to_text(self):
+        conversion = {f"val_{i}": i * 2 for i in range(40)}
+        conversion.update({f"text_{i}": f"state {i}" * (i % 3 + 1) for i in range(40)})
+        conversion["default_addr"] = b"unknown"
+        conversion = from_dict(conversion)
+
+        for values in (self.ints, self.ints.astype("u1"), self.floats):
+            expected = [
+                (
+                    (f"state {int(v) // 2}" * (int(v) // 2 % 3 + 1)).encode()
+                    if not np.isnan(v) and v % 2 == 0 and v < 80
+                    else b"unknown"
+                )
+                for v in values.tolist()
+            ]
+            result = conversion.convert(values)
+            self.assertEqual(result.dtype, np.array(expected).dtype)
+            self.assertEqual(result.tolist(), expected)
+
+        # the texts that are not used do not change the dtype
+        result = conversion.convert(np.array([0, 0, 6] * 100))
+        self.assertEqual(result.dtype, np.dtype("S7"))
+
+    def test_range_to_text(self):
+        conversion = {}
+        for i in range(20):
+            conversion[f"lower_{i}"] = i * 5
+            conversion[f"upper_{i}"] = i * 5 + 3
+            conversion[f"text_{i}"] = f"range {i}"
+        conversion["default_addr"] = b"out"
+        conversion = from_dict(conversion)
+
+        for values in (self.ints, self.floats):
+            expected = [
+                f"range {int(v // 5)}".encode() if not np.isnan(v) and v % 5 <= 3 and v < 100 else b"out"
+                for v in values.tolist()
+            ]
+            self.assertEqual(conversion.convert(values).tolist(), expected)
+
+    def test_table_lookup(self):
+        raw = [0.0, 3.0, 10.0, 11.0]
+        phys = [1.0, -1.0, 5.0, 7.0]
+        conversion = from_dict(
+            {**{f"raw_{i}": v for i, v in enumerate(raw)}, **{f"phys_{i}": v for i, v in enumerate(phys)}}
+        )
+
+        values = np.array([-4, 0, 1, 1.5, 2, 6.5, 7, 10.4, 10.5, 10.6, 30, np.nan])
+        # the ties use the lower raw value
+        expected = [1.0, 1.0, 1.0, 1.0, -1.0, -1.0, 5.0, 5.0, 5.0, 7.0, 7.0, 7.0]
+        self.assertEqual(conversion.convert(values).tolist(), expected)
+        self.assertEqual(conversion.convert(values.reshape(3, 4)).tolist(), np.reshape(expected, (3, 4)).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()